@@ -1,7 +1,8 @@
 """Main module for Ralph's LRS API."""
 
+from contextlib import asynccontextmanager
 from functools import lru_cache
-from typing import Any, Dict, List, Union
+from typing import Any, AsyncIterator, Dict, List, Union
 from urllib.parse import urlparse
 
 import sentry_sdk
@@ -13,6 +14,7 @@ from .. import __version__
 from .auth import get_authenticated_user
 from .auth.user import AuthenticatedUser
 from .routers import health, statements
+from .subscriptions import close_subscriptions
 
 
 @lru_cache(maxsize=None)
@@ -41,7 +43,15 @@ if settings.SENTRY_DSN is not None:
         before_send_transaction=filter_transactions,
     )
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """End open statements subscriptions on shutdown."""
+    yield
+    close_subscriptions()
+
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(statements.router)
 app.include_router(health.router)
 
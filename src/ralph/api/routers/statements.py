@@ -1,9 +1,10 @@
 """API routes related to statements."""
 
+import hashlib
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Literal, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Set, Tuple, Union
 from urllib.parse import ParseResult, urlencode
 from uuid import UUID, uuid4
 
@@ -19,6 +20,7 @@ from fastapi import (
     status,
 )
 from fastapi.dependencies.models import Dependant
+from fastapi.responses import StreamingResponse
 from pydantic import TypeAdapter
 from pydantic.types import Json
 from typing_extensions import Annotated
@@ -27,6 +29,11 @@ from ralph.api.auth import get_authenticated_user
 from ralph.api.auth.user import AuthenticatedUser
 from ralph.api.forwarding import forward_xapi_statements, get_active_xapi_forwardings
 from ralph.api.models import ErrorDetail, LaxStatement
+from ralph.api.subscriptions import (
+    publish_statements,
+    subscribe_statements,
+    unsubscribe_statements,
+)
 from ralph.backends.loader import get_lrs_backends
 from ralph.backends.lrs.base import (
     AgentParameters,
@@ -47,6 +54,7 @@ from ralph.models.xapi.base.common import IRI
 from ralph.utils import (
     await_if_coroutine,
     get_backend_class,
+    get_statement_fingerprint,
     now,
     statements_are_equivalent,
 )
@@ -125,6 +133,141 @@ def _parse_agent_parameters(agent_obj: dict) -> AgentParameters:
     return AgentParameters.model_construct(**agent_query_params)
 
 
+def _get_authority_parameters(
+    current_user: AuthenticatedUser, mine: Optional[bool]
+) -> Optional[dict]:
+    """Return the authority parameters restricting queries to the user statements.
+
+    Return `None` if queries are not restricted to the user statements.
+    """
+    # mine: If using scopes, only restrict users with limited scopes
+    if settings.LRS_RESTRICT_BY_SCOPES:
+        if not current_user.scopes.is_authorized("statements/read"):
+            mine = True
+    # mine: If using only authority, always restrict (otherwise, use the default value)
+    elif settings.LRS_RESTRICT_BY_AUTHORITY:
+        mine = True
+
+    if not mine:
+        return None
+
+    return _parse_agent_parameters(
+        current_user.agent.model_dump(mode="json")
+    ).model_dump(mode="json", exclude_none=True)
+
+
+async def _stream_statements(
+    params: RalphStatementsQuery, target: Optional[str]
+) -> AsyncIterator[str]:
+    """Yield newly stored statements matching `params` as Server-Sent Events."""
+    subscription = subscribe_statements(params, target)
+    try:
+        async for statement in subscription.iter_statements(
+            settings.LRS_SUBSCRIPTIONS_KEEP_ALIVE
+        ):
+            # Comments keep idle connections open through proxies.
+            if not statement:
+                yield ": keep-alive\n\n"
+                continue
+
+            data = json.dumps(statement)
+            yield f"id: {statement['id']}\nevent: statement\ndata: {data}\n\n"
+    finally:
+        unsubscribe_statements(subscription)
+
+
+async def _query_existing_statements(
+    statements: Dict[str, dict], target: Optional[str]
+) -> Tuple[Set[str], Optional[str]]:
+    """Return stored `statements` ids and the id of the first differing statement.
+
+    Stored statements are only fully fetched and deeply compared when their
+    fingerprint differs from the fingerprint of the submitted statement.
+    """
+    ids = list(statements)
+    try:
+        if isinstance(BACKEND_CLIENT, BaseLRSBackend):
+            fingerprints = list(
+                BACKEND_CLIENT.query_statement_fingerprints(ids=ids, target=target)
+            )
+        else:
+            fingerprints = [
+                x
+                async for x in BACKEND_CLIENT.query_statement_fingerprints(
+                    ids=ids, target=target
+                )
+            ]
+
+        differing_ids = [
+            x.id
+            for x in fingerprints
+            if x.fingerprint != get_statement_fingerprint(statements[x.id])
+        ]
+        if not differing_ids:
+            existing_statements = []
+        elif isinstance(BACKEND_CLIENT, BaseLRSBackend):
+            existing_statements = list(
+                BACKEND_CLIENT.query_statements_by_ids(ids=differing_ids, target=target)
+            )
+        else:
+            existing_statements = [
+                x
+                async for x in BACKEND_CLIENT.query_statements_by_ids(
+                    ids=differing_ids, target=target
+                )
+            ]
+    except BackendException as error:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="xAPI statements query failed",
+        ) from error
+
+    # The LRS specification calls for deep comparison of duplicate statement ids.
+    existing_ids = {x.id for x in fingerprints}
+    for existing in existing_statements:
+        if not statements_are_equivalent(statements[existing["id"]], existing):
+            return existing_ids, existing["id"]
+
+    return existing_ids, None
+
+
+async def _create_statements(
+    statements: Dict[str, dict], target: Optional[str]
+) -> Tuple[Set[str], Optional[str]]:
+    """Write new `statements` and return stored ids and the first differing id.
+
+    Only statements conflicting with an already stored id are fetched and compared.
+    Written statements are published before comparing conflicting ones, as they are
+    stored even if a differing statement is found.
+    """
+    try:
+        conflicting_ids = set(
+            await await_if_coroutine(
+                BACKEND_CLIENT.create_statements(
+                    list(statements.values()), target=target
+                )
+            )
+        )
+    except (BackendException, BadFormatException) as exc:
+        logger.error("Failed to index submitted statements")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Statements bulk indexation failed",
+        ) from exc
+
+    logger.info(
+        "Indexed %d statements with success", len(statements) - len(conflicting_ids)
+    )
+    publish_statements(
+        (x for key, x in statements.items() if key not in conflicting_ids), target
+    )
+    if not conflicting_ids:
+        return set(), None
+
+    conflicting_statements = {x: statements[x] for x in conflicting_ids}
+    return await _query_existing_statements(conflicting_statements, target)
+
+
 def strict_query_params(request: Request) -> None:
     """Raise a 400 error when using extra query parameters."""
     dependant: Dependant = request.scope["route"].dependant
@@ -142,10 +285,53 @@ def strict_query_params(request: Request) -> None:
             )
 
 
+def _get_statements_etag(
+    statements: List[dict],
+    query: Dict[str, str],
+    search_after: Optional[str],
+    change_marker: Optional[str],
+    statement_id: Optional[str],
+) -> Optional[str]:
+    """Return the entity tag of a statements query response, if any.
+
+    The response of a single statement lookup is tagged with the fingerprint of the
+    statement. Other responses are tagged with a hash of the statements ids, of the
+    query parameters, of the next page cursor and of the backend change marker.
+    The point in time id is left out as it may change on each request. Responses of
+    backends not providing a change marker are not tagged.
+    """
+    if statement_id and len(statements) == 1 and not search_after:
+        return f'"{get_statement_fingerprint(statements[0])}"'
+
+    if not change_marker:
+        return None
+
+    digest = hashlib.sha256()
+    for statement in statements:
+        digest.update(f"{statement['id']}\n".encode())
+    for name, value in sorted(query.items()):
+        if name != "pit_id":
+            digest.update(f"{name}={value}\n".encode())
+    digest.update(f"{search_after}\n{change_marker}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return whether the `If-None-Match` header value matches the `etag`.
+
+    Entity tags are compared with the weak comparison function of RFC 9110.
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in [tag.removeprefix("W/") for tag in tags]
+
+
 @router.get("")
 @router.get("/")
 async def get(  # noqa: PLR0913
     request: Request,
+    response: Response,
     current_user: Annotated[
         AuthenticatedUser,
         Security(get_authenticated_user, scopes=["statements/read/mine"]),
@@ -365,7 +551,7 @@ async def get(  # noqa: PLR0913
             ),
         )
 
-    query_params = dict(request.query_params)
+    query_params: Dict[str, Any] = dict(request.query_params)
 
     # Parse the "agent" parameter (JSON) into multiple string parameters
     if query_params.get("agent") is not None:
@@ -381,19 +567,10 @@ async def get(  # noqa: PLR0913
     if query_params.get("activity"):
         query_params["activity"] = IRI(query_params["activity"])
 
-    # mine: If using scopes, only restrict users with limited scopes
-    if settings.LRS_RESTRICT_BY_SCOPES:
-        if not current_user.scopes.is_authorized("statements/read"):
-            mine = True
-    # mine: If using only authority, always restrict (otherwise, use the default value)
-    elif settings.LRS_RESTRICT_BY_AUTHORITY:
-        mine = True
-
     # Filter by authority if using `mine`
-    if mine:
-        query_params["authority"] = _parse_agent_parameters(
-            current_user.agent.model_dump(mode="json")
-        ).model_dump(mode="json", exclude_none=True)
+    authority = _get_authority_parameters(current_user, mine)
+    if authority is not None:
+        query_params["authority"] = authority
 
     if "mine" in query_params:
         query_params.pop("mine")
@@ -419,7 +596,7 @@ async def get(  # noqa: PLR0913
     # NB: There is an unhandled edge case where the total number of results is
     # exactly a multiple of the "limit", in which case we'll offer an extra page
     # with 0 results.
-    response = {}
+    more = None
     if len(query_result.statements) == limit:
         # Search after relies on sorting info located in the last hit
         path = request.url.path
@@ -432,20 +609,135 @@ async def get(  # noqa: PLR0913
             }
         )
 
-        response.update(
-            {
-                "more": ParseResult(
-                    scheme="",
-                    netloc="",
-                    path=path,
-                    params="",
-                    query=urlencode(query),
-                    fragment="",
-                ).geturl(),
-            }
+        more = ParseResult(
+            scheme="",
+            netloc="",
+            path=path,
+            params="",
+            query=urlencode(query),
+            fragment="",
+        ).geturl()
+
+    # Clients re-issuing a query get a 304 response, without the statements payload
+    # being serialized, if their cached entity tag still matches.
+    etag = _get_statements_etag(
+        query_result.statements,
+        dict(request.query_params),
+        query_result.search_after if more else None,
+        query_result.change_marker,
+        statement_id,
+    )
+    if etag:
+        if _etag_matches(request.headers.get("If-None-Match"), etag):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+        response.headers["ETag"] = etag
+    if more:
+        return {"more": more, "statements": query_result.statements}
+    return {"statements": query_result.statements}
+
+
+@router.get("/subscribe", response_class=StreamingResponse)
+async def subscribe(  # noqa: PLR0913
+    current_user: Annotated[
+        AuthenticatedUser,
+        Security(get_authenticated_user, scopes=["statements/read/mine"]),
+    ],
+    agent: Annotated[
+        Optional[Json],
+        Query(
+            description=(
+                "Filter, only send Statements for which the specified "
+                "Agent or Group is the Actor or Object of the Statement"
+            ),
+        ),
+    ] = None,
+    verb: Annotated[
+        Optional[str],
+        Query(
+            description="Filter, only send Statements matching the specified Verb id",
+        ),
+    ] = None,
+    activity: Annotated[
+        Optional[str],
+        Query(
+            description=(
+                "Filter, only send Statements for which the Object "
+                "of the Statement is an Activity with the specified id"
+            ),
+        ),
+    ] = None,
+    registration: Annotated[
+        Optional[UUID],
+        Query(
+            description=(
+                "Filter, only send Statements matching the specified registration id"
+            ),
+        ),
+    ] = None,
+    related_activities: Annotated[
+        Optional[bool],
+        Query(
+            description=(
+                "Apply the Activity filter broadly. Include Statements for which "
+                "the Object, any of the context Activities, or any of those properties "
+                "in a contained SubStatement match the Activity parameter"
+            ),
+        ),
+    ] = False,
+    related_agents: Annotated[
+        Optional[bool],
+        Query(
+            description=(
+                "Apply the Agent filter broadly. Include Statements for which "
+                "the Actor, Object, Authority, Instructor, Team, or any of these "
+                "properties in a contained SubStatement match the Agent parameter"
+            ),
+        ),
+    ] = False,
+    mine: Annotated[
+        Optional[bool],
+        Query(
+            description=(
+                'If "true", only send the Statements for which the authority matches '
+                'the "agent" associated to the user that is subscribing.'
+            ),
+        ),
+    ] = False,
+    _: None = Depends(strict_query_params),
+) -> StreamingResponse:
+    """Send newly stored xAPI Statements as Server-Sent Events.
+
+    Each stored Statement matching the query filters is sent as a `statement` event.
+    NB: for internal use, not part of the LRS specification.
+    """
+    if not settings.LRS_SUBSCRIPTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Statements subscriptions are disabled",
         )
 
-    return {**response, "statements": query_result.statements}
+    params: Dict[str, Any] = {
+        "verb": verb,
+        "activity": activity,
+        "registration": registration,
+        "related_activities": related_activities,
+        "related_agents": related_agents,
+    }
+    if agent is not None:
+        params["agent"] = _parse_agent_parameters(agent)
+
+    authority = _get_authority_parameters(current_user, mine)
+    if authority is not None:
+        params["authority"] = authority
+
+    return StreamingResponse(
+        _stream_statements(
+            RalphStatementsQuery.model_construct(**params), current_user.target
+        ),
+        media_type="text/event-stream",
+    )
 
 
 @router.put("/", responses=POST_PUT_RESPONSES, status_code=status.HTTP_204_NO_CONTENT)
@@ -487,36 +779,28 @@ async def put(
     # Finish enriching statements after forwarding
     _enrich_statement_with_authority(statement_as_dict, current_user)
 
-    try:
-        if isinstance(BACKEND_CLIENT, BaseLRSBackend):
-            existing_statements = list(
-                BACKEND_CLIENT.query_statements_by_ids(
-                    ids=[statement_id], target=current_user.target
-                )
-            )
-        else:
-            existing_statements = [
-                x
-                async for x in BACKEND_CLIENT.query_statements_by_ids(
-                    ids=[statement_id], target=current_user.target
-                )
-            ]
-    except BackendException as error:
+    # With optimistic writes, the statement is written first and only compared to
+    # the stored one if its id already exists.
+    check_statements = (
+        _create_statements
+        if settings.LRS_OPTIMISTIC_WRITES
+        else _query_existing_statements
+    )
+    existing_ids, differing_id = await check_statements(
+        {str(statement_id): statement_as_dict}, current_user.target
+    )
+    # In the case that the current statement is not equivalent to one found
+    # in the database we return a 409, otherwise the usual 204.
+    if differing_id:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="xAPI statements query failed",
-        ) from error
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A different statement already exists with the same ID",
+        )
+    if existing_ids:
+        return
 
-    if existing_statements:
-        # The LRS specification calls for deep comparison of duplicate statement ids.
-        # In the case that the current statement is not equivalent to one found
-        # in the database we return a 409, otherwise the usual 204.
-        for existing in existing_statements:
-            if not statements_are_equivalent(statement_as_dict, existing):
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="A different statement already exists with the same ID",
-                )
+    # The statement has already been written and published with optimistic writes
+    if settings.LRS_OPTIMISTIC_WRITES:
         return
 
     # For valid requests, perform the bulk indexing of all incoming statements
@@ -536,6 +820,7 @@ async def put(
         ) from exc
 
     logger.info("Indexed %d statements with success", success_count)
+    publish_statements([statement_as_dict], current_user.target)
 
 
 @router.post("/", responses=POST_PUT_RESPONSES)
@@ -584,45 +869,31 @@ async def post(
             forward_xapi_statements, list(statements_dict.values()), method="post"
         )
 
-    try:
-        if isinstance(BACKEND_CLIENT, BaseLRSBackend):
-            existing_statements = list(
-                BACKEND_CLIENT.query_statements_by_ids(
-                    ids=list(statements_dict), target=current_user.target
-                )
-            )
-        else:
-            existing_statements = [
-                x
-                async for x in BACKEND_CLIENT.query_statements_by_ids(
-                    ids=list(statements_dict), target=current_user.target
-                )
-            ]
-    except BackendException as error:
+    # With optimistic writes, statements are written first and only compared to
+    # stored ones if their id already exists. Note that other submitted statements
+    # are still written when a differing statement is found.
+    check_statements = (
+        _create_statements
+        if settings.LRS_OPTIMISTIC_WRITES
+        else _query_existing_statements
+    )
+    existing_ids, differing_id = await check_statements(
+        statements_dict, current_user.target
+    )
+    # If they are not exactly the same, we raise an error.
+    if differing_id:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="xAPI statements query failed",
-        ) from error
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Differing statements already exist with the same ID: "
+            f"{differing_id}",
+        )
 
     # If there are duplicate statements, remove them from our id list and
     # dictionary for insertion. We will return the shortened list of ids below
     # so that consumers can derive which statements were inserted and which
     # were skipped for being duplicates.
     # See: https://github.com/openfun/ralph/issues/345
-    if existing_statements:
-        existing_ids = set()
-        for existing in existing_statements:
-            existing_ids.add(existing["id"])
-
-            # The LRS specification calls for deep comparison of duplicates. This
-            # is done here. If they are not exactly the same, we raise an error.
-            if not statements_are_equivalent(statements_dict[existing["id"]], existing):
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="Differing statements already exist with the same ID: "
-                    f"{existing['id']}",
-                )
-
+    if existing_ids:
         # Filter existing statements from the incoming statements
         statements_dict = {
             key: value
@@ -633,6 +904,10 @@ async def post(
             response.status_code = status.HTTP_204_NO_CONTENT
             return
 
+    # New statements have already been written and published with optimistic writes
+    if settings.LRS_OPTIMISTIC_WRITES:
+        return list(statements_dict)
+
     # For valid requests, perform the bulk indexing of all incoming statements
     try:
         success_count = await await_if_coroutine(
@@ -650,6 +925,7 @@ async def post(
         ) from exc
 
     logger.info("Indexed %d statements with success", success_count)
+    publish_statements(statements_dict.values(), current_user.target)
 
     # Return the list of IDs in the same order they were stored
     return list(statements_dict)
@@ -0,0 +1,122 @@
+"""Live xAPI statements subscriptions.
+
+Subscriptions are held in memory: statements are only published to the
+subscriptions of the server process storing them.
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Iterable, Optional, Set
+
+from ralph.backends.lrs.base import RalphStatementsQuery
+from ralph.backends.lrs.fs import FSLRSBackend
+from ralph.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StatementsSubscription:
+    """Subscription to the statements stored by the LRS matching a query.
+
+    Matching statements are queued until they are sent to the subscriber. When a
+    subscriber does not keep up with `LRS_SUBSCRIPTIONS_QUEUE_SIZE` queued
+    statements, its subscription is closed.
+    """
+
+    def __init__(self, params: RalphStatementsQuery, target: Optional[str] = None):
+        """Instantiate the statements subscription.
+
+        Args:
+            params (RalphStatementsQuery): The statements query properties to match.
+                Time and pagination parameters are ignored.
+            target (str or None): The target of the subscribed statements.
+        """
+        self.target = target
+        self.closed = False
+        self._filters = FSLRSBackend.get_statement_filters(params)
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def matches(self, statement: dict) -> bool:
+        """Return `True` if the `statement` matches the subscription query."""
+        return all(query_filter(statement) for query_filter in self._filters)
+
+    def put(self, statement: dict) -> None:
+        """Queue the `statement`, closing the subscription when its queue is full."""
+        if self.closed:
+            return
+
+        if self._queue.qsize() >= settings.LRS_SUBSCRIPTIONS_QUEUE_SIZE:
+            logger.warning("Closing a statements subscription not keeping up")
+            self.close()
+            return
+
+        self._queue.put_nowait(statement)
+
+    def close(self) -> None:
+        """Close the subscription once already queued statements are consumed."""
+        if not self.closed:
+            self.closed = True
+            self._queue.put_nowait(None)
+
+    async def iter_statements(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[dict]:
+        """Yield queued statements until the subscription is closed.
+
+        Args:
+            timeout (float or None): The number of seconds to wait for a statement
+                before yielding an empty dictionary instead.
+                If `timeout` is `None`, wait indefinitely.
+        """
+        while True:
+            try:
+                statement = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield {}
+                continue
+
+            if statement is None:
+                return
+
+            yield statement
+
+
+SUBSCRIPTIONS: Set[StatementsSubscription] = set()
+
+
+def subscribe_statements(
+    params: RalphStatementsQuery, target: Optional[str] = None
+) -> StatementsSubscription:
+    """Return a new subscription to stored statements matching `params`."""
+    subscription = StatementsSubscription(params, target)
+    SUBSCRIPTIONS.add(subscription)
+    logger.debug("Added a statements subscription (%d)", len(SUBSCRIPTIONS))
+    return subscription
+
+
+def unsubscribe_statements(subscription: StatementsSubscription) -> None:
+    """Close and remove the statements `subscription`."""
+    subscription.close()
+    SUBSCRIPTIONS.discard(subscription)
+    logger.debug("Removed a statements subscription (%d)", len(SUBSCRIPTIONS))
+
+
+def publish_statements(statements: Iterable[dict], target: Optional[str]) -> None:
+    """Queue stored `statements` for the matching subscriptions."""
+    if not SUBSCRIPTIONS:
+        return
+
+    statements = list(statements)
+    for subscription in list(SUBSCRIPTIONS):
+        if subscription.target != target:
+            continue
+
+        for statement in statements:
+            if subscription.matches(statement):
+                subscription.put(statement)
+
+
+def close_subscriptions() -> None:
+    """Close all statements subscriptions."""
+    for subscription in list(SUBSCRIPTIONS):
+        unsubscribe_statements(subscription)
@@ -0,0 +1,396 @@
+"""Asynchronous ClickHouse data backend for Ralph."""
+
+import asyncio
+import logging
+from io import IOBase
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import clickhouse_connect
+from clickhouse_connect.datatypes.base import ClickHouseType
+from clickhouse_connect.driver.asyncclient import AsyncClient
+from clickhouse_connect.driver.exceptions import ClickHouseError
+from clickhouse_connect.driver.httputil import get_pool_manager
+from clickhouse_connect.driver.query import QueryResult
+from pydantic import PositiveInt
+
+from ralph.backends.data.base import (
+    AsyncListable,
+    AsyncWritable,
+    BaseAsyncDataBackend,
+    BaseOperationType,
+    DataBackendStatus,
+)
+from ralph.backends.data.clickhouse import (
+    INSERT_SETTINGS,
+    ClickHouseDataBackend,
+    ClickHouseDataBackendSettings,
+    ClickHouseQuery,
+    InsertBatch,
+)
+from ralph.exceptions import BackendException
+from ralph.utils import async_parse_iterable_to_dict, await_if_coroutine
+
+logger = logging.getLogger(__name__)
+Settings = TypeVar("Settings", bound=ClickHouseDataBackendSettings)
+
+
+class AsyncClickHouseDataBackend(
+    BaseAsyncDataBackend[Settings, ClickHouseQuery],
+    AsyncWritable,
+    AsyncListable,
+):
+    """Asynchronous ClickHouse database backend."""
+
+    name = "async_clickhouse"
+    default_operation_type = BaseOperationType.CREATE
+    unsupported_operation_types = {
+        BaseOperationType.APPEND,
+        BaseOperationType.DELETE,
+        BaseOperationType.UPDATE,
+    }
+
+    def __init__(self, settings: Optional[Settings] = None):
+        """Instantiate the asynchronous ClickHouse configuration.
+
+        Args:
+            settings (ClickHouseDataBackendSettings or None): The ClickHouse
+                data backend settings.
+        """
+        super().__init__(settings)
+        self.database = self.settings.DATABASE
+        self._client: Optional[AsyncClient] = None
+        self._insert_column_types: Dict[
+            Tuple[str, Tuple[str, ...]], Sequence[ClickHouseType]
+        ] = {}
+
+    async def get_client(self) -> AsyncClient:
+        """Create an asynchronous ClickHouse client if it doesn't exist.
+
+        The client runs each request in the event loop default executor using a
+        pool of `POOL_SIZE` connections. See `ClickHouseDataBackend.client`.
+        """
+        if not self._client:
+            client = await clickhouse_connect.get_async_client(
+                host=self.settings.HOST,
+                port=self.settings.PORT,
+                database=self.database,
+                settings=self.settings.CLIENT_OPTIONS.model_dump(),
+                pool_mgr=get_pool_manager(maxsize=self.settings.POOL_SIZE),
+                **ClickHouseDataBackend.get_credentials(self.settings),
+            )
+            # Another task might have created the client in the meantime.
+            if self._client:
+                await await_if_coroutine(client.close())
+            else:
+                self._client = client
+        return self._client
+
+    async def status(self) -> DataBackendStatus:
+        """Check ClickHouse connection status.
+
+        Return:
+            DataBackendStatus: The status of the data backend.
+        """
+        try:
+            client = await self.get_client()
+            await client.query("SELECT 1")
+        except ClickHouseError:
+            return DataBackendStatus.AWAY
+
+        return DataBackendStatus.OK
+
+    async def list(
+        self, target: Optional[str] = None, details: bool = False, new: bool = False
+    ) -> Union[AsyncIterator[str], AsyncIterator[dict]]:
+        """List tables for a given database.
+
+        Args:
+            target (str): The database name to list tables from.
+            details (bool): Get detailed table information instead of just table names.
+            new (bool): Ignored.
+
+        Yield:
+            str: The next table name. (If `details` is False).
+            dict: The next table details. (If `details` is True).
+
+        Raise:
+            BackendException: If a failure during table names retrieval occurs.
+        """
+        sql = f"SHOW TABLES FROM {target if target else self.database}"
+
+        try:
+            client = await self.get_client()
+            tables = (await client.query(sql)).named_results()
+        except (ClickHouseError, IndexError, TypeError, ValueError) as error:
+            msg = "Failed to read tables: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+        if new:
+            logger.warning("The `new` argument is ignored")
+
+        for table in tables:
+            if details:
+                yield table
+            else:
+                yield str(table.get("name"))
+
+    async def read(  # noqa: PLR0913
+        self,
+        query: Optional[ClickHouseQuery] = None,
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        raw_output: bool = False,
+        ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
+        max_statements: Optional[PositiveInt] = None,
+    ) -> Union[AsyncIterator[bytes], AsyncIterator[dict]]:
+        """Read documents matching the query in the target table and yield them.
+
+        Args:
+            query (ClickHouseQuery): The query to use when fetching documents.
+            target (str or None): The target table name to query.
+                If target is `None`, the `EVENT_TABLE_NAME` is used instead.
+            chunk_size (int or None): The chunk size when reading documents by batches.
+                If `chunk_size` is `None` it defaults to `READ_CHUNK_SIZE`.
+            raw_output (bool): Controls whether to yield dictionaries or bytes.
+            ignore_errors (bool): If `True`, encoding errors during the read operation
+                will be ignored and logged.
+                If `False` (default), a `BackendException` is raised on any error.
+            prefetch (int): The number of records to prefetch (queue) while yielding.
+                If `prefetch` is `None` it defaults to `1`, i.e. no records are
+                prefetched.
+            max_statements (int): The maximum number of statements to yield.
+                If `None` (default) or `0`, there is no maximum.
+
+        Yield:
+            bytes: The next raw document if `raw_output` is True.
+            dict: The next JSON parsed document if `raw_output` is False.
+
+        Raise:
+            BackendException: If a failure occurs during ClickHouse connection or
+                during encoding documents and `ignore_errors` is set to `False`.
+        """
+        statements = super().read(
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
+        )
+        async for statement in statements:
+            yield statement
+
+    async def _read_bytes(
+        self,
+        query: ClickHouseQuery,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+    ) -> AsyncIterator[bytes]:
+        """Method called by `self.read` yielding bytes. See `self.read`.
+
+        The `event` column already holds a JSON document, thus it is written as is
+        in the output, without being decoded and encoded back.
+        """
+        locale = self.settings.LOCALE_ENCODING
+        i = 0
+        async for column_names, row in self._read_rows(query, target, chunk_size):
+            try:
+                yield ClickHouseDataBackend.to_raw_document(column_names, row, locale)
+            except (TypeError, ValueError) as error:
+                msg = "Failed to encode JSON: %s, for document: %s, at line %s"
+                if not ignore_errors:
+                    logger.error(msg, error, row, i)
+                    raise BackendException(msg % (error, row, i)) from error
+                logger.warning(msg, error, row, i)
+            i += 1
+
+    async def _read_dicts(
+        self,
+        query: ClickHouseQuery,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+    ) -> AsyncIterator[dict]:
+        """Method called by `self.read` yielding dictionaries. See `self.read`."""
+        rows = self._read_rows(query, target, chunk_size)
+        documents = (dict(zip(column_names, row)) async for column_names, row in rows)
+        async for document in async_parse_iterable_to_dict(
+            documents, ignore_errors, ClickHouseDataBackend.parse_event_json
+        ):
+            yield document
+
+    async def _read_rows(
+        self, query: ClickHouseQuery, target: Optional[str], chunk_size: int
+    ) -> AsyncIterator[Tuple[Sequence[str], Sequence[Any]]]:
+        """Yield the column names and values of each row matching the `query`.
+
+        Blocks of `chunk_size` rows are received in the event loop default executor,
+        thus only one block is held in memory at a time.
+        """
+        target = target if target else self.settings.EVENT_TABLE_NAME
+        sql = ClickHouseDataBackend.get_sql(query, target)
+        msg = "Start reading the %s table of the %s database (chunk size: %d)"
+        logger.debug(msg, target, self.database, chunk_size)
+        loop = asyncio.get_running_loop()
+        try:
+            client = await self.get_client()
+            stream = await client.query_row_block_stream(
+                sql,
+                parameters=query.parameters,
+                settings={"max_block_size": chunk_size},
+            )
+            with stream:
+                column_names = cast(QueryResult, stream.source).column_names
+                while True:
+                    block = await loop.run_in_executor(None, next, stream, None)
+                    if block is None:
+                        break
+                    for row in block:
+                        yield column_names, row
+        except (ClickHouseError, IndexError, TypeError, ValueError) as error:
+            msg = "Failed to read documents: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+    async def write(  # noqa: PLR0913
+        self,
+        data: Union[IOBase, Iterable[bytes], Iterable[dict]],
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        ignore_errors: bool = False,
+        operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
+    ) -> int:
+        """Write `data` documents to the `target` table and return their count.
+
+        Args:
+            data (Iterable or IOBase): The data containing documents to write.
+            target (str or None): The target table name.
+                If target is `None`, the `EVENT_TABLE_NAME` is used instead.
+            chunk_size (int or None): The number of documents to write in one batch.
+                If `chunk_size` is `None` it defaults to `WRITE_CHUNK_SIZE`.
+            ignore_errors (bool): If `True`, errors during decoding, encoding and
+                sending batches of documents are ignored and logged.
+                If `False` (default), a `BackendException` is raised on any error.
+            operation_type (BaseOperationType or None): The mode of the write operation.
+                If `operation_type` is `None`, the `default_operation_type` is used
+                instead. See `BaseOperationType`.
+            concurrency (int): The number of chunks to write concurrently.
+                If `None` it defaults to `WRITE_CONCURRENCY`.
+
+        Return:
+            int: The number of documents written.
+
+        Raise:
+            BackendException: If any failure occurs during the write operation or
+                if an inescapable failure occurs and `ignore_errors` is set to `True`.
+            BackendParameterException: If the `operation_type` is `APPEND`, `UPDATE`
+                or `DELETE` as it is not supported.
+        """
+        if concurrency is None:
+            concurrency = self.settings.WRITE_CONCURRENCY
+        return await super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
+
+    async def _write_dicts(
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,  # noqa: ARG002
+    ) -> int:
+        """Method called by `self.write` writing dictionaries. See `self.write`."""
+        count = 0
+        target = target if target else self.settings.EVENT_TABLE_NAME
+        msg = "Start writing to the %s table of the %s database (chunk size: %d)"
+        logger.debug(msg, target, self.database, chunk_size)
+        batches = ClickHouseDataBackend.to_insert_columns(
+            data, chunk_size, ignore_errors
+        )
+        for batch in batches:
+            count += await self._bulk_import(batch, ignore_errors, target)
+
+        logger.info("Inserted a total of %d documents with success", count)
+        return count
+
+    async def close(self) -> None:
+        """Close the asynchronous ClickHouse backend client.
+
+        Raise:
+            BackendException: If a failure occurs during the close operation.
+        """
+        if not self._client:
+            logger.warning("No backend client to close.")
+            return
+
+        try:
+            await await_if_coroutine(self._client.close())
+        except ClickHouseError as error:
+            msg = "Failed to close ClickHouse client: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+    async def _get_insert_column_types(
+        self, target: str, column_names: Tuple[str, ...]
+    ) -> Sequence[ClickHouseType]:
+        """Return the types of the `target` table insert `column_names`.
+
+        See `ClickHouseDataBackend._get_insert_column_types`.
+        """
+        key = (target, column_names)
+        if key not in self._insert_column_types:
+            client = await self.get_client()
+            context = await client.create_insert_context(target, column_names)
+            self._insert_column_types[key] = context.column_types
+
+        return self._insert_column_types[key]
+
+    async def _bulk_import(
+        self, batch: InsertBatch, ignore_errors: bool, event_table_name: str
+    ) -> int:
+        """Insert a batch of documents into the selected database table."""
+        try:
+            if len(set(batch.event_id)) != len(batch.event_id):
+                raise BackendException("Duplicate IDs found in batch")
+
+            client = await self.get_client()
+            await client.insert(
+                event_table_name,
+                batch,
+                column_names=batch._fields,
+                column_types=await self._get_insert_column_types(
+                    event_table_name, batch._fields
+                ),
+                column_oriented=True,
+                settings=INSERT_SETTINGS,
+            )
+        except (ClickHouseError, BackendException) as error:
+            if not ignore_errors:
+                raise BackendException(*error.args) from error
+            msg = "Bulk import failed for current chunk but you choose to ignore it."
+            logger.warning(msg)
+            # There is no current way of knowing how many rows from the batch
+            # succeeded, we assume 0 here.
+            return 0
+
+        inserted_count = len(batch.event_id)
+        logger.debug("Inserted %d documents chunk with success", inserted_count)
+
+        return inserted_count
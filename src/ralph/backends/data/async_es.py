@@ -1,8 +1,9 @@
 """Asynchronous Elasticsearch data backend for Ralph."""
 
 import logging
+from asyncio import Queue, create_task
 from io import IOBase
-from typing import AsyncIterator, Iterable, Optional, TypeVar, Union
+from typing import AsyncIterator, Iterable, List, Optional, TypeVar, Union
 
 from elasticsearch import ApiError, AsyncElasticsearch, TransportError
 from elasticsearch.helpers import BulkIndexError, async_streaming_bulk
@@ -15,7 +16,12 @@ from ralph.backends.data.base import (
     BaseOperationType,
     DataBackendStatus,
 )
-from ralph.backends.data.es import ESDataBackend, ESDataBackendSettings, ESQuery
+from ralph.backends.data.es import (
+    SLICE_QUEUE_SIZE,
+    ESDataBackend,
+    ESDataBackendSettings,
+    ESQuery,
+)
 from ralph.exceptions import BackendException
 
 logger = logging.getLogger(__name__)
@@ -178,8 +184,21 @@ class AsyncESDataBackend(
                 logger.error(msg, error)
                 raise BackendException(msg % error) from error
 
-        limit = query.size
-        kwargs = query.model_dump()
+        if query.slices and query.slices > 1:
+            async for document in self._read_slices(query, query.slices, chunk_size):
+                yield document
+            return
+
+        kwargs = ESDataBackend.get_search_kwargs(query)
+        async for documents in self._search(kwargs, query.size, chunk_size):
+            query.search_after = kwargs["search_after"]
+            for document in documents:
+                yield document
+
+    async def _search(
+        self, kwargs: dict, limit: Optional[int], chunk_size: int
+    ) -> AsyncIterator[List[dict]]:
+        """Yield pages of documents using `search_after` to paginate `kwargs`."""
         count = chunk_size
         # The first condition is set to comprise either limit as None
         # (when the backend query does not have `size` parameter),
@@ -195,12 +214,78 @@ class AsyncESDataBackend(
             count = len(documents)
             if limit:
                 limit -= count if chunk_size == count else limit
-            query.search_after = None
+            kwargs["search_after"] = None
             if count:
-                query.search_after = [str(part) for part in documents[-1]["sort"]]
-            kwargs["search_after"] = query.search_after
-            for document in documents:
+                kwargs["search_after"] = [str(part) for part in documents[-1]["sort"]]
+            yield documents
+
+    async def _read_slices(
+        self, query: ESQuery, slices: int, chunk_size: int
+    ) -> AsyncIterator[dict]:
+        """Read the point in time slices concurrently, each one in its own task."""
+        reverse = False
+        if query.ordered_slices:
+            reverse = ESDataBackend.is_sort_descending(query.sort)
+            queues: List[Queue] = [Queue(SLICE_QUEUE_SIZE) for _ in range(slices)]
+        else:
+            queues = [Queue(SLICE_QUEUE_SIZE * slices)] * slices
+
+        async def read_slice(slice_id: int, queue: Queue) -> None:
+            """Put the pages of the `slice_id` slice into the `queue`."""
+            kwargs = ESDataBackend.get_search_kwargs(query)
+            kwargs["slice"] = {"id": slice_id, "max": slices}
+            try:
+                async for documents in self._search(kwargs, query.size, chunk_size):
+                    await queue.put(documents)
+            except Exception as error:  # noqa: BLE001
+                await queue.put(error)
+                return
+            # None signals that the slice is done
+            await queue.put(None)
+
+        async def get(queue: Queue, pending: int) -> AsyncIterator[dict]:
+            """Yield documents from the `queue` until `pending` slices are done."""
+            while pending:
+                documents = await queue.get()
+                if isinstance(documents, Exception):
+                    raise documents
+                if documents is None:
+                    pending -= 1
+                    continue
+                for document in documents:
+                    yield document
+
+        async def merge() -> AsyncIterator[dict]:
+            """Yield documents from all slices following the `sort` order."""
+            readers = [get(queue, 1) for queue in queues]
+            heads = {}
+            for slice_id, documents in enumerate(readers):
+                async for document in documents:
+                    heads[slice_id] = document
+                    break
+            select = max if reverse else min
+            while heads:
+                slice_id = select(heads, key=lambda key: heads[key]["sort"])
+                yield heads.pop(slice_id)
+                async for document in readers[slice_id]:
+                    heads[slice_id] = document
+                    break
+
+        documents = merge() if query.ordered_slices else get(queues[0], slices)
+        tasks = [
+            create_task(read_slice(slice_id, queue))
+            for slice_id, queue in enumerate(queues)
+        ]
+        count = 0
+        try:
+            async for document in documents:
                 yield document
+                count += 1
+                if count == query.size:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def write(  # noqa: PLR0913
         self,
@@ -1,8 +1,9 @@
 """Async LRS data backend for Ralph."""
 
+import asyncio
 import logging
 from io import IOBase
-from typing import AsyncIterator, Iterable, Optional, Union
+from typing import AsyncIterator, Iterable, List, Optional, Union
 from urllib.parse import ParseResult, parse_qs, urljoin, urlparse
 
 from httpx import AsyncClient, HTTPError, HTTPStatusError, RequestError
@@ -14,10 +15,14 @@ from ralph.backends.data.base import (
     BaseOperationType,
     DataBackendStatus,
 )
-from ralph.backends.data.lrs import LRSDataBackendSettings, StatementResponse
+from ralph.backends.data.lrs import (
+    LRSDataBackend,
+    LRSDataBackendSettings,
+    StatementResponse,
+)
 from ralph.backends.lrs.base import LRSStatementsQuery
 from ralph.exceptions import BackendException
-from ralph.utils import iter_by_batch
+from ralph.utils import gather_with_limited_concurrency, iter_by_batch
 
 logger = logging.getLogger(__name__)
 
@@ -52,8 +57,8 @@ class AsyncLRSDataBackend(
     def client(self) -> AsyncClient:
         """Create a `httpx.AsyncClient` if it doesn't exist."""
         if not self._client:
-            headers = self.settings.HEADERS.model_dump(by_alias=True)
-            self._client = AsyncClient(auth=self.auth, headers=headers)
+            options = LRSDataBackend.get_client_options(self.settings)
+            self._client = AsyncClient(**options)
         return self._client
 
     async def status(self) -> DataBackendStatus:
@@ -167,7 +172,7 @@ class AsyncLRSDataBackend(
         chunk_size: Optional[int] = None,
         ignore_errors: bool = False,
         operation_type: Optional[BaseOperationType] = None,
-        concurrency: Optional[int] = None,
+        concurrency: Optional[PositiveInt] = None,
     ) -> int:
         """Write `data` records to the `target` endpoint and return their count.
 
@@ -184,9 +189,11 @@ class AsyncLRSDataBackend(
             operation_type (BaseOperationType or None): The mode of the write operation.
                 If `operation_type` is `None`, the `default_operation_type` is used
                 instead. See `BaseOperationType`.
-            concurrency (int): The number of chunks to write concurrently.
-                If `None` it defaults to `1`.
+            concurrency (int or None): The number of chunks posted concurrently.
+                If `concurrency` is `None` it defaults to `WRITE_CONCURRENCY`.
         """
+        if concurrency is None:
+            concurrency = self.settings.WRITE_CONCURRENCY
         return await super().write(
             data, target, chunk_size, ignore_errors, operation_type, concurrency
         )
@@ -235,34 +242,203 @@ class AsyncLRSDataBackend(
 
         await self.client.aclose()
 
-    async def _fetch_statements(self, target, query_params: dict):
-        """Fetch statements from a LRS."""
-        while True:
-            response = await self.client.get(target, params=query_params)
-            response.raise_for_status()
-            statements_response = StatementResponse(**response.json())
-            statements = statements_response.statements
-            if isinstance(statements, dict):
-                statements = [statements]
+    async def _fetch_statements(
+        self, target: str, query_params: dict
+    ) -> AsyncIterator[dict]:
+        """Fetch statements from a LRS.
+
+        Up to `READ_AHEAD` next pages are fetched in a background task while
+        yielding the statements of the current page.
+        """
+        if self.settings.READ_PARTITIONS > 1:
+            if query_params.get("since") and query_params.get("until"):
+                partitions = self._fetch_partitioned_statements(target, query_params)
+                async for statement in partitions:
+                    yield statement
+                return
+            logger.warning(
+                "Reading statements sequentially as the query has no `since` and "
+                "`until` parameters"
+            )
 
+        pages = self._fetch_pages(target, query_params)
+        if self.settings.READ_AHEAD:
+            pages = self._queue_pages([pages], self.settings.READ_AHEAD)
+
+        async for statements in pages:
             for statement in statements:
                 yield statement
 
-            if not statements_response.more:
+    async def _fetch_partitioned_statements(
+        self, target: str, query_params: dict
+    ) -> AsyncIterator[dict]:
+        """Fetch statements from a LRS, reading time windows concurrently.
+
+        See `LRSDataBackend._fetch_partitioned_statements`.
+        """
+        ascending = bool(query_params.get("ascending"))
+        windows = LRSDataBackend.get_time_windows(
+            query_params["since"],
+            query_params["until"],
+            self.settings.READ_PARTITIONS,
+            ascending,
+        )
+        responses: List[Optional[StatementResponse]] = [None] * len(windows)
+        for _ in range(self.settings.READ_PARTITIONS_SPLIT_DEPTH):
+            pending = [index for index, page in enumerate(responses) if page is None]
+            first_pages = await gather_with_limited_concurrency(
+                min(self.settings.READ_PARTITIONS, self.settings.POOL_SIZE),
+                *(
+                    self._fetch_page(
+                        target,
+                        LRSDataBackend.get_time_window_params(
+                            query_params, windows[index]
+                        ),
+                    )
+                    for index in pending
+                ),
+            )
+            for index, page in zip(pending, first_pages):
+                responses[index] = page
+            windows, responses = LRSDataBackend.split_time_windows(
+                windows, responses, ascending
+            )
+            if None not in responses:
                 break
 
-            query_params.update(parse_qs(urlparse(statements_response.more).query))
+        logger.debug("Reading statements from %d time windows", len(windows))
+        semaphore = asyncio.BoundedSemaphore(self.settings.POOL_SIZE)
+        pages = [
+            self._fetch_pages(
+                target,
+                LRSDataBackend.get_time_window_params(query_params, window),
+                response,
+                semaphore,
+            )
+            for window, response in zip(windows, responses)
+        ]
+        size = self.settings.READ_AHEAD if self.settings.READ_AHEAD else 1
+        ordered = self.settings.READ_PARTITIONS_ORDERED
+        async for statements in self._queue_pages(pages, size, ordered):
+            for statement in statements:
+                yield statement
+
+    async def _queue_pages(
+        self, pages: List[AsyncIterator[List[dict]]], size: int, ordered: bool = True
+    ) -> AsyncIterator[List[dict]]:
+        """Iterate concurrently over `pages` iterators, each one in a background task.
+
+        Up to `size` pages of each iterator are queued ahead. If `ordered` is `True`,
+        the pages of each iterator are yielded after the pages of the previous ones,
+        else they are yielded as soon as they are fetched.
+        """
+        queues: List[asyncio.Queue]
+        if ordered:
+            queues = [asyncio.Queue(size) for _ in pages]
+            tasks = [
+                asyncio.create_task(self._queue_records(queue, iterator))
+                for queue, iterator in zip(queues, pages)
+            ]
+            producer_counts = [1] * len(queues)
+        else:
+            queues = [asyncio.Queue(size * len(pages))]
+            tasks = [
+                asyncio.create_task(self._queue_records(queues[0], iterator))
+                for iterator in pages
+            ]
+            producer_counts = [len(pages)]
 
-    async def _post_and_raise_for_status(self, target, chunk, ignore_errors):
-        """POST chunk of statements to `target` and return the number of insertions."""
         try:
-            request = await self.client.post(target, json=chunk)
-            request.raise_for_status()
-            return len(chunk)
-        except HTTPError as error:
-            msg = "Failed to post statements: %s"
-            if ignore_errors:
-                logger.warning(msg, error)
-                return 0
-            logger.error(msg, error)
-            raise BackendException(msg % (error,)) from error
+            for queue, producer_count in zip(queues, producer_counts):
+                remaining = producer_count
+                while remaining:
+                    statements = await queue.get()
+                    if statements is not None:
+                        yield statements
+                        continue
+
+                    # None signals that a task is done, possibly with an error.
+                    for task in tasks:
+                        if not task.done() or task.cancelled():
+                            continue
+                        if error := task.exception():
+                            raise error
+                    remaining -= 1
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_pages(
+        self,
+        target: str,
+        query_params: dict,
+        response: Optional[StatementResponse] = None,
+        semaphore: Optional[asyncio.BoundedSemaphore] = None,
+    ) -> AsyncIterator[List[dict]]:
+        """Fetch pages of statements from a LRS, following the `more` IRL.
+
+        If `response` is set, it is used as the first page. If `semaphore` is set,
+        it is acquired while fetching each page.
+        """
+        while True:
+            if response is None:
+                response = await self._fetch_limited_page(
+                    target, query_params, semaphore
+                )
+
+            statements = response.statements
+            yield statements if isinstance(statements, list) else [statements]
+
+            if not response.more:
+                break
+
+            query_params.update(parse_qs(urlparse(response.more).query))
+            response = None
+
+    async def _fetch_limited_page(
+        self,
+        target: str,
+        query_params: dict,
+        semaphore: Optional[asyncio.BoundedSemaphore],
+    ) -> StatementResponse:
+        """Fetch a page of statements from a LRS, acquiring `semaphore` if set."""
+        if semaphore is None:
+            return await self._fetch_page(target, query_params)
+
+        async with semaphore:
+            return await self._fetch_page(target, query_params)
+
+    async def _fetch_page(self, target: str, query_params: dict) -> StatementResponse:
+        """Fetch a page of statements from a LRS."""
+        response = await self.client.get(target, params=query_params)
+        response.raise_for_status()
+        return StatementResponse.from_response(response.json())
+
+    async def _post_and_raise_for_status(
+        self, target: str, chunk: List[dict], ignore_errors: bool
+    ) -> int:
+        """POST chunk of statements to `target` and return the number of insertions.
+
+        Failed requests are retried with backoff. See
+        `LRSDataBackend.get_retry_delay`.
+        """
+        options = LRSDataBackend.get_post_options(chunk, self.settings)
+        attempt = 0
+        while True:
+            try:
+                request = await self.client.post(target, **options)
+                request.raise_for_status()
+                return len(chunk)
+            except HTTPError as error:
+                delay = LRSDataBackend.get_retry_delay(error, attempt, self.settings)
+                if delay is None:
+                    msg = "Failed to post statements: %s"
+                    if ignore_errors:
+                        logger.warning(msg, error)
+                        return 0
+                    logger.error(msg, error)
+                    raise BackendException(msg % (error,)) from error
+                logger.warning("Retrying to post statements in %ss: %s", delay, error)
+
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -38,6 +38,8 @@ class AsyncMongoDataBackend(
 
     name = "async_mongo"
     unsupported_operation_types = {BaseOperationType.APPEND}
+    to_documents = staticmethod(MongoDataBackend.to_documents)
+    to_replace_one = staticmethod(MongoDataBackend.to_replace_one)
 
     def __init__(self, settings: Optional[Settings] = None):
         """Instantiate the asynchronous MongoDB client.
@@ -210,7 +212,7 @@ class AsyncMongoDataBackend(
                 If `operation_type` is `None`, the `default_operation_type` is used
                     instead. See `BaseOperationType`.
             concurrency (int): The number of chunks to write concurrently.
-                If `None` it defaults to `1`.
+                If `None` it defaults to `WRITE_CONCURRENCY`.
 
         Return:
             int: The number of documents written.
@@ -221,6 +223,8 @@ class AsyncMongoDataBackend(
             BackendParameterException: If the `operation_type` is `APPEND` as it is not
                 supported.
         """
+        if concurrency is None:
+            concurrency = self.settings.WRITE_CONCURRENCY
         return await super().write(
             data, target, chunk_size, ignore_errors, operation_type, concurrency
         )
@@ -236,10 +240,13 @@ class AsyncMongoDataBackend(
         """Method called by `self.write` writing dictionaries. See `self.write`."""
         count = 0
         collection = self._get_target_collection(target)
+        write_concern = MongoDataBackend.get_write_concern(self.settings)
+        if write_concern:
+            collection = collection.with_options(write_concern=write_concern)
         msg = "Start writing to the %s collection of the %s database (chunk size: %d)"
         logger.debug(msg, collection, self.database, chunk_size)
         if operation_type == BaseOperationType.UPDATE:
-            data = MongoDataBackend.to_replace_one(data)
+            data = self.to_replace_one(data)
             for batch in iter_by_batch(data, chunk_size):
                 count += await self._bulk_update(batch, ignore_errors, collection)
             logger.info("Updated %d documents with success", count)
@@ -248,7 +255,7 @@ class AsyncMongoDataBackend(
                 count += await self._bulk_delete(batch, ignore_errors, collection)
             logger.info("Deleted %d documents with success", count)
         else:
-            data = MongoDataBackend.to_documents(data, ignore_errors, operation_type)
+            data = self.to_documents(data, ignore_errors, operation_type)
             for batch in iter_by_batch(data, chunk_size):
                 count += await self._bulk_import(batch, ignore_errors, collection)
             logger.info("Inserted %d documents with success", count)
@@ -284,12 +291,14 @@ class AsyncMongoDataBackend(
     ):
         """Insert a batch of documents into the selected database collection."""
         try:
-            new_documents = await collection.insert_many(batch)
+            new_documents = await collection.insert_many(
+                batch, ordered=self.settings.WRITE_ORDERED
+            )
         except (BulkWriteError, PyMongoError, BSONError, ValueError) as error:
             msg = "Failed to insert document chunk: %s"
             if ignore_errors:
                 logger.warning(msg, error)
-                return getattr(error, "details", {}).get("nInserted", 0)
+                return MongoDataBackend.get_bulk_write_count(error, "nInserted")
             raise BackendException(msg % error) from error
 
         inserted_count = len(new_documents.inserted_ids)
@@ -320,12 +329,14 @@ class AsyncMongoDataBackend(
     ):
         """Update a batch of documents into the selected database collection."""
         try:
-            updated_documents = await collection.bulk_write(batch)
+            updated_documents = await collection.bulk_write(
+                batch, ordered=self.settings.WRITE_ORDERED
+            )
         except (BulkWriteError, PyMongoError, BSONError, ValueError) as error:
             msg = "Failed to update document chunk: %s"
             if ignore_errors:
                 logger.warning(msg, error)
-                return getattr(error, "details", {}).get("nModified", 0)
+                return MongoDataBackend.get_bulk_write_count(error, "nModified")
             logger.error(msg, error)
             raise BackendException(msg % error) from error
 
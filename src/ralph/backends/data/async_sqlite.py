@@ -0,0 +1,262 @@
+"""Asynchronous SQLite data backend for Ralph."""
+
+import asyncio
+import logging
+from functools import partial
+from io import IOBase
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from pydantic import PositiveInt
+
+from ralph.backends.data.base import (
+    AsyncListable,
+    AsyncWritable,
+    BaseAsyncDataBackend,
+    BaseOperationType,
+    DataBackendStatus,
+)
+from ralph.backends.data.sqlite import (
+    SQLiteDataBackend,
+    SQLiteDataBackendSettings,
+    SQLiteQuery,
+)
+from ralph.utils import iter_by_batch
+
+logger = logging.getLogger(__name__)
+Settings = TypeVar("Settings", bound=SQLiteDataBackendSettings)
+T = TypeVar("T")
+
+
+class AsyncSQLiteDataBackend(
+    BaseAsyncDataBackend[Settings, SQLiteQuery],
+    AsyncWritable,
+    AsyncListable,
+):
+    """Asynchronous SQLite data backend.
+
+    Operations of a `SQLiteDataBackend` are run in the event loop default executor,
+    as the `sqlite3` module only provides blocking calls.
+    """
+
+    name = "async_sqlite"
+    unsupported_operation_types = {BaseOperationType.APPEND}
+    sync_backend_class: Type[SQLiteDataBackend] = SQLiteDataBackend
+
+    def __init__(self, settings: Optional[Settings] = None):
+        """Instantiate the asynchronous SQLite data backend.
+
+        Args:
+            settings (SQLiteDataBackendSettings or None): The data backend settings.
+                If `settings` is `None`, a default settings instance is used instead.
+        """
+        super().__init__(settings)
+        self.backend = self.sync_backend_class(self.settings)
+
+    async def status(self) -> DataBackendStatus:
+        """Check the SQLite database status.
+
+        Return:
+            DataBackendStatus: The status of the data backend.
+        """
+        return await self._run(self.backend.status)
+
+    async def list(
+        self, target: Optional[str] = None, details: bool = False, new: bool = False
+    ) -> Union[AsyncIterator[str], AsyncIterator[dict]]:
+        """List tables of the SQLite database.
+
+        Args:
+            target (str or None): Ignored.
+            details (bool): Get detailed table information instead of just names.
+            new (bool): Ignored.
+
+        Yield:
+            str: The next table name. (If `details` is False).
+            dict: The next table details. (If `details` is True).
+
+        Raise:
+            BackendException: If a failure occurs during the list operation.
+        """
+        tables = cast(
+            Iterator[Union[str, dict]], self.backend.list(target, details, new)
+        )
+        async for table in self._iterate(tables, self.settings.READ_CHUNK_SIZE):
+            yield table
+
+    async def read(  # noqa: PLR0913
+        self,
+        query: Optional[SQLiteQuery] = None,
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        raw_output: bool = False,
+        ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
+        max_statements: Optional[PositiveInt] = None,
+    ) -> Union[AsyncIterator[bytes], AsyncIterator[dict]]:
+        """Read rows matching the `query` in the `target` table and yield them.
+
+        Args:
+            query (SQLiteQuery): The query to use when fetching rows.
+            target (str or None): The target table name to query.
+                If target is `None`, the `DEFAULT_TABLE` is used instead.
+            chunk_size (int or None): The number of rows fetched at once.
+                If `chunk_size` is `None` it defaults to `READ_CHUNK_SIZE`.
+            raw_output (bool): Controls whether to yield dictionaries or bytes.
+            ignore_errors (bool): If `True`, encoding errors during the read operation
+                will be ignored and logged.
+                If `False` (default), a `BackendException` is raised on any error.
+            prefetch (int): The number of records to prefetch (queue) while yielding.
+                If `prefetch` is `None` it defaults to `1`, i.e. no records are
+                prefetched.
+            max_statements (int): The maximum number of statements to yield.
+                If `None` (default) or `0`, there is no maximum.
+
+        Yield:
+            bytes: The next raw row if `raw_output` is True.
+            dict: The next row, with a JSON parsed `statement`, if `raw_output` is
+                False.
+
+        Raise:
+            BackendException: If a failure occurs during the SQLite query or
+                during encoding rows and `ignore_errors` is set to `False`.
+            BackendParameterException: If the `target` is not a valid table name.
+        """
+        statements = super().read(
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
+        )
+        async for statement in statements:
+            yield statement
+
+    async def _read_bytes(
+        self,
+        query: SQLiteQuery,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+    ) -> AsyncIterator[bytes]:
+        """Method called by `self.read` yielding bytes. See `self.read`."""
+        rows = cast(
+            Iterator[bytes],
+            self.backend.read(query, target, chunk_size, True, ignore_errors),
+        )
+        async for row in self._iterate(rows, chunk_size):
+            yield row
+
+    async def _read_dicts(
+        self,
+        query: SQLiteQuery,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+    ) -> AsyncIterator[dict]:
+        """Method called by `self.read` yielding dictionaries. See `self.read`."""
+        rows = cast(
+            Iterator[dict],
+            self.backend.read(query, target, chunk_size, False, ignore_errors),
+        )
+        async for row in self._iterate(rows, chunk_size):
+            yield row
+
+    async def write(  # noqa: PLR0913
+        self,
+        data: Union[IOBase, Iterable[bytes], Iterable[dict]],
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        ignore_errors: bool = False,
+        operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
+    ) -> int:
+        """Write `data` statements to the `target` table and return their count.
+
+        Args:
+            data (Iterable or IOBase): The data containing statements to write.
+            target (str or None): The target table name.
+                If target is `None`, the `DEFAULT_TABLE` is used instead.
+            chunk_size (int or None): The number of statements written in one
+                transaction.
+                If `chunk_size` is `None` it defaults to `WRITE_CHUNK_SIZE`.
+            ignore_errors (bool): If `True`, invalid statements are skipped and
+                statements with an already stored id are ignored.
+                If `False` (default), a `BackendException` is raised on any error.
+            operation_type (BaseOperationType or None): The mode of the write operation.
+                If `operation_type` is `None`, the `default_operation_type` is used
+                instead. See `BaseOperationType`.
+            concurrency (int): The number of chunks to write concurrently.
+                If `None` it defaults to `1`.
+
+        Return:
+            int: The number of statements written.
+
+        Raise:
+            BackendException: If any failure occurs during the write operation or
+                if an inescapable failure occurs and `ignore_errors` is set to `True`.
+            BackendParameterException: If the `operation_type` is `APPEND` as it is not
+                supported or if the `target` is not a valid table name.
+        """
+        return await super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
+
+    async def _write_dicts(
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+    ) -> int:
+        """Method called by `self.write` writing dictionaries. See `self.write`."""
+        return await self._run(
+            self.backend.write,
+            data,
+            target,
+            chunk_size,
+            ignore_errors,
+            operation_type,
+        )
+
+    async def close(self) -> None:
+        """Close the SQLite connections.
+
+        Raise:
+            BackendException: If a failure occurs during the close operation.
+        """
+        await self._run(self.backend.close)
+
+    @staticmethod
+    async def _run(function: Callable[..., T], *args: Any) -> T:
+        """Return the result of `function` called with `args` in the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(function, *args))
+
+    @staticmethod
+    async def _iterate(iterator: Iterator[T], chunk_size: int) -> AsyncIterator[T]:
+        """Yield the items of `iterator`, fetched by chunks in the executor."""
+        batches = iter(iter_by_batch(iterator, chunk_size))
+
+        def next_batch() -> List[T]:
+            """Return the next batch of items or an empty list when exhausted."""
+            return next(batches, [])
+
+        loop = asyncio.get_running_loop()
+        while batch := await loop.run_in_executor(None, next_batch):
+            for item in batch:
+                yield item
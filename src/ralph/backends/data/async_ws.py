@@ -1,10 +1,13 @@
 """Websocket stream backend for Ralph."""
 
+import asyncio
 import logging
-from typing import AsyncIterator, Optional, Union
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, List, Optional, Union
 
 import websockets
-from pydantic import AnyUrl, PositiveInt
+from pydantic import AnyUrl, NonNegativeFloat, NonNegativeInt, PositiveInt
 from pydantic_settings import SettingsConfigDict
 from websockets.http11 import USER_AGENT
 
@@ -66,6 +69,15 @@ class WSDataBackendSettings(BaseDataBackendSettings):
     Attributes:
         CLIENT_OPTIONS (dict): A dictionary of valid options for the websocket client
             connection. See `WSClientOptions`.
+        READ_BUFFER_SIZE (int): The maximum number of chunks of messages received
+            ahead of the consumer. Once reached, messages are no longer received,
+            applying backpressure to the websocket server.
+        READ_MAX_LATENCY (float): The maximum number of seconds to wait for more
+            messages before yielding an incomplete chunk of messages.
+        RECONNECT_ATTEMPTS (int): The number of successive attempts to re-open an
+            abnormally closed websocket connection before failing.
+        RECONNECT_BACKOFF (float): The number of seconds to wait before the first
+            reconnection attempt, doubled on each subsequent attempt.
         URI (str): The URI to connect to.
     """
 
@@ -75,9 +87,48 @@ class WSDataBackendSettings(BaseDataBackendSettings):
     }
 
     CLIENT_OPTIONS: WSClientOptions = WSClientOptions()
+    READ_BUFFER_SIZE: PositiveInt = 10
+    READ_MAX_LATENCY: NonNegativeFloat = 0.1
+    RECONNECT_ATTEMPTS: NonNegativeInt = 0
+    RECONNECT_BACKOFF: NonNegativeFloat = 1.0
     URI: AnyUrl
 
 
+@dataclass
+class WSConnectionStats:
+    """Throughput counters of a websocket connection.
+
+    Attributes:
+        uri (str): The URI of the websocket connection.
+        messages (int): The number of received messages.
+        size (int): The total length of received messages (characters for text
+            messages, bytes for binary messages).
+        chunks (int): The number of chunks of messages received.
+        opened_at (float): The `time.monotonic` value when the connection opened.
+        closed_at (float or None): The `time.monotonic` value when the connection
+            closed, or `None` if it is still open.
+    """
+
+    uri: str
+    messages: int = 0
+    size: int = 0
+    chunks: int = 0
+    opened_at: float = field(default_factory=time.monotonic)
+    closed_at: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        """Return the number of seconds the connection has been open."""
+        closed_at = self.closed_at if self.closed_at else time.monotonic()
+        return closed_at - self.opened_at
+
+    @property
+    def rate(self) -> float:
+        """Return the number of messages received per second."""
+        duration = self.duration
+        return self.messages / duration if duration else 0.0
+
+
 class AsyncWSDataBackend(BaseAsyncDataBackend[WSDataBackendSettings, str]):
     """Websocket stream backend."""
 
@@ -92,6 +143,7 @@ class AsyncWSDataBackend(BaseAsyncDataBackend[WSDataBackendSettings, str]):
         """
         super().__init__(settings)
         self._client = None
+        self.connections: List[WSConnectionStats] = []
 
     async def client(self) -> websockets.WebSocketClientProtocol:
         """Create a websocket client connected to `settings.URI` if it doesn't exist."""
@@ -138,7 +190,10 @@ class AsyncWSDataBackend(BaseAsyncDataBackend[WSDataBackendSettings, str]):
         Args:
             query (str): Ignored.
             target (str or None): Ignored.
-            chunk_size (int or None): Ignored.
+            chunk_size (int or None): The maximum number of messages received in one
+                chunk. A chunk is yielded once full or `READ_MAX_LATENCY` seconds
+                after its first message. If `chunk_size` is `None` it defaults to
+                `READ_CHUNK_SIZE`.
             raw_output (bool): Controls whether to yield bytes or dictionaries.
                 If the records are dictionaries and `raw_output` is set to `True`, they
                 are encoded as JSON.
@@ -179,22 +234,146 @@ class AsyncWSDataBackend(BaseAsyncDataBackend[WSDataBackendSettings, str]):
         chunk_size: int,
         ignore_errors: bool,  # noqa: ARG002
     ) -> AsyncIterator[bytes]:
-        """Method called by `self.read` yielding bytes. See `self.read`."""
-        if target or chunk_size:
-            logger.warning("The `target` and `chunk_size` arguments are ignored")
+        """Method called by `self.read` yielding bytes. See `self.read`.
 
-        client = await self.client()
+        Chunks of messages are received in a background task while yielding the
+        previous ones, buffering up to `READ_BUFFER_SIZE` chunks. Connections stats
+        are logged once the read is over, as the last messages are yielded after
+        their connection is closed.
+        """
+        if target:
+            logger.warning("The `target` argument is ignored")
+
+        opened_connections = len(self.connections)
+        queue: asyncio.Queue = asyncio.Queue(self.settings.READ_BUFFER_SIZE)
+        task = asyncio.create_task(
+            self._queue_records(queue, self._receive_chunks(chunk_size))
+        )
         count = 0
         try:
-            while event := await client.recv():
-                yield bytes(f"{event}\n", encoding=self.settings.LOCALE_ENCODING)
-                count += 1
-        except websockets.exceptions.ConnectionClosedOK:
-            logger.info("Read %s records with success", count)
-        except (websockets.WebSocketException, RuntimeError) as error:
-            msg = "Failed to receive message from websocket %s: %s"
-            logger.error(msg, self.settings.URI, error)
-            raise BackendException(msg % (self.settings.URI, error)) from error
+            while (chunk := await queue.get()) is not None:
+                for message in chunk:
+                    yield bytes(f"{message}\n", encoding=self.settings.LOCALE_ENCODING)
+                count += len(chunk)
+
+            error = task.exception()
+            if error:
+                raise error
+        finally:
+            task.cancel()
+            for stats in self.connections[opened_connections:]:
+                self._log_stats(stats)
+
+        logger.info("Read %s records with success", count)
+
+    async def _receive_chunks(self, chunk_size: int) -> AsyncIterator[List]:
+        """Receive websocket messages by chunks of up to `chunk_size` messages.
+
+        Abnormally closed connections are re-opened up to `RECONNECT_ATTEMPTS`
+        successive times, resuming the stream with the messages sent on the new
+        connection.
+        """
+        attempt = 0
+        while True:
+            stats = None
+            try:
+                client = await self.client()
+                stats = WSConnectionStats(uri=str(self.settings.URI))
+                self.connections.append(stats)
+                chunks = self._receive_connection_chunks(client, chunk_size, stats)
+                async for chunk in chunks:
+                    attempt = 0
+                    yield chunk
+            except websockets.exceptions.ConnectionClosedOK:
+                return
+            except (
+                websockets.WebSocketException,
+                BackendException,
+                OSError,
+                TimeoutError,
+            ) as error:
+                if attempt >= self.settings.RECONNECT_ATTEMPTS:
+                    if isinstance(error, BackendException):
+                        raise error
+                    msg = "Failed to receive message from websocket %s: %s"
+                    logger.error(msg, self.settings.URI, error)
+                    raise BackendException(msg % (self.settings.URI, error)) from error
+
+                delay = self.settings.RECONNECT_BACKOFF * 2**attempt
+                msg = "Reconnecting to websocket %s in %ss: %s"
+                logger.warning(msg, self.settings.URI, delay, error)
+                attempt += 1
+                self._client = None
+            except RuntimeError as error:
+                msg = "Failed to receive message from websocket %s: %s"
+                logger.error(msg, self.settings.URI, error)
+                raise BackendException(msg % (self.settings.URI, error)) from error
+            finally:
+                self._close_stats(stats)
+
+            await asyncio.sleep(delay)
+
+    async def _receive_connection_chunks(
+        self,
+        client: websockets.WebSocketClientProtocol,
+        chunk_size: int,
+        stats: WSConnectionStats,
+    ) -> AsyncIterator[List]:
+        """Receive the `client` connection messages by chunks.
+
+        A chunk is yielded once it holds `chunk_size` messages or `READ_MAX_LATENCY`
+        seconds after its first message. The last incomplete chunk is yielded
+        before raising the error closing the connection.
+        """
+        loop = asyncio.get_running_loop()
+        chunk: List = []
+        try:
+            while True:
+                if not chunk:
+                    message = await client.recv()
+                    deadline = loop.time() + self.settings.READ_MAX_LATENCY
+                else:
+                    timeout = max(deadline - loop.time(), 0)
+                    try:
+                        message = await asyncio.wait_for(client.recv(), timeout)
+                    except asyncio.TimeoutError:
+                        yield self._count_chunk(stats, chunk)
+                        chunk = []
+                        continue
+
+                chunk.append(message)
+                stats.size += len(message)
+                if len(chunk) >= chunk_size:
+                    yield self._count_chunk(stats, chunk)
+                    chunk = []
+        except (websockets.WebSocketException, OSError, TimeoutError):
+            if chunk:
+                yield self._count_chunk(stats, chunk)
+            raise
+
+    @staticmethod
+    def _count_chunk(stats: WSConnectionStats, chunk: List) -> List:
+        """Add the `chunk` messages to the connection `stats` and return it."""
+        stats.messages += len(chunk)
+        stats.chunks += 1
+        return chunk
+
+    @staticmethod
+    def _close_stats(stats: Optional[WSConnectionStats]) -> None:
+        """Mark the connection `stats` as closed."""
+        if stats:
+            stats.closed_at = time.monotonic()
+
+    @staticmethod
+    def _log_stats(stats: WSConnectionStats) -> None:
+        """Log the connection `stats`."""
+        logger.info(
+            "Received %d messages in %d chunks from websocket %s (%.1f messages/s)",
+            stats.messages,
+            stats.chunks,
+            stats.uri,
+            stats.rate,
+        )
 
     async def _read_dicts(
         self,
@@ -3,6 +3,8 @@
 import logging
 from abc import ABC, abstractmethod
 from asyncio import Queue, create_task
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum, IntEnum, unique
 from inspect import isclass
 from io import IOBase
@@ -10,9 +12,12 @@ from itertools import chain
 from typing import (
     Any,
     AsyncIterator,
+    Callable,
+    Deque,
     Generic,
     Iterable,
     Iterator,
+    List,
     Optional,
     Set,
     Type,
@@ -33,6 +38,7 @@ from ralph.utils import (
     async_parse_iterable_to_dict,
     gather_with_limited_concurrency,
     iter_by_batch,
+    iter_in_thread,
     parse_dict_to_bytes,
     parse_iterable_to_dict,
 )
@@ -111,18 +117,24 @@ class Configurable:
 
 
 class Writable(Configurable, ABC):
-    """Data backend interface for backends supporting the write operation."""
+    """Data backend interface for backends supporting the write operation.
+
+    Chunks of records are written concurrently in a bounded thread pool, unless the
+    backend sets `concurrent_writes` to `False`.
+    """
 
     default_operation_type = BaseOperationType.INDEX
     unsupported_operation_types: Set[BaseOperationType] = set()
+    concurrent_writes = True
 
-    def write(
+    def write(  # noqa: PLR0913
         self,
         data: Union[IOBase, Iterable[bytes], Iterable[dict]],
         target: Optional[str] = None,
         chunk_size: Optional[int] = None,
         ignore_errors: bool = False,
         operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
     ) -> int:
         """Write `data` records to the `target` container and return their count.
 
@@ -138,6 +150,10 @@ class Writable(Configurable, ABC):
             operation_type (BaseOperationType or None): The mode of the write operation.
                 If `operation_type` is `None`, the `default_operation_type` is used
                 instead. See `BaseOperationType`.
+            concurrency (int or None): The number of chunks to write concurrently,
+                for backends supporting concurrent writes.
+                If `None`, the backend `WRITE_CONCURRENCY` setting is used instead,
+                defaulting to `1`.
 
         Return:
             int: The number of written records.
@@ -155,6 +171,11 @@ class Writable(Configurable, ABC):
             logger.error(msg)
             raise BackendParameterException(msg)
 
+        if concurrency is not None and concurrency < 1:
+            msg = "concurrency must be a strictly positive integer"
+            logger.error(msg)
+            raise BackendParameterException(msg)
+
         data = iter(data)
         try:
             first_record = next(data)
@@ -164,38 +185,70 @@ class Writable(Configurable, ABC):
         data = chain((first_record,), data)
 
         chunk_size = chunk_size if chunk_size else self.settings.WRITE_CHUNK_SIZE
-        is_bytes = isinstance(first_record, bytes)
-        writer = self._write_bytes if is_bytes else self._write_dicts
-        return writer(data, target, chunk_size, ignore_errors, operation_type)
+        writer: Callable[..., int] = self._write_dicts
+        if isinstance(first_record, bytes):
+            writer = self._write_bytes
+        # Only backends writing concurrently define the `WRITE_CONCURRENCY` setting.
+        max_workers = concurrency
+        if max_workers is None:
+            max_workers = getattr(self.settings, "WRITE_CONCURRENCY", 1)
+        if not self.concurrent_writes or max_workers == 1:
+            return writer(
+                data, target, chunk_size, ignore_errors, operation_type, concurrency
+            )
+
+        count = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: Deque[Future] = deque()
+            for chunk in iter_by_batch(data, chunk_size):
+                # Bound the number of in-flight chunks to avoid consuming the whole
+                # `data` iterable upfront.
+                if len(futures) == max_workers:
+                    count += futures.popleft().result()
+                futures.append(
+                    executor.submit(
+                        writer,
+                        chunk,
+                        target,
+                        chunk_size,
+                        ignore_errors,
+                        operation_type,
+                        concurrency,
+                    )
+                )
+            count += sum(future.result() for future in futures)
+        return count
 
-    def _write_bytes(
+    def _write_bytes(  # noqa: PLR0913
         self,
         data: Iterable[bytes],
         target: Optional[str],
         chunk_size: int,
         ignore_errors: bool,
         operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],
     ) -> int:
         """Method called by `self.write` writing bytes. See `self.write`."""
         statements = parse_iterable_to_dict(data, ignore_errors)
         return self._write_dicts(
-            statements, target, chunk_size, ignore_errors, operation_type
+            statements, target, chunk_size, ignore_errors, operation_type, concurrency
         )
 
     @abstractmethod
-    def _write_dicts(
+    def _write_dicts(  # noqa: PLR0913
         self,
         data: Iterable[dict],
         target: Optional[str],
         chunk_size: int,
         ignore_errors: bool,
         operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],
     ) -> int:
         """Method called by `self.write` writing dictionaries. See `self.write`."""
         locale = self.settings.LOCALE_ENCODING
         statements = parse_dict_to_bytes(data, locale, ignore_errors)
         return self._write_bytes(
-            statements, target, chunk_size, ignore_errors, operation_type
+            statements, target, chunk_size, ignore_errors, operation_type, concurrency
         )
 
 
@@ -299,6 +352,7 @@ class BaseDataBackend(Generic[Settings, Query], ABC):
         chunk_size: Optional[int] = None,
         raw_output: bool = False,
         ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
         max_statements: Optional[PositiveInt] = None,
     ) -> Union[Iterator[bytes], Iterator[dict]]:
         """Read records matching the `query` in the `target` container and yield them.
@@ -318,6 +372,10 @@ class BaseDataBackend(Generic[Settings, Query], ABC):
             ignore_errors (bool): If `True`, encoding errors during the read operation
                 will be ignored and logged.
                 If `False` (default), a `BackendException` is raised on any error.
+            prefetch (int): The number of records to prefetch (queue) in a background
+                thread while yielding.
+                If `prefetch` is `None` it defaults to `1`, i.e. no records are
+                prefetched.
             max_statements (int): The maximum number of statements to yield.
                 If `None` (default) or `0`, there is no maximum.
 
@@ -330,6 +388,27 @@ class BaseDataBackend(Generic[Settings, Query], ABC):
                 during encoding records and `ignore_errors` is set to `False`.
             BackendParameterException: If a backend argument value is not valid.
         """
+        prefetch = prefetch if prefetch else 1
+        if prefetch < 1:
+            msg = "prefetch must be a strictly positive integer"
+            logger.error(msg)
+            raise BackendParameterException(msg)
+
+        if prefetch > 1:
+            # Records are read in a background thread, which stops once the consumer
+            # stops iterating.
+            records: Iterator[Any] = self.read(
+                query,
+                target,
+                chunk_size,
+                raw_output,
+                ignore_errors,
+                None,
+                max_statements,
+            )
+            yield from iter_in_thread(records, prefetch - 1)
+            return
+
         chunk_size = chunk_size if chunk_size else self.settings.READ_CHUNK_SIZE
         query = validate_backend_query(query, self.query_class)
         reader = self._read_bytes if raw_output else self._read_dicts
@@ -417,6 +496,11 @@ class AsyncWritable(Configurable, ABC):
             logger.error(msg)
             raise BackendParameterException(msg)
 
+        if concurrency is not None and concurrency < 1:
+            msg = "concurrency must be a strictly positive integer"
+            logger.error(msg)
+            raise BackendParameterException(msg)
+
         data = iter(data)
         try:
             first_record = next(data)
@@ -433,11 +517,6 @@ class AsyncWritable(Configurable, ABC):
         if concurrency == 1:
             return await writer(data, target, chunk_size, ignore_errors, operation_type)
 
-        if concurrency < 1:
-            msg = "concurrency must be a strictly positive integer"
-            logger.error(msg)
-            raise BackendParameterException(msg)
-
         count = 0
         for batch in iter_by_batch(iter_by_batch(data, chunk_size), concurrency):
             tasks = set()
@@ -654,7 +733,11 @@ class BaseAsyncDataBackend(Generic[Settings, Query], ABC):
         """
 
     async def _queue_records(
-        self, queue: Queue, records: Union[AsyncIterator[bytes], AsyncIterator[dict]]
+        self,
+        queue: Queue,
+        records: Union[
+            AsyncIterator[bytes], AsyncIterator[dict], AsyncIterator[List[dict]]
+        ],
     ):
         """Iterate over the `records` and put them into the `queue`."""
         try:
@@ -7,20 +7,23 @@ from io import IOBase
 from typing import (
     Any,
     Dict,
-    Generator,
     Iterable,
     Iterator,
     List,
     NamedTuple,
     Optional,
+    Sequence,
+    Tuple,
     TypeVar,
     Union,
 )
 from uuid import UUID, uuid4
 
 import clickhouse_connect
+from clickhouse_connect.datatypes.base import ClickHouseType
 from clickhouse_connect.driver.client import Client
 from clickhouse_connect.driver.exceptions import ClickHouseError
+from clickhouse_connect.driver.httputil import get_pool_manager
 from pydantic import BaseModel, PositiveInt, ValidationError
 from pydantic_settings import SettingsConfigDict
 
@@ -53,12 +56,29 @@ class ClickHouseClientOptions(ClientOptions):
     date_time_input_format: str = "best_effort"
 
 
-class InsertTuple(NamedTuple):
-    """Named tuple for ClickHouse insertion."""
+class InsertColumns(NamedTuple):
+    """Named tuple of column values for ClickHouse insertion."""
+
+    event_id: List[UUID]
+    emission_time: List[datetime]
+    event: List[str]
+
+
+class FingerprintedInsertColumns(NamedTuple):
+    """Named tuple of column values for ClickHouse insertion with fingerprints."""
+
+    event_id: List[UUID]
+    emission_time: List[datetime]
+    event: List[str]
+    fingerprint: List[str]
 
-    event_id: UUID
-    emission_time: datetime
-    event: str
+
+InsertBatch = Union[InsertColumns, FingerprintedInsertColumns]
+
+
+# Allow ClickHouse to buffer the insert, and wait for the buffer to flush. Should be
+# configurable, but I think these are reasonable defaults.
+INSERT_SETTINGS = {"async_insert": 1, "wait_for_async_insert": 1}
 
 
 class ClickHouseDataBackendSettings(BaseDataBackendSettings):
@@ -74,8 +94,12 @@ class ClickHouseDataBackendSettings(BaseDataBackendSettings):
         CLIENT_OPTIONS (ClickHouseClientOptions): A dictionary of valid options for the
             ClickHouse client connection.
         LOCALE_ENCODING (str): The locale encoding to use when none is provided.
+        POOL_SIZE (int): The maximum number of connections kept open to the
+            ClickHouse server.
         READ_CHUNK_SIZE (int): The default chunk size for reading.
         WRITE_CHUNK_SIZE (int): The default chunk size for writing.
+        WRITE_CONCURRENCY (int): The default number of batches written
+            concurrently.
     """
 
     model_config = {
@@ -90,6 +114,8 @@ class ClickHouseDataBackendSettings(BaseDataBackendSettings):
     USERNAME: Optional[str] = None
     PASSWORD: Optional[str] = None
     CLIENT_OPTIONS: ClickHouseClientOptions = ClickHouseClientOptions()
+    POOL_SIZE: PositiveInt = 8
+    WRITE_CONCURRENCY: PositiveInt = 1
 
 
 class ClickHouseQuery(BaseQuery):
@@ -101,8 +127,8 @@ class ClickHouseQuery(BaseQuery):
         parameters (dict): Dictionary of substitution values.
         limit (int): Maximum number of rows to return.
         sort (str): Order by expression determining the sorting direction.
-        column_oriented (bool): Whether to return the results as a sequence of columns
-            rather than a sequence of rows.
+        column_oriented (bool): Deprecated. Ignored as results are always streamed by
+            blocks of rows.
     """
 
     select: Union[str, List[str]] = "event"
@@ -127,7 +153,6 @@ class ClickHouseDataBackend(
     default_operation_type = BaseOperationType.CREATE
     unsupported_operation_types = {
         BaseOperationType.APPEND,
-        BaseOperationType.DELETE,
         BaseOperationType.UPDATE,
     }
 
@@ -141,6 +166,9 @@ class ClickHouseDataBackend(
         super().__init__(settings)
         self.database = self.settings.DATABASE
         self._client = None
+        self._insert_column_types: Dict[
+            Tuple[str, Tuple[str, ...]], Sequence[ClickHouseType]
+        ] = {}
 
     @property
     def client(self) -> Client:
@@ -150,16 +178,18 @@ class ClickHouseDataBackend(
         where ClickHouse is not running when Ralph starts up, which will cause
         Ralph to hang. This client is HTTP, so not actually stateful. Ralph
         should be able to gracefully deal with ClickHouse outages at all other
-        times.
+        times. No session is used, as a session does not allow batches to be
+        written concurrently.
         """
         if not self._client:
             self._client = clickhouse_connect.get_client(
                 host=self.settings.HOST,
                 port=self.settings.PORT,
                 database=self.database,
-                username=self.settings.USERNAME,
-                password=self.settings.PASSWORD,
                 settings=self.settings.CLIENT_OPTIONS.model_dump(),
+                pool_mgr=get_pool_manager(maxsize=self.settings.POOL_SIZE),
+                autogenerate_session_id=False,
+                **self.get_credentials(self.settings),
             )
         return self._client
 
@@ -218,6 +248,7 @@ class ClickHouseDataBackend(
         chunk_size: Optional[int] = None,
         raw_output: bool = False,
         ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
         max_statements: Optional[PositiveInt] = None,
     ) -> Union[Iterator[bytes], Iterator[dict]]:
         """Read documents matching the query in the target table and yield them.
@@ -232,6 +263,9 @@ class ClickHouseDataBackend(
             ignore_errors (bool): If `True`, encoding errors during the read operation
                 will be ignored and logged.
                 If `False` (default), a `BackendException` is raised on any error.
+            prefetch (int): The number of records to prefetch (queue) while yielding.
+                If `prefetch` is `None` it defaults to `1`, i.e. no records are
+                prefetched.
             max_statements (int): The maximum number of statements to yield.
                 If `None` (default) or `0`, there is no maximum.
 
@@ -244,9 +278,40 @@ class ClickHouseDataBackend(
                 during encoding documents and `ignore_errors` is set to `False`.
         """
         yield from super().read(
-            query, target, chunk_size, raw_output, ignore_errors, max_statements
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
         )
 
+    def _read_bytes(
+        self,
+        query: ClickHouseQuery,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+    ) -> Iterator[bytes]:
+        """Method called by `self.read` yielding bytes. See `self.read`.
+
+        The `event` column already holds a JSON document, thus it is written as is
+        in the output, without being decoded and encoded back.
+        """
+        locale = self.settings.LOCALE_ENCODING
+        rows = self._read_rows(query, target, chunk_size)
+        for i, (column_names, row) in enumerate(rows):
+            try:
+                yield self.to_raw_document(column_names, row, locale)
+            except (TypeError, ValueError) as error:
+                msg = "Failed to encode JSON: %s, for document: %s, at line %s"
+                if ignore_errors:
+                    logger.warning(msg, error, row, i)
+                    continue
+                logger.error(msg, error, row, i)
+                raise BackendException(msg % (error, row, i)) from error
+
     def _read_dicts(
         self,
         query: ClickHouseQuery,
@@ -255,54 +320,47 @@ class ClickHouseDataBackend(
         ignore_errors: bool,
     ) -> Iterator[dict]:
         """Method called by `self.read` yielding dictionaries. See `self.read`."""
-        target = target if target else self.settings.EVENT_TABLE_NAME
-
-        if isinstance(query.select, str):
-            query.select = [query.select]
-        select = ",".join(query.select)
-        sql = f"SELECT {select} FROM {target}"  # noqa: S608
-
-        if query.where:
-            if isinstance(query.where, str):
-                query.where = [query.where]
-            filter_str = "\nWHERE 1=1 AND "
-            filter_str += """
-            AND
-            """.join(
-                query.where
-            )
-            sql += filter_str
-
-        if query.sort:
-            sql += f"\nORDER BY {query.sort}"
+        rows = self._read_rows(query, target, chunk_size)
+        documents = (dict(zip(column_names, row)) for column_names, row in rows)
+        yield from parse_iterable_to_dict(
+            documents, ignore_errors, self.parse_event_json
+        )
 
-        if query.limit:
-            sql += f"\nLIMIT {query.limit}"
+    def _read_rows(
+        self, query: ClickHouseQuery, target: Optional[str], chunk_size: int
+    ) -> Iterator[Tuple[Sequence[str], Sequence[Any]]]:
+        """Yield the column names and values of each row matching the `query`.
 
+        Rows are streamed from ClickHouse by blocks of `chunk_size` rows, thus only
+        one block is held in memory at a time.
+        """
+        target = target if target else self.settings.EVENT_TABLE_NAME
+        sql = self.get_sql(query, target)
         msg = "Start reading the %s table of the %s database (chunk size: %d)"
         logger.debug(msg, target, self.database, chunk_size)
         try:
-            result = self.client.query(
+            with self.client.query_row_block_stream(
                 sql,
                 parameters=query.parameters,
-                settings={"buffer_size": chunk_size},
-                column_oriented=query.column_oriented,
-            ).named_results()
-            yield from parse_iterable_to_dict(
-                result, ignore_errors, self._parse_event_json
-            )
+                settings={"max_block_size": chunk_size},
+            ) as stream:
+                column_names = stream.source.column_names
+                for block in stream:
+                    for row in block:
+                        yield column_names, row
         except (ClickHouseError, IndexError, TypeError, ValueError) as error:
             msg = "Failed to read documents: %s"
             logger.error(msg, error)
             raise BackendException(msg % error) from error
 
-    def write(
+    def write(  # noqa: PLR0913
         self,
         data: Union[IOBase, Iterable[bytes], Iterable[dict]],
         target: Optional[str] = None,
         chunk_size: Optional[int] = None,
         ignore_errors: bool = False,
         operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
     ) -> int:
         """Write `data` documents to the `target` table and return their count.
 
@@ -318,6 +376,8 @@ class ClickHouseDataBackend(
             operation_type (BaseOperationType or None): The mode of the write operation.
                 If `operation_type` is `None`, the `default_operation_type` is used
                 instead. See `BaseOperationType`.
+            concurrency (int or None): The number of batches written concurrently.
+                If `concurrency` is `None` it defaults to `WRITE_CONCURRENCY`.
 
         Return:
             int: The number of documents written.
@@ -325,26 +385,35 @@ class ClickHouseDataBackend(
         Raise:
             BackendException: If any failure occurs during the write operation or
                 if an inescapable failure occurs and `ignore_errors` is set to `True`.
-            BackendParameterException: If the `operation_type` is `APPEND`, `UPDATE`
-                or `DELETE` as it is not supported.
+            BackendParameterException: If the `operation_type` is `APPEND` or `UPDATE`
+                as it is not supported.
         """
-        return super().write(data, target, chunk_size, ignore_errors, operation_type)
+        return super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
 
-    def _write_dicts(
+    def _write_dicts(  # noqa: PLR0913
         self,
         data: Iterable[dict],
         target: Optional[str],
         chunk_size: int,
         ignore_errors: bool,
-        operation_type: BaseOperationType,  # noqa: ARG002
+        operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],  # noqa: ARG002
     ) -> int:
         """Method called by `self.write` writing dictionaries. See `self.write`."""
         count = 0
         target = target if target else self.settings.EVENT_TABLE_NAME
+        if operation_type == BaseOperationType.DELETE:
+            ids = (statement.get("id") for statement in data)
+            for ids_batch in iter_by_batch(ids, chunk_size):
+                count += self._bulk_delete(ids_batch, ignore_errors, target)
+            logger.info("Deleted a total of %d documents with success", count)
+            return count
+
         msg = "Start writing to the %s table of the %s database (chunk size: %d)"
         logger.debug(msg, target, self.database, chunk_size)
-        insert_tuples = self._to_insert_tuples(data, ignore_errors)
-        for batch in iter_by_batch(insert_tuples, chunk_size):
+        for batch in self.to_insert_columns(data, chunk_size, ignore_errors):
             count += self._bulk_import(batch, ignore_errors, target)
 
         logger.info("Inserted a total of %d documents with success", count)
@@ -367,55 +436,78 @@ class ClickHouseDataBackend(
             logger.error(msg, error)
             raise BackendException(msg % error) from error
 
-    def _to_insert_tuples(
-        self,
+    @staticmethod
+    def get_credentials(settings: ClickHouseDataBackendSettings) -> Dict[str, Any]:
+        """Return the `username` and `password` client arguments which are set.
+
+        Unset credentials are not passed, thus the client defaults are used.
+        """
+        credentials = {"username": settings.USERNAME, "password": settings.PASSWORD}
+        return {name: value for name, value in credentials.items() if value is not None}
+
+    @staticmethod
+    def to_insert(statement: dict, ignore_errors: bool) -> Optional[ClickHouseInsert]:
+        """Return the `statement` insert fields, or `None` if they are invalid.
+
+        Raise:
+            BackendException: If the `statement` has an invalid `id` or `timestamp`
+                field and `ignore_errors` is set to `False`.
+        """
+        try:
+            return ClickHouseInsert(
+                event_id=statement.get("id", str(uuid4())),
+                emission_time=statement["timestamp"],
+            )
+        except (KeyError, ValidationError) as error:
+            msg = "Statement %s has an invalid 'id' or 'timestamp' field"
+            if ignore_errors:
+                logger.warning(msg, statement)
+                return None
+            logger.error(msg, statement)
+            raise BackendException(msg % statement) from error
+
+    @staticmethod
+    def to_insert_columns(
         data: Iterable[dict],
+        chunk_size: int,
         ignore_errors: bool = False,
-    ) -> Generator[InsertTuple, None, None]:
-        """Convert `data` dictionaries to insert tuples."""
+    ) -> Iterator[InsertColumns]:
+        """Convert `data` dictionaries to batches of `chunk_size` insert columns."""
+        columns = InsertColumns([], [], [])
         for statement in data:
-            try:
-                insert = ClickHouseInsert(
-                    event_id=statement.get("id", str(uuid4())),
-                    emission_time=statement["timestamp"],
-                )
-            except (KeyError, ValidationError) as error:
-                msg = "Statement %s has an invalid 'id' or 'timestamp' field"
-                if ignore_errors:
-                    logger.warning(msg, statement)
-                    continue
-                logger.error(msg, statement)
-                raise BackendException(msg % statement) from error
+            insert = ClickHouseDataBackend.to_insert(statement, ignore_errors)
+            if not insert:
+                continue
 
-            insert_tuple = InsertTuple(
-                insert.event_id,
-                insert.emission_time,
-                json.dumps(statement),
-            )
+            columns.event_id.append(insert.event_id)
+            columns.emission_time.append(insert.emission_time)
+            columns.event.append(json.dumps(statement))
+            if len(columns.event_id) >= chunk_size:
+                yield columns
+                columns = InsertColumns([], [], [])
 
-            yield insert_tuple
+        if columns.event_id:
+            yield columns
 
     def _bulk_import(
-        self,
-        batch: List[InsertTuple],
-        ignore_errors: bool = False,
-        event_table_name: Optional[str] = None,
-    ):
+        self, batch: InsertBatch, ignore_errors: bool, event_table_name: str
+    ) -> int:
         """Insert a batch of documents into the selected database table."""
         try:
-            found_ids = {document.event_id for document in batch}
+            found_ids = set(batch.event_id)
 
-            if len(found_ids) != len(batch):
+            if len(found_ids) != len(batch.event_id):
                 raise BackendException("Duplicate IDs found in batch")
 
             self.client.insert(
                 event_table_name,
                 batch,
-                column_names=["event_id", "emission_time", "event"],
-                # Allow ClickHouse to buffer the insert, and wait for the
-                # buffer to flush. Should be configurable, but I think these are
-                # reasonable defaults.
-                settings={"async_insert": 1, "wait_for_async_insert": 1},
+                column_names=batch._fields,
+                column_types=self._get_insert_column_types(
+                    event_table_name, batch._fields
+                ),
+                column_oriented=True,
+                settings=INSERT_SETTINGS,
             )
         except (ClickHouseError, BackendException) as error:
             if not ignore_errors:
@@ -426,13 +518,86 @@ class ClickHouseDataBackend(
             # succeeded, we assume 0 here.
             return 0
 
-        inserted_count = len(batch)
+        inserted_count = len(batch.event_id)
         logger.debug("Inserted %d documents chunk with success", inserted_count)
 
         return inserted_count
 
+    def _bulk_delete(
+        self, batch: List[str], ignore_errors: bool, event_table_name: str
+    ) -> int:
+        """Delete a batch of documents by `event_id` from the selected table.
+
+        Rows are deleted with a lightweight `DELETE` statement, thus they are
+        immediately hidden from queries.
+        """
+        sql = f"DELETE FROM {event_table_name} "  # noqa: S608
+        sql += "WHERE event_id IN {ids:Array(UUID)}"
+        try:
+            self.client.command(sql, parameters={"ids": batch})
+        except (ClickHouseError, ValueError) as error:
+            if not ignore_errors:
+                msg = "Failed to delete documents: %s"
+                logger.error(msg, error)
+                raise BackendException(msg % error) from error
+            logger.warning(
+                "Bulk delete failed for current chunk but you choose to ignore it."
+            )
+            return 0
+
+        logger.debug("Deleted %d documents chunk with success", len(batch))
+        return len(batch)
+
+    def _get_insert_column_types(
+        self, target: str, column_names: Tuple[str, ...]
+    ) -> Sequence[ClickHouseType]:
+        """Return the types of the `target` table insert `column_names`.
+
+        Column types are retrieved once per table and columns to avoid describing
+        the table before each batch insertion.
+        """
+        key = (target, column_names)
+        if key not in self._insert_column_types:
+            context = self.client.create_insert_context(target, column_names)
+            self._insert_column_types[key] = context.column_types
+
+        return self._insert_column_types[key]
+
+    @staticmethod
+    def get_sql(query: ClickHouseQuery, target: str) -> str:
+        """Return the SQL statement selecting the `query` rows in `target`."""
+        if isinstance(query.select, str):
+            query.select = [query.select]
+        select = ",".join(query.select)
+        sql = f"SELECT {select} FROM {target}"  # noqa: S608
+
+        if query.where:
+            if isinstance(query.where, str):
+                query.where = [query.where]
+            separator = "\n            AND\n            "
+            sql += "\nWHERE 1=1 AND " + separator.join(query.where)
+
+        if query.sort:
+            sql += f"\nORDER BY {query.sort}"
+
+        if query.limit:
+            sql += f"\nLIMIT {query.limit}"
+
+        return sql
+
+    @staticmethod
+    def to_raw_document(
+        column_names: Sequence[str], row: Sequence[Any], encoding: str
+    ) -> bytes:
+        """Encode a `row` as a JSON line, writing the `event` column value as is."""
+        fields = (
+            f"{json.dumps(name)}: {value if name == 'event' else json.dumps(value)}"
+            for name, value in zip(column_names, row)
+        )
+        return f"{{{', '.join(fields)}}}\n".encode(encoding)
+
     @staticmethod
-    def _parse_event_json(document: Dict[str, Any]) -> Dict[str, Any]:
+    def parse_event_json(document: Dict[str, Any]) -> Dict[str, Any]:
         """Return the `document` with a JSON parsed `event` field."""
         if "event" in document:
             document["event"] = json.loads(document["event"])
@@ -1,12 +1,28 @@
 """Elasticsearch data backend for Ralph."""
 
+import heapq
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from io import IOBase
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable, Iterator, List, Literal, Optional, TypeVar, Union
+from queue import Full, Queue
+from threading import Event
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from elasticsearch import ApiError, Elasticsearch, TransportError
-from elasticsearch.helpers import BulkIndexError, streaming_bulk
+from elasticsearch.helpers import BulkIndexError, parallel_bulk, streaming_bulk
 from pydantic import BaseModel, PositiveInt, ValidationError
 from pydantic_settings import SettingsConfigDict
 from typing_extensions import Self
@@ -21,10 +37,13 @@ from ralph.backends.data.base import (
     Writable,
 )
 from ralph.conf import BASE_SETTINGS_CONFIG, ClientOptions, CommaSeparatedTuple
-from ralph.exceptions import BackendException
+from ralph.exceptions import BackendException, BackendParameterException
 
 logger = logging.getLogger(__name__)
 
+# The number of pages each slice may read ahead of the consumer.
+SLICE_QUEUE_SIZE = 2
+
 
 class ESClientOptions(ClientOptions):
     """Elasticsearch additional client options."""
@@ -51,6 +70,8 @@ class ESDataBackendSettings(BaseDataBackendSettings):
         REFRESH_AFTER_WRITE (str or bool): Whether the Elasticsearch index should be
             refreshed after the write operation.
         WRITE_CHUNK_SIZE (int): The default chunk size for writing batches of documents.
+        WRITE_CONCURRENCY (int): The default number of threads used to send bulk
+            requests in parallel. Set to `1` to send them sequentially.
     """
 
     model_config = {
@@ -66,6 +87,7 @@ class ESDataBackendSettings(BaseDataBackendSettings):
     )
     POINT_IN_TIME_KEEP_ALIVE: str = "1m"
     REFRESH_AFTER_WRITE: Optional[Union[Literal["false", "true", "wait_for"]]] = None
+    WRITE_CONCURRENCY: PositiveInt = 1
 
 
 class ESQueryPit(BaseModel):
@@ -100,6 +122,17 @@ class ESQuery(BaseQuery):
             matching the set of sort values in `search_after`. Used for pagination.
         track_total_hits (bool): Number of hits matching the query to count accurately.
             Not used. Always set to `False`.
+        source (bool or list): The source fields to return. If `source` is `None`,
+            the whole document source is returned.
+            See https://www.elastic.co/guide/en/elasticsearch/reference/8.9/search-fields.html#source-filtering
+        seq_no_primary_term (bool): Whether to return the sequence number and primary
+            term of the last modification of each document.
+        slices (int): The number of slices of the point in time to read concurrently.
+            If `slices` is `None` or `1`, documents are read with a single cursor.
+            See https://www.elastic.co/guide/en/elasticsearch/reference/8.9/paginate-search-results.html#slice-scroll
+        ordered_slices (bool): Whether sliced reads should yield documents following
+            the `sort` order. If `False` (default), documents are yielded as soon as
+            one of the slices returns them.
     """
 
     q: Optional[str] = None
@@ -109,6 +142,10 @@ class ESQuery(BaseQuery):
     sort: Union[str, List[dict]] = "_shard_doc"
     search_after: Optional[list] = None
     track_total_hits: Literal[False] = False
+    source: Optional[Union[bool, List[str]]] = None
+    seq_no_primary_term: Optional[bool] = None
+    slices: Optional[PositiveInt] = None
+    ordered_slices: bool = False
 
     @classmethod
     def from_string(cls, query: str) -> Self:
@@ -129,6 +166,8 @@ class ESDataBackend(BaseDataBackend[Settings, ESQuery], Writable, Listable):
 
     name = "es"
     unsupported_operation_types = {BaseOperationType.APPEND}
+    # Bulk requests are sent concurrently by the `parallel_bulk` helper.
+    concurrent_writes = False
 
     def __init__(self, settings: Optional[Settings] = None):
         """Instantiate the Elasticsearch data backend.
@@ -216,6 +255,7 @@ class ESDataBackend(BaseDataBackend[Settings, ESQuery], Writable, Listable):
         chunk_size: Optional[int] = None,
         raw_output: bool = False,
         ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
         max_statements: Optional[PositiveInt] = None,
     ) -> Union[Iterator[bytes], Iterator[dict]]:
         """Read documents matching the query in the target index and yield them.
@@ -229,6 +269,9 @@ class ESDataBackend(BaseDataBackend[Settings, ESQuery], Writable, Listable):
             raw_output (bool): Controls whether to yield dictionaries or bytes.
             ignore_errors (bool): No impact as encoding errors are not expected in
                 Elasticsearch results.
+            prefetch (int): The number of records to prefetch (queue) while yielding.
+                If `prefetch` is `None` it defaults to `1`, i.e. no records are
+                prefetched.
             max_statements (int): The maximum number of statements to yield.
                 If `None` (default) or `0`, there is no maximum.
 
@@ -240,7 +283,13 @@ class ESDataBackend(BaseDataBackend[Settings, ESQuery], Writable, Listable):
             BackendException: If a failure occurs during Elasticsearch connection.
         """
         yield from super().read(
-            query, target, chunk_size, raw_output, ignore_errors, max_statements
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
         )
 
     def _read_dicts(
@@ -264,8 +313,19 @@ class ESDataBackend(BaseDataBackend[Settings, ESQuery], Writable, Listable):
                 logger.error(msg, error)
                 raise BackendException(msg % error) from error
 
-        limit = query.size
-        kwargs = query.model_dump()
+        if query.slices and query.slices > 1:
+            yield from self._read_slices(query, query.slices, chunk_size)
+            return
+
+        kwargs = ESDataBackend.get_search_kwargs(query)
+        for documents in self._search(kwargs, query.size, chunk_size):
+            query.search_after = kwargs["search_after"]
+            yield from documents
+
+    def _search(
+        self, kwargs: dict, limit: Optional[int], chunk_size: int
+    ) -> Iterator[List[dict]]:
+        """Yield pages of documents using `search_after` to paginate `kwargs`."""
         count = chunk_size
         # The first condition is set to comprise either limit as None
         # (when the backend query does not have `size` parameter),
@@ -281,19 +341,84 @@ class ESDataBackend(BaseDataBackend[Settings, ESQuery], Writable, Listable):
             count = len(documents)
             if limit:
                 limit -= count if chunk_size == count else limit
-            query.search_after = None
+            kwargs["search_after"] = None
             if count:
-                query.search_after = [str(part) for part in documents[-1]["sort"]]
-            kwargs["search_after"] = query.search_after
-            yield from documents
+                kwargs["search_after"] = [str(part) for part in documents[-1]["sort"]]
+            yield documents
+
+    def _read_slices(
+        self, query: ESQuery, slices: int, chunk_size: int
+    ) -> Iterator[dict]:
+        """Read the point in time slices concurrently, each one in its own thread."""
+        reverse = False
+        if query.ordered_slices:
+            reverse = ESDataBackend.is_sort_descending(query.sort)
+            queues: List[Queue] = [Queue(SLICE_QUEUE_SIZE) for _ in range(slices)]
+        else:
+            queues = [Queue(SLICE_QUEUE_SIZE * slices)] * slices
+
+        stop = Event()
+
+        def put(queue: Queue, item: Union[List[dict], Exception, None]) -> bool:
+            """Put `item` into the `queue` unless the reader has stopped."""
+            while not stop.is_set():
+                try:
+                    queue.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def read_slice(slice_id: int, queue: Queue) -> None:
+            """Put the pages of the `slice_id` slice into the `queue`."""
+            kwargs = ESDataBackend.get_search_kwargs(query)
+            kwargs["slice"] = {"id": slice_id, "max": slices}
+            try:
+                for documents in self._search(kwargs, query.size, chunk_size):
+                    if not put(queue, documents):
+                        return
+            except Exception as error:  # noqa: BLE001
+                put(queue, error)
+                return
+            # None signals that the slice is done
+            put(queue, None)
+
+        def get(queue: Queue, pending: int) -> Iterator[dict]:
+            """Yield documents from the `queue` until `pending` slices are done."""
+            while pending:
+                documents = queue.get()
+                if isinstance(documents, Exception):
+                    raise documents
+                if documents is None:
+                    pending -= 1
+                    continue
+                yield from documents
+
+        if query.ordered_slices:
+            documents = heapq.merge(
+                *(get(queue, 1) for queue in queues),
+                key=itemgetter("sort"),
+                reverse=reverse,
+            )
+        else:
+            documents = get(queues[0], slices)
 
-    def write(
+        with ThreadPoolExecutor(max_workers=slices) as executor:
+            for slice_id, queue in enumerate(queues):
+                executor.submit(read_slice, slice_id, queue)
+            try:
+                yield from islice(documents, query.size)
+            finally:
+                stop.set()
+
+    def write(  # noqa: PLR0913
         self,
         data: Union[IOBase, Iterable[bytes], Iterable[dict]],
         target: Optional[str] = None,
         chunk_size: Optional[int] = None,
         ignore_errors: bool = False,
         operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
     ) -> int:
         """Write data documents to the target index and return their count.
 
@@ -309,6 +434,9 @@ class ESDataBackend(BaseDataBackend[Settings, ESQuery], Writable, Listable):
             operation_type (BaseOperationType or None): The mode of the write operation.
                 If `operation_type` is `None`, the `default_operation_type` is used
                 instead. See `BaseOperationType`.
+            concurrency (int or None): The number of threads sending bulk requests
+                in parallel. If `concurrency` is `None` it defaults to
+                `WRITE_CONCURRENCY`.
 
         Return:
             int: The number of documents written.
@@ -317,31 +445,46 @@ class ESDataBackend(BaseDataBackend[Settings, ESQuery], Writable, Listable):
             BackendException: If any failure occurs during the write operation or
                 if an inescapable failure occurs and `ignore_errors` is set to `True`.
             BackendParameterException: If the `operation_type` is `APPEND` as it is not
-                supported.
+                supported or if `concurrency` is not a strictly positive integer.
         """
-        return super().write(data, target, chunk_size, ignore_errors, operation_type)
+        return super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
 
-    def _write_dicts(
+    def _write_dicts(  # noqa: PLR0913
         self,
         data: Iterable[dict],
         target: Optional[str],
         chunk_size: int,
         ignore_errors: bool,
         operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],
     ) -> int:
         """Method called by `self.write` writing dictionaries. See `self.write`."""
         count = 0
         target = target if target else self.settings.DEFAULT_INDEX
-        msg = "Start writing to the %s index (chunk size: %d)"
-        logger.debug(msg, target, chunk_size)
+        if concurrency is None:
+            concurrency = self.settings.WRITE_CONCURRENCY
+        msg = "Start writing to the %s index (chunk size: %d, concurrency: %d)"
+        logger.debug(msg, target, chunk_size, concurrency)
+        bulk_options: Dict[str, Any] = {
+            "client": self.client,
+            "actions": ESDataBackend.to_documents(data, target, operation_type),
+            "chunk_size": chunk_size,
+            "raise_on_error": not ignore_errors,
+            "refresh": self.settings.REFRESH_AFTER_WRITE,
+        }
+        if concurrency > 1:
+            # `parallel_bulk` yields the results of each chunk as soon as the thread
+            # pool processed it; bounding the queue to the number of threads
+            # prevents consuming the whole `data` iterable upfront.
+            bulk = parallel_bulk(
+                thread_count=concurrency, queue_size=concurrency, **bulk_options
+            )
+        else:
+            bulk = streaming_bulk(**bulk_options)
         try:
-            for success, action in streaming_bulk(
-                client=self.client,
-                actions=ESDataBackend.to_documents(data, target, operation_type),
-                chunk_size=chunk_size,
-                raise_on_error=(not ignore_errors),
-                refresh=self.settings.REFRESH_AFTER_WRITE,
-            ):
+            for success, action in bulk:
                 count += success
                 logger.debug("Wrote %d document [action: %s]", success, action)
 
@@ -370,6 +513,37 @@ class ESDataBackend(BaseDataBackend[Settings, ESQuery], Writable, Listable):
             logger.error(msg, error)
             raise BackendException(msg % error) from error
 
+    @staticmethod
+    def get_search_kwargs(query: ESQuery) -> dict:
+        """Return the Elasticsearch search arguments of the `query`."""
+        return query.model_dump(exclude={"slices", "ordered_slices"})
+
+    @staticmethod
+    def is_sort_descending(sort: Union[str, List[dict]]) -> bool:
+        """Return whether the `sort` clauses all order documents descendingly.
+
+        Raise:
+            BackendParameterException: If the `sort` clauses mix ascending and
+                descending orders as documents can't be merged following them.
+        """
+        if isinstance(sort, str):
+            clauses = (clause.strip().partition(":") for clause in sort.split(","))
+            sort = [{field: order} for field, _, order in clauses]
+
+        orders = set()
+        for clause in sort:
+            for field, options in clause.items():
+                order = options.get("order") if isinstance(options, dict) else options
+                default = "desc" if field == "_score" else "asc"
+                orders.add(order if order else default)
+
+        if len(orders) > 1:
+            msg = "Ordered sliced reads require all sort clauses to share one order"
+            logger.error(msg)
+            raise BackendParameterException(msg)
+
+        return orders == {"desc"}
+
     @staticmethod
     def to_documents(
         data: Iterable[dict],
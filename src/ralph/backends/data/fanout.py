@@ -0,0 +1,304 @@
+"""Fan-out data backend for Ralph."""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import IOBase
+from queue import Full, Queue
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, cast
+
+from pydantic import PositiveInt
+from pydantic_settings import SettingsConfigDict
+
+from ralph.backends.data.base import (
+    BaseDataBackend,
+    BaseDataBackendSettings,
+    BaseOperationType,
+    DataBackendStatus,
+    Writable,
+)
+from ralph.backends.loader import get_cli_backends
+from ralph.conf import BASE_SETTINGS_CONFIG, CommaSeparatedTuple
+from ralph.exceptions import BackendParameterException
+from ralph.utils import iter_by_batch
+
+logger = logging.getLogger(__name__)
+
+# The number of chunks queued ahead for each backend.
+CHUNK_QUEUE_SIZE = 2
+# The number of seconds to wait before checking whether a backend write failed.
+QUEUE_PUT_TIMEOUT = 0.1
+
+
+class FanoutDataBackendSettings(BaseDataBackendSettings):
+    """Fan-out data backend default configuration.
+
+    Attributes:
+        BACKENDS (str): Comma-separated names of the backends records are written to.
+        PRIMARY_BACKEND (str): The name of the backend serving reads. If it is not
+            set, the first one of `BACKENDS` is used instead.
+        WRITE_CHUNK_SIZE (int): The number of records queued at once for each
+            backend.
+    """
+
+    model_config = {
+        **BASE_SETTINGS_CONFIG,
+        **SettingsConfigDict(env_prefix="RALPH_BACKENDS__DATA__FANOUT__"),
+    }
+
+    BACKENDS: CommaSeparatedTuple = ("es",)
+    PRIMARY_BACKEND: Optional[str] = None
+
+
+class FanoutDataBackend(
+    BaseDataBackend[FanoutDataBackendSettings, Any],
+    Writable,
+):
+    """Fan-out data backend writing records to several backends concurrently.
+
+    Records are written to all backends at once, in distinct threads, hence a write
+    lasts as long as the slowest backend instead of the sum of their durations.
+    Reads are served by the primary backend.
+    Each backend is configured by its own settings.
+    """
+
+    name = "fanout"
+    # The write concurrency is forwarded to each backend.
+    concurrent_writes = False
+
+    def __init__(self, settings: Optional[FanoutDataBackendSettings] = None):
+        """Instantiate the fanned-out backends.
+
+        Args:
+            settings (FanoutDataBackendSettings or None): The data backend settings.
+                If `settings` is `None`, a default settings instance is used instead.
+
+        Raise:
+            BackendParameterException: If a backend is not a synchronous writable
+                backend or if the primary backend is not one of `BACKENDS`.
+        """
+        super().__init__(settings)
+        # Writable data backends by name.
+        self.backends: Dict[str, Any] = {
+            name: self.get_backend(name) for name in self.settings.BACKENDS
+        }
+        primary = self.settings.PRIMARY_BACKEND or self.settings.BACKENDS[0]
+        if primary not in self.backends:
+            msg = "The %s primary backend is not one of the fanned-out backends"
+            logger.error(msg, primary)
+            raise BackendParameterException(msg % primary)
+
+        self.primary_name = primary
+        self.primary = self.backends[primary]
+        # Counts of records written to each backend by the last write, by name.
+        self.write_counts: Dict[str, int] = {}
+        self.default_operation_type = self.primary.default_operation_type
+        # Only operations supported by all backends are supported.
+        self.unsupported_operation_types = set().union(
+            *(backend.unsupported_operation_types for backend in self.backends.values())
+        )
+
+    def status(self) -> DataBackendStatus:
+        """Return the least healthy status of the fanned-out backends."""
+        statuses = {backend.status() for backend in self.backends.values()}
+        for status in (DataBackendStatus.ERROR, DataBackendStatus.AWAY):
+            if status in statuses:
+                return status
+        return DataBackendStatus.OK
+
+    def read(  # noqa: PLR0913
+        self,
+        query: Optional[Any] = None,
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        raw_output: bool = False,
+        ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
+        max_statements: Optional[PositiveInt] = None,
+    ) -> Union[Iterator[bytes], Iterator[dict]]:
+        """Read records of the primary backend. See the primary backend `read`."""
+        yield from self.primary.read(
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
+        )
+
+    def _read_dicts(
+        self,
+        query: Any,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+    ) -> Iterator[dict]:
+        """Method called by `self.read` yielding dictionaries. See `self.read`."""
+        records = self.primary.read(query, target, chunk_size, False, ignore_errors)
+        yield from cast(Iterator[dict], records)
+
+    def write(  # noqa: PLR0913
+        self,
+        data: Union[IOBase, Iterable[bytes], Iterable[dict]],
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        ignore_errors: bool = False,
+        operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
+    ) -> int:
+        """Write `data` records to all backends and return the primary backend count.
+
+        Each backend writes records in its own thread, consuming chunks of
+        `chunk_size` records from a bounded queue, so that all backends write
+        concurrently without loading all records in memory.
+        The count of records written to each backend is logged and stored in
+        `write_counts`, failed backends excepted.
+
+        Args:
+            data (Iterable or IOBase): The data to write.
+            target (str or None): The target container name of all backends.
+                If `target` is `None`, their default values are used instead.
+            chunk_size (int or None): The number of records or bytes queued at once
+                for each backend, and written by backends in one batch.
+                If `chunk_size` is `None` it defaults to `WRITE_CHUNK_SIZE`.
+            ignore_errors (bool): If `True`, escapable errors are ignored and logged.
+                If `False` (default), a `BackendException` is raised on any error.
+            operation_type (BaseOperationType or None): The mode of the write operation.
+                If `operation_type` is `None`, each backend uses its own
+                `default_operation_type`.
+            concurrency (int or None): The number of chunks each backend writes
+                concurrently, for backends supporting concurrent writes.
+                If `None`, the backends default is used instead.
+
+        Return:
+            int: The number of records written to the primary backend.
+
+        Raise:
+            BackendException: If a failure occurs while writing to any backend.
+            BackendParameterException: If a backend argument value is not valid.
+        """
+        if operation_type in self.unsupported_operation_types:
+            msg = f"{operation_type.value.capitalize()} operation_type is not allowed"
+            logger.error(msg)
+            raise BackendParameterException(msg)
+
+        chunk_size = chunk_size if chunk_size else self.settings.WRITE_CHUNK_SIZE
+        return self._fan_out(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
+
+    def _write_dicts(  # noqa: PLR0913
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],
+    ) -> int:
+        """Write dictionaries to all backends. See `self.write`."""
+        return self._fan_out(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
+
+    def _fan_out(  # noqa: PLR0913
+        self,
+        data: Union[IOBase, Iterable[bytes], Iterable[dict]],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: Optional[BaseOperationType],
+        concurrency: Optional[PositiveInt],
+    ) -> int:
+        """Write `data` to all backends concurrently. See `self.write`."""
+        queues: Dict[str, Queue] = {
+            name: Queue(CHUNK_QUEUE_SIZE) for name in self.backends
+        }
+        with ThreadPoolExecutor(max_workers=len(self.backends)) as executor:
+            futures = {
+                name: executor.submit(
+                    backend.write,
+                    self.iter_queue(queues[name]),
+                    target,
+                    chunk_size,
+                    ignore_errors,
+                    operation_type,
+                    concurrency,
+                )
+                for name, backend in self.backends.items()
+            }
+            try:
+                for batch in iter_by_batch(data, chunk_size):
+                    for name, queue in queues.items():
+                        self.put_queue(queue, batch, futures[name])
+            finally:
+                for name, queue in queues.items():
+                    self.put_queue(queue, None, futures[name])
+
+        self.write_counts = {}
+        for name, future in futures.items():
+            error = future.exception()
+            if error:
+                msg = "Failed to write records to the %s backend: %s"
+                logger.error(msg, name, error)
+                continue
+            self.write_counts[name] = future.result()
+            count = self.write_counts[name]
+            logger.info("Written %d records to the %s backend", count, name)
+
+        for future in futures.values():
+            # Raise the error of the first failed backend.
+            future.result()
+
+        return self.write_counts[self.primary_name]
+
+    def close(self) -> None:
+        """Close the fanned-out backends.
+
+        Raise:
+            BackendException: If a failure occurs during the close operation.
+        """
+        for backend in self.backends.values():
+            backend.close()
+
+    @classmethod
+    def get_backend(cls, name: str) -> Any:
+        """Return an instance of the `name` backend.
+
+        Raise:
+            BackendParameterException: If the backend is not a synchronous writable
+                backend.
+        """
+        backend_class = cls.get_backend_classes().get(name)
+        if (
+            not backend_class
+            or not issubclass(backend_class, Writable)
+            or not issubclass(backend_class, BaseDataBackend)
+            or issubclass(backend_class, FanoutDataBackend)
+        ):
+            msg = "The %s backend is not a synchronous writable backend"
+            logger.error(msg, name)
+            raise BackendParameterException(msg % name)
+
+        return backend_class()
+
+    @staticmethod
+    def get_backend_classes() -> Dict[str, type]:
+        """Return the classes of the backends which may be fanned out to."""
+        return get_cli_backends()
+
+    @staticmethod
+    def iter_queue(queue: Queue) -> Iterator[Any]:
+        """Yield records of the chunks put in the `queue` until `None` is put."""
+        while (batch := queue.get()) is not None:
+            yield from batch
+
+    @staticmethod
+    def put_queue(queue: Queue, batch: Optional[List], future: Future) -> None:
+        """Put the `batch` in the `queue` unless its consumer `future` is done."""
+        while not future.done():
+            try:
+                queue.put(batch, timeout=QUEUE_PUT_TIMEOUT)
+                return
+            except Full:
+                continue
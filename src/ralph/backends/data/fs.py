@@ -76,6 +76,7 @@ class FSDataBackend(
     name = "fs"
     default_operation_type = BaseOperationType.CREATE
     unsupported_operation_types = {BaseOperationType.DELETE}
+    concurrent_writes = False
 
     def __init__(self, settings: Optional[Settings] = None):
         """Create the default target directory if it does not exist.
@@ -130,11 +131,11 @@ class FSDataBackend(
         Raise:
             BackendParameterException: If the `target` argument is not a directory path.
         """
-        target: Path = Path(target) if target else self.default_directory
-        if not target.is_absolute() and target != self.default_directory:
-            target = self.default_directory / target
+        target_path = Path(target) if target else self.default_directory
+        if not target_path.is_absolute() and target_path != self.default_directory:
+            target_path = self.default_directory / target_path
         try:
-            paths = set(target.absolute().iterdir())
+            paths = set(target_path.absolute().iterdir())
         except OSError as error:
             msg = "Invalid target argument"
             logger.error("%s. %s", msg, error)
@@ -167,6 +168,7 @@ class FSDataBackend(
         chunk_size: Optional[int] = None,
         raw_output: bool = False,
         ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
         max_statements: Optional[PositiveInt] = None,
     ) -> Union[Iterator[bytes], Iterator[dict]]:
         """Read files matching the query in the target folder and yield them.
@@ -184,6 +186,9 @@ class FSDataBackend(
             ignore_errors (bool): If `True`, encoding errors during the read operation
                 will be ignored and logged.
                 If `False` (default), a `BackendException` is raised on any error.
+            prefetch (int): The number of records to prefetch (queue) while yielding.
+                If `prefetch` is `None` it defaults to `1`, i.e. no records are
+                prefetched.
             max_statements (int): The maximum number of statements to yield.
                 If `None` (default) or `0`, there is no maximum.
 
@@ -196,7 +201,13 @@ class FSDataBackend(
                 during JSON encoding lines and `ignore_errors` is set to `False`.
         """
         yield from super().read(
-            query, target, chunk_size, raw_output, ignore_errors, max_statements
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
         )
 
     def _read_bytes(
@@ -264,13 +275,14 @@ class FSDataBackend(
             with path.open("rb") as file:
                 yield file, path
 
-    def write(
+    def write(  # noqa: PLR0913
         self,
         data: Union[IOBase, Iterable[bytes], Iterable[dict]],
         target: Optional[str] = None,
         chunk_size: Optional[int] = None,
         ignore_errors: bool = False,
         operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
     ) -> int:
         """Write data records to the target file and return their count.
 
@@ -291,6 +303,8 @@ class FSDataBackend(
                 If operation_type is `UPDATE`, the target file is overwritten.
                 If operation_type is `APPEND`, the data is appended to the
                     end of the target file.
+            concurrency (int or None): Ignored as records are written sequentially
+                to a single file.
 
         Return:
             int: The number of written files.
@@ -303,28 +317,32 @@ class FSDataBackend(
             BackendParameterException: If the `operation_type` is `DELETE` as it is not
                 supported.
         """
-        return super().write(data, target, chunk_size, ignore_errors, operation_type)
+        return super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
 
-    def _write_dicts(
+    def _write_dicts(  # noqa: PLR0913
         self,
         data: Iterable[dict],
         target: Optional[str],
         chunk_size: int,
         ignore_errors: bool,
         operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],
     ) -> int:
         """Method called by `self.write` writing dictionaries. See `self.write`."""
         return super()._write_dicts(
-            data, target, chunk_size, ignore_errors, operation_type
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
         )
 
-    def _write_bytes(
+    def _write_bytes(  # noqa: PLR0913
         self,
         data: Iterable[bytes],
         target: Optional[str],
         chunk_size: int,  # noqa: ARG002
         ignore_errors: bool,  # noqa: ARG002
         operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],  # noqa: ARG002
     ) -> int:
         """Method called by `self.write` writing bytes. See `self.write`."""
         if not target:
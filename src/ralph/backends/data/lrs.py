@@ -1,15 +1,33 @@
 """LRS data backend for Ralph."""
 
+import gzip
+import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime, timezone
+from functools import partial
 from io import IOBase
-from typing import Iterable, Iterator, List, Optional, Union
+from threading import BoundedSemaphore
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import ParseResult, parse_qs, urljoin, urlparse
 
-from httpx import Client, HTTPError, HTTPStatusError, RequestError
+from httpx import (
+    Client,
+    HTTPError,
+    HTTPStatusError,
+    Limits,
+    RequestError,
+    TransportError,
+    codes,
+)
 from pydantic import (
     AnyHttpUrl,
     BaseModel,
     Field,
+    NonNegativeFloat,
+    NonNegativeInt,
     PositiveInt,
     TypeAdapter,
 )
@@ -25,8 +43,8 @@ from ralph.backends.data.base import (
 )
 from ralph.backends.lrs.base import LRSStatementsQuery
 from ralph.conf import BASE_SETTINGS_CONFIG, HeadersParameters
-from ralph.exceptions import BackendException
-from ralph.utils import iter_by_batch
+from ralph.exceptions import BackendException, BackendParameterException
+from ralph.utils import iter_by_batch, iter_in_thread, iter_in_threads
 
 logger = logging.getLogger(__name__)
 
@@ -48,11 +66,33 @@ class LRSDataBackendSettings(BaseDataBackendSettings):
         USERNAME (str): Basic auth username for LRS authentication.
         PASSWORD (str): Basic auth password for LRS authentication.
         HEADERS (dict): Headers defined for the LRS server connection.
+        HTTP2 (bool): Whether to connect to the LRS server using HTTP/2. Requires
+            the `h2` package.
         LOCALE_ENCODING (str): The encoding used for reading statements.
+        READ_AHEAD (int): The number of next pages of statements fetched while
+            yielding the statements of the current page. If `0`, the next page is
+            only fetched once the current page is consumed.
+        POOL_SIZE (int): The maximum number of connections kept open to the LRS
+            server.
         READ_CHUNK_SIZE (int): The default chunk size for reading statements.
+        READ_PARTITIONS (int): The number of time windows the `since`/`until` range
+            of a query is split into, to read them concurrently.
+        READ_PARTITIONS_ORDERED (bool): Whether the statements of time windows are
+            yielded in the query order. If `False`, statements are yielded as soon
+            as they are fetched.
+        READ_PARTITIONS_SPLIT_DEPTH (int): The number of times a time window whose
+            first page is not the last one is split in two halves.
         STATUS_ENDPOINT (str): Endpoint used to check server status.
         STATEMENTS_ENDPOINT (str): Default endpoint for LRS statements resource.
         WRITE_CHUNK_SIZE (int): The default chunk size for writing statements.
+        WRITE_CONCURRENCY (int): The default number of chunks of statements posted
+            concurrently.
+        WRITE_GZIP (bool): Whether to gzip the body of requests posting statements.
+        WRITE_RETRIES (int): The number of times posting a chunk of statements is
+            retried on network errors and `429` or `5xx` responses.
+        WRITE_RETRY_BACKOFF (float): The number of seconds to wait before the first
+            retry, doubled on each subsequent retry. The `Retry-After` response
+            header value is used instead when present.
     """
 
     model_config = {
@@ -66,6 +106,16 @@ class LRSDataBackendSettings(BaseDataBackendSettings):
     HEADERS: LRSHeaders = LRSHeaders()
     STATUS_ENDPOINT: str = "/__heartbeat__"
     STATEMENTS_ENDPOINT: str = "/xAPI/statements"
+    HTTP2: bool = False
+    POOL_SIZE: PositiveInt = 10
+    READ_AHEAD: NonNegativeInt = 0
+    READ_PARTITIONS: PositiveInt = 1
+    READ_PARTITIONS_ORDERED: bool = True
+    READ_PARTITIONS_SPLIT_DEPTH: NonNegativeInt = 0
+    WRITE_CONCURRENCY: PositiveInt = 1
+    WRITE_GZIP: bool = False
+    WRITE_RETRIES: NonNegativeInt = 0
+    WRITE_RETRY_BACKOFF: NonNegativeFloat = 0.5
 
 
 class StatementResponse(BaseModel):
@@ -74,6 +124,14 @@ class StatementResponse(BaseModel):
     statements: Union[List[dict], dict]
     more: Optional[str] = None
 
+    @classmethod
+    def from_response(cls, response: dict) -> "StatementResponse":
+        """Return the `response` page, with `statements` as a list of statements."""
+        statement_response = cls(**response)
+        if isinstance(statement_response.statements, dict):
+            statement_response.statements = [statement_response.statements]
+        return statement_response
+
 
 class LRSDataBackend(
     BaseDataBackend[LRSDataBackendSettings, LRSStatementsQuery], Writable
@@ -104,10 +162,121 @@ class LRSDataBackend(
     def client(self) -> Client:
         """Create a `httpx.Client` if it doesn't exist."""
         if not self._client:
-            headers = self.settings.HEADERS.model_dump(by_alias=True)
-            self._client = Client(auth=self.auth, headers=headers)
+            self._client = Client(**self.get_client_options(self.settings))
         return self._client
 
+    @staticmethod
+    def get_client_options(settings: LRSDataBackendSettings) -> dict:
+        """Return the `httpx` client keyword arguments matching `settings`."""
+        return {
+            "auth": (settings.USERNAME, settings.PASSWORD),
+            "headers": settings.HEADERS.model_dump(by_alias=True),
+            "http2": settings.HTTP2,
+            "limits": Limits(
+                max_connections=settings.POOL_SIZE,
+                max_keepalive_connections=settings.POOL_SIZE,
+            ),
+        }
+
+    @staticmethod
+    def get_post_options(chunk: List[dict], settings: LRSDataBackendSettings) -> dict:
+        """Return the `httpx` post keyword arguments sending the `chunk` statements.
+
+        The JSON body is gzip-compressed if `WRITE_GZIP` is set.
+        """
+        if not settings.WRITE_GZIP:
+            return {"json": chunk}
+
+        content = gzip.compress(json.dumps(chunk).encode("utf-8"))
+        return {"content": content, "headers": {"Content-Encoding": "gzip"}}
+
+    @staticmethod
+    def get_retry_delay(
+        error: HTTPError, attempt: int, settings: LRSDataBackendSettings
+    ) -> Optional[float]:
+        """Return the seconds to wait before retrying a request failing with `error`.
+
+        Only network errors and `429` or `5xx` responses are retried, up to
+        `WRITE_RETRIES` times. Return `None` if the request should not be retried.
+        """
+        if attempt >= settings.WRITE_RETRIES:
+            return None
+
+        if isinstance(error, HTTPStatusError):
+            response = error.response
+            if response.status_code != codes.TOO_MANY_REQUESTS and not (
+                codes.is_server_error(response.status_code)
+            ):
+                return None
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return float(retry_after)
+        elif not isinstance(error, TransportError):
+            return None
+
+        return settings.WRITE_RETRY_BACKOFF * 2.0**attempt
+
+    @staticmethod
+    def get_time_windows(
+        since: str, until: str, count: int, ascending: bool
+    ) -> List[Tuple[str, str]]:
+        """Split the `since`/`until` time range into `count` contiguous windows.
+
+        Windows are sorted chronologically if `ascending` is `True`, else in reverse
+        chronological order, matching the order of statements returned by the LRS.
+        A naive bound is considered to be in UTC when the other one is aware.
+
+        Raise:
+            BackendParameterException: If `since` or `until` is not a valid ISO 8601
+                date time string.
+        """
+        try:
+            start = datetime.fromisoformat(since)
+            end = datetime.fromisoformat(until)
+        except ValueError as error:
+            msg = "Invalid `since` or `until` query parameter: %s"
+            logger.error(msg, error)
+            raise BackendParameterException(msg % error) from error
+
+        if (start.tzinfo is None) != (end.tzinfo is None):
+            start = start if start.tzinfo else start.replace(tzinfo=timezone.utc)
+            end = end if end.tzinfo else end.replace(tzinfo=timezone.utc)
+
+        step = (end - start) / count
+        bounds = [(start + step * index).isoformat() for index in range(1, count)]
+        bounds = [since, *bounds, until]
+        windows = list(zip(bounds[:-1], bounds[1:]))
+        return windows if ascending else windows[::-1]
+
+    @staticmethod
+    def get_time_window_params(query_params: dict, window: Tuple[str, str]) -> dict:
+        """Return a copy of `query_params` restricted to the `window` time range."""
+        return {**query_params, "since": window[0], "until": window[1]}
+
+    @classmethod
+    def split_time_windows(
+        cls,
+        windows: List[Tuple[str, str]],
+        responses: List[Optional[StatementResponse]],
+        ascending: bool,
+    ) -> Tuple[List[Tuple[str, str]], List[Optional[StatementResponse]]]:
+        """Split in two halves the `windows` whose first page is not the last one.
+
+        Return the new windows along with their first page, or `None` for windows
+        resulting from a split.
+        """
+        new_windows: List[Tuple[str, str]] = []
+        new_responses: List[Optional[StatementResponse]] = []
+        for window, response in zip(windows, responses):
+            if response is not None and not response.more:
+                new_windows.append(window)
+                new_responses.append(response)
+                continue
+            new_windows.extend(cls.get_time_windows(*window, 2, ascending))
+            new_responses.extend([None, None])
+
+        return new_windows, new_responses
+
     def status(self) -> DataBackendStatus:
         """HTTP backend check for server status."""
         status_url = urljoin(str(self.base_url), self.settings.STATUS_ENDPOINT)
@@ -130,6 +299,7 @@ class LRSDataBackend(
         chunk_size: Optional[int] = None,
         raw_output: bool = False,
         ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
         max_statements: Optional[PositiveInt] = None,
     ) -> Union[Iterator[bytes], Iterator[dict]]:
         """Get statements from LRS `target` endpoint.
@@ -152,10 +322,19 @@ class LRSDataBackend(
             ignore_errors (bool): If `True`, errors during the read operation
                 are ignored and logged. If `False` (default), a `BackendException`
                 is raised if an error occurs.
+            prefetch (int): The number of records to prefetch (queue) while yielding.
+                If `prefetch` is `None` it defaults to `1`, i.e. no records are
+                prefetched.
             max_statements: The maximum number of statements to yield.
         """
         yield from super().read(
-            query, target, chunk_size, raw_output, ignore_errors, max_statements
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
         )
 
     def _read_dicts(
@@ -201,13 +380,14 @@ class LRSDataBackend(
             logger.error(msg, error)
             raise BackendException(msg % (error,)) from error
 
-    def write(
+    def write(  # noqa: PLR0913
         self,
         data: Union[IOBase, Iterable[bytes], Iterable[dict]],
         target: Optional[str] = None,
         chunk_size: Optional[int] = None,
         ignore_errors: bool = False,
         operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
     ) -> int:
         """Write `data` records to the `target` endpoint and return their count.
 
@@ -224,16 +404,21 @@ class LRSDataBackend(
             operation_type (BaseOperationType or None): The mode of the write operation.
                 If `operation_type` is `None`, the `default_operation_type` is used
                 instead. See `BaseOperationType`.
+            concurrency (int or None): The number of chunks posted concurrently.
+                If `concurrency` is `None` it defaults to `WRITE_CONCURRENCY`.
         """
-        return super().write(data, target, chunk_size, ignore_errors, operation_type)
+        return super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
 
-    def _write_dicts(
+    def _write_dicts(  # noqa: PLR0913
         self,
         data: Iterable[dict],
         target: Optional[str],
         chunk_size: int,
         ignore_errors: bool,
         operation_type: BaseOperationType,  # noqa: ARG002
+        concurrency: Optional[PositiveInt],  # noqa: ARG002
     ) -> int:
         """Method called by `self.write` writing dictionaries. See `self.write`."""
         if not target:
@@ -271,34 +456,140 @@ class LRSDataBackend(
 
         self.client.close()
 
-    def _fetch_statements(self, target, query_params: dict):
-        """Fetch statements from a LRS."""
+    def _fetch_statements(self, target: str, query_params: dict) -> Iterator[dict]:
+        """Fetch statements from a LRS.
+
+        Up to `READ_AHEAD` next pages are fetched in a background thread while
+        yielding the statements of the current page.
+        """
+        if self.settings.READ_PARTITIONS > 1:
+            if query_params.get("since") and query_params.get("until"):
+                yield from self._fetch_partitioned_statements(target, query_params)
+                return
+            logger.warning(
+                "Reading statements sequentially as the query has no `since` and "
+                "`until` parameters"
+            )
+
+        pages = self._fetch_pages(target, query_params)
+        if self.settings.READ_AHEAD:
+            pages = iter_in_thread(pages, self.settings.READ_AHEAD)
+
+        for statements in pages:
+            yield from statements
+
+    def _fetch_partitioned_statements(
+        self, target: str, query_params: dict
+    ) -> Iterator[dict]:
+        """Fetch statements from a LRS, reading time windows concurrently.
+
+        The `since`/`until` range is split into `READ_PARTITIONS` windows, each one
+        read in a background thread. Windows whose first page is not the last one
+        are split in two halves up to `READ_PARTITIONS_SPLIT_DEPTH` times.
+        At most `POOL_SIZE` pages are fetched at once.
+        """
+        ascending = bool(query_params.get("ascending"))
+        windows = self.get_time_windows(
+            query_params["since"],
+            query_params["until"],
+            self.settings.READ_PARTITIONS,
+            ascending,
+        )
+        responses: List[Optional[StatementResponse]] = [None] * len(windows)
+        max_workers = min(self.settings.READ_PARTITIONS, self.settings.POOL_SIZE)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in range(self.settings.READ_PARTITIONS_SPLIT_DEPTH):
+                pending = [
+                    index for index, page in enumerate(responses) if page is None
+                ]
+                params = [
+                    self.get_time_window_params(query_params, windows[index])
+                    for index in pending
+                ]
+                first_pages = executor.map(partial(self._fetch_page, target), params)
+                for index, page in zip(pending, first_pages):
+                    responses[index] = page
+                windows, responses = self.split_time_windows(
+                    windows, responses, ascending
+                )
+                if None not in responses:
+                    break
+
+        logger.debug("Reading statements from %d time windows", len(windows))
+        semaphore = BoundedSemaphore(self.settings.POOL_SIZE)
+        pages = [
+            self._fetch_pages(
+                target,
+                self.get_time_window_params(query_params, window),
+                response,
+                semaphore,
+            )
+            for window, response in zip(windows, responses)
+        ]
+        size = self.settings.READ_AHEAD if self.settings.READ_AHEAD else 1
+        ordered = self.settings.READ_PARTITIONS_ORDERED
+        for statements in iter_in_threads(pages, size, ordered):
+            yield from statements
+
+    def _fetch_pages(
+        self,
+        target: str,
+        query_params: dict,
+        response: Optional[StatementResponse] = None,
+        semaphore: Optional[BoundedSemaphore] = None,
+    ) -> Iterator[List[dict]]:
+        """Fetch pages of statements from a LRS, following the `more` IRL.
+
+        If `response` is set, it is used as the first page. If `semaphore` is set,
+        it is acquired while fetching each page.
+        """
+        lock: AbstractContextManager = nullcontext()
+        if semaphore:
+            lock = semaphore
         while True:
-            response = self.client.get(target, params=query_params)
-            response.raise_for_status()
-            statements_response = StatementResponse(**response.json())
-            statements = statements_response.statements
-            if isinstance(statements, dict):
-                statements = [statements]
+            if response is None:
+                with lock:
+                    response = self._fetch_page(target, query_params)
 
-            for statement in statements:
-                yield statement
+            statements = response.statements
+            yield statements if isinstance(statements, list) else [statements]
 
-            if not statements_response.more:
+            if not response.more:
                 break
 
-            query_params.update(parse_qs(urlparse(statements_response.more).query))
+            query_params.update(parse_qs(urlparse(response.more).query))
+            response = None
 
-    def _post_and_raise_for_status(self, target, chunk, ignore_errors):
-        """POST chunk of statements to `target` and return the number of insertions."""
-        try:
-            request = self.client.post(target, json=chunk)
-            request.raise_for_status()
-            return len(chunk)
-        except HTTPError as error:
-            msg = "Failed to post statements: %s"
-            if ignore_errors:
-                logger.warning(msg, error)
-                return 0
-            logger.error(msg, error)
-            raise BackendException(msg % (error,)) from error
+    def _fetch_page(self, target: str, query_params: dict) -> StatementResponse:
+        """Fetch a page of statements from a LRS."""
+        response = self.client.get(target, params=query_params)
+        response.raise_for_status()
+        return StatementResponse.from_response(response.json())
+
+    def _post_and_raise_for_status(
+        self, target: str, chunk: List[dict], ignore_errors: bool
+    ) -> int:
+        """POST chunk of statements to `target` and return the number of insertions.
+
+        Failed requests are retried with backoff. See `self.get_retry_delay`.
+        """
+        options = self.get_post_options(chunk, self.settings)
+        attempt = 0
+        while True:
+            try:
+                request = self.client.post(target, **options)
+                request.raise_for_status()
+                return len(chunk)
+            except HTTPError as error:
+                delay = self.get_retry_delay(error, attempt, self.settings)
+                if delay is None:
+                    msg = "Failed to post statements: %s"
+                    if ignore_errors:
+                        logger.warning(msg, error)
+                        return 0
+                    logger.error(msg, error)
+                    raise BackendException(msg % (error,)) from error
+                logger.warning("Retrying to post statements in %ss: %s", delay, error)
+
+            time.sleep(delay)
+            attempt += 1
@@ -6,15 +6,24 @@ import hashlib
 import logging
 import struct
 from io import IOBase
-from typing import Generator, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+from typing import (
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from uuid import uuid4
 
 from bson.errors import BSONError
 from bson.objectid import ObjectId
 from dateutil.parser import isoparse
-from pydantic import MongoDsn, PositiveInt, StringConstraints
+from pydantic import MongoDsn, NonNegativeInt, PositiveInt, StringConstraints
 from pydantic_settings import SettingsConfigDict
-from pymongo import MongoClient, ReplaceOne
+from pymongo import MongoClient, ReplaceOne, WriteConcern
 from pymongo.collection import Collection
 from pymongo.errors import (
     BulkWriteError,
@@ -56,6 +65,16 @@ class MongoDataBackendSettings(BaseDataBackendSettings):
         DEFAULT_DATABASE (str): The MongoDB database to connect to.
         DEFAULT_COLLECTION (str): The MongoDB database collection to get objects from.
         CLIENT_OPTIONS (MongoClientOptions): A dictionary of MongoDB client options.
+        WRITE_CONCERN (int or str or None): The number of MongoDB instances, or the
+            tag (e.g. `majority`), acknowledging write operations. If `None`, the
+            server default write concern is used.
+        WRITE_CONCURRENCY (int): The default number of batches of documents written
+            concurrently.
+        WRITE_JOURNAL (bool or None): Whether write operations should be acknowledged
+            once written to the on-disk journal. If `None`, the server default is
+            used.
+        WRITE_ORDERED (bool): Whether the documents of a batch are written in order.
+            If `False`, a failing document does not prevent writing the other ones.
         LOCALE_ENCODING (str): The locale encoding to use when none is provided.
         READ_CHUNK_SIZE (int): The default chunk size for reading batches of documents.
         WRITE_CHUNK_SIZE (int): The default chunk size for writing batches of documents.
@@ -77,6 +96,10 @@ class MongoDataBackendSettings(BaseDataBackendSettings):
         StringConstraints(pattern=r"^(?!.*\.\.)[^.$\x00]+(?:\.[^.$\x00]+)*$"),
     ] = "marsha"
     CLIENT_OPTIONS: MongoClientOptions = MongoClientOptions()
+    WRITE_CONCERN: Optional[Union[NonNegativeInt, str]] = None
+    WRITE_CONCURRENCY: PositiveInt = 1
+    WRITE_JOURNAL: Optional[bool] = None
+    WRITE_ORDERED: bool = True
 
 
 class MongoQuery(BaseQuery):
@@ -184,6 +207,7 @@ class MongoDataBackend(BaseDataBackend[Settings, MongoQuery], Writable, Listable
         chunk_size: Optional[int] = None,
         raw_output: bool = False,
         ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
         max_statements: Optional[PositiveInt] = None,
     ) -> Union[Iterator[bytes], Iterator[dict]]:
         """Read documents matching the `query` from `target` collection and yield them.
@@ -198,6 +222,9 @@ class MongoDataBackend(BaseDataBackend[Settings, MongoQuery], Writable, Listable
             ignore_errors (bool): If `True`, encoding errors during the read operation
                 will be ignored and logged.
                 If `False` (default), a `BackendException` is raised on any error.
+            prefetch (int): The number of records to prefetch (queue) while yielding.
+                If `prefetch` is `None` it defaults to `1`, i.e. no records are
+                prefetched.
             max_statements (int): The maximum number of statements to yield.
                 If `None` (default) or `0`, there is no maximum.
 
@@ -211,7 +238,13 @@ class MongoDataBackend(BaseDataBackend[Settings, MongoQuery], Writable, Listable
             BackendParameterException: If the `target` is not a valid collection name.
         """
         yield from super().read(
-            query, target, chunk_size, raw_output, ignore_errors, max_statements
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
         )
 
     def _read_dicts(
@@ -232,13 +265,14 @@ class MongoDataBackend(BaseDataBackend[Settings, MongoQuery], Writable, Listable
             logger.error(msg, error)
             raise BackendException(msg % error) from error
 
-    def write(
+    def write(  # noqa: PLR0913
         self,
         data: Union[IOBase, Iterable[bytes], Iterable[dict]],
         target: Optional[str] = None,
         chunk_size: Optional[int] = None,
         ignore_errors: bool = False,
         operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
     ) -> int:
         """Write `data` documents to the `target` collection and return their count.
 
@@ -253,6 +287,8 @@ class MongoDataBackend(BaseDataBackend[Settings, MongoQuery], Writable, Listable
             operation_type (BaseOperationType or None): The mode of the write operation.
                 If `operation_type` is `None`, the `default_operation_type` is used
                     instead. See `BaseOperationType`.
+            concurrency (int or None): The number of batches written concurrently.
+                If `concurrency` is `None` it defaults to `WRITE_CONCURRENCY`.
 
         Return:
             int: The number of documents written.
@@ -261,37 +297,46 @@ class MongoDataBackend(BaseDataBackend[Settings, MongoQuery], Writable, Listable
             BackendException: If any failure occurs during the write operation or
                 if an inescapable failure occurs and `ignore_errors` is set to `True`.
             BackendParameterException: If the `operation_type` is `APPEND` as it is not
-                supported.
+                supported or if `concurrency` is not a strictly positive integer.
         """
-        return super().write(data, target, chunk_size, ignore_errors, operation_type)
+        return super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
 
-    def _write_dicts(
+    def _write_dicts(  # noqa: PLR0913
         self,
         data: Iterable[dict],
         target: Optional[str],
         chunk_size: int,
         ignore_errors: bool,
         operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],  # noqa: ARG002
     ) -> int:
         """Method called by `self.write` writing dictionaries. See `self.write`."""
-        count = 0
         collection = self._get_target_collection(target)
+        write_concern = self.get_write_concern(self.settings)
+        if write_concern:
+            collection = collection.with_options(write_concern=write_concern)
         msg = "Start writing to the %s collection of the %s database (chunk size: %d)"
         logger.debug(msg, collection, self.database, chunk_size)
         if operation_type == BaseOperationType.UPDATE:
-            for batch in iter_by_batch(self.to_replace_one(data), chunk_size):
-                count += self._bulk_update(batch, ignore_errors, collection)
-            logger.info("Updated %d documents with success", count)
+            batches = iter_by_batch(self.to_replace_one(data), chunk_size)
+            write_batch = self._bulk_update
+            msg = "Updated %d documents with success"
         elif operation_type == BaseOperationType.DELETE:
-            for batch in iter_by_batch(self.to_ids(data), chunk_size):
-                count += self._bulk_delete(batch, ignore_errors, collection)
-            logger.info("Deleted %d documents with success", count)
+            batches = iter_by_batch(self.to_ids(data), chunk_size)
+            write_batch = self._bulk_delete
+            msg = "Deleted %d documents with success"
         else:
             data = self.to_documents(data, ignore_errors, operation_type)
-            for batch in iter_by_batch(data, chunk_size):
-                count += self._bulk_import(batch, ignore_errors, collection)
-            logger.info("Inserted %d documents with success", count)
+            batches = iter_by_batch(data, chunk_size)
+            write_batch = self._bulk_import
+            msg = "Inserted %d documents with success"
 
+        count = 0
+        for batch in batches:
+            count += write_batch(batch, ignore_errors, collection)
+        logger.info(msg, count)
         return count
 
     def close(self) -> None:
@@ -307,6 +352,25 @@ class MongoDataBackend(BaseDataBackend[Settings, MongoQuery], Writable, Listable
             logger.error(msg, error)
             raise BackendException(msg % error) from error
 
+    @staticmethod
+    def get_write_concern(settings: MongoDataBackendSettings) -> Optional[WriteConcern]:
+        """Return the configured write concern or `None` to use the server default."""
+        if settings.WRITE_CONCERN is None and settings.WRITE_JOURNAL is None:
+            return None
+        return WriteConcern(w=settings.WRITE_CONCERN, j=settings.WRITE_JOURNAL)
+
+    @staticmethod
+    def get_bulk_write_count(error: Exception, key: str) -> int:
+        """Log failed documents of a bulk write `error` and return the `key` count.
+
+        With unordered bulk writes, only failed documents are not written.
+        """
+        details = getattr(error, "details", {})
+        for write_error in details.get("writeErrors", []):
+            msg = "Failed to write document %s of the chunk: %s"
+            logger.warning(msg, write_error.get("index"), write_error.get("errmsg"))
+        return details.get(key, 0)
+
     @staticmethod
     def to_ids(data: Iterable[dict]) -> Iterable[str]:
         """Convert `data` statements to ids."""
@@ -388,12 +452,14 @@ class MongoDataBackend(BaseDataBackend[Settings, MongoQuery], Writable, Listable
     ) -> int:
         """Insert a `batch` of documents into the MongoDB `collection`."""
         try:
-            new_documents = collection.insert_many(batch)
+            new_documents = collection.insert_many(
+                batch, ordered=self.settings.WRITE_ORDERED
+            )
         except (BulkWriteError, PyMongoError, BSONError, ValueError) as error:
             msg = "Failed to insert document chunk: %s"
             if ignore_errors:
                 logger.warning(msg, error)
-                return getattr(error, "details", {}).get("nInserted", 0)
+                return self.get_bulk_write_count(error, "nInserted")
             logger.error(msg, error)
             raise BackendException(msg % error) from error
 
@@ -424,12 +490,14 @@ class MongoDataBackend(BaseDataBackend[Settings, MongoQuery], Writable, Listable
     ) -> int:
         """Update a `batch` of documents into the MongoDB `collection`."""
         try:
-            updated_documents = collection.bulk_write(batch)
+            updated_documents = collection.bulk_write(
+                batch, ordered=self.settings.WRITE_ORDERED
+            )
         except (BulkWriteError, PyMongoError, BSONError, ValueError) as error:
             msg = "Failed to update document chunk: %s"
             if ignore_errors:
                 logger.warning(msg, error)
-                return getattr(error, "details", {}).get("nModified", 0)
+                return self.get_bulk_write_count(error, "nModified")
             logger.error(msg, error)
             raise BackendException(msg % error) from error
 
@@ -0,0 +1,763 @@
+"""Parquet data backend for Ralph."""
+
+import json
+import logging
+import os
+import re
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from functools import partial
+from io import SEEK_CUR, SEEK_END, SEEK_SET, IOBase, RawIOBase
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+from uuid import uuid4
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from dateutil.parser import isoparse
+from pydantic import PositiveInt
+from pydantic_settings import SettingsConfigDict
+
+from ralph.backends.data.base import (
+    BaseDataBackend,
+    BaseDataBackendSettings,
+    BaseOperationType,
+    BaseQuery,
+    DataBackendStatus,
+    Listable,
+    Writable,
+)
+from ralph.conf import BASE_SETTINGS_CONFIG
+from ralph.exceptions import BackendException, BackendParameterException
+from ralph.utils import (
+    get_statement_fingerprint,
+    iter_by_batch,
+    now,
+    parse_iterable_to_dict,
+)
+
+if TYPE_CHECKING:
+    from ralph.backends.data.s3 import S3DataBackend
+
+logger = logging.getLogger(__name__)
+
+# Core statement fields stored in dedicated columns. Each column is associated with
+# the path of its field in the statement.
+STATEMENT_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "id": ("id",),
+    "verb": ("verb", "id"),
+    "object": ("object", "id"),
+    "object_type": ("object", "objectType"),
+    "actor_mbox": ("actor", "mbox"),
+    "actor_mbox_sha1sum": ("actor", "mbox_sha1sum"),
+    "actor_openid": ("actor", "openid"),
+    "actor_account_name": ("actor", "account", "name"),
+    "actor_account_home_page": ("actor", "account", "homePage"),
+    "registration": ("context", "registration"),
+}
+
+# Objects written to S3 are held in memory up to this size, then in a temporary file.
+SPOOLED_FILE_MAX_SIZE = 64 * 1024 * 1024
+
+TIMESTAMP_TYPE = pa.timestamp("us", tz="UTC")
+
+SCHEMA = pa.schema(
+    [
+        pa.field("timestamp", TIMESTAMP_TYPE, nullable=False),
+        *(pa.field(column, pa.string()) for column in STATEMENT_COLUMNS),
+        pa.field("fingerprint", pa.string()),
+        pa.field("statement", pa.string(), nullable=False),
+    ]
+)
+
+
+class ParquetDataBackendSettings(BaseDataBackendSettings):
+    """Parquet data backend default configuration.
+
+    Attributes:
+        STORAGE (str): Where Parquet files are stored. Either `fs` to store files in
+            the `DEFAULT_DIRECTORY_PATH` or `s3` to store objects with the S3 data
+            backend (configured with the `RALPH_BACKENDS__DATA__S3__` settings).
+        DEFAULT_DIRECTORY_PATH (Path): The default directory where to list, read and
+            write files when the `STORAGE` is `fs`.
+        COMPRESSION (str): The compression codec of written files.
+        LOCALE_ENCODING (str): The encoding used for writing raw statements.
+        READ_CHUNK_SIZE (int): The default number of rows read at once.
+        WRITE_CHUNK_SIZE (int): The default number of rows of written row groups.
+    """
+
+    model_config = {
+        **BASE_SETTINGS_CONFIG,
+        **SettingsConfigDict(env_prefix="RALPH_BACKENDS__DATA__PARQUET__"),
+    }
+
+    STORAGE: Literal["fs", "s3"] = "fs"
+    DEFAULT_DIRECTORY_PATH: Path = Path(".")
+    COMPRESSION: Literal["none", "snappy", "gzip", "brotli", "lz4", "zstd"] = "zstd"
+    WRITE_CHUNK_SIZE: int = 10000
+
+
+class ParquetQuery(BaseQuery):
+    """Parquet query model.
+
+    Attributes:
+        pattern (str): The glob pattern of the files (or object keys) to read in the
+            target directory (or bucket).
+        columns (list): The columns to read. If `None`, whole statements are read.
+        since (datetime): Only read statements with a greater timestamp.
+        until (datetime): Only read statements with a lower or equal timestamp.
+        verb (str): Only read statements with this verb id.
+        ids (list): Only read statements with one of these ids.
+    """
+
+    pattern: str = "*.parquet"
+    columns: Optional[List[str]] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    verb: Optional[str] = None
+    ids: Optional[List[str]] = None
+
+
+class S3ObjectFile(RawIOBase):
+    """Read-only file object fetching ranges of an S3 object on demand.
+
+    Parquet readers only fetch the footer and the column chunks of selected row
+    groups, thus an archive is not downloaded as a whole.
+    """
+
+    def __init__(self, client: Any, bucket: str, key: str, size: int):
+        """Instantiate the file object of the `key` object of `bucket`."""
+        super().__init__()
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.size = size
+        self.position = 0
+
+    def readable(self) -> bool:
+        """Return `True` as the object is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return `True` as the object supports random access."""
+        return True
+
+    def tell(self) -> int:
+        """Return the current position in the object."""
+        return self.position
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        """Change the current position in the object and return it."""
+        origin = {SEEK_SET: 0, SEEK_CUR: self.position, SEEK_END: self.size}
+        self.position = max(origin[whence] + offset, 0)
+        return self.position
+
+    def readinto(self, buffer: Any) -> int:
+        """Read the next bytes of the object into `buffer` with a ranged request."""
+        end = min(self.position + len(buffer), self.size)
+        if end <= self.position:
+            return 0
+        response = self.client.get_object(
+            Bucket=self.bucket,
+            Key=self.key,
+            Range=f"bytes={self.position}-{end - 1}",
+        )
+        data = response["Body"].read()
+        buffer[: len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+
+Settings = TypeVar("Settings", bound=ParquetDataBackendSettings)
+
+
+class ParquetDataBackend(BaseDataBackend[Settings, ParquetQuery], Writable, Listable):
+    """Parquet data backend.
+
+    Statements are written to Parquet files with a column for their timestamp,
+    each of the `STATEMENT_COLUMNS` and their fingerprint, along with the whole
+    statement as a JSON column. Reads only decode the selected columns of the row
+    groups whose statistics match the query timestamp and verb.
+    """
+
+    name = "parquet"
+    default_operation_type = BaseOperationType.CREATE
+    unsupported_operation_types = {
+        BaseOperationType.APPEND,
+        BaseOperationType.DELETE,
+        BaseOperationType.UPDATE,
+    }
+    concurrent_writes = False
+
+    def __init__(self, settings: Optional[Settings] = None):
+        """Instantiate the Parquet data backend.
+
+        Args:
+            settings (ParquetDataBackendSettings or None): The data backend settings.
+                If `settings` is `None`, a default settings instance is used instead.
+        """
+        super().__init__(settings)
+        self.default_directory = self.settings.DEFAULT_DIRECTORY_PATH
+        self._s3: Optional["S3DataBackend"] = None
+
+    @property
+    def s3(self) -> "S3DataBackend":
+        """Return the S3 data backend storing objects, creating it if needed."""
+        if not self._s3:
+            from ralph.backends.data.s3 import S3DataBackend
+
+            self._s3 = S3DataBackend()
+        return self._s3
+
+    def status(self) -> DataBackendStatus:
+        """Check whether Parquet files can be read and written.
+
+        Return:
+            DataBackendStatus: The status of the data backend.
+        """
+        if self.settings.STORAGE == "s3":
+            return self.s3.status()
+
+        if not os.access(self.default_directory, os.R_OK | os.W_OK | os.X_OK):
+            logger.error(
+                "Invalid permissions for the default directory at %s",
+                self.default_directory.absolute(),
+            )
+            return DataBackendStatus.ERROR
+
+        return DataBackendStatus.OK
+
+    def list(
+        self, target: Optional[str] = None, details: bool = False, new: bool = False
+    ) -> Union[Iterator[str], Iterator[dict]]:
+        """List Parquet files (or objects) of the target directory (or bucket).
+
+        Args:
+            target (str or None): The target directory path (or bucket).
+                If target is `None`, the `DEFAULT_DIRECTORY_PATH` (or the default
+                bucket) is used instead.
+            details (bool): Get detailed file information instead of just file paths.
+            new (bool): Given the history, list only not already read objects.
+                Only supported by the `s3` storage.
+
+        Yield:
+            str: The next file path. (If details is False).
+            dict: The next file details. (If details is True).
+
+        Raise:
+            BackendException: If a failure occurs during the list operation.
+            BackendParameterException: If the `target` is not a directory path.
+        """
+        if self.settings.STORAGE == "s3":
+            yield from self.s3.list(target, details, new)
+            return
+
+        if new:
+            logger.warning("The `new` argument is ignored")
+
+        directory = self._get_path(target)
+        try:
+            paths = sorted(path for path in directory.iterdir() if path.is_file())
+        except OSError as error:
+            msg = "Invalid target argument: %s"
+            logger.error(msg, error)
+            raise BackendParameterException(msg % error) from error
+
+        for path in paths:
+            if not details:
+                yield str(path)
+                continue
+            stats = path.stat()
+            modified_at = datetime.fromtimestamp(int(stats.st_mtime), tz=timezone.utc)
+            yield {
+                "path": str(path),
+                "size": stats.st_size,
+                "modified_at": modified_at.isoformat(),
+            }
+
+    def read(  # noqa: PLR0913
+        self,
+        query: Optional[ParquetQuery] = None,
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        raw_output: bool = False,
+        ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
+        max_statements: Optional[PositiveInt] = None,
+    ) -> Union[Iterator[bytes], Iterator[dict]]:
+        """Read Parquet files matching the query in the target directory.
+
+        Args:
+            query (ParquetQuery): The files to read and the columns and statements
+                to select.
+            target (str or None): The target directory path (or bucket, optionally
+                followed by a `/` and a key prefix) containing the files.
+                If target is `None`, the `DEFAULT_DIRECTORY_PATH` (or the default
+                bucket) is used instead.
+            chunk_size (int or None): The number of rows read at once.
+                If `chunk_size` is `None` it defaults to `READ_CHUNK_SIZE`.
+            raw_output (bool): Controls whether to yield bytes or dictionaries.
+            ignore_errors (bool): If `True`, decoding errors of statements are
+                ignored and logged.
+                If `False` (default), a `BackendException` is raised on any error.
+            prefetch (int): The number of records to prefetch (queue) while yielding.
+                If `prefetch` is `None` it defaults to `1`, i.e. no records are
+                prefetched.
+            max_statements (int): The maximum number of statements to yield.
+                If `None` (default) or `0`, there is no maximum.
+
+        Yield:
+            bytes: The next JSON encoded statement (or selected columns) if
+                `raw_output` is True.
+            dict: The next statement (or selected columns) if `raw_output` is False.
+
+        Raise:
+            BackendException: If a failure occurs while reading a file or decoding
+                statements and `ignore_errors` is set to `False`.
+            BackendParameterException: If the query selects an unknown column.
+        """
+        yield from super().read(
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
+        )
+
+    def _read_bytes(
+        self,
+        query: ParquetQuery,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,  # noqa: ARG002
+    ) -> Iterator[bytes]:
+        """Method called by `self.read` yielding bytes. See `self.read`."""
+        encoding = self.settings.LOCALE_ENCODING
+        for batch in self._read_batches(query, target, chunk_size):
+            if query.columns is None:
+                # The `statement` column already holds JSON encoded statements.
+                for statement in batch.column(0).to_pylist():
+                    yield f"{statement}\n".encode(encoding)
+                continue
+
+            for row in self.to_documents(batch):
+                yield f"{json.dumps(row)}\n".encode(encoding)
+
+    def _read_dicts(
+        self,
+        query: ParquetQuery,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+    ) -> Iterator[dict]:
+        """Method called by `self.read` yielding dictionaries. See `self.read`."""
+        for batch in self._read_batches(query, target, chunk_size):
+            if query.columns is None:
+                statements = batch.column(0).to_pylist()
+                yield from parse_iterable_to_dict(statements, ignore_errors)
+                continue
+
+            yield from self.to_documents(batch)
+
+    def _read_batches(
+        self, query: ParquetQuery, target: Optional[str], chunk_size: int
+    ) -> Iterator[pa.RecordBatch]:
+        """Yield batches of the `query` columns of the matching rows.
+
+        Row groups whose statistics don't match the query are skipped, and only
+        selected and filtered columns are decoded.
+        """
+        columns = query.columns if query.columns is not None else ["statement"]
+        unknown_columns = set(columns).difference(SCHEMA.names)
+        if unknown_columns:
+            msg = "Unknown columns: %s"
+            logger.error(msg, sorted(unknown_columns))
+            raise BackendParameterException(msg % sorted(unknown_columns))
+
+        filter_columns = []
+        if query.since or query.until:
+            filter_columns.append("timestamp")
+        if query.verb:
+            filter_columns.append("verb")
+        if query.ids is not None:
+            filter_columns.append("id")
+        read_columns = list(dict.fromkeys([*columns, *filter_columns]))
+
+        for name, source in self._iter_sources(target, query.pattern):
+            try:
+                parquet_file = pq.ParquetFile(source)
+                row_groups = self.get_row_groups(parquet_file.metadata, query)
+                logger.debug(
+                    "Reading %d of %d row groups of %s",
+                    len(row_groups),
+                    parquet_file.metadata.num_row_groups,
+                    name,
+                )
+                if not row_groups:
+                    continue
+                batches = parquet_file.iter_batches(
+                    batch_size=chunk_size, row_groups=row_groups, columns=read_columns
+                )
+                for batch in batches:
+                    mask = self.get_mask(batch, query)
+                    if mask is not None:
+                        batch = batch.filter(mask)  # noqa: PLW2901
+                    if batch.num_rows:
+                        yield batch.select(columns)
+            except (OSError, pa.ArrowException) as error:
+                msg = "Failed to read %s: %s"
+                logger.error(msg, name, error)
+                raise BackendException(msg % (name, error)) from error
+            finally:
+                source.close()
+
+    def _iter_sources(
+        self, target: Optional[str], pattern: str
+    ) -> Iterator[Tuple[str, Any]]:
+        """Yield the name and the file object of files matching the `pattern`."""
+        if self.settings.STORAGE == "s3":
+            bucket, prefix = self._get_bucket_and_key(target)
+            if prefix:
+                pattern = f"{prefix.rstrip('/')}/{pattern}"
+            for key, size in self._list_objects(bucket, pattern):
+                yield key, S3ObjectFile(self.s3.client, bucket, key, size)
+            return
+
+        directory = self._get_path(target)
+        paths = sorted(path for path in directory.glob(pattern) if path.is_file())
+        if not paths:
+            logger.info("No file found for query: %s", directory / pattern)
+        for path in paths:
+            yield str(path), pa.OSFile(str(path))
+
+    def _list_objects(self, bucket: str, pattern: str) -> Iterator[Tuple[str, int]]:
+        """Yield the key and the size of the `bucket` objects matching `pattern`.
+
+        Only objects sharing the literal prefix of the `pattern` are listed.
+
+        Raise:
+            BackendException: If a failure occurs while listing the bucket.
+        """
+        from botocore.exceptions import ClientError
+
+        prefix = re.split(r"[*?[]", pattern, maxsplit=1)[0]
+        paginator = self.s3.client.get_paginator("list_objects_v2")
+        try:
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+                for obj in page.get("Contents", []):
+                    if fnmatch(obj["Key"], pattern):
+                        yield obj["Key"], obj["Size"]
+        except ClientError as error:
+            error_msg = error.response["Error"]["Message"]
+            msg = "Failed to list the bucket %s: %s"
+            logger.error(msg, bucket, error_msg)
+            raise BackendException(msg % (bucket, error_msg)) from error
+
+    def write(  # noqa: PLR0913
+        self,
+        data: Union[IOBase, Iterable[bytes], Iterable[dict]],
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        ignore_errors: bool = False,
+        operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
+    ) -> int:
+        """Write `data` statements to a Parquet file and return their count.
+
+        Args:
+            data (Iterable or IOBase): The data containing statements to write.
+            target (str or None): The target file path (or bucket and object key
+                separated by a `/`).
+                If target is `None`, a random file name is used in the
+                `DEFAULT_DIRECTORY_PATH` (or in the default bucket).
+            chunk_size (int or None): The number of rows of each row group.
+                If `chunk_size` is `None` it defaults to `WRITE_CHUNK_SIZE`.
+            ignore_errors (bool): If `True`, statements without a valid timestamp
+                are skipped and logged.
+                If `False` (default), a `BackendException` is raised on any error.
+            operation_type (BaseOperationType or None): The mode of the write operation.
+                If `operation_type` is `None`, the `default_operation_type` is used
+                instead. The target file is expected to be absent.
+            concurrency (int or None): Ignored as a Parquet file is written
+                sequentially.
+
+        Return:
+            int: The number of written statements.
+
+        Raise:
+            BackendException: If any failure occurs during the write operation or
+                if the target file already exists.
+            BackendParameterException: If the `operation_type` is `APPEND`, `UPDATE`
+                or `DELETE` as they are not supported.
+        """
+        return super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
+
+    def _write_dicts(  # noqa: PLR0913
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,  # noqa: ARG002
+        concurrency: Optional[PositiveInt],  # noqa: ARG002
+    ) -> int:
+        """Method called by `self.write` writing dictionaries. See `self.write`."""
+        if not target:
+            target = f"{now()}-{uuid4()}.parquet"
+            logger.info("Target file not specified; using random file name: %s", target)
+
+        count = 0
+        compression = self.settings.COMPRESSION
+        with self._open_output(target) as sink:
+            try:
+                with pq.ParquetWriter(sink, SCHEMA, compression=compression) as writer:
+                    rows = self.to_rows(data, ignore_errors)
+                    for batch in iter_by_batch(rows, chunk_size):
+                        table = self.to_table(batch)
+                        writer.write_table(table, row_group_size=chunk_size)
+                        count += len(batch)
+            except (OSError, pa.ArrowException) as error:
+                msg = "Failed to write to %s: %s"
+                logger.error(msg, target, error)
+                raise BackendException(msg % (target, error)) from error
+
+        logger.info("Written %d statements to %s with success", count, target)
+        return count
+
+    @contextmanager
+    def _open_output(self, target: str) -> Iterator[Any]:
+        """Yield the file object writing to the `target` file (or object).
+
+        Objects are first written to a temporary file, then uploaded with the S3 data
+        backend. Partially written files are removed on failure.
+
+        Raise:
+            BackendException: If the target file already exists or if a failure
+                occurs while uploading the object.
+        """
+        if self.settings.STORAGE == "s3":
+            bucket, key = self._get_bucket_and_key(target, object_key=True)
+            with SpooledTemporaryFile(max_size=SPOOLED_FILE_MAX_SIZE) as file:
+                yield file
+                file.seek(0)
+                chunks = iter(
+                    partial(file.read, self.s3.settings.WRITE_CHUNK_SIZE), b""
+                )
+                self.s3.write(
+                    chunks,
+                    target=f"{bucket}/{key}",
+                    operation_type=BaseOperationType.CREATE,
+                )
+            return
+
+        path = self._get_path(target)
+        if path.exists():
+            msg = "%s already exists and overwrite is not allowed"
+            logger.error(msg, path)
+            raise BackendException(msg % path)
+
+        try:
+            with path.open("xb") as file:
+                yield file
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+
+    def close(self) -> None:
+        """Close the S3 data backend client if it was used.
+
+        Raise:
+            BackendException: If a failure occurs during the close operation.
+        """
+        if not self._s3:
+            logger.info("No open connections to close; skipping")
+            return
+
+        self._s3.close()
+
+    def _get_path(self, target: Optional[str]) -> Path:
+        """Return the `target` path, relative to the `DEFAULT_DIRECTORY_PATH`."""
+        if not target:
+            return self.default_directory
+        path = Path(target)
+        return path if path.is_absolute() else self.default_directory / path
+
+    def _get_bucket_and_key(
+        self, target: Optional[str], object_key: bool = False
+    ) -> Tuple[str, str]:
+        """Return the bucket and the object key (or key prefix) of the `target`.
+
+        If `object_key` is `True`, a target without `/` is an object key of the
+        default bucket, else it is a bucket.
+
+        Raise:
+            BackendParameterException: If the target bucket is not set.
+        """
+        if target and ("/" in target or not object_key):
+            bucket, _, key = target.partition("/")
+        else:
+            bucket, key = self.s3.default_bucket_name or "", target or ""
+
+        if not bucket:
+            msg = "The target bucket is not set"
+            logger.error(msg)
+            raise BackendParameterException(msg)
+
+        return bucket, key
+
+    @staticmethod
+    def get_row_groups(metadata: pq.FileMetaData, query: ParquetQuery) -> List[int]:
+        """Return the indexes of row groups which may contain matching statements.
+
+        Row groups are skipped when the minimum and maximum values of their
+        `timestamp` or `verb` column don't match the query.
+        """
+        since = ParquetDataBackend.to_utc(query.since)
+        until = ParquetDataBackend.to_utc(query.until)
+        names = metadata.schema.to_arrow_schema().names
+        row_groups = []
+        for index in range(metadata.num_row_groups):
+            row_group = metadata.row_group(index)
+            bounds: Dict[str, Tuple[Any, Any]] = {}
+            for column in ("timestamp", "verb"):
+                if column not in names:
+                    continue
+                statistics = row_group.column(names.index(column)).statistics
+                if statistics is not None and statistics.has_min_max:
+                    bounds[column] = (statistics.min, statistics.max)
+
+            if "timestamp" in bounds:
+                first, last = (
+                    cast(datetime, ParquetDataBackend.to_utc(value))
+                    for value in bounds["timestamp"]
+                )
+                if (since and last <= since) or (until and first > until):
+                    continue
+
+            if query.verb and "verb" in bounds:
+                lowest, highest = bounds["verb"]
+                if not lowest <= query.verb <= highest:
+                    continue
+
+            row_groups.append(index)
+        return row_groups
+
+    @staticmethod
+    def get_mask(batch: pa.RecordBatch, query: ParquetQuery) -> Optional[pa.Array]:
+        """Return the mask of the `batch` rows matching the query or `None`."""
+        conditions = []
+        if query.since:
+            since = pa.scalar(ParquetDataBackend.to_utc(query.since), TIMESTAMP_TYPE)
+            conditions.append(pc.greater(batch["timestamp"], since))
+        if query.until:
+            until = pa.scalar(ParquetDataBackend.to_utc(query.until), TIMESTAMP_TYPE)
+            conditions.append(pc.less_equal(batch["timestamp"], until))
+        if query.verb:
+            conditions.append(pc.equal(batch["verb"], query.verb))
+        if query.ids is not None:
+            conditions.append(pc.is_in(batch["id"], pa.array(query.ids, pa.string())))
+
+        if not conditions:
+            return None
+
+        mask = conditions[0]
+        for condition in conditions[1:]:
+            mask = pc.and_(mask, condition)
+        return pc.fill_null(mask, False)
+
+    @staticmethod
+    def to_utc(value: Optional[datetime]) -> Optional[datetime]:
+        """Return the `value` in UTC, considering naive datetimes to be in UTC."""
+        if value is None:
+            return None
+        if not value.tzinfo:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    @staticmethod
+    def get_field(statement: dict, path: Tuple[str, ...]) -> Optional[str]:
+        """Return the `statement` field value at `path` or `None` if it is missing."""
+        value: Any = statement
+        for key in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return None if value is None else str(value)
+
+    @staticmethod
+    def get_timestamp(statement: dict, ignore_errors: bool) -> Optional[datetime]:
+        """Return the `statement` timestamp in UTC, or `None` if it is invalid.
+
+        Raise:
+            BackendException: If the statement has no valid timestamp and
+                `ignore_errors` is set to `False`.
+        """
+        try:
+            return ParquetDataBackend.to_utc(isoparse(statement["timestamp"]))
+        except (KeyError, TypeError, ValueError, OverflowError) as error:
+            msg = "statement %s has a missing or invalid 'timestamp' field"
+            if ignore_errors:
+                logger.warning(msg, statement)
+                return None
+            logger.error(msg, statement)
+            raise BackendException(msg % statement) from error
+
+    @staticmethod
+    def to_rows(data: Iterable[dict], ignore_errors: bool) -> Iterator[Tuple]:
+        """Convert `data` statements to rows of `SCHEMA` values.
+
+        Raise:
+            BackendException: If a statement has no valid timestamp and
+                `ignore_errors` is set to `False`.
+        """
+        for statement in data:
+            timestamp = ParquetDataBackend.get_timestamp(statement, ignore_errors)
+            if not timestamp:
+                continue
+
+            yield (
+                timestamp,
+                *(
+                    ParquetDataBackend.get_field(statement, path)
+                    for path in STATEMENT_COLUMNS.values()
+                ),
+                get_statement_fingerprint(statement),
+                json.dumps(statement),
+            )
+
+    @staticmethod
+    def to_table(rows: List[Tuple]) -> pa.Table:
+        """Convert `rows` of `SCHEMA` values to a table."""
+        columns = zip(*rows)
+        arrays = [
+            pa.array(values, field.type) for values, field in zip(columns, SCHEMA)
+        ]
+        return pa.Table.from_arrays(arrays, schema=SCHEMA)
+
+    @staticmethod
+    def to_documents(batch: pa.RecordBatch) -> Iterator[dict]:
+        """Yield the `batch` rows as dictionaries with ISO 8601 timestamps."""
+        for row in batch.to_pylist():
+            if isinstance(row.get("timestamp"), datetime):
+                row["timestamp"] = row["timestamp"].isoformat()
+            yield row
@@ -77,6 +77,7 @@ class S3DataBackend(
         BaseOperationType.DELETE,
         BaseOperationType.UPDATE,
     }
+    concurrent_writes = False
 
     def __init__(self, settings: Optional[S3DataBackendSettings] = None):
         """Instantiate the AWS S3 client."""
@@ -163,6 +164,7 @@ class S3DataBackend(
         chunk_size: Optional[int] = None,
         raw_output: bool = False,
         ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
         max_statements: Optional[PositiveInt] = None,
     ) -> Union[Iterator[bytes], Iterator[dict]]:
         """Read an object matching the `query` in the `target` bucket and yield it.
@@ -178,6 +180,9 @@ class S3DataBackend(
             ignore_errors (bool): If `True`, encoding errors during the read operation
                 will be ignored and logged.
                 If `False` (default), a `BackendException` is raised on any error.
+            prefetch (int): The number of records to prefetch (queue) while yielding.
+                If `prefetch` is `None` it defaults to `1`, i.e. no records are
+                prefetched.
             max_statements (int): The maximum number of statements to yield.
                 If `None` (default) or `0`, there is no maximum.
 
@@ -191,7 +196,13 @@ class S3DataBackend(
             BackendParameterException: If a backend argument value is not valid.
         """
         yield from super().read(
-            query, target, chunk_size, raw_output, ignore_errors, max_statements
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
         )
 
     def _read_bytes(
@@ -274,13 +285,14 @@ class S3DataBackend(
             logger.error(msg, key, error_msg)
             raise BackendException(msg % (key, error_msg)) from error
 
-    def write(
+    def write(  # noqa: PLR0913
         self,
         data: Union[IOBase, Iterable[bytes], Iterable[dict]],
         target: Optional[str] = None,
         chunk_size: Optional[int] = None,
         ignore_errors: bool = False,
         operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
     ) -> int:
         """Write `data` records to the `target` bucket and return their count.
 
@@ -302,6 +314,8 @@ class S3DataBackend(
                 If operation_type is `CREATE` or `INDEX`, the target object is
                 expected to be absent. If the target object exists a
                 `BackendException` is raised.
+            concurrency (int or None): Ignored as records are uploaded sequentially
+                to a single object.
 
         Return:
             int: The number of written objects.
@@ -311,28 +325,32 @@ class S3DataBackend(
                 if an inescapable failure occurs and `ignore_errors` is set to `True`.
             BackendParameterException: If a backend argument value is not valid.
         """
-        return super().write(data, target, chunk_size, ignore_errors, operation_type)
+        return super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
 
-    def _write_dicts(
+    def _write_dicts(  # noqa: PLR0913
         self,
         data: Iterable[dict],
         target: Optional[str],
         chunk_size: int,
         ignore_errors: bool,
         operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],
     ) -> int:
         """Method called by `self.write` writing dictionaries. See `self.write`."""
         return super()._write_dicts(
-            data, target, chunk_size, ignore_errors, operation_type
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
         )
 
-    def _write_bytes(
+    def _write_bytes(  # noqa: PLR0913
         self,
         data: Iterable[bytes],
         target: Optional[str],
         chunk_size: int,
         ignore_errors: bool,  # noqa: ARG002
         operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],  # noqa: ARG002
     ) -> int:
         """Method called by `self.write` writing bytes. See `self.write`."""
         if not target:
@@ -0,0 +1,640 @@
+"""SQLite data backend for Ralph."""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from io import IOBase
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from uuid import uuid4
+
+from dateutil.parser import isoparse
+from pydantic import NonNegativeFloat, PositiveInt, StringConstraints
+from pydantic_settings import SettingsConfigDict
+from typing_extensions import Annotated
+
+from ralph.backends.data.base import (
+    BaseDataBackend,
+    BaseDataBackendSettings,
+    BaseOperationType,
+    BaseQuery,
+    DataBackendStatus,
+    Listable,
+    Writable,
+)
+from ralph.conf import BASE_SETTINGS_CONFIG
+from ralph.exceptions import BackendException, BackendParameterException
+from ralph.utils import (
+    get_statement_fingerprint,
+    iter_by_batch,
+    parse_iterable_to_dict,
+)
+
+logger = logging.getLogger(__name__)
+
+TABLE_NAME_PATTERN = r"^[A-Za-z_][A-Za-z0-9_]*$"
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Statement fields stored in dedicated columns to be queried through an index. Each
+# column is associated with the path of its field in the statement.
+STATEMENT_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "verb": ("verb", "id"),
+    "object": ("object", "id"),
+    "actor_mbox": ("actor", "mbox"),
+    "actor_mbox_sha1sum": ("actor", "mbox_sha1sum"),
+    "actor_openid": ("actor", "openid"),
+    "actor_account_name": ("actor", "account", "name"),
+    "actor_account_home_page": ("actor", "account", "homePage"),
+    "authority_mbox": ("authority", "mbox"),
+    "authority_mbox_sha1sum": ("authority", "mbox_sha1sum"),
+    "authority_openid": ("authority", "openid"),
+    "authority_account_name": ("authority", "account", "name"),
+    "authority_account_home_page": ("authority", "account", "homePage"),
+    "registration": ("context", "registration"),
+}
+
+COLUMNS = ("id", "timestamp", *STATEMENT_COLUMNS, "fingerprint", "statement")
+
+# Indexes of the statements table by name. Each index starts with the columns queried
+# by equality and ends with the `timestamp` and `id` sort columns. Except for the
+# `timestamp` index, indexes are partial to only index statements having the field.
+INDEXES: Dict[str, Tuple[str, ...]] = {
+    "timestamp": (),
+    "verb": ("verb",),
+    "object": ("object",),
+    "actor_mbox": ("actor_mbox",),
+    "actor_mbox_sha1sum": ("actor_mbox_sha1sum",),
+    "actor_openid": ("actor_openid",),
+    "actor_account": ("actor_account_name", "actor_account_home_page"),
+    "authority_mbox": ("authority_mbox",),
+    "authority_mbox_sha1sum": ("authority_mbox_sha1sum",),
+    "authority_openid": ("authority_openid",),
+    "authority_account": ("authority_account_name", "authority_account_home_page"),
+    "registration": ("registration",),
+}
+
+
+class SQLiteDataBackendSettings(BaseDataBackendSettings):
+    """SQLite data backend default configuration.
+
+    Attributes:
+        DATABASE_PATH (Path): The path of the SQLite database file.
+        DEFAULT_TABLE (str): The default table to read and write statements.
+        BUSY_TIMEOUT (float): The number of seconds to wait for a lock held by another
+            connection before failing a write operation.
+        SYNCHRONOUS (str): The `synchronous` pragma of connections. In WAL mode,
+            `NORMAL` only syncs the database file on checkpoints.
+        LOCALE_ENCODING (str): The locale encoding to use when none is provided.
+        READ_CHUNK_SIZE (int): The default chunk size for reading rows.
+        WRITE_CHUNK_SIZE (int): The default number of rows written in one transaction.
+    """
+
+    model_config = {
+        **BASE_SETTINGS_CONFIG,
+        **SettingsConfigDict(env_prefix="RALPH_BACKENDS__DATA__SQLITE__"),
+    }
+
+    DATABASE_PATH: Path = Path("ralph.sqlite3")
+    DEFAULT_TABLE: Annotated[str, StringConstraints(pattern=TABLE_NAME_PATTERN)] = (
+        "statements"
+    )
+    BUSY_TIMEOUT: NonNegativeFloat = 5.0
+    SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+
+
+class SQLiteQuery(BaseQuery):
+    """SQLite query model.
+
+    Attributes:
+        select (str or list): The column(s) to select.
+        where (str or list): The condition(s) rows should match.
+        parameters (dict or list): The values of the named or positional parameters
+            of the query.
+        limit (int): The maximum number of rows to return.
+        sort (str): The order by expression of the query.
+    """
+
+    select: Union[str, List[str]] = "statement"
+    where: Optional[Union[str, List[str]]] = None
+    parameters: Optional[Union[Dict[str, Any], List[Any]]] = None
+    limit: Optional[int] = None
+    sort: Optional[str] = None
+
+
+Settings = TypeVar("Settings", bound=SQLiteDataBackendSettings)
+
+
+class SQLiteDataBackend(BaseDataBackend[Settings, SQLiteQuery], Writable, Listable):
+    """SQLite data backend.
+
+    Statements are stored in a table with indexed columns for the fields queried by
+    the LRS, their fingerprint and the whole statement as a JSON document. The
+    database is opened in WAL mode, thus reads are not blocked by writes.
+    """
+
+    name = "sqlite"
+    unsupported_operation_types = {BaseOperationType.APPEND}
+    concurrent_writes = False
+
+    def __init__(self, settings: Optional[Settings] = None):
+        """Instantiate the SQLite data backend.
+
+        Args:
+            settings (SQLiteDataBackendSettings or None): The data backend settings.
+                If `settings` is `None`, a default settings instance is used instead.
+        """
+        super().__init__(settings)
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._tables: Set[str] = set()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Return the SQLite connection of the current thread.
+
+        Connections are opened on first use, one per thread, as a connection only
+        runs one transaction at a time.
+        """
+        thread_id = threading.get_ident()
+        if thread_id not in self._connections:
+            self._connections[thread_id] = self._connect()
+        return self._connections[thread_id]
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the SQLite database in WAL mode."""
+        try:
+            connection = sqlite3.connect(
+                self.settings.DATABASE_PATH,
+                timeout=self.settings.BUSY_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(f"PRAGMA synchronous={self.settings.SYNCHRONOUS}")
+        except sqlite3.Error as error:
+            msg = "Failed to connect to the %s SQLite database: %s"
+            logger.error(msg, self.settings.DATABASE_PATH, error)
+            raise BackendException(
+                msg % (self.settings.DATABASE_PATH, error)
+            ) from error
+        return connection
+
+    def status(self) -> DataBackendStatus:
+        """Check the SQLite database status.
+
+        Return:
+            DataBackendStatus: The status of the data backend.
+        """
+        try:
+            self.connection.execute("SELECT 1")
+        except (BackendException, sqlite3.Error) as error:
+            logger.error("Failed to query the SQLite database: %s", error)
+            return DataBackendStatus.AWAY
+
+        return DataBackendStatus.OK
+
+    def list(
+        self, target: Optional[str] = None, details: bool = False, new: bool = False
+    ) -> Union[Iterator[str], Iterator[dict]]:
+        """List tables of the SQLite database.
+
+        Args:
+            target (str or None): Ignored.
+            details (bool): Get detailed table information instead of just names.
+            new (bool): Ignored.
+
+        Yield:
+            str: The next table name. (If `details` is False).
+            dict: The next table details. (If `details` is True).
+
+        Raise:
+            BackendException: If a failure occurs during the list operation.
+        """
+        if target:
+            logger.warning("The `target` argument is ignored")
+
+        if new:
+            logger.warning("The `new` argument is ignored")
+
+        sql = "SELECT name, sql FROM sqlite_master WHERE type = 'table'"
+        try:
+            tables = self.connection.execute(sql).fetchall()
+        except sqlite3.Error as error:
+            msg = "Failed to list SQLite tables: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+        for name, sql in tables:
+            if details:
+                yield {"name": name, "sql": sql}
+            else:
+                yield name
+
+    def read(  # noqa: PLR0913
+        self,
+        query: Optional[SQLiteQuery] = None,
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        raw_output: bool = False,
+        ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
+        max_statements: Optional[PositiveInt] = None,
+    ) -> Union[Iterator[bytes], Iterator[dict]]:
+        """Read rows matching the `query` in the `target` table and yield them.
+
+        Args:
+            query (SQLiteQuery): The query to use when fetching rows.
+            target (str or None): The target table name to query.
+                If target is `None`, the `DEFAULT_TABLE` is used instead.
+            chunk_size (int or None): The number of rows fetched at once.
+                If `chunk_size` is `None` it defaults to `READ_CHUNK_SIZE`.
+            raw_output (bool): Controls whether to yield dictionaries or bytes.
+            ignore_errors (bool): If `True`, encoding errors during the read operation
+                will be ignored and logged.
+                If `False` (default), a `BackendException` is raised on any error.
+            prefetch (int): The number of records to prefetch (queue) while yielding.
+                If `prefetch` is `None` it defaults to `1`, i.e. no records are
+                prefetched.
+            max_statements (int): The maximum number of statements to yield.
+                If `None` (default) or `0`, there is no maximum.
+
+        Yield:
+            bytes: The next raw row if `raw_output` is True.
+            dict: The next row, with a JSON parsed `statement`, if `raw_output` is
+                False.
+
+        Raise:
+            BackendException: If a failure occurs during the SQLite query or
+                during encoding rows and `ignore_errors` is set to `False`.
+            BackendParameterException: If the `target` is not a valid table name.
+        """
+        yield from super().read(
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
+        )
+
+    def _read_bytes(
+        self,
+        query: SQLiteQuery,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+    ) -> Iterator[bytes]:
+        """Method called by `self.read` yielding bytes. See `self.read`.
+
+        The `statement` column already holds a JSON document, thus it is written as
+        is in the output, without being decoded and encoded back.
+        """
+        locale = self.settings.LOCALE_ENCODING
+        rows = self._read_rows(query, target, chunk_size)
+        for i, (column_names, row) in enumerate(rows):
+            try:
+                yield self.to_raw_document(column_names, row, locale)
+            except (TypeError, ValueError) as error:
+                msg = "Failed to encode JSON: %s, for document: %s, at line %s"
+                if ignore_errors:
+                    logger.warning(msg, error, row, i)
+                    continue
+                logger.error(msg, error, row, i)
+                raise BackendException(msg % (error, row, i)) from error
+
+    def _read_dicts(
+        self,
+        query: SQLiteQuery,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+    ) -> Iterator[dict]:
+        """Method called by `self.read` yielding dictionaries. See `self.read`."""
+        rows = self._read_rows(query, target, chunk_size)
+        documents = (dict(zip(column_names, row)) for column_names, row in rows)
+        yield from parse_iterable_to_dict(
+            documents, ignore_errors, self.parse_statement_json
+        )
+
+    def _read_rows(
+        self, query: SQLiteQuery, target: Optional[str], chunk_size: int
+    ) -> Iterator[Tuple[Sequence[str], Sequence[Any]]]:
+        """Yield the column names and values of each row matching the `query`.
+
+        Rows are fetched by chunks of `chunk_size` rows, thus only one chunk is held
+        in memory at a time.
+        """
+        table = self.get_table(target)
+        sql = self.get_sql(query, table)
+        msg = "Start reading the %s table of the %s database (chunk size: %d)"
+        logger.debug(msg, table, self.settings.DATABASE_PATH, chunk_size)
+        try:
+            cursor = self.connection.execute(sql, query.parameters or ())
+            column_names = [column[0] for column in cursor.description]
+            while rows := cursor.fetchmany(chunk_size):
+                for row in rows:
+                    yield column_names, row
+        except sqlite3.Error as error:
+            msg = "Failed to read rows: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+    def write(  # noqa: PLR0913
+        self,
+        data: Union[IOBase, Iterable[bytes], Iterable[dict]],
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        ignore_errors: bool = False,
+        operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
+    ) -> int:
+        """Write `data` statements to the `target` table and return their count.
+
+        Args:
+            data (Iterable or IOBase): The data containing statements to write.
+            target (str or None): The target table name.
+                If target is `None`, the `DEFAULT_TABLE` is used instead.
+            chunk_size (int or None): The number of statements written in one
+                transaction.
+                If `chunk_size` is `None` it defaults to `WRITE_CHUNK_SIZE`.
+            ignore_errors (bool): If `True`, invalid statements are skipped and
+                statements with an already stored id are ignored.
+                If `False` (default), a `BackendException` is raised on any error.
+            operation_type (BaseOperationType or None): The mode of the write operation.
+                If `operation_type` is `None`, the `default_operation_type` is used
+                instead. See `BaseOperationType`.
+            concurrency (int or None): Ignored as SQLite only allows one writer at a
+                time.
+
+        Return:
+            int: The number of statements written.
+
+        Raise:
+            BackendException: If any failure occurs during the write operation or
+                if an inescapable failure occurs and `ignore_errors` is set to `True`.
+            BackendParameterException: If the `operation_type` is `APPEND` as it is not
+                supported or if the `target` is not a valid table name.
+        """
+        return super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
+
+    def _write_dicts(  # noqa: PLR0913
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],  # noqa: ARG002
+    ) -> int:
+        """Method called by `self.write` writing dictionaries. See `self.write`."""
+        table = self.get_table(target)
+        msg = "Start writing to the %s table of the %s database (chunk size: %d)"
+        logger.debug(msg, table, self.settings.DATABASE_PATH, chunk_size)
+        if operation_type == BaseOperationType.DELETE:
+            sql = f"DELETE FROM {table} WHERE id = ?"  # noqa: S608
+            rows: Iterable[Tuple] = ((statement.get("id"),) for statement in data)
+            msg = "Deleted %d statements with success"
+        elif operation_type == BaseOperationType.UPDATE:
+            columns = ", ".join(f"{column} = ?" for column in COLUMNS[1:])
+            sql = f"UPDATE {table} SET {columns} WHERE id = ?"  # noqa: S608
+            rows = self.to_rows(data, ignore_errors, operation_type)
+            rows = (row[1:] + row[:1] for row in rows)
+            msg = "Updated %d statements with success"
+        else:
+            sql = self.get_insert_sql(table, ignore_errors)
+            rows = self.to_rows(data, ignore_errors, operation_type)
+            msg = "Inserted %d statements with success"
+
+        count = 0
+        for batch in iter_by_batch(rows, chunk_size):
+            count += self._execute_batch(sql, batch)
+        logger.info(msg, count)
+        return count
+
+    def _execute_batch(self, sql: str, batch: List[Tuple]) -> int:
+        """Execute `sql` for each row of the `batch` in one transaction.
+
+        Return:
+            int: The number of modified rows.
+        """
+        connection = self.connection
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                count = connection.executemany(sql, batch).rowcount
+            except sqlite3.Error:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        except sqlite3.Error as error:
+            msg = "Failed to write statements batch: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+        logger.debug("Modified %d rows with success", count)
+        return count
+
+    def close(self) -> None:
+        """Close the SQLite connections.
+
+        Raise:
+            BackendException: If a failure occurs during the close operation.
+        """
+        if not self._connections:
+            logger.warning("No backend client to close.")
+            return
+
+        connections = list(self._connections.values())
+        self._connections.clear()
+        try:
+            for connection in connections:
+                connection.close()
+        except sqlite3.Error as error:
+            msg = "Failed to close SQLite connection: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+    def get_table(self, target: Optional[str]) -> str:
+        """Return the validated `target` table, creating it if it does not exist.
+
+        Raise:
+            BackendException: If a failure occurs while creating the table.
+            BackendParameterException: If the `target` is not a valid table name.
+        """
+        table = target if target else self.settings.DEFAULT_TABLE
+        if table in self._tables:
+            return table
+
+        if not re.match(TABLE_NAME_PATTERN, table):
+            msg = "The target=`%s` is not a valid table name"
+            logger.error(msg, table)
+            raise BackendParameterException(msg % table)
+
+        try:
+            self.connection.executescript(";\n".join(self.get_schema(table)))
+        except sqlite3.Error as error:
+            msg = "Failed to create the %s table: %s"
+            logger.error(msg, table, error)
+            raise BackendException(msg % (table, error)) from error
+
+        self._tables.add(table)
+        return table
+
+    @staticmethod
+    def get_schema(table: str) -> List[str]:
+        """Return the SQL statements creating the `table` and its indexes."""
+        definitions = ",\n    ".join(f"{column} TEXT" for column in STATEMENT_COLUMNS)
+        schema = [
+            f"""CREATE TABLE IF NOT EXISTS {table} (
+    id TEXT NOT NULL PRIMARY KEY,
+    timestamp INTEGER NOT NULL,
+    {definitions},
+    fingerprint TEXT,
+    statement TEXT NOT NULL
+)"""
+        ]
+        for name, columns in INDEXES.items():
+            keys = ", ".join((*columns, "timestamp", "id"))
+            sql = f"CREATE INDEX IF NOT EXISTS {table}_{name}_idx ON {table} ({keys})"
+            if columns:
+                sql += f" WHERE {columns[0]} IS NOT NULL"
+            schema.append(sql)
+        return schema
+
+    @staticmethod
+    def get_index_names(table: str) -> List[str]:
+        """Return the names of the `table` indexes."""
+        return [f"{table}_{name}_idx" for name in INDEXES]
+
+    @staticmethod
+    def get_insert_sql(table: str, ignore_errors: bool = False) -> str:
+        """Return the SQL statement inserting rows in the `table`.
+
+        If `ignore_errors` is `True`, rows with an already stored id are ignored.
+        """
+        conflict = " OR IGNORE" if ignore_errors else ""
+        columns = ", ".join(COLUMNS)
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        return f"INSERT{conflict} INTO {table} ({columns}) VALUES ({placeholders})"
+
+    @staticmethod
+    def get_sql(query: SQLiteQuery, table: str) -> str:
+        """Return the SQL statement selecting the `query` rows in `table`."""
+        select = query.select
+        if not isinstance(select, str):
+            select = ", ".join(select)
+        sql = f"SELECT {select} FROM {table}"  # noqa: S608
+
+        if query.where:
+            where = [query.where] if isinstance(query.where, str) else query.where
+            sql += " WHERE " + " AND ".join(f"({condition})" for condition in where)
+
+        if query.sort:
+            sql += f" ORDER BY {query.sort}"
+
+        if query.limit:
+            sql += f" LIMIT {int(query.limit)}"
+
+        return sql
+
+    @staticmethod
+    def get_timestamp(value: str) -> int:
+        """Return the number of microseconds from the epoch to the ISO 8601 `value`.
+
+        Timestamps without a time zone are considered to be in UTC.
+
+        Raise:
+            ValueError: If the `value` is not a valid ISO 8601 date.
+        """
+        date = isoparse(value)
+        if not date.tzinfo:
+            date = date.replace(tzinfo=timezone.utc)
+        return (date - EPOCH) // timedelta(microseconds=1)
+
+    @staticmethod
+    def get_field(statement: dict, path: Tuple[str, ...]) -> Optional[str]:
+        """Return the `statement` field value at `path` or `None` if it is missing."""
+        value: Any = statement
+        for key in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return None if value is None else str(value)
+
+    @staticmethod
+    def to_rows(
+        data: Iterable[dict],
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+    ) -> Iterator[Tuple]:
+        """Convert `data` statements to rows of `COLUMNS` values.
+
+        Statements are expected to have a `timestamp` field, and an `id` field when
+        indexing them. Statements created without an `id` are given a random one.
+        """
+        for statement in data:
+            if "id" not in statement and operation_type != BaseOperationType.CREATE:
+                msg = "statement %s has no 'id' field"
+                if ignore_errors:
+                    logger.warning(msg, statement)
+                    continue
+                logger.error(msg, statement)
+                raise BackendException(msg % statement)
+            try:
+                timestamp = SQLiteDataBackend.get_timestamp(statement["timestamp"])
+            except (KeyError, TypeError, ValueError, OverflowError) as error:
+                msg = "statement %s has a missing or invalid 'timestamp' field"
+                if ignore_errors:
+                    logger.warning(msg, statement)
+                    continue
+                logger.error(msg, statement)
+                raise BackendException(msg % statement) from error
+
+            yield (
+                str(statement.get("id", uuid4())),
+                timestamp,
+                *(
+                    SQLiteDataBackend.get_field(statement, path)
+                    for path in STATEMENT_COLUMNS.values()
+                ),
+                get_statement_fingerprint(statement),
+                json.dumps(statement),
+            )
+
+    @staticmethod
+    def to_raw_document(
+        column_names: Sequence[str], row: Sequence[Any], encoding: str
+    ) -> bytes:
+        """Encode a `row` as a JSON line, writing the `statement` column as is."""
+        fields = (
+            f"{json.dumps(name)}: {value if name == 'statement' else json.dumps(value)}"
+            for name, value in zip(column_names, row)
+        )
+        return f"{{{', '.join(fields)}}}\n".encode(encoding)
+
+    @staticmethod
+    def parse_statement_json(document: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the `document` with a JSON parsed `statement` field."""
+        if "statement" in document:
+            document["statement"] = json.loads(document["statement"])
+
+        return document
@@ -81,6 +81,7 @@ class SwiftDataBackend(
         BaseOperationType.DELETE,
         BaseOperationType.UPDATE,
     }
+    concurrent_writes = False
 
     def __init__(self, settings: Optional[SwiftDataBackendSettings] = None):
         """Prepares the options for the SwiftService."""
@@ -175,6 +176,7 @@ class SwiftDataBackend(
         chunk_size: Optional[int] = None,
         raw_output: bool = False,
         ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
         max_statements: Optional[PositiveInt] = None,
     ) -> Union[Iterator[bytes], Iterator[dict]]:
         """Read objects matching the `query` in the `target` container and yield them.
@@ -194,6 +196,9 @@ class SwiftDataBackend(
             ignore_errors (bool): If `True`, encoding errors during the read operation
                 will be ignored and logged.
                 If `False` (default), a `BackendException` is raised on any error.
+            prefetch (int): The number of records to prefetch (queue) while yielding.
+                If `prefetch` is `None` it defaults to `1`, i.e. no records are
+                prefetched.
             max_statements (int): The maximum number of statements to yield.
                 If `None` (default) or `0`, there is no maximum.
 
@@ -207,7 +212,13 @@ class SwiftDataBackend(
             BackendParameterException: If a backend argument value is not valid.
         """
         yield from super().read(
-            query, target, chunk_size, raw_output, ignore_errors, max_statements
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
         )
 
     def _read_bytes(
@@ -286,13 +297,14 @@ class SwiftDataBackend(
             logger.error(msg, obj, error.msg)
             raise BackendException(msg % (obj, error.msg)) from error
 
-    def write(
+    def write(  # noqa: PLR0913
         self,
         data: Union[IOBase, Iterable[bytes], Iterable[dict]],
         target: Optional[str] = None,
         chunk_size: Optional[int] = None,
         ignore_errors: bool = False,
         operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
     ) -> int:
         """Write `data` records to the `target` container and returns their count.
 
@@ -308,6 +320,8 @@ class SwiftDataBackend(
             operation_type (BaseOperationType or None): The mode of the write operation.
                 If `operation_type` is `None`, the `default_operation_type` is used
                 instead. See `BaseOperationType`.
+            concurrency (int or None): Ignored as records are uploaded sequentially
+                to a single object.
 
         Return:
             int: The number of written records.
@@ -317,28 +331,32 @@ class SwiftDataBackend(
                 if an inescapable failure occurs and `ignore_errors` is set to `True`.
             BackendParameterException: If a backend argument value is not valid.
         """
-        return super().write(data, target, chunk_size, ignore_errors, operation_type)
+        return super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
 
-    def _write_dicts(
+    def _write_dicts(  # noqa: PLR0913
         self,
         data: Iterable[dict],
         target: Optional[str],
         chunk_size: int,
         ignore_errors: bool,
         operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],
     ) -> int:
         """Method called by `self.write` writing dictionaries. See `self.write`."""
         return super()._write_dicts(
-            data, target, chunk_size, ignore_errors, operation_type
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
         )
 
-    def _write_bytes(
+    def _write_bytes(  # noqa: PLR0913
         self,
         data: Iterable[bytes],
         target: Optional[str],
         chunk_size: int,
         ignore_errors: bool,  # noqa: ARG002
         operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],  # noqa: ARG002
     ) -> int:
         """Method called by `self.write` writing bytes. See `self.write`."""
         counter = {"count": 0}
@@ -18,7 +18,13 @@ from ralph.backends.data.base import (
     Listable,
     Writable,
 )
-from ralph.backends.lrs.base import BaseAsyncLRSBackend, BaseLRSBackend
+from ralph.backends.lrs.base import (
+    Archivable,
+    AsyncIndexable,
+    BaseAsyncLRSBackend,
+    BaseLRSBackend,
+    Indexable,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -90,3 +96,23 @@ def get_lrs_backends() -> Dict[str, type]:
     """Return Ralph's backend classes for LRS usage."""
     lrs_backends = entry_points(group="ralph.backends.lrs")
     return get_backends(lrs_backends, (BaseAsyncLRSBackend, BaseLRSBackend))
+
+
+@lru_cache(maxsize=1)
+def get_lrs_index_backends() -> Dict[str, type]:
+    """Return Ralph's backend classes for LRS indexes management usage."""
+    return {
+        name: backend
+        for name, backend in get_lrs_backends().items()
+        if issubclass(backend, (Indexable, AsyncIndexable))
+    }
+
+
+@lru_cache(maxsize=1)
+def get_lrs_archive_backends() -> Dict[str, type]:
+    """Return Ralph's backend classes for LRS statements archiving usage."""
+    return {
+        name: backend
+        for name, backend in get_lrs_backends().items()
+        if issubclass(backend, Archivable)
+    }
@@ -0,0 +1,295 @@
+"""Asynchronous cached LRS backend for Ralph."""
+
+import logging
+from asyncio import get_running_loop
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from pydantic import PositiveInt
+from pydantic_settings import SettingsConfigDict
+
+from ralph.backends.data.base import BaseOperationType, DataBackendStatus
+from ralph.backends.loader import get_lrs_backends
+from ralph.backends.lrs.base import (
+    BaseAsyncLRSBackend,
+    RalphStatementsQuery,
+    StatementFingerprint,
+    StatementQueryResult,
+)
+from ralph.backends.lrs.cached import CachedLRSBackendSettings, StatementCache
+from ralph.conf import BASE_SETTINGS_CONFIG
+from ralph.exceptions import BackendParameterException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncCachedLRSBackendSettings(CachedLRSBackendSettings):
+    """Asynchronous cached LRS backend default configuration.
+
+    Attributes:
+        BACKEND (str): The name of the asynchronous LRS backend whose statements are
+            cached.
+    """
+
+    model_config = {
+        **BASE_SETTINGS_CONFIG,
+        **SettingsConfigDict(env_prefix="RALPH_BACKENDS__LRS__ASYNC_CACHED__"),
+    }
+
+    BACKEND: str = "async_es"
+
+
+class AsyncCachedLRSBackend(BaseAsyncLRSBackend[AsyncCachedLRSBackendSettings]):
+    """Asynchronous cached LRS backend.
+
+    See `CachedLRSBackend`. Operations of the shared statements cache are run in the
+    event loop default executor.
+    """
+
+    name = "async_cached"
+
+    def __init__(self, settings: Optional[AsyncCachedLRSBackendSettings] = None):
+        """Instantiate the asynchronous cached LRS backend and the statements cache.
+
+        Args:
+            settings (AsyncCachedLRSBackendSettings or None): The LRS backend
+                settings. If `settings` is `None`, a default settings instance is
+                used instead.
+
+        Raise:
+            BackendParameterException: If the cached backend is not an asynchronous
+                LRS backend.
+        """
+        super().__init__(settings)
+        self.backend = self.get_cached_backend(self.settings.BACKEND)
+        self.cache = StatementCache(
+            self.settings.CACHE_MAX_SIZE,
+            self.settings.CACHE_TTL,
+            self.settings.CACHE_DATABASE_PATH,
+        )
+        # Writes are forwarded to the cached backend.
+        self.default_operation_type = self.backend.default_operation_type
+        self.unsupported_operation_types = self.backend.unsupported_operation_types
+
+    async def status(self) -> DataBackendStatus:
+        """Return the status of the cached backend."""
+        return await self.backend.status()
+
+    async def read(  # noqa: PLR0913
+        self,
+        query: Optional[Any] = None,
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        raw_output: bool = False,
+        ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
+        max_statements: Optional[PositiveInt] = None,
+    ) -> Union[AsyncIterator[bytes], AsyncIterator[dict]]:
+        """Read records of the cached backend. See the cached backend `read`."""
+        async for statement in self.backend.read(
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
+        ):
+            yield statement
+
+    async def _read_dicts(
+        self,
+        query: Any,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+    ) -> AsyncIterator[dict]:
+        """Method called by `self.read` yielding dictionaries. See `self.read`."""
+        statements = self.backend.read(query, target, chunk_size, False, ignore_errors)
+        async for statement in cast(AsyncIterator[dict], statements):
+            yield statement
+
+    async def _write_dicts(
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+    ) -> int:
+        """Write statements to the cached backend and remove them from the cache.
+
+        See `self.write`.
+        """
+        keys: List[str] = []
+
+        def track_keys(statements: Iterable[dict]) -> Iterable[dict]:
+            """Collect the cache keys of the written `statements`."""
+            for statement in statements:
+                if "id" in statement:
+                    keys.append(self.cache.get_key(statement["id"], target))
+                yield statement
+
+        try:
+            return await self.backend.write(
+                track_keys(data), target, chunk_size, ignore_errors, operation_type
+            )
+        finally:
+            await self._run_cache(self.cache.delete, keys)
+
+    async def query_statements(
+        self, params: RalphStatementsQuery, target: Optional[str] = None
+    ) -> StatementQueryResult:
+        """Return the statements query payload using xAPI parameters.
+
+        Queries of a single statement by id are served by the cache.
+        """
+        statement_id = self.cache.get_query_statement_id(params)
+        if not statement_id:
+            return await self.backend.query_statements(params, target)
+
+        key = self.cache.get_key(statement_id, target)
+        cached = await self._run_cache(self.cache.get, [key])
+        if key in cached:
+            return StatementQueryResult(statements=[cached[key]])
+
+        result = await self.backend.query_statements(params, target)
+        if [statement["id"] for statement in result.statements] == [statement_id]:
+            await self._run_cache(self.cache.set, {key: result.statements[0]})
+        return result
+
+    async def query_statements_by_ids(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> AsyncIterator[dict]:
+        """Yield statements with matching ids from the cache, then the backend.
+
+        The cached backend is only queried for ids missing from the cache.
+        """
+        keys = {
+            statement_id: self.cache.get_key(statement_id, target)
+            for statement_id in ids
+        }
+        cached = await self._run_cache(self.cache.get, list(keys.values()))
+        for statement in cached.values():
+            yield statement
+
+        missing_ids = [
+            statement_id for statement_id, key in keys.items() if key not in cached
+        ]
+        if not missing_ids:
+            return
+
+        # Statements are cached before being yielded, as callers may mutate them.
+        statements = [
+            statement
+            async for statement in self.backend.query_statements_by_ids(
+                missing_ids, target
+            )
+        ]
+        await self._run_cache(
+            self.cache.set,
+            {
+                keys[statement["id"]]: statement
+                for statement in statements
+                if statement["id"] in keys
+            },
+        )
+        for statement in statements:
+            yield statement
+
+    async def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> AsyncIterator[StatementFingerprint]:
+        """Yield fingerprints of statements with matching ids.
+
+        Fingerprints of cached statements are computed from the cache, the cached
+        backend is only queried for the other ones.
+        """
+        keys = {
+            statement_id: self.cache.get_key(statement_id, target)
+            for statement_id in ids
+        }
+        cached = await self._run_cache(self.cache.get, list(keys.values()))
+        for statement in cached.values():
+            yield self.cache.get_fingerprint(statement)
+
+        missing_ids = [
+            statement_id for statement_id, key in keys.items() if key not in cached
+        ]
+        if missing_ids:
+            async for fingerprint in self.backend.query_statement_fingerprints(
+                missing_ids, target
+            ):
+                yield fingerprint
+
+    async def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        Created statements are added to the cache.
+        """
+        existing_ids = await self.backend.create_statements(statements, target)
+        excluded_ids = set(existing_ids)
+        await self._run_cache(
+            self.cache.set,
+            {
+                self.cache.get_key(statement["id"], target): statement
+                for statement in statements
+                if statement["id"] not in excluded_ids
+            },
+        )
+        return existing_ids
+
+    async def backfill_fingerprints(
+        self, target: Optional[str] = None, chunk_size: Optional[int] = None
+    ) -> int:
+        """Store the fingerprint of statements missing it and return their count."""
+        return await self.backend.backfill_fingerprints(target, chunk_size)
+
+    async def close(self) -> None:
+        """Close the cached backend.
+
+        Raise:
+            BackendException: If a failure occurs during the close operation.
+        """
+        await self.backend.close()
+
+    async def _run_cache(self, function: Callable[..., T], *args: Any) -> T:
+        """Run a cache operation, in the default executor if the cache is shared."""
+        if not self.cache.database_path:
+            return function(*args)
+        loop = get_running_loop()
+        return await loop.run_in_executor(None, partial(function, *args))
+
+    @staticmethod
+    def get_cached_backend(name: str) -> BaseAsyncLRSBackend:
+        """Return an instance of the `name` asynchronous LRS backend.
+
+        Raise:
+            BackendParameterException: If the backend is not an asynchronous LRS
+                backend.
+        """
+        backend_class = get_lrs_backends().get(name)
+        if (
+            not backend_class
+            or not issubclass(backend_class, BaseAsyncLRSBackend)
+            or issubclass(backend_class, AsyncCachedLRSBackend)
+        ):
+            msg = "The %s backend is not an asynchronous LRS backend"
+            logger.error(msg, name)
+            raise BackendParameterException(msg % name)
+
+        return backend_class()
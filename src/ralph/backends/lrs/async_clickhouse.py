@@ -0,0 +1,248 @@
+"""Asynchronous ClickHouse LRS backend for Ralph."""
+
+import logging
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, cast
+
+from clickhouse_connect.driver.exceptions import ClickHouseError
+
+from ralph.backends.data.async_clickhouse import AsyncClickHouseDataBackend
+from ralph.backends.data.base import BaseOperationType
+from ralph.backends.data.clickhouse import ClickHouseQuery
+from ralph.backends.lrs.base import (
+    AsyncIndexable,
+    BaseAsyncLRSBackend,
+    RalphStatementsQuery,
+    StatementFingerprint,
+    StatementQueryResult,
+)
+from ralph.backends.lrs.clickhouse import (
+    BACKFILL_SETTINGS,
+    FINGERPRINT_COLUMN,
+    FINGERPRINT_ROW_COLUMNS,
+    TABLE_COLUMNS_SQL,
+    ClickHouseLRSBackend,
+    ClickHouseLRSBackendSettings,
+)
+from ralph.exceptions import BackendException, BackendParameterException
+from ralph.utils import iter_by_batch
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncClickHouseLRSBackend(
+    BaseAsyncLRSBackend[ClickHouseLRSBackendSettings],
+    AsyncClickHouseDataBackend,
+    AsyncIndexable,
+):
+    """Asynchronous ClickHouse LRS backend implementation."""
+
+    def __init__(self, settings: Optional[ClickHouseLRSBackendSettings] = None):
+        """Instantiate the asynchronous ClickHouse LRS backend.
+
+        Args:
+            settings (ClickHouseLRSBackendSettings or None): The LRS backend settings.
+                If `settings` is `None`, a default settings instance is used instead.
+        """
+        super().__init__(settings)
+        self._columns: Dict[str, Dict[str, str]] = {}
+
+    async def query_statements(
+        self, params: RalphStatementsQuery, target: Optional[str] = None
+    ) -> StatementQueryResult:
+        """Return the statements query payload using xAPI parameters."""
+        materialized_columns = await self._get_materialized_columns(target)
+        query = ClickHouseLRSBackend.get_query(params, materialized_columns)
+        statements = []
+        document = None
+        try:
+            async for document in self._read_documents(
+                query, target, ignore_errors=True
+            ):
+                statements.append(document["event"])
+        except (BackendException, BackendParameterException) as error:
+            logger.error("Failed to read from ClickHouse")
+            raise error
+
+        new_search_after = None
+        new_pit_id = None
+
+        if document:
+            # See `ClickHouseLRSBackend.query_statements`.
+            new_search_after = document["emission_time"].isoformat()
+            new_pit_id = str(document["event_id"])
+
+        return StatementQueryResult(
+            statements=statements,
+            search_after=new_search_after,
+            pit_id=new_pit_id,
+        )
+
+    async def query_statements_by_ids(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> AsyncIterator[dict]:
+        """Yield statements with matching ids from the backend."""
+        query = self.query_class(
+            select="event",
+            where="event_id IN ({ids:Array(String)})",
+            parameters={"ids": ["1"]},
+        )
+        try:
+            for chunk_ids in iter_by_batch(ids, self.settings.IDS_CHUNK_SIZE):
+                query.parameters["ids"] = chunk_ids
+                async for document in self._read_documents(
+                    query, target, ignore_errors=True
+                ):
+                    yield document["event"]
+        except (BackendException, BackendParameterException) as error:
+            logger.error("Failed to read from ClickHouse")
+            raise error
+
+    async def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> AsyncIterator[StatementFingerprint]:
+        """Yield fingerprints of statements with matching ids from the backend."""
+        columns = await self._get_columns(target)
+        query = ClickHouseLRSBackend.get_fingerprints_query(columns)
+        try:
+            for chunk_ids in iter_by_batch(ids, self.settings.IDS_CHUNK_SIZE):
+                query.parameters = {"ids": chunk_ids}
+                async for document in self._read_documents(query, target):
+                    yield ClickHouseLRSBackend.to_statement_fingerprint(document)
+        except (BackendException, BackendParameterException) as error:
+            logger.error("Failed to read from ClickHouse")
+            raise error
+
+    async def backfill_fingerprints(
+        self, target: Optional[str] = None, chunk_size: Optional[int] = None
+    ) -> int:
+        """Store the fingerprint of statements missing it and return their count.
+
+        See `ClickHouseLRSBackend.backfill_fingerprints`.
+        """
+        target = target if target else self.settings.EVENT_TABLE_NAME
+        chunk_size = chunk_size if chunk_size else self.settings.WRITE_CHUNK_SIZE
+        table = f"{target}_fingerprints"
+        commands, mutation = ClickHouseLRSBackend.get_backfill_commands(target, table)
+        query = ClickHouseLRSBackend.get_backfill_query(chunk_size)
+        count = 0
+        client = await self.get_client()
+        try:
+            for command in commands:
+                await client.command(command)
+            self._columns.pop(target, None)
+            while True:
+                documents = [x async for x in self._read_documents(query, target)]
+                if not documents:
+                    break
+
+                rows = ClickHouseLRSBackend.to_fingerprint_rows(documents)
+                await client.insert(table, rows, column_names=FINGERPRINT_ROW_COLUMNS)
+                count += len(rows)
+                query = ClickHouseLRSBackend.get_backfill_query(
+                    chunk_size, documents[-1]
+                )
+
+            if count:
+                await client.command(mutation, settings=BACKFILL_SETTINGS)
+        except ClickHouseError as error:
+            msg = "Failed to store statement fingerprints: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+        finally:
+            await client.command(f"DROP TABLE IF EXISTS {table}")
+
+        logger.info("Stored the fingerprint of %d statements", count)
+        return count
+
+    async def _write_dicts(
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+    ) -> int:
+        """Write statements along with their fingerprint. See `self.write`.
+
+        See `ClickHouseLRSBackend._write_dicts`.
+        """
+        target = target if target else self.settings.EVENT_TABLE_NAME
+        if FINGERPRINT_COLUMN not in await self._get_columns(target):
+            return await super()._write_dicts(
+                data, target, chunk_size, ignore_errors, operation_type
+            )
+
+        count = 0
+        msg = "Start writing to the %s table of the %s database (chunk size: %d)"
+        logger.debug(msg, target, self.database, chunk_size)
+        batches = ClickHouseLRSBackend.to_fingerprinted_insert_columns(
+            data, chunk_size, ignore_errors
+        )
+        for batch in batches:
+            count += await self._bulk_import(batch, ignore_errors, target)
+
+        logger.info("Inserted a total of %d documents with success", count)
+        return count
+
+    async def init_indexes(self, target: Optional[str] = None) -> List[str]:
+        """Create the columns and indexes serving statements queries.
+
+        See `ClickHouseLRSBackend.init_indexes`.
+        """
+        target = target if target else self.settings.EVENT_TABLE_NAME
+        names, commands = ClickHouseLRSBackend.get_index_commands(target)
+        try:
+            client = await self.get_client()
+            for command in commands:
+                await client.command(command)
+        except ClickHouseError as error:
+            msg = "Failed to create the statements columns and indexes: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+        self._columns.pop(target, None)
+        return names
+
+    async def explain_query_shapes(self, target: Optional[str] = None) -> List[str]:
+        """Return the names of the `STATEMENTS_QUERY_SHAPES` not served by an index.
+
+        See `ClickHouseLRSBackend.explain_query_shapes`.
+        """
+        materialized_columns = await self._get_materialized_columns(target)
+        return ClickHouseLRSBackend.get_unindexed_query_shapes(materialized_columns)
+
+    async def _get_columns(self, target: Optional[str]) -> Dict[str, str]:
+        """Return the `target` table columns names and default kinds.
+
+        See `ClickHouseLRSBackend._get_columns`.
+        """
+        target = target if target else self.settings.EVENT_TABLE_NAME
+        if target in self._columns:
+            return self._columns[target]
+
+        parameters = ClickHouseLRSBackend.get_table_parameters(target, self.database)
+        try:
+            client = await self.get_client()
+            result = await client.query(TABLE_COLUMNS_SQL, parameters)
+        except ClickHouseError as error:
+            msg = "Failed to get the %s table columns: %s"
+            logger.error(msg, target, error)
+            raise BackendException(msg % (target, error)) from error
+
+        rows = result.result_rows
+        self._columns[target] = {str(name): str(kind) for name, kind in rows}
+        return self._columns[target]
+
+    def _read_documents(
+        self, query: ClickHouseQuery, target: Optional[str], ignore_errors: bool = False
+    ) -> AsyncIterator[dict]:
+        """Yield the ClickHouse rows matching the `query` as dictionaries."""
+        return cast(
+            AsyncIterator[dict],
+            self.read(query=query, target=target, ignore_errors=ignore_errors),
+        )
+
+    async def _get_materialized_columns(self, target: Optional[str]) -> Set[str]:
+        """Return the names of the `target` table materialized columns."""
+        columns = await self._get_columns(target)
+        return ClickHouseLRSBackend.get_materialized_columns(columns)
@@ -1,21 +1,37 @@
 """Asynchronous Elasticsearch LRS backend for Ralph."""
 
 import logging
-from typing import AsyncIterator, List, Optional
+from typing import AsyncIterator, Iterable, List, Optional, cast
+
+from elasticsearch import ApiError, TransportError
+from elasticsearch.helpers import async_streaming_bulk
 
 from ralph.backends.data.async_es import AsyncESDataBackend
+from ralph.backends.data.base import BaseOperationType
+from ralph.backends.data.es import ESQuery
 from ralph.backends.lrs.base import (
+    STATEMENTS_QUERY_SHAPES,
+    AsyncIndexable,
     BaseAsyncLRSBackend,
     RalphStatementsQuery,
     StatementQueryResult,
+    get_change_marker,
+)
+from ralph.backends.lrs.es import (
+    PERIOD_OPERATION_TYPES,
+    STATEMENTS_MAPPINGS,
+    ESLRSBackend,
+    ESLRSBackendSettings,
 )
-from ralph.backends.lrs.es import ESLRSBackend, ESLRSBackendSettings
 from ralph.exceptions import BackendException, BackendParameterException
+from ralph.utils import iter_by_batch
 
 logger = logging.getLogger(__name__)
 
 
-class AsyncESLRSBackend(BaseAsyncLRSBackend[ESLRSBackendSettings], AsyncESDataBackend):
+class AsyncESLRSBackend(
+    BaseAsyncLRSBackend[ESLRSBackendSettings], AsyncESDataBackend, AsyncIndexable
+):
     """Asynchronous Elasticsearch LRS backend implementation."""
 
     async def query_statements(
@@ -23,21 +39,28 @@ class AsyncESLRSBackend(BaseAsyncLRSBackend[ESLRSBackendSettings], AsyncESDataBa
     ) -> StatementQueryResult:
         """Return the statements query payload using xAPI parameters."""
         query = ESLRSBackend.get_query(params=params)
+        target = ESLRSBackend.get_query_indices(
+            target if target else self.settings.DEFAULT_INDEX,
+            self.settings.INDEX_PERIOD,
+            params.since,
+            params.until,
+        )
         try:
-            statements = [
-                document["_source"]
-                async for document in self.read(
-                    query=query, target=target, chunk_size=params.limit
-                )
+            es_documents = [
+                document
+                async for document in self._read_documents(query, target, params.limit)
             ]
         except (BackendException, BackendParameterException) as error:
             logger.error("Failed to read from Elasticsearch")
             raise error
 
         return StatementQueryResult(
-            statements=statements,
+            statements=[document["_source"] for document in es_documents],
             pit_id=query.pit.id,
             search_after="|".join(query.search_after) if query.search_after else "",
+            change_marker=get_change_marker(
+                map(ESLRSBackend.get_version, es_documents)
+            ),
         )
 
     async def query_statements_by_ids(
@@ -45,9 +68,142 @@ class AsyncESLRSBackend(BaseAsyncLRSBackend[ESLRSBackendSettings], AsyncESDataBa
     ) -> AsyncIterator[dict]:
         """Yield statements with matching ids from the backend."""
         query = self.query_class(query={"terms": {"_id": ids}})
+        target = self._get_indices(target)
         try:
-            async for document in self.read(query=query, target=target):
+            async for document in self._read_documents(query, target):
                 yield document["_source"]
         except (BackendException, BackendParameterException) as error:
             logger.error("Failed to read from Elasticsearch")
             raise error
+
+    def _read_documents(
+        self, query: ESQuery, target: str, chunk_size: Optional[int] = None
+    ) -> AsyncIterator[dict]:
+        """Yield the Elasticsearch documents matching the `query` as dictionaries."""
+        return cast(
+            AsyncIterator[dict],
+            self.read(query=query, target=target, chunk_size=chunk_size),
+        )
+
+    async def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        See `ESLRSBackend.create_statements`.
+        """
+        target = target if target else self.settings.DEFAULT_INDEX
+        conflicting_ids = []
+        if self.settings.INDEX_PERIOD:
+            ids = [statement["id"] for statement in statements]
+            stored_ids = {
+                fingerprint.id
+                async for fingerprint in self.query_statement_fingerprints(ids, target)
+            }
+            conflicting_ids = [x for x in ids if x in stored_ids]
+            statements = [x for x in statements if x["id"] not in stored_ids]
+
+        actions = ESLRSBackend.to_period_documents(
+            statements, target, BaseOperationType.CREATE, self.settings.INDEX_PERIOD
+        )
+        try:
+            async for success, item in async_streaming_bulk(
+                client=self.client,
+                actions=actions,
+                chunk_size=self.settings.WRITE_CHUNK_SIZE,
+                raise_on_error=False,
+                refresh=self.settings.REFRESH_AFTER_WRITE,
+            ):
+                if not success:
+                    conflicting_ids.append(ESLRSBackend.get_conflicting_id(item))
+        except (ApiError, TransportError) as error:
+            msg = "Failed to create statements: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+        return conflicting_ids
+
+    async def init_indexes(self, target: Optional[str] = None) -> List[str]:
+        """Create the index template serving statements queries and return its name.
+
+        See `ESLRSBackend.init_indexes`.
+        """
+        target = target if target else self.settings.DEFAULT_INDEX
+        indices = ESLRSBackend.get_query_indices(target, self.settings.INDEX_PERIOD)
+        try:
+            await self.client.indices.put_index_template(
+                name=target,
+                index_patterns=[indices],
+                template={"mappings": STATEMENTS_MAPPINGS},
+            )
+            if await self.client.indices.exists(index=indices):
+                await self.client.indices.put_mapping(
+                    index=indices, properties=STATEMENTS_MAPPINGS["properties"]
+                )
+        except (ApiError, TransportError) as error:
+            msg = "Failed to create the statements index template: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+        return [target]
+
+    async def explain_query_shapes(self, target: Optional[str] = None) -> List[str]:
+        """Return the names of the `STATEMENTS_QUERY_SHAPES` not served by an index.
+
+        See `ESLRSBackend.explain_query_shapes`.
+        """
+        target = self._get_indices(target)
+        query_shapes_fields = {
+            name: ESLRSBackend.get_query_fields(ESLRSBackend.get_query(params))
+            for name, params in STATEMENTS_QUERY_SHAPES.items()
+        }
+        fields = sorted(
+            {field for item in query_shapes_fields.values() for field in item}
+        )
+        try:
+            field_mappings = await self.client.indices.get_field_mapping(
+                index=target, fields=fields
+            )
+        except (ApiError, TransportError) as error:
+            msg = "Failed to get the %s index field mappings: %s"
+            logger.error(msg, target, error)
+            raise BackendException(msg % (target, error)) from error
+
+        return ESLRSBackend.get_unindexed_query_shapes(
+            query_shapes_fields, dict(field_mappings)
+        )
+
+    async def _write_dicts(
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+    ) -> int:
+        """Write statements to the index of their period. See `self.write`.
+
+        See `ESLRSBackend._write_dicts`.
+        """
+        period = self.settings.INDEX_PERIOD
+        if not period or operation_type not in PERIOD_OPERATION_TYPES:
+            return await super()._write_dicts(
+                data, target, chunk_size, ignore_errors, operation_type
+            )
+
+        count = 0
+        target = target if target else self.settings.DEFAULT_INDEX
+        for batch in iter_by_batch(data, chunk_size):
+            indices = ESLRSBackend.group_by_period_index(
+                batch, target, period, ignore_errors
+            )
+            for index, statements in indices.items():
+                count += await super()._write_dicts(
+                    statements, index, chunk_size, ignore_errors, operation_type
+                )
+        return count
+
+    def _get_indices(self, target: Optional[str]) -> str:
+        """Return the `target` indices pattern. See `ESLRSBackend.get_query_indices`."""
+        target = target if target else self.settings.DEFAULT_INDEX
+        return ESLRSBackend.get_query_indices(target, self.settings.INDEX_PERIOD)
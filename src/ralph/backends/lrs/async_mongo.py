@@ -1,25 +1,52 @@
 """Async MongoDB LRS backend for Ralph."""
 
 import logging
-from typing import AsyncIterator, List, Optional
+from typing import AsyncIterator, List, Optional, Set, cast
+
+from bson.errors import BSONError
+from pymongo.errors import BulkWriteError, PyMongoError
 
 from ralph.backends.data.async_mongo import AsyncMongoDataBackend
+from ralph.backends.data.base import BaseOperationType
+from ralph.backends.data.mongo import MongoQuery
 from ralph.backends.lrs.base import (
+    STATEMENTS_QUERY_SHAPES,
+    AsyncIndexable,
     BaseAsyncLRSBackend,
     RalphStatementsQuery,
+    StatementFingerprint,
     StatementQueryResult,
 )
-from ralph.backends.lrs.mongo import MongoLRSBackend, MongoLRSBackendSettings
+from ralph.backends.lrs.mongo import (
+    FINGERPRINT_FIELD,
+    UNIQUE_ID_INDEX_MISSING_MSG,
+    MongoLRSBackend,
+    MongoLRSBackendSettings,
+)
 from ralph.exceptions import BackendException, BackendParameterException
+from ralph.utils import iter_by_batch
 
 logger = logging.getLogger(__name__)
 
 
 class AsyncMongoLRSBackend(
-    BaseAsyncLRSBackend[MongoLRSBackendSettings], AsyncMongoDataBackend
+    BaseAsyncLRSBackend[MongoLRSBackendSettings], AsyncMongoDataBackend, AsyncIndexable
 ):
     """Async MongoDB LRS backend implementation."""
 
+    to_documents = staticmethod(MongoLRSBackend.to_documents)
+    to_replace_one = staticmethod(MongoLRSBackend.to_replace_one)
+
+    def __init__(self, settings: Optional[MongoLRSBackendSettings] = None):
+        """Instantiate the asynchronous MongoDB LRS backend.
+
+        Args:
+            settings (MongoLRSBackendSettings or None): The LRS backend settings.
+                If `settings` is `None`, a default settings instance is used instead.
+        """
+        super().__init__(settings)
+        self._unique_id_collections: Set[str] = set()
+
     async def query_statements(
         self, params: RalphStatementsQuery, target: Optional[str] = None
     ) -> StatementQueryResult:
@@ -28,9 +55,7 @@ class AsyncMongoLRSBackend(
         try:
             mongo_response = [
                 document
-                async for document in self.read(
-                    query=query, target=target, chunk_size=params.limit
-                )
+                async for document in self._read_documents(query, target, params.limit)
             ]
         except (BackendException, BackendParameterException) as error:
             logger.error("Failed to read from async MongoDB")
@@ -52,8 +77,132 @@ class AsyncMongoLRSBackend(
         """Yield statements with matching ids from the backend."""
         query = self.query_class(filter={"_source.id": {"$in": ids}})
         try:
-            async for document in self.read(query=query, target=target):
+            async for document in self._read_documents(query, target):
                 yield document["_source"]
         except (BackendException, BackendParameterException) as error:
             logger.error("Failed to read from MongoDB")
             raise error
+
+    async def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> AsyncIterator[StatementFingerprint]:
+        """Yield fingerprints of statements with matching ids from the backend."""
+        query = MongoLRSBackend.get_fingerprint_query(ids)
+        try:
+            async for document in self._read_documents(query, target):
+                fingerprint = document.get(FINGERPRINT_FIELD)
+                yield StatementFingerprint(document["_source"]["id"], fingerprint)
+        except (BackendException, BackendParameterException) as error:
+            logger.error("Failed to read from MongoDB")
+            raise error
+
+    async def backfill_fingerprints(
+        self, target: Optional[str] = None, chunk_size: Optional[int] = None
+    ) -> int:
+        """Store the fingerprint of statements missing it and return their count.
+
+        See `MongoLRSBackend.backfill_fingerprints`.
+        """
+        chunk_size = chunk_size if chunk_size else self.settings.WRITE_CHUNK_SIZE
+        query = MongoLRSBackend.get_missing_fingerprints_query()
+        statements: List[dict] = []
+        count = 0
+        async for document in self._read_documents(query, target, chunk_size):
+            statements.append(document["_source"])
+            if len(statements) >= chunk_size:
+                count += await self._write_fingerprinted(statements, target)
+                statements = []
+
+        return count + await self._write_fingerprinted(statements, target)
+
+    def _read_documents(
+        self, query: MongoQuery, target: Optional[str], chunk_size: Optional[int] = None
+    ) -> AsyncIterator[dict]:
+        """Yield the MongoDB documents matching the `query` as dictionaries."""
+        return cast(
+            AsyncIterator[dict],
+            self.read(query=query, target=target, chunk_size=chunk_size),
+        )
+
+    async def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        See `MongoLRSBackend.create_statements`.
+        """
+        collection = self._get_target_collection(target)
+        write_concern = MongoLRSBackend.get_write_concern(self.settings)
+        if write_concern:
+            collection = collection.with_options(write_concern=write_concern)
+        if collection.name not in self._unique_id_collections:
+            try:
+                indexes = await collection.index_information()
+            except PyMongoError as error:
+                msg = "Failed to get the statements collection indexes: %s"
+                logger.error(msg, error)
+                raise BackendException(msg % error) from error
+            if not MongoLRSBackend.has_unique_id_index(indexes):
+                logger.warning(UNIQUE_ID_INDEX_MISSING_MSG, collection.name)
+                return await super().create_statements(statements, target)
+            self._unique_id_collections.add(collection.name)
+
+        documents = self.to_documents(statements, False, BaseOperationType.CREATE)
+        conflicting_ids = []
+        for batch in iter_by_batch(documents, self.settings.WRITE_CHUNK_SIZE):
+            try:
+                await collection.insert_many(batch, ordered=False)
+            except BulkWriteError as error:
+                conflicting_ids.extend(MongoLRSBackend.get_conflicting_ids(error))
+            except (PyMongoError, BSONError, ValueError) as error:
+                msg = "Failed to create statements: %s"
+                logger.error(msg, error)
+                raise BackendException(msg % error) from error
+
+        return conflicting_ids
+
+    async def init_indexes(self, target: Optional[str] = None) -> List[str]:
+        """Create the indexes serving statements queries and return their names.
+
+        See `MongoLRSBackend.init_indexes`.
+        """
+        collection = self._get_target_collection(target)
+        try:
+            return await collection.create_indexes(MongoLRSBackend.get_indexes())
+        except PyMongoError as error:
+            msg = "Failed to create the statements indexes: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+    async def explain_query_shapes(self, target: Optional[str] = None) -> List[str]:
+        """Return the names of the `STATEMENTS_QUERY_SHAPES` not served by an index.
+
+        See `MongoLRSBackend.explain_query_shapes`.
+        """
+        collection = self._get_target_collection(target)
+        unindexed_query_shapes = []
+        for name, params in STATEMENTS_QUERY_SHAPES.items():
+            query = MongoLRSBackend.get_query(params)
+            kwargs = query.model_dump(exclude_unset=True)
+            try:
+                explanation = await collection.find(**kwargs).explain()
+            except PyMongoError as error:
+                msg = "Failed to explain the %s query shape: %s"
+                logger.error(msg, name, error)
+                raise BackendException(msg % (name, error)) from error
+            plan = explanation["queryPlanner"]["winningPlan"]
+            if MongoLRSBackend.is_collection_scan(plan):
+                unindexed_query_shapes.append(name)
+
+        return unindexed_query_shapes
+
+    async def _write_fingerprinted(
+        self, statements: List[dict], target: Optional[str]
+    ) -> int:
+        """Replace `statements` along with their fingerprint and return their count."""
+        return await self.write(
+            statements,
+            target=target,
+            chunk_size=len(statements),
+            operation_type=BaseOperationType.UPDATE,
+        )
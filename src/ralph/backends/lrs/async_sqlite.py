@@ -0,0 +1,70 @@
+"""Asynchronous SQLite LRS backend for Ralph."""
+
+import logging
+from typing import AsyncIterator, List, Optional
+
+from ralph.backends.data.async_sqlite import AsyncSQLiteDataBackend
+from ralph.backends.lrs.base import (
+    AsyncIndexable,
+    BaseAsyncLRSBackend,
+    RalphStatementsQuery,
+    StatementFingerprint,
+    StatementQueryResult,
+)
+from ralph.backends.lrs.sqlite import SQLiteLRSBackend, SQLiteLRSBackendSettings
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSQLiteLRSBackend(
+    BaseAsyncLRSBackend[SQLiteLRSBackendSettings],
+    AsyncSQLiteDataBackend,
+    AsyncIndexable,
+):
+    """Asynchronous SQLite LRS backend.
+
+    Operations of a `SQLiteLRSBackend` are run in the event loop default executor.
+    """
+
+    sync_backend_class = SQLiteLRSBackend
+    backend: SQLiteLRSBackend
+
+    async def query_statements(
+        self, params: RalphStatementsQuery, target: Optional[str] = None
+    ) -> StatementQueryResult:
+        """Return the statements query payload using xAPI parameters."""
+        return await self._run(self.backend.query_statements, params, target)
+
+    async def query_statements_by_ids(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> AsyncIterator[dict]:
+        """Yield statements with matching ids from the backend."""
+        statements = self.backend.query_statements_by_ids(ids, target)
+        async for statement in self._iterate(statements, self.settings.READ_CHUNK_SIZE):
+            yield statement
+
+    async def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> AsyncIterator[StatementFingerprint]:
+        """Yield fingerprints of statements with matching ids from the backend."""
+        fingerprints = self.backend.query_statement_fingerprints(ids, target)
+        size = self.settings.READ_CHUNK_SIZE
+        async for fingerprint in self._iterate(fingerprints, size):
+            yield fingerprint
+
+    async def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        See `SQLiteLRSBackend.create_statements`.
+        """
+        return await self._run(self.backend.create_statements, statements, target)
+
+    async def init_indexes(self, target: Optional[str] = None) -> List[str]:
+        """Create the indexes serving statements queries and return their names."""
+        return await self._run(self.backend.init_indexes, target)
+
+    async def explain_query_shapes(self, target: Optional[str] = None) -> List[str]:
+        """Return the names of the `STATEMENTS_QUERY_SHAPES` not served by an index."""
+        return await self._run(self.backend.explain_query_shapes, target)
@@ -1,11 +1,14 @@
 """Base LRS backend for Ralph."""
 
-from abc import abstractmethod
+import hashlib
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from typing import (
     Any,
     AsyncIterator,
+    Dict,
+    Iterable,
     Iterator,
     List,
     Literal,
@@ -20,15 +23,18 @@ from pydantic_settings import SettingsConfigDict
 from typing_extensions import Annotated
 
 from ralph.backends.data.base import (
+    AsyncWritable,
     BaseAsyncDataBackend,
     BaseDataBackend,
     BaseDataBackendSettings,
     BaseQuery,
+    Writable,
 )
 from ralph.conf import BASE_SETTINGS_CONFIG
 from ralph.models.xapi.base.agents import BaseXapiAgent
 from ralph.models.xapi.base.common import IRI
 from ralph.models.xapi.base.groups import BaseXapiGroup
+from ralph.utils import get_statement_fingerprint
 
 
 class BaseLRSBackendSettings(BaseDataBackendSettings):
@@ -40,16 +46,47 @@ class BaseLRSBackendSettings(BaseDataBackendSettings):
     }
 
 
+@dataclass
+class StatementFingerprint:
+    """Fingerprint of a statement stored in an LRS backend.
+
+    The `fingerprint` is `None` if it has not been stored along with the statement.
+    It is stored outside of the statement, thus stored statements are left unchanged.
+    See `ralph.utils.get_statement_fingerprint`.
+    """
+
+    id: str
+    fingerprint: Optional[str]
+
+
+def get_change_marker(fingerprints: Iterable[Optional[str]]) -> Optional[str]:
+    """Return a hash of the stored `fingerprints` of queried statements.
+
+    Return `None` if the fingerprint of a statement is not stored.
+    """
+    digest = hashlib.sha256()
+    for fingerprint in fingerprints:
+        if not fingerprint:
+            return None
+        digest.update(f"{fingerprint} ".encode("utf-8"))
+    return digest.hexdigest()
+
+
 @dataclass
 class StatementQueryResult:
-    """Result of an LRS statements query."""
+    """Result of an LRS statements query.
+
+    The `change_marker` changes whenever the stored content of the `statements`
+    changes. It is `None` if the backend does not provide it.
+    """
 
     statements: List[dict]
     pit_id: Optional[str] = None
     search_after: Optional[str] = None
+    change_marker: Optional[str] = None
 
 
-def validate_iso_datetime_str(value: Union[str, datetime]) -> datetime:
+def validate_iso_datetime_str(value: Union[str, datetime]) -> str:
     """Value is expected to be an ISO 8601 date time string.
 
     Note that we also accept datetime python instance that will be converted
@@ -67,6 +104,8 @@ def validate_iso_datetime_str(value: Union[str, datetime]) -> datetime:
     except ValueError as err:
         raise ValueError("invalid ISO 8601 date time string") from err
 
+    return value
+
 
 IsoDatetimeStr = Annotated[
     Union[str, datetime], AfterValidator(validate_iso_datetime_str)
@@ -121,10 +160,117 @@ class RalphStatementsQuery(LRSStatementsQuery):
     ignore_order: Optional[bool] = None
 
 
+# Query shapes of the statements queries issued by the LRS API. Used to check that
+# the indexes of LRS backends serve them. See `Indexable.explain_query_shapes`.
+_QUERY_SHAPES_PARAMS: Dict[str, Dict[str, Any]] = {
+    "timestamp": {},
+    "statementId": {"statement_id": "shape"},
+    "verb": {"verb": "shape"},
+    "activity": {"activity": "shape"},
+    "since_until": {"since": "shape", "until": "shape"},
+}
+STATEMENTS_QUERY_SHAPES: Dict[str, RalphStatementsQuery] = {
+    name: RalphStatementsQuery.model_construct(**params)
+    for name, params in _QUERY_SHAPES_PARAMS.items()
+}
+_AGENT_QUERY_SHAPES: Dict[str, AgentParameters] = {
+    "mbox": AgentParameters.model_construct(mbox="shape"),
+    "mbox_sha1sum": AgentParameters.model_construct(mbox_sha1sum="shape"),
+    "openid": AgentParameters.model_construct(openid="shape"),
+    "account": AgentParameters.model_construct(
+        account__name="shape", account__home_page="shape"
+    ),
+}
+for _name, _agent in _AGENT_QUERY_SHAPES.items():
+    STATEMENTS_QUERY_SHAPES[f"agent.{_name}"] = RalphStatementsQuery.model_construct(
+        agent=_agent
+    )
+for _name, _agent in _AGENT_QUERY_SHAPES.items():
+    STATEMENTS_QUERY_SHAPES[f"authority.{_name}"] = (
+        RalphStatementsQuery.model_construct(authority=_agent)
+    )
+
+
+class Indexable(ABC):
+    """LRS backend interface for backends managing statements queries indexes."""
+
+    @abstractmethod
+    def init_indexes(self, target: Optional[str] = None) -> List[str]:
+        """Create the indexes serving statements queries and return their names.
+
+        Args:
+            target (str or None): The target container name.
+                If `target` is `None`, a default value is used instead.
+
+        Raise:
+            BackendException: If a failure occurs.
+        """
+
+    @abstractmethod
+    def explain_query_shapes(self, target: Optional[str] = None) -> List[str]:
+        """Return the names of the `STATEMENTS_QUERY_SHAPES` not served by an index.
+
+        Args:
+            target (str or None): The target container name.
+                If `target` is `None`, a default value is used instead.
+
+        Raise:
+            BackendException: If a failure occurs.
+        """
+
+
+class AsyncIndexable(ABC):
+    """Async LRS backend interface for backends managing statements queries indexes."""
+
+    @abstractmethod
+    async def init_indexes(self, target: Optional[str] = None) -> List[str]:
+        """Create the indexes serving statements queries and return their names.
+
+        Args:
+            target (str or None): The target container name.
+                If `target` is `None`, a default value is used instead.
+
+        Raise:
+            BackendException: If a failure occurs.
+        """
+
+    @abstractmethod
+    async def explain_query_shapes(self, target: Optional[str] = None) -> List[str]:
+        """Return the names of the `STATEMENTS_QUERY_SHAPES` not served by an index.
+
+        Args:
+            target (str or None): The target container name.
+                If `target` is `None`, a default value is used instead.
+
+        Raise:
+            BackendException: If a failure occurs.
+        """
+
+
+class Archivable(ABC):
+    """LRS backend interface for backends archiving aged statements."""
+
+    @abstractmethod
+    def archive_statements(
+        self, target: Optional[str] = None, chunk_size: Optional[int] = None
+    ) -> int:
+        """Move aged statements to the archive and return their count.
+
+        Args:
+            target (str or None): The target container name.
+                If `target` is `None`, a default value is used instead.
+            chunk_size (int or None): The number of statements to move at once.
+                If `chunk_size` is `None` a default value is used instead.
+
+        Raise:
+            BackendException: If a failure occurs.
+        """
+
+
 Settings = TypeVar("Settings", bound=BaseLRSBackendSettings)
 
 
-class BaseLRSBackend(BaseDataBackend[Settings, Any]):
+class BaseLRSBackend(BaseDataBackend[Settings, Any], Writable):
     """Base LRS backend interface."""
 
     @abstractmethod
@@ -139,8 +285,49 @@ class BaseLRSBackend(BaseDataBackend[Settings, Any]):
     ) -> Iterator[dict]:
         """Yield statements with matching ids from the backend."""
 
-
-class BaseAsyncLRSBackend(BaseAsyncDataBackend[Settings, Any]):
+    def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[StatementFingerprint]:
+        """Yield fingerprints of statements with matching ids from the backend.
+
+        Fingerprints are computed from the fetched statements. Backends storing
+        fingerprints should override this method to only fetch the stored ones.
+        """
+        for statement in self.query_statements_by_ids(ids, target):
+            fingerprint = get_statement_fingerprint(statement)
+            yield StatementFingerprint(statement["id"], fingerprint)
+
+    def backfill_fingerprints(
+        self,
+        target: Optional[str] = None,  # noqa: ARG002
+        chunk_size: Optional[int] = None,  # noqa: ARG002
+    ) -> int:
+        """Store the fingerprint of statements missing it and return their count.
+
+        Backends storing fingerprints should override this method. Others have no
+        fingerprint to store, thus `0` is returned.
+        """
+        return 0
+
+    def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        Backends should override this method to rely on create-only writes instead
+        of querying stored statements first.
+        """
+        ids = [statement["id"] for statement in statements]
+        existing_ids = {
+            item.id for item in self.query_statement_fingerprints(ids, target)
+        }
+        new_statements = [item for item in statements if item["id"] not in existing_ids]
+        if new_statements:
+            self.write(new_statements, target=target)
+        return [statement_id for statement_id in ids if statement_id in existing_ids]
+
+
+class BaseAsyncLRSBackend(BaseAsyncDataBackend[Settings, Any], AsyncWritable):
     """Base async LRS backend interface."""
 
     @abstractmethod
@@ -150,7 +337,48 @@ class BaseAsyncLRSBackend(BaseAsyncDataBackend[Settings, Any]):
         """Return the statements query payload using xAPI parameters."""
 
     @abstractmethod
-    async def query_statements_by_ids(
+    def query_statements_by_ids(
         self, ids: List[str], target: Optional[str] = None
     ) -> AsyncIterator[dict]:
         """Return the list of matching statement IDs from the database."""
+
+    async def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> AsyncIterator[StatementFingerprint]:
+        """Yield fingerprints of statements with matching ids from the backend.
+
+        Fingerprints are computed from the fetched statements. Backends storing
+        fingerprints should override this method to only fetch the stored ones.
+        """
+        async for statement in self.query_statements_by_ids(ids, target):
+            fingerprint = get_statement_fingerprint(statement)
+            yield StatementFingerprint(statement["id"], fingerprint)
+
+    async def backfill_fingerprints(
+        self,
+        target: Optional[str] = None,  # noqa: ARG002
+        chunk_size: Optional[int] = None,  # noqa: ARG002
+    ) -> int:
+        """Store the fingerprint of statements missing it and return their count.
+
+        Backends storing fingerprints should override this method. Others have no
+        fingerprint to store, thus `0` is returned.
+        """
+        return 0
+
+    async def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        Backends should override this method to rely on create-only writes instead
+        of querying stored statements first.
+        """
+        ids = [statement["id"] for statement in statements]
+        existing_ids = {
+            item.id async for item in self.query_statement_fingerprints(ids, target)
+        }
+        new_statements = [item for item in statements if item["id"] not in existing_ids]
+        if new_statements:
+            await self.write(new_statements, target=target)
+        return [statement_id for statement_id in ids if statement_id in existing_ids]
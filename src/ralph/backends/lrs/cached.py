@@ -0,0 +1,473 @@
+"""Cached LRS backend for Ralph."""
+
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, cast
+
+from cachetools import TTLCache
+from pydantic import BaseModel, PositiveFloat, PositiveInt
+from pydantic_settings import SettingsConfigDict
+
+from ralph.backends.data.base import BaseOperationType, DataBackendStatus
+from ralph.backends.loader import get_lrs_backends
+from ralph.backends.lrs.base import (
+    BaseLRSBackend,
+    BaseLRSBackendSettings,
+    RalphStatementsQuery,
+    StatementFingerprint,
+    StatementQueryResult,
+)
+from ralph.conf import BASE_SETTINGS_CONFIG
+from ralph.exceptions import BackendParameterException
+from ralph.utils import get_statement_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Statements query parameters narrowing a query by id down to no statement.
+FILTER_PARAMETERS = (
+    "voided_statement_id",
+    "verb",
+    "activity",
+    "registration",
+    "related_activities",
+    "related_agents",
+    "since",
+    "until",
+    "search_after",
+)
+
+
+class CachedLRSBackendSettings(BaseLRSBackendSettings):
+    """Cached LRS backend default configuration.
+
+    Attributes:
+        BACKEND (str): The name of the LRS backend whose statements are cached.
+        CACHE_MAX_SIZE (int): The maximum number of cached statements.
+        CACHE_TTL (float): The number of seconds statements are cached.
+        CACHE_DATABASE_PATH (Path): The path of a SQLite database file caching
+            statements for all workers of the host. If it is not set, statements are
+            only cached in the memory of each worker.
+    """
+
+    model_config = {
+        **BASE_SETTINGS_CONFIG,
+        **SettingsConfigDict(env_prefix="RALPH_BACKENDS__LRS__CACHED__"),
+    }
+
+    BACKEND: str = "es"
+    CACHE_MAX_SIZE: PositiveInt = 10000
+    CACHE_TTL: PositiveFloat = 3600
+    CACHE_DATABASE_PATH: Optional[Path] = None
+
+
+class StatementCache:
+    """Bounded least recently used statements cache with a time to live.
+
+    Statements are cached in memory as JSON strings, thus callers may mutate the
+    statements they get. If a `database_path` is given, statements are also cached
+    in a SQLite database shared by all processes of the host. Failures of the shared
+    cache are logged and handled as cache misses.
+    """
+
+    def __init__(self, max_size: int, ttl: float, database_path: Optional[Path] = None):
+        """Instantiate the statements cache."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self.database_path = database_path
+        self.hits = 0
+        self.misses = 0
+        self._memory: TTLCache = TTLCache(maxsize=max_size, ttl=ttl)
+        self._lock = Lock()
+        self._table_created = False
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the ratio of statements lookups served by the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_statistics(self) -> Dict[str, Union[int, float]]:
+        """Return the cache hits, misses, hit rate and in-memory size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self._memory),
+        }
+
+    def get(self, keys: List[str]) -> Dict[str, dict]:
+        """Return cached statements by key, skipping the missing ones."""
+        found: Dict[str, str] = {}
+        with self._lock:
+            for key in keys:
+                value = self._memory.get(key)
+                if value is not None:
+                    found[key] = value
+
+        missing_keys = [key for key in keys if key not in found]
+        if missing_keys and self.database_path:
+            shared = self._get_shared(missing_keys)
+            with self._lock:
+                self._memory.update(shared)
+            found.update(shared)
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        logger.debug(
+            "Statement cache hits: %d/%d (hit rate: %.2f)",
+            len(found),
+            len(keys),
+            self.hit_rate,
+        )
+        return {key: json.loads(value) for key, value in found.items()}
+
+    def set(self, statements: Dict[str, dict]) -> None:
+        """Cache the `statements` by key."""
+        values = {key: json.dumps(statement) for key, statement in statements.items()}
+        with self._lock:
+            self._memory.update(values)
+        if values and self.database_path:
+            self._set_shared(values)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        """Remove the statements of the `keys` from the cache."""
+        keys = list(keys)
+        with self._lock:
+            for key in keys:
+                self._memory.pop(key, None)
+        if keys and self.database_path:
+            self._delete_shared(keys)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the shared cache database."""
+        connection = sqlite3.connect(
+            cast(Path, self.database_path), timeout=1, isolation_level=None
+        )
+        if not self._table_created:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS statements "
+                "(key TEXT PRIMARY KEY, statement TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            self._table_created = True
+        return connection
+
+    def _get_shared(self, keys: List[str]) -> Dict[str, str]:
+        """Return the statements of the shared cache by key."""
+        placeholders = ", ".join("?" for _ in keys)
+        sql = (
+            "SELECT key, statement FROM statements "  # noqa: S608
+            f"WHERE key IN ({placeholders}) AND expires > ?"
+        )
+        try:
+            connection = self._connect()
+            try:
+                return dict(connection.execute(sql, (*keys, time.time())).fetchall())
+            finally:
+                connection.close()
+        except sqlite3.Error as error:
+            logger.warning("Failed to read the shared statement cache: %s", error)
+            return {}
+
+    def _set_shared(self, values: Dict[str, str]) -> None:
+        """Cache statements in the shared cache and evict the oldest ones."""
+        now = time.time()
+        rows = [(key, value, now + self.ttl) for key, value in values.items()]
+        try:
+            connection = self._connect()
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.executemany(
+                    "INSERT OR REPLACE INTO statements VALUES (?, ?, ?)", rows
+                )
+                connection.execute("DELETE FROM statements WHERE expires <= ?", (now,))
+                connection.execute(
+                    "DELETE FROM statements WHERE key IN (SELECT key FROM statements "
+                    "ORDER BY expires DESC LIMIT -1 OFFSET ?)",
+                    (self.max_size,),
+                )
+                connection.execute("COMMIT")
+            finally:
+                connection.close()
+        except sqlite3.Error as error:
+            logger.warning("Failed to write the shared statement cache: %s", error)
+
+    def _delete_shared(self, keys: List[str]) -> None:
+        """Remove the statements of the `keys` from the shared cache."""
+        try:
+            connection = self._connect()
+            try:
+                connection.executemany(
+                    "DELETE FROM statements WHERE key = ?", [(key,) for key in keys]
+                )
+            finally:
+                connection.close()
+        except sqlite3.Error as error:
+            logger.warning("Failed to invalidate the shared statement cache: %s", error)
+
+    @staticmethod
+    def get_key(statement_id: str, target: Optional[str] = None) -> str:
+        """Return the cache key of a statement of the `target` container."""
+        return f"{target or ''}|{statement_id}"
+
+    @staticmethod
+    def get_query_statement_id(params: RalphStatementsQuery) -> Optional[str]:
+        """Return the statement id of a query selecting a single statement by id.
+
+        Queries filtering statements on other parameters, such as the `authority` of
+        restricted users, are not served by the cache.
+        """
+        if not params.statement_id:
+            return None
+        if any(getattr(params, name) for name in FILTER_PARAMETERS):
+            return None
+        for agent in (params.agent, params.authority):
+            # Queries built with `model_construct` may hold agents as dictionaries.
+            values = agent.model_dump() if isinstance(agent, BaseModel) else agent
+            if values and any(values.values()):
+                return None
+        return str(params.statement_id)
+
+    @staticmethod
+    def get_fingerprint(statement: dict) -> StatementFingerprint:
+        """Return the fingerprint of a cached statement."""
+        return StatementFingerprint(
+            statement["id"], get_statement_fingerprint(statement)
+        )
+
+
+class CachedLRSBackend(BaseLRSBackend[CachedLRSBackendSettings]):
+    """Cached LRS backend serving statements lookups by id from a read-through cache.
+
+    Statements fetched by id from the cached backend are kept in a bounded cache, as
+    statements are immutable. Statements written by `write` are removed from the
+    cache, while statements created by `create_statements` are added to it.
+    Other statements queries are forwarded to the cached backend.
+    """
+
+    name = "cached"
+    # The write concurrency is forwarded to the cached backend.
+    concurrent_writes = False
+
+    def __init__(self, settings: Optional[CachedLRSBackendSettings] = None):
+        """Instantiate the cached LRS backend and the statements cache.
+
+        Args:
+            settings (CachedLRSBackendSettings or None): The LRS backend settings.
+                If `settings` is `None`, a default settings instance is used instead.
+
+        Raise:
+            BackendParameterException: If the cached backend is not a synchronous
+                LRS backend.
+        """
+        super().__init__(settings)
+        self.backend = self.get_cached_backend(self.settings.BACKEND)
+        self.cache = StatementCache(
+            self.settings.CACHE_MAX_SIZE,
+            self.settings.CACHE_TTL,
+            self.settings.CACHE_DATABASE_PATH,
+        )
+        # Writes are forwarded to the cached backend.
+        self.default_operation_type = self.backend.default_operation_type
+        self.unsupported_operation_types = self.backend.unsupported_operation_types
+
+    def status(self) -> DataBackendStatus:
+        """Return the status of the cached backend."""
+        return self.backend.status()
+
+    def read(  # noqa: PLR0913
+        self,
+        query: Optional[Any] = None,
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        raw_output: bool = False,
+        ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
+        max_statements: Optional[PositiveInt] = None,
+    ) -> Union[Iterator[bytes], Iterator[dict]]:
+        """Read records of the cached backend. See the cached backend `read`."""
+        yield from self.backend.read(
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
+        )
+
+    def _read_dicts(
+        self,
+        query: Any,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+    ) -> Iterator[dict]:
+        """Method called by `self.read` yielding dictionaries. See `self.read`."""
+        statements = self.backend.read(query, target, chunk_size, False, ignore_errors)
+        yield from cast(Iterator[dict], statements)
+
+    def _write_dicts(  # noqa: PLR0913
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],
+    ) -> int:
+        """Write statements to the cached backend and remove them from the cache.
+
+        See `self.write`.
+        """
+        keys: List[str] = []
+
+        def track_keys(statements: Iterable[dict]) -> Iterator[dict]:
+            """Collect the cache keys of the written `statements`."""
+            for statement in statements:
+                if "id" in statement:
+                    keys.append(self.cache.get_key(statement["id"], target))
+                yield statement
+
+        try:
+            return self.backend.write(
+                track_keys(data),
+                target,
+                chunk_size,
+                ignore_errors,
+                operation_type,
+                concurrency,
+            )
+        finally:
+            self.cache.delete(keys)
+
+    def query_statements(
+        self, params: RalphStatementsQuery, target: Optional[str] = None
+    ) -> StatementQueryResult:
+        """Return the statements query payload using xAPI parameters.
+
+        Queries of a single statement by id are served by the cache.
+        """
+        statement_id = self.cache.get_query_statement_id(params)
+        if not statement_id:
+            return self.backend.query_statements(params, target)
+
+        key = self.cache.get_key(statement_id, target)
+        cached = self.cache.get([key])
+        if key in cached:
+            return StatementQueryResult(statements=[cached[key]])
+
+        result = self.backend.query_statements(params, target)
+        if [statement["id"] for statement in result.statements] == [statement_id]:
+            self.cache.set({key: result.statements[0]})
+        return result
+
+    def query_statements_by_ids(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[dict]:
+        """Yield statements with matching ids from the cache, then the backend.
+
+        The cached backend is only queried for ids missing from the cache.
+        """
+        keys = {
+            statement_id: self.cache.get_key(statement_id, target)
+            for statement_id in ids
+        }
+        cached = self.cache.get(list(keys.values()))
+        yield from cached.values()
+
+        missing_ids = [
+            statement_id for statement_id, key in keys.items() if key not in cached
+        ]
+        if not missing_ids:
+            return
+
+        # Statements are cached before being yielded, as callers may mutate them.
+        statements = list(self.backend.query_statements_by_ids(missing_ids, target))
+        self.cache.set(
+            {
+                keys[statement["id"]]: statement
+                for statement in statements
+                if statement["id"] in keys
+            }
+        )
+        yield from statements
+
+    def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[StatementFingerprint]:
+        """Yield fingerprints of statements with matching ids.
+
+        Fingerprints of cached statements are computed from the cache, the cached
+        backend is only queried for the other ones.
+        """
+        keys = {
+            statement_id: self.cache.get_key(statement_id, target)
+            for statement_id in ids
+        }
+        cached = self.cache.get(list(keys.values()))
+        for statement in cached.values():
+            yield self.cache.get_fingerprint(statement)
+
+        missing_ids = [
+            statement_id for statement_id, key in keys.items() if key not in cached
+        ]
+        if missing_ids:
+            yield from self.backend.query_statement_fingerprints(missing_ids, target)
+
+    def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        Created statements are added to the cache.
+        """
+        existing_ids = self.backend.create_statements(statements, target)
+        excluded_ids = set(existing_ids)
+        self.cache.set(
+            {
+                self.cache.get_key(statement["id"], target): statement
+                for statement in statements
+                if statement["id"] not in excluded_ids
+            }
+        )
+        return existing_ids
+
+    def backfill_fingerprints(
+        self, target: Optional[str] = None, chunk_size: Optional[int] = None
+    ) -> int:
+        """Store the fingerprint of statements missing it and return their count."""
+        return self.backend.backfill_fingerprints(target, chunk_size)
+
+    def close(self) -> None:
+        """Close the cached backend.
+
+        Raise:
+            BackendException: If a failure occurs during the close operation.
+        """
+        self.backend.close()
+
+    @staticmethod
+    def get_cached_backend(name: str) -> BaseLRSBackend:
+        """Return an instance of the `name` LRS backend.
+
+        Raise:
+            BackendParameterException: If the backend is not a synchronous LRS
+                backend.
+        """
+        backend_class = get_lrs_backends().get(name)
+        if (
+            not backend_class
+            or not issubclass(backend_class, BaseLRSBackend)
+            or issubclass(backend_class, CachedLRSBackend)
+        ):
+            msg = "The %s backend is not a synchronous LRS backend"
+            logger.error(msg, name)
+            raise BackendParameterException(msg % name)
+
+        return backend_class()
@@ -1,26 +1,77 @@
 """ClickHouse LRS backend for Ralph."""
 
+import json
 import logging
-from typing import Generator, Iterator, List, Optional
+from typing import (
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
+from uuid import UUID
 
+from clickhouse_connect.driver.exceptions import ClickHouseError
+from pydantic import PositiveInt
 from pydantic_settings import SettingsConfigDict
 
+from ralph.backends.data.base import BaseOperationType
 from ralph.backends.data.clickhouse import (
     ClickHouseDataBackend,
     ClickHouseDataBackendSettings,
+    ClickHouseQuery,
+    FingerprintedInsertColumns,
 )
 from ralph.backends.lrs.base import (
+    STATEMENTS_QUERY_SHAPES,
     AgentParameters,
     BaseLRSBackend,
     BaseLRSBackendSettings,
+    Indexable,
     RalphStatementsQuery,
+    StatementFingerprint,
     StatementQueryResult,
 )
 from ralph.conf import BASE_SETTINGS_CONFIG
 from ralph.exceptions import BackendException, BackendParameterException
+from ralph.utils import get_statement_fingerprint, iter_by_batch
 
 logger = logging.getLogger(__name__)
 
+# Materialized columns of the statements fields filtered by statements queries,
+# with the path of the field in the `event` JSON column.
+MATERIALIZED_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "verb_id": ("verb", "id"),
+    "object_id": ("object", "id"),
+    "actor_mbox": ("actor", "mbox"),
+    "actor_mbox_sha1sum": ("actor", "mbox_sha1sum"),
+    "actor_openid": ("actor", "openid"),
+    "actor_account_name": ("actor", "account", "name"),
+    "actor_account_home_page": ("actor", "account", "homePage"),
+    "authority_mbox": ("authority", "mbox"),
+    "authority_mbox_sha1sum": ("authority", "mbox_sha1sum"),
+    "authority_openid": ("authority", "openid"),
+    "authority_account_name": ("authority", "account", "name"),
+    "authority_account_home_page": ("authority", "account", "homePage"),
+    "registration": ("context", "registration"),
+}
+
+# Column storing the fingerprint of statements written by the LRS backend.
+FINGERPRINT_COLUMN = "fingerprint"
+FINGERPRINT_ROW_COLUMNS = ["event_id", FINGERPRINT_COLUMN]
+
+TABLE_COLUMNS_SQL = (
+    "SELECT name, default_kind FROM system.columns "
+    "WHERE database = {database:String} AND table = {table:String}"
+)
+
+# Allow the fingerprints backfill mutation to read the fingerprints `Join` table.
+BACKFILL_SETTINGS = {"mutations_sync": 1, "allow_nondeterministic_mutations": 1}
+
 
 class ClickHouseLRSBackendSettings(
     BaseLRSBackendSettings, ClickHouseDataBackendSettings
@@ -40,14 +91,62 @@ class ClickHouseLRSBackendSettings(
 
 
 class ClickHouseLRSBackend(
-    BaseLRSBackend[ClickHouseLRSBackendSettings], ClickHouseDataBackend
+    BaseLRSBackend[ClickHouseLRSBackendSettings], ClickHouseDataBackend, Indexable
 ):
     """ClickHouse LRS backend implementation."""
 
+    def __init__(self, settings: Optional[ClickHouseLRSBackendSettings] = None):
+        """Instantiate the ClickHouse LRS backend.
+
+        Args:
+            settings (ClickHouseLRSBackendSettings or None): The LRS backend settings.
+                If `settings` is `None`, a default settings instance is used instead.
+        """
+        super().__init__(settings)
+        self._columns: Dict[str, Dict[str, str]] = {}
+
     def query_statements(
         self, params: RalphStatementsQuery, target: Optional[str] = None
     ) -> StatementQueryResult:
         """Return the statements query payload using xAPI parameters."""
+        query = self.get_query(params, self._get_materialized_columns(target))
+        statements = []
+        document = None
+        try:
+            for document in self._read_documents(query, target, ignore_errors=True):
+                statements.append(document["event"])
+        except (BackendException, BackendParameterException) as error:
+            logger.error("Failed to read from ClickHouse")
+            raise error
+
+        new_search_after = None
+        new_pit_id = None
+
+        if document:
+            # Our search after string is a combination of event timestamp and
+            # event id, so that we can avoid losing events when they have the
+            # same timestamp, and also avoid sending the same event twice.
+            new_search_after = document["emission_time"].isoformat()
+            new_pit_id = str(document["event_id"])
+
+        return StatementQueryResult(
+            statements=statements,
+            search_after=new_search_after,
+            pit_id=new_pit_id,
+        )
+
+    @classmethod
+    def get_query(
+        cls,
+        params: RalphStatementsQuery,
+        materialized_columns: Optional[Set[str]] = None,
+    ) -> ClickHouseQuery:
+        """Construct query from statement parameters.
+
+        Statements fields are filtered using their column if it is part of the
+        `materialized_columns`. See `init_indexes`.
+        """
+        columns = materialized_columns if materialized_columns else set()
         ch_params = params.model_dump(exclude_none=True)
 
         if "statement_id" in ch_params:
@@ -58,17 +157,19 @@ class ClickHouseLRSBackend(
         if params.statement_id:
             where.append("event_id = {statementId:UUID}")
 
-        self._add_agent_filters(ch_params, where, params.agent, "actor")
+        cls._add_agent_filters(ch_params, where, params.agent, "actor", columns)
         ch_params.pop("agent", None)
 
-        self._add_agent_filters(ch_params, where, params.authority, "authority")
+        cls._add_agent_filters(ch_params, where, params.authority, "authority", columns)
         ch_params.pop("authority", None)
 
         if params.verb:
-            where.append("JSONExtractString(event, 'verb', 'id') = {verb:String}")
+            field = cls._get_event_field("verb_id", columns)
+            where.append(f"{field} = {{verb:String}}")
 
         if params.activity:
-            where.append("JSONExtractString(event, 'object', 'id') = {activity:String}")
+            field = cls._get_event_field("object_id", columns)
+            where.append(f"{field} = {{activity:String}}")
 
         if params.since:
             where.append("emission_time > {since:DateTime64(6)}")
@@ -93,7 +194,7 @@ class ClickHouseLRSBackend(
         sort_order = "ASCENDING" if params.ascending else "DESCENDING"
         order_by = f"emission_time {sort_order}, event_id {sort_order}"
 
-        query = self.query_class(
+        return ClickHouseQuery(
             select=["event_id", "emission_time", "event"],
             where=where,
             parameters=ch_params,
@@ -101,34 +202,6 @@ class ClickHouseLRSBackend(
             sort=order_by,
         )
 
-        try:
-            clickhouse_response = list(
-                self.read(
-                    query=query,
-                    target=target,
-                    ignore_errors=True,
-                )
-            )
-        except (BackendException, BackendParameterException) as error:
-            logger.error("Failed to read from ClickHouse")
-            raise error
-
-        new_search_after = None
-        new_pit_id = None
-
-        if clickhouse_response:
-            # Our search after string is a combination of event timestamp and
-            # event id, so that we can avoid losing events when they have the
-            # same timestamp, and also avoid sending the same event twice.
-            new_search_after = clickhouse_response[-1]["emission_time"].isoformat()
-            new_pit_id = str(clickhouse_response[-1]["event_id"])
-
-        return StatementQueryResult(
-            statements=[document["event"] for document in clickhouse_response],
-            search_after=new_search_after,
-            pit_id=new_pit_id,
-        )
-
     def query_statements_by_ids(
         self, ids: List[str], target: Optional[str] = None
     ) -> Iterator[dict]:
@@ -142,28 +215,349 @@ class ClickHouseLRSBackend(
             select="event",
             where="event_id IN ({ids:Array(String)})",
             parameters={"ids": ["1"]},
-            column_oriented=True,
         )
         try:
             for chunk_ids in chunk_id_list():
                 query.parameters["ids"] = chunk_ids
-                ch_response = self.read(
-                    query=query,
-                    target=target,
-                    ignore_errors=True,
-                )
+                ch_response = self._read_documents(query, target, ignore_errors=True)
                 yield from (document["event"] for document in ch_response)
         except (BackendException, BackendParameterException) as error:
             msg = "Failed to read from ClickHouse"
             logger.error(msg)
             raise error
 
+    def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[StatementFingerprint]:
+        """Yield fingerprints of statements with matching ids from the backend."""
+        query = self.get_fingerprints_query(self._get_columns(target))
+        try:
+            for chunk_ids in iter_by_batch(ids, self.settings.IDS_CHUNK_SIZE):
+                query.parameters = {"ids": chunk_ids}
+                for document in self._read_documents(query, target):
+                    yield self.to_statement_fingerprint(document)
+        except (BackendException, BackendParameterException) as error:
+            msg = "Failed to read from ClickHouse"
+            logger.error(msg)
+            raise error
+
+    def backfill_fingerprints(
+        self, target: Optional[str] = None, chunk_size: Optional[int] = None
+    ) -> int:
+        """Store the fingerprint of statements missing it and return their count.
+
+        Fingerprints are inserted by chunks in a temporary `Join` table, then stored
+        in the `fingerprint` column using a single mutation. The column is added to
+        the `target` table if it does not exist yet.
+        """
+        target = target if target else self.settings.EVENT_TABLE_NAME
+        chunk_size = chunk_size if chunk_size else self.settings.WRITE_CHUNK_SIZE
+        table = f"{target}_fingerprints"
+        commands, mutation = self.get_backfill_commands(target, table)
+        query = self.get_backfill_query(chunk_size)
+        count = 0
+        try:
+            for command in commands:
+                self.client.command(command)
+            self._columns.pop(target, None)
+            # Each chunk is fully read before inserting its fingerprints, as the
+            # next chunk query starts after its last document.
+            while documents := list(self._read_documents(query, target)):
+                rows = self.to_fingerprint_rows(documents)
+                self.client.insert(table, rows, column_names=FINGERPRINT_ROW_COLUMNS)
+                count += len(rows)
+                query = self.get_backfill_query(chunk_size, documents[-1])
+
+            if count:
+                self.client.command(mutation, settings=BACKFILL_SETTINGS)
+        except ClickHouseError as error:
+            msg = "Failed to store statement fingerprints: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+        finally:
+            self.client.command(f"DROP TABLE IF EXISTS {table}")
+
+        logger.info("Stored the fingerprint of %d statements", count)
+        return count
+
+    def _write_dicts(  # noqa: PLR0913
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],
+    ) -> int:
+        """Write statements along with their fingerprint. See `self.write`.
+
+        Fingerprints are stored in the `fingerprint` column of the `target` table,
+        rather than in the `event` column. Statements are written without their
+        fingerprint if the table has no such column.
+        """
+        target = target if target else self.settings.EVENT_TABLE_NAME
+        if (
+            operation_type == BaseOperationType.DELETE
+            or FINGERPRINT_COLUMN not in self._get_columns(target)
+        ):
+            return super()._write_dicts(
+                data, target, chunk_size, ignore_errors, operation_type, concurrency
+            )
+
+        count = 0
+        msg = "Start writing to the %s table of the %s database (chunk size: %d)"
+        logger.debug(msg, target, self.database, chunk_size)
+        batches = self.to_fingerprinted_insert_columns(data, chunk_size, ignore_errors)
+        for batch in batches:
+            count += self._bulk_import(batch, ignore_errors, target)
+
+        logger.info("Inserted a total of %d documents with success", count)
+        return count
+
+    def init_indexes(self, target: Optional[str] = None) -> List[str]:
+        """Create the columns and indexes serving statements queries.
+
+        Add the `MATERIALIZED_COLUMNS` to the `target` table with a bloom filter skip
+        index each, and the `fingerprint` column, and return their names. Columns and
+        indexes of existing rows are then materialized by a background mutation.
+        """
+        target = target if target else self.settings.EVENT_TABLE_NAME
+        names, commands = self.get_index_commands(target)
+        try:
+            for command in commands:
+                self.client.command(command)
+        except ClickHouseError as error:
+            msg = "Failed to create the statements columns and indexes: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+        self._columns.pop(target, None)
+        return names
+
+    def explain_query_shapes(self, target: Optional[str] = None) -> List[str]:
+        """Return the names of the `STATEMENTS_QUERY_SHAPES` not served by an index.
+
+        A query shape is not served by an index if it filters statements by
+        extracting fields from the `event` JSON column.
+        """
+        return self.get_unindexed_query_shapes(self._get_materialized_columns(target))
+
+    @classmethod
+    def get_unindexed_query_shapes(cls, materialized_columns: Set[str]) -> List[str]:
+        """Return the `STATEMENTS_QUERY_SHAPES` not served by `materialized_columns`."""
+        return [
+            name
+            for name, params in STATEMENTS_QUERY_SHAPES.items()
+            if any(
+                "JSONExtract" in clause
+                for clause in cls.get_query(params, materialized_columns).where or []
+            )
+        ]
+
+    @staticmethod
+    def get_fingerprints_query(columns: Dict[str, str]) -> ClickHouseQuery:
+        """Return the query selecting statement ids and stored fingerprints.
+
+        If the `fingerprint` column is not part of the table `columns`, an empty
+        fingerprint is selected instead.
+        """
+        fingerprint = FINGERPRINT_COLUMN if FINGERPRINT_COLUMN in columns else "''"
+        return ClickHouseQuery(
+            select=["event_id AS id", f"{fingerprint} AS {FINGERPRINT_COLUMN}"],
+            where="event_id IN ({ids:Array(String)})",
+            parameters={"ids": ["1"]},
+        )
+
+    @staticmethod
+    def to_statement_fingerprint(document: dict) -> StatementFingerprint:
+        """Return the `StatementFingerprint` of a `get_fingerprints_query` row."""
+        # Statements written without fingerprint have an empty `fingerprint` column
+        fingerprint = document[FINGERPRINT_COLUMN] or None
+        return StatementFingerprint(str(document["id"]), fingerprint)
+
+    @staticmethod
+    def to_fingerprinted_insert_columns(
+        data: Iterable[dict],
+        chunk_size: int,
+        ignore_errors: bool = False,
+    ) -> Iterator[FingerprintedInsertColumns]:
+        """Convert `data` statements to batches of insert columns with fingerprints.
+
+        See `ClickHouseDataBackend.to_insert_columns`.
+        """
+        columns = FingerprintedInsertColumns([], [], [], [])
+        for statement in data:
+            insert = ClickHouseDataBackend.to_insert(statement, ignore_errors)
+            if not insert:
+                continue
+
+            columns.event_id.append(insert.event_id)
+            columns.emission_time.append(insert.emission_time)
+            columns.event.append(json.dumps(statement))
+            columns.fingerprint.append(get_statement_fingerprint(statement))
+            if len(columns.event_id) >= chunk_size:
+                yield columns
+                columns = FingerprintedInsertColumns([], [], [], [])
+
+        if columns.event_id:
+            yield columns
+
+    @staticmethod
+    def to_fingerprint_rows(documents: List[dict]) -> List[Tuple[UUID, str]]:
+        """Return the `event_id` and fingerprint rows of `documents` statements."""
+        return [
+            (document["event_id"], get_statement_fingerprint(document["event"]))
+            for document in documents
+        ]
+
+    @staticmethod
+    def get_backfill_query(
+        chunk_size: int, last_document: Optional[dict] = None
+    ) -> ClickHouseQuery:
+        """Return the query selecting the next statements missing a fingerprint.
+
+        Statements are selected by chunks of `chunk_size` rows in primary key order,
+        following the `last_document` of the previous chunk if any.
+        """
+        where = [f"{FINGERPRINT_COLUMN} = ''"]
+        parameters = {}
+        if last_document:
+            where += [
+                "emission_time >= {emission_time:DateTime64(6)}",
+                "(emission_time, event_id) > "
+                "({emission_time:DateTime64(6)}, {event_id:UUID})",
+            ]
+            parameters = {
+                "emission_time": last_document["emission_time"].isoformat(),
+                "event_id": str(last_document["event_id"]),
+            }
+
+        return ClickHouseQuery(
+            select=["event_id", "emission_time", "event"],
+            where=where,
+            parameters=parameters,
+            limit=chunk_size,
+            sort="emission_time, event_id",
+        )
+
+    @staticmethod
+    def get_backfill_commands(target: str, table: str) -> Tuple[List[str], str]:
+        """Return the fingerprints backfill commands and mutation.
+
+        The commands add the `fingerprint` column to the `target` table and create
+        the fingerprints `Join` `table`. The mutation then stores the fingerprints of
+        `table` in the `target` table.
+        """
+        commands = [
+            f"ALTER TABLE {target} "
+            f"ADD COLUMN IF NOT EXISTS {FINGERPRINT_COLUMN} String",
+            f"DROP TABLE IF EXISTS {table}",
+            f"CREATE TABLE {table} (event_id UUID, {FINGERPRINT_COLUMN} String) "
+            "ENGINE = Join(ANY, LEFT, event_id)",
+        ]
+        mutation = (
+            f"ALTER TABLE {target} UPDATE {FINGERPRINT_COLUMN} = "
+            f"joinGet('{table}', '{FINGERPRINT_COLUMN}', event_id) "
+            f"WHERE {FINGERPRINT_COLUMN} = ''"
+        )
+        return commands, mutation
+
+    @classmethod
+    def get_index_commands(cls, target: str) -> Tuple[List[str], List[str]]:
+        """Return the `MATERIALIZED_COLUMNS` and indexes names and their commands.
+
+        The commands add the columns and indexes to the `target` table, then
+        materialize them for existing rows.
+        """
+        names = [FINGERPRINT_COLUMN]
+        actions = [f"ADD COLUMN IF NOT EXISTS {FINGERPRINT_COLUMN} String"]
+        for column, path in MATERIALIZED_COLUMNS.items():
+            index = f"{column}_index"
+            actions += [
+                f"ADD COLUMN IF NOT EXISTS {column} String "
+                f"MATERIALIZED {cls.get_json_extraction(path)}",
+                f"ADD INDEX IF NOT EXISTS {index} {column} "
+                "TYPE bloom_filter GRANULARITY 1",
+            ]
+            names += [column, index]
+        mutations = [f"MATERIALIZE COLUMN {column}" for column in MATERIALIZED_COLUMNS]
+        mutations += [
+            f"MATERIALIZE INDEX {column}_index" for column in MATERIALIZED_COLUMNS
+        ]
+        commands = [
+            f"ALTER TABLE {target} {', '.join(actions)}",
+            f"ALTER TABLE {target} {', '.join(mutations)}",
+        ]
+        return names, commands
+
+    @staticmethod
+    def get_materialized_columns(columns: Dict[str, str]) -> Set[str]:
+        """Return the names of the materialized `columns`. See `_get_columns`."""
+        return {name for name, kind in columns.items() if kind == "MATERIALIZED"}
+
+    @staticmethod
+    def get_table_parameters(target: str, default_database: str) -> Dict[str, str]:
+        """Return the database and table names of `target` as query parameters."""
+        database, _, table = target.rpartition(".")
+        return {"database": database if database else default_database, "table": table}
+
     @staticmethod
+    def get_json_extraction(path: Tuple[str, ...]) -> str:
+        """Return the expression extracting the `path` field of the `event` column."""
+        keys = ", ".join(f"'{key}'" for key in path)
+        return f"JSONExtractString(event, {keys})"
+
+    @classmethod
+    def _get_event_field(cls, column: str, materialized_columns: Set[str]) -> str:
+        """Return the `column` if it is materialized, else its JSON expression.
+
+        See `MATERIALIZED_COLUMNS`.
+        """
+        if column in materialized_columns:
+            return column
+        return cls.get_json_extraction(MATERIALIZED_COLUMNS[column])
+
+    def _get_columns(self, target: Optional[str]) -> Dict[str, str]:
+        """Return the `target` table columns names and default kinds.
+
+        Columns are fetched once per table and backend instance.
+        """
+        target = target if target else self.settings.EVENT_TABLE_NAME
+        if target in self._columns:
+            return self._columns[target]
+
+        parameters = self.get_table_parameters(target, self.database)
+        try:
+            rows = self.client.query(TABLE_COLUMNS_SQL, parameters).result_rows
+        except ClickHouseError as error:
+            msg = "Failed to get the %s table columns: %s"
+            logger.error(msg, target, error)
+            raise BackendException(msg % (target, error)) from error
+
+        self._columns[target] = {str(name): str(kind) for name, kind in rows}
+        return self._columns[target]
+
+    def _read_documents(
+        self, query: ClickHouseQuery, target: Optional[str], ignore_errors: bool = False
+    ) -> Iterator[dict]:
+        """Yield the ClickHouse rows matching the `query` as dictionaries."""
+        return cast(
+            Iterator[dict],
+            self.read(query=query, target=target, ignore_errors=ignore_errors),
+        )
+
+    def _get_materialized_columns(self, target: Optional[str]) -> Set[str]:
+        """Return the names of the `target` table materialized columns."""
+        return self.get_materialized_columns(self._get_columns(target))
+
+    @classmethod
     def _add_agent_filters(
+        cls,
         ch_params: dict,
         where: list,
         agent_params: AgentParameters,
         target_field: str,
+        materialized_columns: Set[str],
     ) -> None:
         """Add filters relative to agents to `where`."""
         if not agent_params:
@@ -174,36 +568,32 @@ class ClickHouseLRSBackend(
 
         if agent_params.get("mbox"):
             ch_params[f"{target_field}__mbox"] = agent_params.get("mbox")
-            where.append(
-                f"JSONExtractString(event, '{target_field}', 'mbox') = "
-                f"{{{target_field}__mbox:String}}"
-            )
+            field = cls._get_event_field(f"{target_field}_mbox", materialized_columns)
+            where.append(f"{field} = {{{target_field}__mbox:String}}")
         elif agent_params.get("mbox_sha1sum"):
             ch_params[f"{target_field}__mbox_sha1sum"] = agent_params.get(
                 "mbox_sha1sum"
             )
-            where.append(
-                f"JSONExtractString(event, '{target_field}', 'mbox_sha1sum') = "
-                f"{{{target_field}__mbox_sha1sum:String}}"
+            field = cls._get_event_field(
+                f"{target_field}_mbox_sha1sum", materialized_columns
             )
+            where.append(f"{field} = {{{target_field}__mbox_sha1sum:String}}")
         elif agent_params.get("openid"):
             ch_params[f"{target_field}__openid"] = agent_params.get("openid")
-            where.append(
-                f"JSONExtractString(event, '{target_field}', 'openid') = "
-                f"{{{target_field}__openid:String}}"
-            )
+            field = cls._get_event_field(f"{target_field}_openid", materialized_columns)
+            where.append(f"{field} = {{{target_field}__openid:String}}")
         elif agent_params.get("account__name"):
             ch_params[f"{target_field}__account__name"] = agent_params.get(
                 "account__name"
             )
-            where.append(
-                f"JSONExtractString(event, '{target_field}', 'account', 'name') = "
-                f"{{{target_field}__account__name:String}}"
+            field = cls._get_event_field(
+                f"{target_field}_account_name", materialized_columns
             )
+            where.append(f"{field} = {{{target_field}__account__name:String}}")
             ch_params[f"{target_field}__account__home_page"] = agent_params.get(
                 "account__home_page"
             )
-            where.append(
-                f"JSONExtractString(event, '{target_field}', 'account', 'homePage') = "
-                f"{{{target_field}__account__home_page:String}}"
+            field = cls._get_event_field(
+                f"{target_field}_account_home_page", materialized_columns
             )
+            where.append(f"{field} = {{{target_field}__account__home_page:String}}")
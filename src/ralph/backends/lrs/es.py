@@ -1,10 +1,18 @@
 """Elasticsearch LRS backend for Ralph."""
 
 import logging
-from typing import Iterator, List, Optional
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Union, cast
 
+from dateutil.parser import isoparse
+from dateutil.relativedelta import relativedelta
+from elasticsearch import ApiError, TransportError
+from elasticsearch.helpers import streaming_bulk
+from pydantic import PositiveInt
 from pydantic_settings import SettingsConfigDict
 
+from ralph.backends.data.base import BaseOperationType
 from ralph.backends.data.es import (
     ESDataBackend,
     ESDataBackendSettings,
@@ -12,28 +20,83 @@ from ralph.backends.data.es import (
     ESQueryPit,
 )
 from ralph.backends.lrs.base import (
+    STATEMENTS_QUERY_SHAPES,
     AgentParameters,
     BaseLRSBackend,
     BaseLRSBackendSettings,
+    Indexable,
     RalphStatementsQuery,
     StatementQueryResult,
+    get_change_marker,
 )
 from ralph.conf import BASE_SETTINGS_CONFIG
 from ralph.exceptions import BackendException, BackendParameterException
+from ralph.utils import iter_by_batch
 
 logger = logging.getLogger(__name__)
 
+# Longest string (in UTF-8 characters) Lucene can index as a single keyword term.
+# Dynamic mapping only indexes keywords up to 256 characters, skipping long IRIs.
+KEYWORD_IGNORE_ABOVE = 8191
+
+# Mapping of statements fields queried by `ESLRSBackend.get_query`. String fields
+# keep the dynamic mapping shape (a `text` field with a `keyword` subfield).
+KEYWORD_MAPPING: Dict[str, Any] = {
+    "type": "text",
+    "fields": {"keyword": {"type": "keyword", "ignore_above": KEYWORD_IGNORE_ABOVE}},
+}
+AGENT_MAPPING: Dict[str, Any] = {
+    "properties": {
+        "mbox": KEYWORD_MAPPING,
+        "mbox_sha1sum": KEYWORD_MAPPING,
+        "openid": KEYWORD_MAPPING,
+        "account": {
+            "properties": {"name": KEYWORD_MAPPING, "homePage": KEYWORD_MAPPING}
+        },
+    }
+}
+STATEMENTS_MAPPINGS: Dict[str, Dict[str, Any]] = {
+    "properties": {
+        "actor": AGENT_MAPPING,
+        "authority": AGENT_MAPPING,
+        "object": {"properties": {"id": KEYWORD_MAPPING}},
+        "timestamp": {"type": "date"},
+        "verb": {"properties": {"id": KEYWORD_MAPPING}},
+    }
+}
+
+# Operation types writing statements to the index of their period.
+PERIOD_OPERATION_TYPES = {BaseOperationType.CREATE, BaseOperationType.INDEX}
+
+# Periods of time-partitioned statements indices, from the coarsest to the finest,
+# with the format of their index name suffix and their duration.
+INDEX_PERIODS = {
+    "year": ("%Y", relativedelta(years=1)),
+    "month": ("%Y.%m", relativedelta(months=1)),
+    "day": ("%Y.%m.%d", relativedelta(days=1)),
+}
+
 
 class ESLRSBackendSettings(BaseLRSBackendSettings, ESDataBackendSettings):
-    """Elasticsearch LRS backend default configuration."""
+    """Elasticsearch LRS backend default configuration.
+
+    Attributes:
+        INDEX_PERIOD (str or None): The period of the time-partitioned indices
+            statements are written to, based on their `timestamp`. One of `year`,
+            `month` or `day`. E.g. with the `month` period, a statement of March 2024
+            is written to the `<DEFAULT_INDEX>-2024.03` index. If `None`, statements
+            are written to the `DEFAULT_INDEX`.
+    """
 
     model_config = {
         **BASE_SETTINGS_CONFIG,
         **SettingsConfigDict(env_prefix="RALPH_BACKENDS__LRS__ES__"),
     }
 
+    INDEX_PERIOD: Optional[Literal["year", "month", "day"]] = None
+
 
-class ESLRSBackend(BaseLRSBackend[ESLRSBackendSettings], ESDataBackend):
+class ESLRSBackend(BaseLRSBackend[ESLRSBackendSettings], ESDataBackend, Indexable):
     """Elasticsearch LRS backend implementation."""
 
     def query_statements(
@@ -41,19 +104,23 @@ class ESLRSBackend(BaseLRSBackend[ESLRSBackendSettings], ESDataBackend):
     ) -> StatementQueryResult:
         """Return the statements query payload using xAPI parameters."""
         query = self.get_query(params=params)
+        target = self.get_query_indices(
+            target if target else self.settings.DEFAULT_INDEX,
+            self.settings.INDEX_PERIOD,
+            params.since,
+            params.until,
+        )
         try:
-            es_documents = self.read(
-                query=query, target=target, chunk_size=params.limit
-            )
-            statements = [document["_source"] for document in es_documents]
+            es_documents = list(self._read_documents(query, target, params.limit))
         except (BackendException, BackendParameterException) as error:
             logger.error("Failed to read from Elasticsearch")
             raise error
 
         return StatementQueryResult(
-            statements=statements,
+            statements=[document["_source"] for document in es_documents],
             pit_id=query.pit.id,
             search_after="|".join(query.search_after) if query.search_after else "",
+            change_marker=get_change_marker(map(self.get_version, es_documents)),
         )
 
     def query_statements_by_ids(
@@ -61,13 +128,352 @@ class ESLRSBackend(BaseLRSBackend[ESLRSBackendSettings], ESDataBackend):
     ) -> Iterator[dict]:
         """Yield statements with matching ids from the backend."""
         query = self.query_class(query={"terms": {"_id": ids}})
+        target = self._get_indices(target)
         try:
-            es_response = self.read(query=query, target=target)
+            es_response = self._read_documents(query, target)
             yield from (document["_source"] for document in es_response)
         except (BackendException, BackendParameterException) as error:
             logger.error("Failed to read from Elasticsearch")
             raise error
 
+    def _read_documents(
+        self, query: ESQuery, target: str, chunk_size: Optional[int] = None
+    ) -> Iterator[dict]:
+        """Yield the Elasticsearch documents matching the `query` as dictionaries."""
+        return cast(
+            Iterator[dict],
+            self.read(query=query, target=target, chunk_size=chunk_size),
+        )
+
+    def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        Statements are written using the `create` bulk operation type, failing for
+        already stored statements ids. If `INDEX_PERIOD` is set, statements ids are
+        only unique per period index, thus stored ids are queried first.
+        """
+        target = target if target else self.settings.DEFAULT_INDEX
+        conflicting_ids = []
+        if self.settings.INDEX_PERIOD:
+            ids = [statement["id"] for statement in statements]
+            fingerprints = self.query_statement_fingerprints(ids, target)
+            stored_ids = {fingerprint.id for fingerprint in fingerprints}
+            conflicting_ids = [x for x in ids if x in stored_ids]
+            statements = [x for x in statements if x["id"] not in stored_ids]
+
+        actions = self.to_period_documents(
+            statements, target, BaseOperationType.CREATE, self.settings.INDEX_PERIOD
+        )
+        try:
+            for success, item in streaming_bulk(
+                client=self.client,
+                actions=actions,
+                chunk_size=self.settings.WRITE_CHUNK_SIZE,
+                raise_on_error=False,
+                refresh=self.settings.REFRESH_AFTER_WRITE,
+            ):
+                if not success:
+                    conflicting_ids.append(self.get_conflicting_id(item))
+        except (ApiError, TransportError) as error:
+            msg = "Failed to create statements: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+        return conflicting_ids
+
+    def _write_dicts(  # noqa: PLR0913
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],
+    ) -> int:
+        """Write statements to the index of their period. See `self.write`.
+
+        If `INDEX_PERIOD` is set, `CREATE` and `INDEX` operations write each batch of
+        statements to the `target` indices of their `timestamp` period. Other
+        operations write to the `target` index.
+        """
+        period = self.settings.INDEX_PERIOD
+        if not period or operation_type not in PERIOD_OPERATION_TYPES:
+            return super()._write_dicts(
+                data, target, chunk_size, ignore_errors, operation_type, concurrency
+            )
+
+        count = 0
+        target = target if target else self.settings.DEFAULT_INDEX
+        for batch in iter_by_batch(data, chunk_size):
+            indices = self.group_by_period_index(batch, target, period, ignore_errors)
+            for index, statements in indices.items():
+                count += super()._write_dicts(
+                    statements,
+                    index,
+                    chunk_size,
+                    ignore_errors,
+                    operation_type,
+                    concurrency,
+                )
+        return count
+
+    def _get_indices(self, target: Optional[str]) -> str:
+        """Return the `target` indices pattern. See `get_query_indices`."""
+        target = target if target else self.settings.DEFAULT_INDEX
+        return self.get_query_indices(target, self.settings.INDEX_PERIOD)
+
+    def init_indexes(self, target: Optional[str] = None) -> List[str]:
+        """Create the index template serving statements queries and return its name.
+
+        The `target` index template applies `STATEMENTS_MAPPINGS` to the `target`
+        index, or to its period indices if `INDEX_PERIOD` is set, when it is created.
+        The mapping of already existing indices is updated.
+        """
+        target = target if target else self.settings.DEFAULT_INDEX
+        indices = self.get_query_indices(target, self.settings.INDEX_PERIOD)
+        try:
+            self.client.indices.put_index_template(
+                name=target,
+                index_patterns=[indices],
+                template={"mappings": STATEMENTS_MAPPINGS},
+            )
+            if self.client.indices.exists(index=indices):
+                self.client.indices.put_mapping(
+                    index=indices, properties=STATEMENTS_MAPPINGS["properties"]
+                )
+        except (ApiError, TransportError) as error:
+            msg = "Failed to create the statements index template: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+        return [target]
+
+    def explain_query_shapes(self, target: Optional[str] = None) -> List[str]:
+        """Return the names of the `STATEMENTS_QUERY_SHAPES` not served by an index.
+
+        A query shape is not served by an index if a field it filters or sorts on is
+        not mapped with the expected type in the `target` index.
+        """
+        target = self._get_indices(target)
+        query_shapes_fields = {
+            name: self.get_query_fields(self.get_query(params))
+            for name, params in STATEMENTS_QUERY_SHAPES.items()
+        }
+        fields = sorted(
+            {field for item in query_shapes_fields.values() for field in item}
+        )
+        try:
+            field_mappings = self.client.indices.get_field_mapping(
+                index=target, fields=fields
+            )
+        except (ApiError, TransportError) as error:
+            msg = "Failed to get the %s index field mappings: %s"
+            logger.error(msg, target, error)
+            raise BackendException(msg % (target, error)) from error
+
+        return self.get_unindexed_query_shapes(
+            query_shapes_fields, dict(field_mappings)
+        )
+
+    @staticmethod
+    def get_query_fields(query: ESQuery) -> Dict[str, str]:
+        """Return the fields `query` filters or sorts on with their expected type."""
+        fields = {}
+        for clause in (query.query or {}).get("bool", {}).get("filter", []):
+            fields.update({field: "keyword" for field in clause.get("term", {})})
+            fields.update({field: "date" for field in clause.get("range", {})})
+        if isinstance(query.sort, list):
+            fields.update({field: "date" for sort in query.sort for field in sort})
+        # Statements ids are stored as document ids, which are always indexed.
+        fields.pop("_id", None)
+        return fields
+
+    @staticmethod
+    def get_unindexed_query_shapes(
+        query_shapes_fields: Dict[str, Dict[str, str]], field_mappings: dict
+    ) -> List[str]:
+        """Return the query shapes having a field not mapped with its expected type.
+
+        Args:
+            query_shapes_fields (dict): The fields of each query shape with their
+                expected type. See `get_query_fields`.
+            field_mappings (dict): The `get_field_mapping` API response.
+        """
+        if not field_mappings:
+            return list(query_shapes_fields)
+
+        return [
+            name
+            for name, fields in query_shapes_fields.items()
+            if not all(
+                ESLRSBackend.is_indexed_field(
+                    index["mappings"].get(field), expected_type
+                )
+                for field, expected_type in fields.items()
+                for index in field_mappings.values()
+            )
+        ]
+
+    @staticmethod
+    def is_indexed_field(field_mapping: Optional[dict], expected_type: str) -> bool:
+        """Return whether the `field_mapping` indexes values of `expected_type`.
+
+        Keyword fields ignoring values longer than `KEYWORD_IGNORE_ABOVE` are not
+        considered indexed as long values would be missing from query results.
+        """
+        if not field_mapping:
+            return False
+        mapping: dict = next(iter(field_mapping["mapping"].values()), {})
+        ignore_above = mapping.get("ignore_above", KEYWORD_IGNORE_ABOVE)
+        return (
+            mapping.get("type") == expected_type
+            and ignore_above >= KEYWORD_IGNORE_ABOVE
+        )
+
+    @staticmethod
+    def get_period_index(statement: dict, target: str, period: str) -> str:
+        """Return the `target` index of the `statement` `timestamp` period.
+
+        Raise:
+            BackendException: If the statement `timestamp` is missing or invalid.
+        """
+        try:
+            timestamp = ESLRSBackend.to_utc(statement["timestamp"])
+        except (KeyError, TypeError, ValueError) as error:
+            msg = "Failed to get the period index of statement %s: %s"
+            logger.error(msg, statement.get("id"), error)
+            raise BackendException(msg % (statement.get("id"), error)) from error
+        return f"{target}-{timestamp.strftime(INDEX_PERIODS[period][0])}"
+
+    @staticmethod
+    def group_by_period_index(
+        statements: Iterable[dict], target: str, period: str, ignore_errors: bool
+    ) -> Dict[str, List[dict]]:
+        """Return `statements` grouped by the `target` index of their period.
+
+        Raise:
+            BackendException: If a statement `timestamp` is missing or invalid and
+                `ignore_errors` is set to `False`.
+        """
+        indices = defaultdict(list)
+        for statement in statements:
+            try:
+                index = ESLRSBackend.get_period_index(statement, target, period)
+            except BackendException:
+                if not ignore_errors:
+                    raise
+                continue
+            indices[index].append(statement)
+        return indices
+
+    @staticmethod
+    def to_period_documents(
+        data: Iterable[dict],
+        target: str,
+        operation_type: BaseOperationType,
+        period: Optional[str],
+    ) -> Iterator[dict]:
+        """Convert `data` statements to ES documents of their period index.
+
+        See `to_documents` and `get_period_index`.
+        """
+        for document in ESLRSBackend.to_documents(data, target, operation_type):
+            if period:
+                statement = document["_source"]
+                document["_index"] = ESLRSBackend.get_period_index(
+                    statement, target, period
+                )
+            yield document
+
+    @staticmethod
+    def get_query_indices(
+        target: str,
+        period: Optional[str],
+        since: Optional[Union[str, datetime]] = None,
+        until: Optional[Union[str, datetime]] = None,
+    ) -> str:
+        """Return the `target` indices pattern of statements from `since` to `until`.
+
+        If `period` is `None`, the `target` index is returned. Else, the patterns of
+        the `target` period indices overlapping the `since`-`until` window, using
+        the coarsest periods entirely within the window. If `since` is `None`, all
+        period indices are returned. If `until` is `None`, it defaults to now.
+        """
+        if not period:
+            return target
+
+        if not since:
+            return f"{target}-*"
+
+        periods = list(INDEX_PERIODS)
+        start = ESLRSBackend.get_period_start(ESLRSBackend.to_utc(since), period)
+        end = ESLRSBackend.to_utc(until) if until else datetime.now(timezone.utc)
+        patterns = []
+        while start <= end:
+            # Use the coarsest period starting at `start` and ending within the window.
+            for name in periods[: periods.index(period) + 1]:
+                suffix_format, duration = INDEX_PERIODS[name]
+                is_aligned = ESLRSBackend.get_period_start(start, name) == start
+                if name == period or (is_aligned and start + duration <= end):
+                    break
+            patterns.append(f"{target}-{start.strftime(suffix_format)}*")
+            start += duration
+
+        return ",".join(patterns)
+
+    @staticmethod
+    def get_period_start(timestamp: datetime, period: str) -> datetime:
+        """Return the start of the `period` including `timestamp`."""
+        timestamp = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+        if period in ("year", "month"):
+            timestamp = timestamp.replace(day=1)
+        if period == "year":
+            timestamp = timestamp.replace(month=1)
+        return timestamp
+
+    @staticmethod
+    def to_utc(timestamp: Union[str, datetime]) -> datetime:
+        """Convert an ISO 8601 `timestamp` to a UTC datetime.
+
+        Naive timestamps are considered in UTC.
+        """
+        if not isinstance(timestamp, datetime):
+            timestamp = isoparse(timestamp)
+        if not timestamp.tzinfo:
+            return timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.astimezone(timezone.utc)
+
+    @staticmethod
+    def get_conflicting_id(item: dict) -> str:
+        """Return the statement id of the failed bulk create `item`.
+
+        Raise:
+            BackendException: If the failure is not due to an already stored id.
+        """
+        result = item.get("create", {})
+        if result.get("status") != 409:  # noqa: PLR2004
+            msg = "Failed to create statement: %s"
+            logger.error(msg, result)
+            raise BackendException(msg % result)
+        return str(result["_id"])
+
+    @staticmethod
+    def get_version(document: dict) -> Optional[str]:
+        """Return the version of the statement stored in the `document`.
+
+        The sequence number and primary term of a document change whenever it is
+        written, thus they identify the version of the statement it stores. Return
+        `None` if they are not part of the search response.
+        """
+        if "_seq_no" not in document:
+            return None
+        return (
+            f"{document['_index']}/{document['_id']}:"
+            f"{document['_primary_term']}:{document['_seq_no']}"
+        )
+
     @staticmethod
     def get_query(params: RalphStatementsQuery) -> ESQuery:
         """Construct query from statement parameters."""
@@ -93,10 +499,11 @@ class ESLRSBackend(BaseLRSBackend[ESLRSBackendSettings], ESDataBackend):
         if params.until:
             es_query_filters += [{"range": {"timestamp": {"lte": params.until}}}]
 
-        es_query = {
+        es_query: Dict[str, Any] = {
             "pit": ESQueryPit.model_construct(id=params.pit_id),
             "size": params.limit,
             "sort": [{"timestamp": {"order": "asc" if params.ascending else "desc"}}],
+            "seq_no_primary_term": True,
         }
         if len(es_query_filters) > 0:
             es_query["query"] = {"bool": {"filter": es_query_filters}}
@@ -0,0 +1,112 @@
+"""Fan-out LRS backend for Ralph."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, cast
+
+from pydantic_settings import SettingsConfigDict
+
+from ralph.backends.data.fanout import FanoutDataBackend, FanoutDataBackendSettings
+from ralph.backends.loader import get_lrs_backends
+from ralph.backends.lrs.base import (
+    BaseLRSBackend,
+    BaseLRSBackendSettings,
+    RalphStatementsQuery,
+    StatementFingerprint,
+    StatementQueryResult,
+)
+from ralph.conf import BASE_SETTINGS_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class FanoutLRSBackendSettings(BaseLRSBackendSettings, FanoutDataBackendSettings):
+    """Fan-out LRS backend default configuration."""
+
+    model_config = {
+        **BASE_SETTINGS_CONFIG,
+        **SettingsConfigDict(env_prefix="RALPH_BACKENDS__LRS__FANOUT__"),
+    }
+
+
+class FanoutLRSBackend(BaseLRSBackend[FanoutLRSBackendSettings], FanoutDataBackend):
+    """Fan-out LRS backend writing statements to several LRS backends concurrently.
+
+    Statements queries are served by the primary backend.
+    """
+
+    @property
+    def lrs_backends(self) -> Dict[str, BaseLRSBackend]:
+        """Return the fanned-out LRS backends by name."""
+        return cast(Dict[str, BaseLRSBackend], self.backends)
+
+    @property
+    def primary_lrs_backend(self) -> BaseLRSBackend:
+        """Return the primary LRS backend."""
+        return cast(BaseLRSBackend, self.primary)
+
+    def query_statements(
+        self, params: RalphStatementsQuery, target: Optional[str] = None
+    ) -> StatementQueryResult:
+        """Return the statements query payload of the primary backend."""
+        return self.primary_lrs_backend.query_statements(params, target)
+
+    def query_statements_by_ids(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[dict]:
+        """Yield statements with matching ids from the primary backend."""
+        return self.primary_lrs_backend.query_statements_by_ids(ids, target)
+
+    def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[StatementFingerprint]:
+        """Yield fingerprints of statements with matching ids from the primary."""
+        return self.primary_lrs_backend.query_statement_fingerprints(ids, target)
+
+    def backfill_fingerprints(
+        self, target: Optional[str] = None, chunk_size: Optional[int] = None
+    ) -> int:
+        """Store the fingerprint of statements missing it in all backends.
+
+        Return the count of statements updated in the primary backend.
+        """
+        counts = {
+            name: backend.backfill_fingerprints(target, chunk_size)
+            for name, backend in self.lrs_backends.items()
+        }
+        return counts[self.primary_name]
+
+    def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        Statements are created in the primary backend first, then the new ones are
+        created in the other backends concurrently.
+        """
+        existing_ids = self.primary_lrs_backend.create_statements(statements, target)
+        excluded_ids = set(existing_ids)
+        new_statements = [item for item in statements if item["id"] not in excluded_ids]
+        secondaries = [
+            backend
+            for name, backend in self.lrs_backends.items()
+            if name != self.primary_name
+        ]
+        if new_statements and secondaries:
+            with ThreadPoolExecutor(max_workers=len(secondaries)) as executor:
+                futures = [
+                    executor.submit(backend.create_statements, new_statements, target)
+                    for backend in secondaries
+                ]
+                for future in futures:
+                    future.result()
+        return existing_ids
+
+    @staticmethod
+    def get_backend_classes() -> Dict[str, type]:
+        """Return the classes of the LRS backends which may be fanned out to."""
+        return {
+            name: backend
+            for name, backend in get_lrs_backends().items()
+            if issubclass(backend, BaseLRSBackend)
+        }
@@ -4,9 +4,10 @@ import logging
 from datetime import datetime
 from io import IOBase
 from pathlib import Path
-from typing import Iterable, List, Literal, Optional, Union
+from typing import Callable, Iterable, Iterator, List, Literal, Optional, Union, cast
 from uuid import UUID
 
+from pydantic import PositiveInt
 from pydantic_settings import SettingsConfigDict
 
 from ralph.backends.data.base import BaseOperationType
@@ -41,13 +42,14 @@ class FSLRSBackendSettings(BaseLRSBackendSettings, FSDataBackendSettings):
 class FSLRSBackend(BaseLRSBackend[FSLRSBackendSettings], FSDataBackend):
     """FileSystem LRS Backend."""
 
-    def write(
+    def write(  # noqa: PLR0913
         self,
         data: Union[IOBase, Iterable[bytes], Iterable[dict]],
         target: Optional[str] = None,
         chunk_size: Optional[int] = None,
         ignore_errors: bool = False,
         operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
     ) -> int:
         """Write data records to the target file and return their count.
 
@@ -57,21 +59,15 @@ class FSLRSBackend(BaseLRSBackend[FSLRSBackendSettings], FSDataBackend):
             target = str(Path(target) / Path(self.settings.DEFAULT_LRS_FILE))
         else:
             target = self.settings.DEFAULT_LRS_FILE
-        return super().write(data, target, chunk_size, ignore_errors, operation_type)
+        return super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
 
     def query_statements(
         self, params: RalphStatementsQuery, target: Optional[str] = None
     ) -> StatementQueryResult:
         """Return the statements query payload using xAPI parameters."""
-        filters = []
-        self._add_filter_by_id(filters, params.statement_id)
-        self._add_filter_by_agent(filters, params.agent, params.related_agents)
-        self._add_filter_by_authority(filters, params.authority)
-        self._add_filter_by_verb(filters, params.verb)
-        self._add_filter_by_activity(
-            filters, params.activity, params.related_activities
-        )
-        self._add_filter_by_registration(filters, params.registration)
+        filters = self.get_statement_filters(params)
         self._add_filter_by_timestamp_since(filters, params.since)
         self._add_filter_by_timestamp_until(filters, params.until)
         self._add_filter_by_search_after(filters, params.search_after)
@@ -80,7 +76,7 @@ class FSLRSBackend(BaseLRSBackend[FSLRSBackendSettings], FSDataBackend):
         statements_count = 0
         search_after = None
         statements = []
-        for statement in self.read(query=self.settings.DEFAULT_LRS_FILE, target=target):
+        for statement in self._read_statements(target):
             for query_filter in filters:
                 if not query_filter(statement):
                     break
@@ -105,12 +101,53 @@ class FSLRSBackend(BaseLRSBackend[FSLRSBackendSettings], FSDataBackend):
         """Return the list of matching statement IDs from the database."""
         statement_ids = set(ids)
         statements = []
-        for statement in self.read(query=self.settings.DEFAULT_LRS_FILE, target=target):
+        for statement in self._read_statements(target):
             if statement.get("id") in statement_ids:
                 statements.append(statement)
 
         return statements
 
+    def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        New statements are appended to the LRS file after checking its ids.
+        """
+        stored_ids = {
+            statement.get("id") for statement in self._read_statements(target)
+        }
+        new_statements = [item for item in statements if item["id"] not in stored_ids]
+        if new_statements:
+            self.write(new_statements, target, operation_type=BaseOperationType.APPEND)
+        return [item["id"] for item in statements if item["id"] in stored_ids]
+
+    def _read_statements(self, target: Optional[str]) -> Iterator[dict]:
+        """Yield the statements of the LRS file as dictionaries."""
+        return cast(
+            Iterator[dict],
+            self.read(query=self.settings.DEFAULT_LRS_FILE, target=target),
+        )
+
+    @staticmethod
+    def get_statement_filters(
+        params: RalphStatementsQuery,
+    ) -> List[Callable[[dict], bool]]:
+        """Return the filters matching statements with the queried properties.
+
+        Filters on `since`, `until` and `search_after` parameters are not included.
+        """
+        filters = []
+        FSLRSBackend._add_filter_by_id(filters, params.statement_id)
+        FSLRSBackend._add_filter_by_agent(filters, params.agent, params.related_agents)
+        FSLRSBackend._add_filter_by_authority(filters, params.authority)
+        FSLRSBackend._add_filter_by_verb(filters, params.verb)
+        FSLRSBackend._add_filter_by_activity(
+            filters, params.activity, params.related_activities
+        )
+        FSLRSBackend._add_filter_by_registration(filters, params.registration)
+        return filters
+
     @staticmethod
     def _add_filter_by_agent(
         filters: list, agent: Optional[AgentParameters], related: Optional[bool]
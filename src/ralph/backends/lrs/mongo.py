@@ -1,29 +1,74 @@
 """MongoDB LRS backend for Ralph."""
 
 import logging
-from typing import Iterator, List, Optional
+from typing import (
+    Any,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 
+from bson.errors import BSONError
 from bson.objectid import ObjectId
 from pydantic_settings import SettingsConfigDict
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReplaceOne
+from pymongo.errors import BulkWriteError, PyMongoError
 
+from ralph.backends.data.base import BaseOperationType
 from ralph.backends.data.mongo import (
     MongoDataBackend,
     MongoDataBackendSettings,
     MongoQuery,
 )
 from ralph.backends.lrs.base import (
+    STATEMENTS_QUERY_SHAPES,
     AgentParameters,
     BaseLRSBackend,
     BaseLRSBackendSettings,
+    Indexable,
     RalphStatementsQuery,
+    StatementFingerprint,
     StatementQueryResult,
 )
 from ralph.conf import BASE_SETTINGS_CONFIG
 from ralph.exceptions import BackendException, BackendParameterException
+from ralph.utils import get_statement_fingerprint, iter_by_batch
 
 logger = logging.getLogger(__name__)
 
+# Warning logged by `create_statements` when statements ids are not unique.
+UNIQUE_ID_INDEX_MISSING_MSG = (
+    "The %s collection has no unique statements id index, querying stored "
+    "statements before writing. Create it with the `ralph init` command"
+)
+
+# MongoDB error code raised when inserting a document with an existing unique key.
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+# Document field storing the fingerprint of the statement stored in `_source`.
+FINGERPRINT_FIELD = "_fingerprint"
+
+# Statements fields queried by equality in `MongoLRSBackend.get_query`. Each tuple is
+# the prefix of a compound index followed by the query sort fields.
+INDEXED_QUERY_FIELDS: List[Tuple[str, ...]] = [
+    ("_source.verb.id",),
+    ("_source.object.id",),
+    ("_source.actor.mbox",),
+    ("_source.actor.mbox_sha1sum",),
+    ("_source.actor.openid",),
+    ("_source.actor.account.name", "_source.actor.account.homePage"),
+    ("_source.authority.mbox",),
+    ("_source.authority.mbox_sha1sum",),
+    ("_source.authority.openid",),
+    ("_source.authority.account.name", "_source.authority.account.homePage"),
+]
+
 
 class MongoLRSBackendSettings(BaseLRSBackendSettings, MongoDataBackendSettings):
     """MongoDB LRS backend default configuration."""
@@ -34,18 +79,28 @@ class MongoLRSBackendSettings(BaseLRSBackendSettings, MongoDataBackendSettings):
     }
 
 
-class MongoLRSBackend(BaseLRSBackend[MongoLRSBackendSettings], MongoDataBackend):
+class MongoLRSBackend(
+    BaseLRSBackend[MongoLRSBackendSettings], MongoDataBackend, Indexable
+):
     """MongoDB LRS backend."""
 
+    def __init__(self, settings: Optional[MongoLRSBackendSettings] = None):
+        """Instantiate the MongoDB LRS backend.
+
+        Args:
+            settings (MongoLRSBackendSettings or None): The LRS backend settings.
+                If `settings` is `None`, a default settings instance is used instead.
+        """
+        super().__init__(settings)
+        self._unique_id_collections: Set[str] = set()
+
     def query_statements(
         self, params: RalphStatementsQuery, target: Optional[str] = None
     ) -> StatementQueryResult:
         """Return the results of a statements query using xAPI parameters."""
         query = self.get_query(params)
         try:
-            mongo_response = list(
-                self.read(query=query, target=target, chunk_size=params.limit)
-            )
+            mongo_response = list(self._read_documents(query, target, params.limit))
         except (BackendException, BackendParameterException) as error:
             logger.error("Failed to read from MongoDB")
             raise error
@@ -66,12 +121,223 @@ class MongoLRSBackend(BaseLRSBackend[MongoLRSBackendSettings], MongoDataBackend)
         """Yield statements with matching ids from the backend."""
         query = self.query_class(filter={"_source.id": {"$in": ids}})
         try:
-            mongo_response = self.read(query=query, target=target)
+            mongo_response = self._read_documents(query, target)
             yield from (document["_source"] for document in mongo_response)
         except (BackendException, BackendParameterException) as error:
             logger.error("Failed to read from MongoDB")
             raise error
 
+    def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[StatementFingerprint]:
+        """Yield fingerprints of statements with matching ids from the backend."""
+        query = MongoLRSBackend.get_fingerprint_query(ids)
+        try:
+            for document in self._read_documents(query, target):
+                fingerprint = document.get(FINGERPRINT_FIELD)
+                yield StatementFingerprint(document["_source"]["id"], fingerprint)
+        except (BackendException, BackendParameterException) as error:
+            logger.error("Failed to read from MongoDB")
+            raise error
+
+    def backfill_fingerprints(
+        self, target: Optional[str] = None, chunk_size: Optional[int] = None
+    ) -> int:
+        """Store the fingerprint of statements missing it and return their count.
+
+        Documents are replaced along with the fingerprint of their statement.
+        """
+        query = self.get_missing_fingerprints_query()
+        statements = (
+            document["_source"]
+            for document in self._read_documents(query, target, chunk_size)
+        )
+        return self.write(
+            statements,
+            target=target,
+            chunk_size=chunk_size,
+            operation_type=BaseOperationType.UPDATE,
+        )
+
+    def _read_documents(
+        self, query: MongoQuery, target: Optional[str], chunk_size: Optional[int] = None
+    ) -> Iterator[dict]:
+        """Yield the MongoDB documents matching the `query` as dictionaries."""
+        return cast(
+            Iterator[dict],
+            self.read(query=query, target=target, chunk_size=chunk_size),
+        )
+
+    def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        Statements are inserted in unordered batches, relying on the unique index on
+        statements ids created by `init_indexes` to reject already stored ones.
+        Without this index, stored statements are queried first.
+        """
+        collection = self._get_target_collection(target)
+        write_concern = self.get_write_concern(self.settings)
+        if write_concern:
+            collection = collection.with_options(write_concern=write_concern)
+        if collection.name not in self._unique_id_collections:
+            try:
+                indexes = collection.index_information()
+            except PyMongoError as error:
+                msg = "Failed to get the statements collection indexes: %s"
+                logger.error(msg, error)
+                raise BackendException(msg % error) from error
+            if not self.has_unique_id_index(indexes):
+                logger.warning(UNIQUE_ID_INDEX_MISSING_MSG, collection.name)
+                return super().create_statements(statements, target)
+            self._unique_id_collections.add(collection.name)
+
+        documents = self.to_documents(statements, False, BaseOperationType.CREATE)
+        conflicting_ids = []
+        for batch in iter_by_batch(documents, self.settings.WRITE_CHUNK_SIZE):
+            try:
+                collection.insert_many(batch, ordered=False)
+            except BulkWriteError as error:
+                conflicting_ids.extend(self.get_conflicting_ids(error))
+            except (PyMongoError, BSONError, ValueError) as error:
+                msg = "Failed to create statements: %s"
+                logger.error(msg, error)
+                raise BackendException(msg % error) from error
+
+        return conflicting_ids
+
+    def init_indexes(self, target: Optional[str] = None) -> List[str]:
+        """Create the indexes serving statements queries and return their names.
+
+        Compound indexes start with the fields queried by equality and end with the
+        sort fields. Already existing indexes are left unchanged.
+        """
+        collection = self._get_target_collection(target)
+        try:
+            return collection.create_indexes(self.get_indexes())
+        except PyMongoError as error:
+            msg = "Failed to create the statements indexes: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+    def explain_query_shapes(self, target: Optional[str] = None) -> List[str]:
+        """Return the names of the `STATEMENTS_QUERY_SHAPES` not served by an index.
+
+        A query shape is not served by an index if its winning plan scans the whole
+        collection.
+        """
+        collection = self._get_target_collection(target)
+        unindexed_query_shapes = []
+        for name, params in STATEMENTS_QUERY_SHAPES.items():
+            kwargs = self.get_query(params).model_dump(exclude_unset=True)
+            try:
+                explanation = collection.find(**kwargs).explain()
+            except PyMongoError as error:
+                msg = "Failed to explain the %s query shape: %s"
+                logger.error(msg, name, error)
+                raise BackendException(msg % (name, error)) from error
+            if self.is_collection_scan(explanation["queryPlanner"]["winningPlan"]):
+                unindexed_query_shapes.append(name)
+
+        return unindexed_query_shapes
+
+    @staticmethod
+    def has_unique_id_index(indexes: Mapping[str, Any]) -> bool:
+        """Return whether `indexes` include a unique index on statements ids.
+
+        Args:
+            indexes (dict): The collection index information by index name.
+        """
+        return any(
+            index.get("unique") and [key for key, _ in index["key"]] == ["_source.id"]
+            for index in indexes.values()
+        )
+
+    @staticmethod
+    def get_indexes() -> List[IndexModel]:
+        """Return the indexes serving the queries constructed by `get_query`.
+
+        Indexes of optional fields are partial to only index statements having them.
+        """
+        sort = [("_source.timestamp", DESCENDING), ("_id", DESCENDING)]
+        indexes = [IndexModel("_source.id", unique=True), IndexModel(sort)]
+        for fields in INDEXED_QUERY_FIELDS:
+            keys = [(field, ASCENDING) for field in fields] + sort
+            partial_filter = {fields[0]: {"$exists": True}}
+            indexes.append(IndexModel(keys, partialFilterExpression=partial_filter))
+        return indexes
+
+    @staticmethod
+    def is_collection_scan(plan: dict) -> bool:
+        """Return whether the query `plan` includes a collection scan stage."""
+        # Slot based execution plans nest the query plan.
+        plan = plan.get("queryPlan", plan)
+        if plan.get("stage") == "COLLSCAN":
+            return True
+        stages = plan.get("inputStages", [])
+        if "inputStage" in plan:
+            stages = [plan["inputStage"], *stages]
+        return any(MongoLRSBackend.is_collection_scan(stage) for stage in stages)
+
+    @staticmethod
+    def get_conflicting_ids(error: BulkWriteError) -> List[str]:
+        """Return the statements ids rejected by the unordered insert `error`.
+
+        Raise:
+            BackendException: If a failure is not due to an already stored id.
+        """
+        conflicting_ids = []
+        for write_error in error.details.get("writeErrors", []):
+            if write_error.get("code") != DUPLICATE_KEY_ERROR_CODE:
+                msg = "Failed to create statement: %s"
+                logger.error(msg, write_error)
+                raise BackendException(msg % write_error)
+            conflicting_ids.append(write_error["op"]["_source"]["id"])
+        return conflicting_ids
+
+    @staticmethod
+    def to_documents(
+        data: Iterable[dict],
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+    ) -> Generator[dict, None, None]:
+        """Convert `data` statements to MongoDB documents with their fingerprint.
+
+        See `MongoDataBackend.to_documents`.
+        """
+        for document in MongoDataBackend.to_documents(
+            data, ignore_errors, operation_type
+        ):
+            document[FINGERPRINT_FIELD] = get_statement_fingerprint(document["_source"])
+            yield document
+
+    @staticmethod
+    def to_replace_one(data: Iterable[dict]) -> Iterable[ReplaceOne]:
+        """Convert `data` statements to Mongo `ReplaceOne` objects.
+
+        Replacement documents include the fingerprint of their statement.
+        """
+        for statement in data:
+            yield ReplaceOne(
+                {"_source.id": {"$eq": statement.get("id")}},
+                {
+                    "_source": statement,
+                    FINGERPRINT_FIELD: get_statement_fingerprint(statement),
+                },
+            )
+
+    @staticmethod
+    def get_fingerprint_query(ids: List[str]) -> MongoQuery:
+        """Construct the query projecting the stored fingerprint of `ids`."""
+        projection = {"_source.id": 1, FINGERPRINT_FIELD: 1}
+        return MongoQuery(filter={"_source.id": {"$in": ids}}, projection=projection)
+
+    @staticmethod
+    def get_missing_fingerprints_query() -> MongoQuery:
+        """Construct the query matching statements without a stored fingerprint."""
+        return MongoQuery(filter={FINGERPRINT_FIELD: {"$exists": False}})
+
     @staticmethod
     def get_query(params: RalphStatementsQuery) -> MongoQuery:
         """Construct query from statement parameters."""
@@ -0,0 +1,285 @@
+"""Parquet LRS backend for Ralph."""
+
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from hashlib import sha256
+from io import IOBase
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
+
+from pydantic import PositiveInt
+from pydantic_settings import SettingsConfigDict
+
+from ralph.backends.data.base import BaseOperationType
+from ralph.backends.data.parquet import (
+    ParquetDataBackend,
+    ParquetDataBackendSettings,
+    ParquetQuery,
+)
+from ralph.backends.lrs.base import (
+    BaseLRSBackend,
+    BaseLRSBackendSettings,
+    RalphStatementsQuery,
+    StatementFingerprint,
+    StatementQueryResult,
+)
+from ralph.backends.lrs.fs import FSLRSBackend
+from ralph.conf import BASE_SETTINGS_CONFIG
+from ralph.exceptions import BackendParameterException
+
+logger = logging.getLogger(__name__)
+
+# The glob pattern of the archive files, stored in `year/month/day` directories.
+PARTITION_PATTERN = "*/*/*/*.parquet"
+PARTITION_FORMAT = "%Y/%m/%d"
+
+
+class ParquetLRSBackendSettings(BaseLRSBackendSettings, ParquetDataBackendSettings):
+    """Parquet LRS backend default configuration."""
+
+    model_config = {
+        **BASE_SETTINGS_CONFIG,
+        **SettingsConfigDict(env_prefix="RALPH_BACKENDS__LRS__PARQUET__"),
+    }
+
+
+class ParquetLRSBackend(BaseLRSBackend[ParquetLRSBackendSettings], ParquetDataBackend):
+    """Parquet LRS backend archiving statements in daily partitions.
+
+    Statements are stored in Parquet files of `year/month/day` directories, after
+    the UTC date of their timestamp, in the `DEFAULT_DIRECTORY_PATH` (or in the
+    default bucket). The LRS `target` is a sub-directory (or a key prefix) of it.
+    """
+
+    def write(  # noqa: PLR0913
+        self,
+        data: Union[IOBase, Iterable[bytes], Iterable[dict]],
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        ignore_errors: bool = False,
+        operation_type: Optional[BaseOperationType] = None,
+        concurrency: Optional[PositiveInt] = None,
+    ) -> int:
+        """Write statements to the target daily partitions and return their count.
+
+        Statements of each day are sorted by timestamp and written to a new file
+        named after the digest of their ids. Files already holding the same
+        statements are not written again.
+
+        See `ParquetDataBackend.write`.
+        """
+        return super().write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
+
+    def _write_dicts(  # noqa: PLR0913
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],
+    ) -> int:
+        """Method called by `self.write` writing dictionaries. See `self.write`."""
+        partitions: Dict[date, List[Tuple[datetime, dict]]] = defaultdict(list)
+        for statement in data:
+            timestamp = self.get_timestamp(statement, ignore_errors)
+            if timestamp:
+                partitions[timestamp.date()].append((timestamp, statement))
+
+        count = 0
+        for day, items in sorted(partitions.items()):
+            items.sort(key=lambda item: item[0])
+            statements = [statement for _, statement in items]
+            ids = "\n".join(str(statement.get("id")) for statement in statements)
+            name = f"{sha256(ids.encode()).hexdigest()[:32]}.parquet"
+            file_target = self._get_file_target(target, day, name)
+            if self._exists(file_target):
+                logger.info("%s is already archived; skipping", file_target)
+                continue
+            count += super()._write_dicts(
+                statements,
+                file_target,
+                chunk_size,
+                ignore_errors,
+                operation_type,
+                concurrency,
+            )
+        return count
+
+    def query_statements(
+        self, params: RalphStatementsQuery, target: Optional[str] = None
+    ) -> StatementQueryResult:
+        """Return the statements query payload using xAPI parameters.
+
+        Only daily partitions of the `since` and `until` window are read, and
+        statements are first filtered on their `timestamp`, `verb` and `id` columns.
+
+        Statements are ordered on their timestamp and id. The `search_after` cursor
+        is made of the timestamp and the id of the last returned statement,
+        separated by a `|`.
+        """
+        since = self.to_utc(self.parse_datetime(params.since))
+        until = self.to_utc(self.parse_datetime(params.until))
+        cursor = None
+        if params.search_after:
+            cursor = self.parse_cursor(params.search_after)
+            cursor_timestamp, _ = cursor
+            if params.ascending:
+                # Include statements sharing the cursor timestamp.
+                cursor_since = cursor_timestamp - timedelta(microseconds=1)
+                since = max(since, cursor_since) if since else cursor_since
+            else:
+                until = min(until, cursor_timestamp) if until else cursor_timestamp
+
+        days = [
+            day
+            for day in self._list_days(target)
+            if (not since or day >= since.date()) and (not until or day <= until.date())
+        ]
+        days.sort(reverse=not params.ascending)
+        filters = FSLRSBackend.get_statement_filters(params)
+        statements: List[dict] = []
+        for day in days:
+            query = ParquetQuery(
+                pattern=f"{day.strftime(PARTITION_FORMAT)}/*.parquet",
+                since=since,
+                until=until,
+                verb=str(params.verb) if params.verb else None,
+                ids=[params.statement_id] if params.statement_id else None,
+            )
+            # Files of a day are not ordered, thus their statements are sorted.
+            matches = sorted(
+                (
+                    (self.get_sort_key(statement), statement)
+                    for statement in self._read_statements(query, target)
+                    if all(query_filter(statement) for query_filter in filters)
+                ),
+                key=lambda match: match[0],
+                reverse=not params.ascending,
+            )
+            for key, statement in matches:
+                # Skip statements up to the cursor, included.
+                if cursor and (key <= cursor if params.ascending else key >= cursor):
+                    continue
+
+                statements.append(statement)
+                if params.limit and len(statements) == params.limit:
+                    return StatementQueryResult(
+                        statements=statements,
+                        search_after=self.get_cursor(statement),
+                    )
+
+        return StatementQueryResult(statements=statements)
+
+    def query_statements_by_ids(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[dict]:
+        """Yield archived statements with matching ids, only decoding matching rows."""
+        query = ParquetQuery(pattern=PARTITION_PATTERN, ids=ids)
+        return self._read_statements(query, target)
+
+    def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[StatementFingerprint]:
+        """Yield fingerprints of archived statements with matching ids.
+
+        Only the `id` and `fingerprint` columns are read, rather than whole
+        statements.
+        """
+        query = ParquetQuery(
+            pattern=PARTITION_PATTERN, columns=["id", "fingerprint"], ids=ids
+        )
+        for row in self._read_statements(query, target):
+            yield StatementFingerprint(row["id"], row["fingerprint"])
+
+    def _read_statements(
+        self, query: ParquetQuery, target: Optional[str]
+    ) -> Iterator[dict]:
+        """Yield the archived statements (or selected columns) matching the `query`."""
+        return cast(Iterator[dict], self.read(query, self._get_archive_target(target)))
+
+    def _list_days(self, target: Optional[str]) -> List[date]:
+        """Return the dates of the daily partitions of the `target`."""
+        if self.settings.STORAGE == "s3":
+            bucket, prefix = self._get_bucket_and_key(self._get_archive_target(target))
+            prefix = f"{prefix.rstrip('/')}/" if prefix else ""
+            objects = self._list_objects(bucket, f"{prefix}{PARTITION_PATTERN}")
+            names = [key[len(prefix) :] for key, _ in objects]
+        else:
+            directory = self._get_path(target)
+            names = [
+                path.relative_to(directory).as_posix()
+                for path in directory.glob(PARTITION_PATTERN)
+            ]
+
+        days = set()
+        for name in names:
+            try:
+                days.add(datetime.strptime(name.rsplit("/", 1)[0], PARTITION_FORMAT))
+            except ValueError:
+                logger.debug("Skipping %s, which is not in a daily partition", name)
+        return [day.date() for day in days]
+
+    def _get_archive_target(self, target: Optional[str]) -> Optional[str]:
+        """Return the `ParquetDataBackend` target of the LRS `target`."""
+        if self.settings.STORAGE == "fs" or not target:
+            return target
+        bucket, _ = self._get_bucket_and_key(None)
+        return f"{bucket}/{target}"
+
+    def _get_file_target(self, target: Optional[str], day: date, name: str) -> str:
+        """Return the target of the `name` file of the `day` partition."""
+        partition = day.strftime(PARTITION_FORMAT)
+        if self.settings.STORAGE == "fs":
+            file_target = str(Path(target or "") / partition / name)
+            self._get_path(file_target).parent.mkdir(parents=True, exist_ok=True)
+            return file_target
+
+        bucket, prefix = self._get_bucket_and_key(self._get_archive_target(target))
+        prefix = f"{prefix.rstrip('/')}/" if prefix else ""
+        return f"{bucket}/{prefix}{partition}/{name}"
+
+    def _exists(self, file_target: str) -> bool:
+        """Return whether the `file_target` file (or object) exists."""
+        if self.settings.STORAGE == "fs":
+            return self._get_path(file_target).exists()
+        bucket, key = self._get_bucket_and_key(file_target, object_key=True)
+        return any(True for _ in self._list_objects(bucket, key))
+
+    @staticmethod
+    def parse_datetime(value: Union[str, datetime, None]) -> Optional[datetime]:
+        """Return the `value` ISO 8601 date time string as a datetime."""
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return value
+
+    @staticmethod
+    def get_cursor(statement: dict) -> str:
+        """Return the `search_after` cursor pointing to the `statement`."""
+        timestamp, statement_id = ParquetLRSBackend.get_sort_key(statement)
+        return f"{timestamp.isoformat()}|{statement_id}"
+
+    @staticmethod
+    def get_sort_key(statement: dict) -> Tuple[datetime, str]:
+        """Return the `timestamp` and `id` of the `statement`, ordering pages."""
+        timestamp = cast(datetime, ParquetDataBackend.get_timestamp(statement, False))
+        return timestamp, str(statement.get("id"))
+
+    @staticmethod
+    def parse_cursor(search_after: str) -> Tuple[datetime, str]:
+        """Return the timestamp and the statement id of the `search_after` cursor.
+
+        Raise:
+            BackendParameterException: If the cursor is not valid.
+        """
+        timestamp, _, statement_id = search_after.partition("|")
+        try:
+            cursor_timestamp = datetime.fromisoformat(timestamp)
+        except ValueError as error:
+            msg = "Invalid search_after cursor: %s"
+            logger.error(msg, search_after)
+            raise BackendParameterException(msg % search_after) from error
+        return cast(datetime, ParquetDataBackend.to_utc(cursor_timestamp)), statement_id
@@ -0,0 +1,298 @@
+"""SQLite LRS backend for Ralph."""
+
+import logging
+import sqlite3
+from typing import Any, Dict, Iterator, List, Optional, cast
+
+from pydantic_settings import SettingsConfigDict
+
+from ralph.backends.data.base import BaseOperationType
+from ralph.backends.data.sqlite import (
+    SQLiteDataBackend,
+    SQLiteDataBackendSettings,
+    SQLiteQuery,
+)
+from ralph.backends.lrs.base import (
+    STATEMENTS_QUERY_SHAPES,
+    AgentParameters,
+    BaseLRSBackend,
+    BaseLRSBackendSettings,
+    Indexable,
+    RalphStatementsQuery,
+    StatementFingerprint,
+    StatementQueryResult,
+    get_change_marker,
+)
+from ralph.conf import BASE_SETTINGS_CONFIG
+from ralph.exceptions import BackendException, BackendParameterException
+from ralph.utils import iter_by_batch
+
+logger = logging.getLogger(__name__)
+
+# Timestamp used in place of the `since` and `until` parameters of query shapes.
+QUERY_SHAPE_TIMESTAMP = "1970-01-01T00:00:00+00:00"
+
+
+class SQLiteLRSBackendSettings(BaseLRSBackendSettings, SQLiteDataBackendSettings):
+    """SQLite LRS backend default configuration."""
+
+    model_config = {
+        **BASE_SETTINGS_CONFIG,
+        **SettingsConfigDict(env_prefix="RALPH_BACKENDS__LRS__SQLITE__"),
+    }
+
+
+class SQLiteLRSBackend(
+    BaseLRSBackend[SQLiteLRSBackendSettings], SQLiteDataBackend, Indexable
+):
+    """SQLite LRS backend."""
+
+    def query_statements(
+        self, params: RalphStatementsQuery, target: Optional[str] = None
+    ) -> StatementQueryResult:
+        """Return the results of a statements query using xAPI parameters.
+
+        Statements are paginated on their `timestamp` and `id`, thus a page is read
+        through the indexes whatever the number of previous pages.
+        """
+        query = self.get_query(params)
+        try:
+            rows = list(self._read_rows_as_dicts(query, target, params.limit))
+        except (BackendException, BackendParameterException) as error:
+            logger.error("Failed to read from SQLite")
+            raise error
+
+        search_after = None
+        if rows:
+            search_after = f"{rows[-1]['timestamp']}:{rows[-1]['id']}"
+
+        return StatementQueryResult(
+            statements=[row["statement"] for row in rows],
+            pit_id=None,
+            search_after=search_after,
+            change_marker=get_change_marker(row["fingerprint"] for row in rows),
+        )
+
+    def query_statements_by_ids(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[dict]:
+        """Yield statements with matching ids from the backend."""
+        try:
+            for batch in iter_by_batch(ids, self.settings.READ_CHUNK_SIZE):
+                query = self.get_ids_query(batch, "statement")
+                for row in self._read_rows_as_dicts(query, target):
+                    yield row["statement"]
+        except (BackendException, BackendParameterException) as error:
+            logger.error("Failed to read from SQLite")
+            raise error
+
+    def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[StatementFingerprint]:
+        """Yield fingerprints of statements with matching ids from the backend.
+
+        Only the `fingerprint` column is read, rather than whole statements.
+        """
+        try:
+            for batch in iter_by_batch(ids, self.settings.READ_CHUNK_SIZE):
+                query = self.get_ids_query(batch, ["id", "fingerprint"])
+                for row in self._read_rows_as_dicts(query, target):
+                    yield StatementFingerprint(row["id"], row["fingerprint"])
+        except (BackendException, BackendParameterException) as error:
+            logger.error("Failed to read from SQLite")
+            raise error
+
+    def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        Stored ids are queried and new statements inserted in the same transaction,
+        thus concurrent requests can't store the same statement id twice.
+        """
+        table = self.get_table(target)
+        rows = self.to_rows(statements, False, BaseOperationType.CREATE)
+        connection = self.connection
+        conflicting_ids: List[str] = []
+        try:
+            for batch in iter_by_batch(rows, self.settings.WRITE_CHUNK_SIZE):
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    query = self.get_ids_query([row[0] for row in batch], "id")
+                    stored_ids = {
+                        stored_id
+                        for stored_id, in connection.execute(
+                            self.get_sql(query, table), query.parameters or ()
+                        )
+                    }
+                    connection.executemany(
+                        self.get_insert_sql(table, ignore_errors=True),
+                        [row for row in batch if row[0] not in stored_ids],
+                    )
+                except sqlite3.Error:
+                    connection.execute("ROLLBACK")
+                    raise
+                connection.execute("COMMIT")
+                conflicting_ids.extend(row[0] for row in batch if row[0] in stored_ids)
+        except sqlite3.Error as error:
+            msg = "Failed to create statements: %s"
+            logger.error(msg, error)
+            raise BackendException(msg % error) from error
+
+        return conflicting_ids
+
+    def init_indexes(self, target: Optional[str] = None) -> List[str]:
+        """Create the indexes serving statements queries and return their names.
+
+        Indexes are created along with the table on its first use, thus this method
+        only creates the table if it does not exist yet.
+        """
+        table = self.get_table(target)
+        return self.get_index_names(table)
+
+    def explain_query_shapes(self, target: Optional[str] = None) -> List[str]:
+        """Return the names of the `STATEMENTS_QUERY_SHAPES` not served by an index.
+
+        A query shape is not served by an index if its query plan scans the whole
+        table.
+        """
+        table = self.get_table(target)
+        unindexed_query_shapes = []
+        for name, params in STATEMENTS_QUERY_SHAPES.items():
+            # Timestamps are converted to numbers, thus they should be valid dates.
+            update = {
+                field: QUERY_SHAPE_TIMESTAMP
+                for field in ("since", "until")
+                if getattr(params, field)
+            }
+            query = self.get_query(params.model_copy(update=update))
+            sql = f"EXPLAIN QUERY PLAN {self.get_sql(query, table)}"
+            try:
+                plan = self.connection.execute(sql, query.parameters or ()).fetchall()
+            except sqlite3.Error as error:
+                msg = "Failed to explain the %s query shape: %s"
+                logger.error(msg, name, error)
+                raise BackendException(msg % (name, error)) from error
+            if any(self.is_table_scan(step[-1]) for step in plan):
+                unindexed_query_shapes.append(name)
+
+        return unindexed_query_shapes
+
+    def _read_rows_as_dicts(
+        self,
+        query: SQLiteQuery,
+        target: Optional[str],
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """Yield the rows matching the `query` as dictionaries."""
+        return cast(
+            Iterator[dict],
+            self.read(query=query, target=target, chunk_size=chunk_size),
+        )
+
+    @staticmethod
+    def is_table_scan(detail: str) -> bool:
+        """Return whether the query plan step `detail` scans a whole table."""
+        return detail.startswith("SCAN") and " INDEX " not in detail
+
+    @staticmethod
+    def get_ids_query(ids: List[str], select: Any) -> SQLiteQuery:
+        """Construct the query selecting the `select` columns of statements `ids`."""
+        placeholders = ", ".join("?" for _ in ids)
+        return SQLiteQuery.model_construct(
+            select=select, where=f"id IN ({placeholders})", parameters=list(ids)
+        )
+
+    @staticmethod
+    def get_query(params: RalphStatementsQuery) -> SQLiteQuery:
+        """Construct the query from statement parameters.
+
+        Raise:
+            BackendParameterException: If the `since`, `until` or `search_after`
+                parameters are invalid.
+        """
+        filters: Dict[str, Any] = {}
+
+        if params.statement_id:
+            filters["id"] = str(params.statement_id)
+
+        SQLiteLRSBackend._add_agent_filters(filters, params.agent, "actor")
+        SQLiteLRSBackend._add_agent_filters(filters, params.authority, "authority")
+
+        if params.verb:
+            filters["verb"] = str(params.verb)
+
+        if params.activity:
+            filters["object"] = str(params.activity)
+
+        if params.registration:
+            filters["registration"] = str(params.registration)
+
+        where = [f"{column} = :{column}" for column in filters]
+        parameters = dict(filters)
+        try:
+            if params.since:
+                since = SQLiteDataBackend.get_timestamp(str(params.since))
+                where.append("timestamp > :since")
+                parameters["since"] = since
+
+            if params.until:
+                until = SQLiteDataBackend.get_timestamp(str(params.until))
+                where.append("timestamp <= :until")
+                parameters["until"] = until
+
+            if params.search_after:
+                timestamp, _, statement_id = params.search_after.partition(":")
+                parameters["after_timestamp"] = int(timestamp)
+                parameters["after_id"] = statement_id
+                search_order = ">" if params.ascending else "<"
+                where.append(
+                    f"(timestamp, id) {search_order} (:after_timestamp, :after_id)"
+                )
+        except (OverflowError, ValueError) as error:
+            msg = "Invalid statements query parameters: %s"
+            logger.error(msg, error)
+            raise BackendParameterException(msg % error) from error
+
+        sort_order = "ASC" if params.ascending else "DESC"
+
+        # Note: `params` fields are validated thus we skip SQLiteQuery validation.
+        return SQLiteQuery.model_construct(
+            select=["id", "timestamp", "fingerprint", "statement"],
+            where=where,
+            parameters=parameters,
+            limit=params.limit,
+            sort=f"timestamp {sort_order}, id {sort_order}",
+        )
+
+    @staticmethod
+    def _add_agent_filters(
+        filters: Dict[str, Any],
+        agent_params: Optional[AgentParameters],
+        target_field: str,
+    ) -> None:
+        """Add column values relative to agents to `filters`.
+
+        Args:
+            filters (dict): Values of the columns queried by equality.
+            agent_params (AgentParameters): Agent query parameters to search for.
+            target_field (str): The target agent field name to perform the search.
+        """
+        if not agent_params:
+            return
+
+        agent: Dict[str, Any] = (
+            agent_params
+            if isinstance(agent_params, dict)
+            else agent_params.model_dump()
+        )
+
+        for field in ("mbox", "mbox_sha1sum", "openid"):
+            if agent.get(field):
+                filters[f"{target_field}_{field}"] = agent.get(field)
+
+        if agent.get("account__name"):
+            filters[f"{target_field}_account_name"] = agent["account__name"]
+            filters[f"{target_field}_account_home_page"] = agent.get(
+                "account__home_page"
+            )
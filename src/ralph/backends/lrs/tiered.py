@@ -0,0 +1,359 @@
+"""Tiered LRS backend for Ralph."""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
+
+from pydantic import PositiveInt
+from pydantic_settings import SettingsConfigDict
+
+from ralph.backends.data.base import BaseOperationType, DataBackendStatus
+from ralph.backends.loader import get_lrs_backends
+from ralph.backends.lrs.base import (
+    Archivable,
+    BaseLRSBackend,
+    BaseLRSBackendSettings,
+    RalphStatementsQuery,
+    StatementFingerprint,
+    StatementQueryResult,
+)
+from ralph.conf import BASE_SETTINGS_CONFIG
+from ralph.exceptions import BackendParameterException
+
+logger = logging.getLogger(__name__)
+
+HOT = "hot"
+COLD = "cold"
+
+
+def join_markers(markers: List[Optional[str]]) -> Optional[str]:
+    """Return the change marker of the tiers `markers`, or `None` if one is missing."""
+    if not all(markers):
+        return None
+    return "|".join(cast(List[str], markers))
+
+
+class TieredLRSBackendSettings(BaseLRSBackendSettings):
+    """Tiered LRS backend default configuration.
+
+    Attributes:
+        HOT_BACKEND (str): The name of the LRS backend storing recent statements.
+        COLD_BACKEND (str): The name of the LRS backend archiving aged statements.
+        HOT_RETENTION_DAYS (int): The number of days statements are kept in the hot
+            backend before being moved to the cold backend by the `archive` command.
+    """
+
+    model_config = {
+        **BASE_SETTINGS_CONFIG,
+        **SettingsConfigDict(env_prefix="RALPH_BACKENDS__LRS__TIERED__"),
+    }
+
+    HOT_BACKEND: str = "es"
+    COLD_BACKEND: str = "parquet"
+    HOT_RETENTION_DAYS: PositiveInt = 30
+
+
+class TieredLRSBackend(BaseLRSBackend[TieredLRSBackendSettings], Archivable):
+    """Tiered LRS backend storing recent and aged statements in distinct backends.
+
+    Statements are written to the hot backend, and moved to the cold backend once
+    they are older than `HOT_RETENTION_DAYS` by the `archive_statements` method.
+    Each tier is configured by the settings of its own backend.
+    """
+
+    name = "tiered"
+    # The write concurrency is forwarded to the hot tier.
+    concurrent_writes = False
+
+    def __init__(self, settings: Optional[TieredLRSBackendSettings] = None):
+        """Instantiate the hot and cold LRS backends.
+
+        Args:
+            settings (TieredLRSBackendSettings or None): The LRS backend settings.
+                If `settings` is `None`, a default settings instance is used instead.
+
+        Raise:
+            BackendParameterException: If a tier backend is not a synchronous LRS
+                backend.
+        """
+        super().__init__(settings)
+        self.hot = self.get_tier_backend(self.settings.HOT_BACKEND)
+        self.cold = self.get_tier_backend(self.settings.COLD_BACKEND)
+        # Writes are forwarded to the hot backend.
+        self.default_operation_type = self.hot.default_operation_type
+        self.unsupported_operation_types = self.hot.unsupported_operation_types
+
+    def status(self) -> DataBackendStatus:
+        """Return the least healthy status of the hot and cold backends."""
+        statuses = {self.hot.status(), self.cold.status()}
+        for status in (DataBackendStatus.ERROR, DataBackendStatus.AWAY):
+            if status in statuses:
+                return status
+        return DataBackendStatus.OK
+
+    def read(  # noqa: PLR0913
+        self,
+        query: Optional[object] = None,
+        target: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        raw_output: bool = False,
+        ignore_errors: bool = False,
+        prefetch: Optional[PositiveInt] = None,
+        max_statements: Optional[PositiveInt] = None,
+    ) -> Union[Iterator[bytes], Iterator[dict]]:
+        """Read records of the hot backend. See the hot backend `read` method."""
+        yield from self.hot.read(
+            query,
+            target,
+            chunk_size,
+            raw_output,
+            ignore_errors,
+            prefetch,
+            max_statements,
+        )
+
+    def _read_dicts(
+        self,
+        query: object,
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+    ) -> Iterator[dict]:
+        """Method called by `self.read` yielding dictionaries. See `self.read`."""
+        statements = self.hot.read(query, target, chunk_size, False, ignore_errors)
+        yield from cast(Iterator[dict], statements)
+
+    def _write_dicts(  # noqa: PLR0913
+        self,
+        data: Iterable[dict],
+        target: Optional[str],
+        chunk_size: int,
+        ignore_errors: bool,
+        operation_type: BaseOperationType,
+        concurrency: Optional[PositiveInt],
+    ) -> int:
+        """Write statements to the hot backend. See `self.write`."""
+        return self.hot.write(
+            data, target, chunk_size, ignore_errors, operation_type, concurrency
+        )
+
+    def query_statements(
+        self, params: RalphStatementsQuery, target: Optional[str] = None
+    ) -> StatementQueryResult:
+        """Return the statements query payload using xAPI parameters.
+
+        Statements of the hot backend come first, followed by statements of the cold
+        backend (or the other way around if `ascending` is set). The cold backend is
+        only queried if the `since` parameter precedes `HOT_RETENTION_DAYS`.
+
+        The `search_after` cursor is made of the name of the tier to resume
+        from and of the cursor of its backend, separated by a `|`.
+
+        Raise:
+            BackendParameterException: If the `search_after` cursor is not valid.
+        """
+        tiers: List[Tuple[str, BaseLRSBackend]] = [(HOT, self.hot)]
+        if self._may_query_cold(params):
+            tiers.append((COLD, self.cold))
+        if params.ascending:
+            tiers.reverse()
+
+        tier, cursor = None, None
+        if params.search_after:
+            tier, _, cursor = params.search_after.partition("|")
+            names = [name for name, _ in tiers]
+            if tier not in names:
+                msg = "Invalid search_after cursor: %s"
+                logger.error(msg, params.search_after)
+                raise BackendParameterException(msg % params.search_after)
+            tiers = tiers[names.index(tier) :]
+
+        statements: List[dict] = []
+        markers: List[Optional[str]] = []
+        for index, (name, backend) in enumerate(tiers):
+            update: Dict[str, Any] = {"search_after": None, "pit_id": None}
+            if name == tier and cursor:
+                update = {"search_after": cursor, "pit_id": params.pit_id}
+            if params.limit:
+                update["limit"] = params.limit - len(statements)
+            result = backend.query_statements(params.model_copy(update=update), target)
+            statements.extend(result.statements)
+            markers.append(result.change_marker)
+            if not params.limit or len(statements) < params.limit:
+                # The tier is exhausted, statements are completed by the next one.
+                continue
+
+            if result.search_after:
+                search_after = f"{name}|{result.search_after}"
+                return StatementQueryResult(
+                    statements, result.pit_id, search_after, join_markers(markers)
+                )
+            if index + 1 < len(tiers):
+                search_after = f"{tiers[index + 1][0]}|"
+                return StatementQueryResult(
+                    statements, None, search_after, join_markers(markers)
+                )
+            break
+
+        return StatementQueryResult(
+            statements=statements, change_marker=join_markers(markers)
+        )
+
+    def query_statements_by_ids(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[dict]:
+        """Yield statements with matching ids from the hot, then the cold backend.
+
+        The cold backend is only queried for ids missing from the hot backend.
+        """
+        found_ids = set()
+        for statement in self.hot.query_statements_by_ids(ids, target):
+            found_ids.add(statement["id"])
+            yield statement
+
+        missing_ids = [
+            statement_id for statement_id in ids if statement_id not in found_ids
+        ]
+        if missing_ids:
+            yield from self.cold.query_statements_by_ids(missing_ids, target)
+
+    def query_statement_fingerprints(
+        self, ids: List[str], target: Optional[str] = None
+    ) -> Iterator[StatementFingerprint]:
+        """Yield fingerprints of statements with matching ids from both tiers.
+
+        The cold backend is only queried for ids missing from the hot backend.
+        """
+        found_ids = set()
+        for fingerprint in self.hot.query_statement_fingerprints(ids, target):
+            found_ids.add(fingerprint.id)
+            yield fingerprint
+
+        missing_ids = [
+            statement_id for statement_id in ids if statement_id not in found_ids
+        ]
+        if missing_ids:
+            yield from self.cold.query_statement_fingerprints(missing_ids, target)
+
+    def create_statements(
+        self, statements: List[dict], target: Optional[str] = None
+    ) -> List[str]:
+        """Write `statements` not yet stored and return the ids of the other ones.
+
+        Statements archived in the cold backend are excluded before relying on the
+        hot backend `create_statements` method.
+        """
+        ids = [statement["id"] for statement in statements]
+        archived_ids = {
+            item.id for item in self.cold.query_statement_fingerprints(ids, target)
+        }
+        new_statements = [item for item in statements if item["id"] not in archived_ids]
+        stored_ids = set(archived_ids)
+        if new_statements:
+            stored_ids.update(self.hot.create_statements(new_statements, target))
+        return [statement_id for statement_id in ids if statement_id in stored_ids]
+
+    def backfill_fingerprints(
+        self, target: Optional[str] = None, chunk_size: Optional[int] = None
+    ) -> int:
+        """Store the fingerprint of statements missing it and return their count."""
+        count = self.hot.backfill_fingerprints(target, chunk_size)
+        return count + self.cold.backfill_fingerprints(target, chunk_size)
+
+    def archive_statements(
+        self, target: Optional[str] = None, chunk_size: Optional[int] = None
+    ) -> int:
+        """Move statements older than `HOT_RETENTION_DAYS` to the cold backend.
+
+        Aged statements are read from the hot backend by chunks, in ascending
+        timestamp order. Each chunk is written to the cold backend, then deleted from
+        the hot backend.
+
+        Args:
+            target (str or None): The target container name of both backends.
+                If `target` is `None`, their default values are used instead.
+            chunk_size (int or None): The number of statements to move at once.
+                If `chunk_size` is `None` it defaults to `WRITE_CHUNK_SIZE`.
+
+        Return:
+            int: The number of statements moved to the cold backend.
+
+        Raise:
+            BackendException: If a failure occurs.
+            BackendParameterException: If the hot backend does not support deleting
+                statements.
+        """
+        if BaseOperationType.DELETE in self.hot.unsupported_operation_types:
+            msg = "The %s hot backend does not support deleting statements"
+            logger.error(msg, self.settings.HOT_BACKEND)
+            raise BackendParameterException(msg % self.settings.HOT_BACKEND)
+
+        chunk_size = chunk_size if chunk_size else self.settings.WRITE_CHUNK_SIZE
+        params = RalphStatementsQuery.model_construct(
+            until=self.get_retention_limit().isoformat(),
+            limit=chunk_size,
+            ascending=True,
+        )
+        count = 0
+        while True:
+            result = self.hot.query_statements(params, target)
+            if not result.statements:
+                break
+
+            self.cold.write(result.statements, target)
+            ids = [{"id": statement["id"]} for statement in result.statements]
+            self.hot.write(ids, target, operation_type=BaseOperationType.DELETE)
+            count += len(result.statements)
+            logger.info("Moved %d statements to the cold backend", count)
+            if len(result.statements) < chunk_size or not result.search_after:
+                break
+            params = params.model_copy(
+                update={"search_after": result.search_after, "pit_id": result.pit_id}
+            )
+
+        return count
+
+    def close(self) -> None:
+        """Close the hot and cold backends.
+
+        Raise:
+            BackendException: If a failure occurs during the close operation.
+        """
+        self.hot.close()
+        self.cold.close()
+
+    def get_retention_limit(self) -> datetime:
+        """Return the date time before which statements are moved to the cold tier."""
+        days = self.settings.HOT_RETENTION_DAYS
+        return datetime.now(tz=timezone.utc) - timedelta(days=days)
+
+    def _may_query_cold(self, params: RalphStatementsQuery) -> bool:
+        """Return whether statements of the cold backend may match the query."""
+        since = params.since
+        if not since:
+            return True
+        if isinstance(since, str):
+            since = datetime.fromisoformat(since)
+        if not since.tzinfo:
+            since = since.replace(tzinfo=timezone.utc)
+        return since < self.get_retention_limit()
+
+    @staticmethod
+    def get_tier_backend(name: str) -> BaseLRSBackend:
+        """Return an instance of the `name` LRS backend.
+
+        Raise:
+            BackendParameterException: If the backend is not a synchronous LRS
+                backend.
+        """
+        backend_class = get_lrs_backends().get(name)
+        if (
+            not backend_class
+            or not issubclass(backend_class, BaseLRSBackend)
+            or issubclass(backend_class, TieredLRSBackend)
+        ):
+            msg = "The %s backend is not a synchronous LRS backend"
+            logger.error(msg, name)
+            raise BackendParameterException(msg % name)
+
+        return backend_class()
@@ -1,13 +1,18 @@
 """Ralph CLI entrypoint."""
 
+import cProfile
 import json
 import logging
 import re
 import sys
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
 from inspect import isasyncgen, isclass
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Any, Callable, Dict, Optional, Type, Union
+from typing import Any, Callable, Dict, Iterator, Optional, Type, Union
 
 import bcrypt
 
@@ -39,7 +44,9 @@ from ralph.backends.loader import (
     get_cli_backends,
     get_cli_list_backends,
     get_cli_write_backends,
+    get_lrs_archive_backends,
     get_lrs_backends,
+    get_lrs_index_backends,
 )
 from ralph.conf import ClientOptions, HeadersParameters, settings
 from ralph.logger import configure_logging
@@ -193,6 +200,159 @@ class JSONStringParamType(click.ParamType):
         return options
 
 
+@dataclass
+class StageStats:
+    """Throughput counters of a pipeline stage (standard input or output)."""
+
+    events: int = 0
+    bytes: int = 0
+
+
+class PipelineStats:
+    """Throughput counters collected while running a Ralph command."""
+
+    def __init__(self) -> None:
+        """Instantiate empty counters and start the wall clock."""
+        self.input = StageStats()
+        self.output = StageStats()
+        self.warnings = 0
+        self.errors = 0
+        self.start_time = time.perf_counter()
+        self.end_time: Optional[float] = None
+
+    @property
+    def wall_time(self) -> float:
+        """Return the elapsed time in seconds."""
+        end_time = self.end_time if self.end_time else time.perf_counter()
+        return end_time - self.start_time
+
+    def summary(self) -> str:
+        """Return a human-readable summary of the collected counters."""
+        wall_time = self.wall_time
+        lines = [
+            f"{'stage':<8}{'events':>12}{'bytes':>16}{'events/s':>14}",
+        ]
+        for name, stage in (("input", self.input), ("output", self.output)):
+            rate = stage.events / wall_time if wall_time else 0.0
+            lines.append(f"{name:<8}{stage.events:>12}{stage.bytes:>16}{rate:>14.1f}")
+        lines.append(f"warnings: {self.warnings} | errors: {self.errors}")
+        lines.append(f"wall time: {wall_time:.3f}s")
+        return "\n".join(lines)
+
+
+class StatsStream:
+    """Standard stream proxy counting events (lines) and bytes going through it."""
+
+    def __init__(self, stream: Any, stage: StageStats, encoding: str) -> None:
+        """Instantiate the stream proxy.
+
+        Args:
+            stream (any): The text or binary stream to proxy.
+            stage (StageStats): The stage counters to update.
+            encoding (str): The encoding used to count bytes of text data.
+        """
+        self._stream = stream
+        self._stage = stage
+        self._encoding = encoding
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate other attributes to the proxied stream."""
+        return getattr(self._stream, name)
+
+    def __iter__(self) -> "StatsStream":
+        """Return the stream proxy as an iterator over lines."""
+        return self
+
+    def __next__(self) -> Union[str, bytes]:
+        """Return the next line of the proxied stream."""
+        return self._count(next(self._stream))
+
+    @property
+    def buffer(self) -> "StatsStream":
+        """Return the proxied binary buffer, sharing the same counters."""
+        return StatsStream(self._stream.buffer, self._stage, self._encoding)
+
+    def read(self, *args: Any) -> Union[str, bytes]:
+        """Read from the proxied stream."""
+        return self._count(self._stream.read(*args))
+
+    def readline(self, *args: Any) -> Union[str, bytes]:
+        """Read a line from the proxied stream."""
+        return self._count(self._stream.readline(*args))
+
+    def write(self, data: Union[str, bytes]) -> int:
+        """Write `data` to the proxied stream."""
+        written: int = self._stream.write(data)
+        self._count(data)
+        return written
+
+    def _count(self, data: Union[str, bytes]) -> Union[str, bytes]:
+        """Update stage counters with `data` and return it."""
+        if isinstance(data, str):
+            self._stage.bytes += len(data.encode(self._encoding, errors="replace"))
+            self._stage.events += data.count("\n")
+        else:
+            self._stage.bytes += len(data)
+            self._stage.events += data.count(b"\n")
+        return data
+
+
+class StatsHandler(logging.Handler):
+    """Logging handler counting warnings and errors into the pipeline stats."""
+
+    def __init__(self, stats: PipelineStats) -> None:
+        """Instantiate the handler for `stats`."""
+        super().__init__(logging.WARNING)
+        self.stats = stats
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Count the `record` as a warning or an error."""
+        if record.levelno >= logging.ERROR:
+            self.stats.errors += 1
+        else:
+            self.stats.warnings += 1
+
+
+@contextmanager
+def collect_stats() -> Iterator[PipelineStats]:
+    """Count events flowing through standard streams and print a summary."""
+    stats = PipelineStats()
+    encoding = settings.LOCALE_ENCODING
+    stdin, stdout = sys.stdin, sys.stdout
+    handler = StatsHandler(stats)
+    sys.stdin = StatsStream(stdin, stats.input, encoding)
+    sys.stdout = StatsStream(stdout, stats.output, encoding)
+    get_root_logger().addHandler(handler)
+    try:
+        yield stats
+    finally:
+        stats.end_time = time.perf_counter()
+        sys.stdin, sys.stdout = stdin, stdout
+        get_root_logger().removeHandler(handler)
+        click.echo(stats.summary(), err=True)
+
+
+@contextmanager
+def profile_command(path: Path, top: int = 10) -> Iterator[cProfile.Profile]:
+    """Profile the wrapped code, dump pstats to `path` and report peak memory."""
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        profiler.dump_stats(path)
+        logger.info("Profiling statistics written to: %s", path)
+        report = [f"peak memory: {peak / 1024**2:.2f} MiB", "top allocations:"]
+        for stat in snapshot.statistics("lineno")[:top]:
+            report.append(f"  {stat}")
+        click.echo("\n".join(report), err=True)
+
+
 class RalphCLI(click.Group):
     """Ralph CLI entrypoint."""
 
@@ -222,7 +382,13 @@ class RalphCLI(click.Group):
             get_root_logger().setLevel(level)
             for handler in get_root_logger().handlers:
                 handler.setLevel(level)
-        return super().invoke(ctx)
+
+        with ExitStack() as stack:
+            if ctx.params.get("profile"):
+                stack.enter_context(profile_command(ctx.params["profile"]))
+            if ctx.params.get("stats"):
+                stack.enter_context(collect_stats())
+            return super().invoke(ctx)
 
     def list_commands(self, ctx):
         """Register all lazy commands before calling `list_commands`."""
@@ -248,8 +414,20 @@ class RalphCLI(click.Group):
     required=False,
     help="Either CRITICAL, ERROR, WARNING, INFO (default) or DEBUG",
 )
+@click.option(
+    "--stats",
+    is_flag=True,
+    default=False,
+    help="Print a throughput summary of the command to stderr",
+)
+@click.option(
+    "--profile",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write cProfile statistics to this file and report peak memory on stderr",
+)
 @click.version_option(version=ralph_version)
-def cli(verbosity=None):
+def cli(verbosity=None, stats=False, profile=None):
     """The cli is a stream-based tool to play with your logs.
 
     It offers functionalities to:
@@ -281,6 +459,8 @@ def backends_options(backends: Dict[str, Type], name: Optional[str] = None):
                 if field_type is bool:
                     option = f"{option}/--no-{field_name}"
                     option_kwargs["is_flag"] = True
+                elif field_type is int:  # PositiveInt, NonNegativeInt
+                    option_kwargs["type"] = int
                 elif field_type is dict:
                     option_kwargs["type"] = CommaSeparatedKeyValueParamType()
                 elif field_type is tuple:  # CommaSeparatedTuple
@@ -656,12 +836,23 @@ def convert(from_, to_, ignore_errors, fail_on_unknown, **conversion_set_kwargs)
     default=False,
     help="Ignore errors during the encoding operation.",
 )
-def read(
+@click.option(
+    "-p",
+    "--prefetch",
+    type=int,
+    default=None,
+    help=(
+        "Number of records read ahead in a background thread while outputting "
+        "previous ones. Defaults to 1, i.e. no read ahead"
+    ),
+)
+def read(  # noqa: PLR0913
     backend,
     chunk_size,
     target,
     query,
     ignore_errors,
+    prefetch,
     **options,
 ):
     """Read records matching the QUERY (json or string) from a configured backend."""
@@ -689,6 +880,7 @@ def read(
         chunk_size=chunk_size,
         raw_output=True,
         ignore_errors=ignore_errors,
+        prefetch=prefetch,
     )
     if isinstance(backend, BaseAsyncDataBackend):
         statements = iter_over_async(statements)
@@ -730,8 +922,12 @@ def read(
 @click.option(
     "-c",
     "--concurrency",
-    default=1,
-    help="Number of chunks to write concurrently. (async backends only)",
+    type=int,
+    default=None,
+    help=(
+        "Number of chunks to write concurrently, for backends supporting it. "
+        "Defaults to the backend WRITE_CONCURRENCY setting"
+    ),
 )
 def write(  # noqa: PLR0913
     backend,
@@ -751,10 +947,8 @@ def write(  # noqa: PLR0913
     backend = get_backend_instance(backend_class, options)
 
     writer = backend.write
-    async_options = {}
     if isinstance(backend, AsyncWritable):
         writer = execute_async(backend.write)
-        async_options = {"concurrency": concurrency}
 
     writer(
         data=sys.stdin.buffer,
@@ -762,7 +956,7 @@ def write(  # noqa: PLR0913
         chunk_size=chunk_size,
         ignore_errors=ignore_errors,
         operation_type=BaseOperationType(operation_type) if operation_type else None,
-        **async_options,
+        concurrency=concurrency,
     )
 
 
@@ -807,6 +1001,112 @@ def list_(target, details, new, backend, **options):
         logger.warning("Configured %s backend contains no document", backend.name)
 
 
+@RalphCLI.lazy_backends_options(get_lrs_backends, name="migrate")
+@click.option(
+    "-t",
+    "--target",
+    type=str,
+    default=None,
+    help="The target container to migrate",
+)
+@click.option(
+    "-s",
+    "--chunk-size",
+    type=int,
+    default=None,
+    help="Migrate statements by chunks of size #",
+)
+def migrate(backend: str, target: str, chunk_size: int, **options: Any) -> None:
+    """Migrate statements stored in a configured LRS backend.
+
+    Store the fingerprint of statements written by previous Ralph versions.
+    """
+    logger.info("Migrating target %s for the configured %s backend", target, backend)
+    logger.debug("Backend parameters: %s", options)
+
+    backend_class = get_backend_class(get_lrs_backends(), backend)
+    lrs_backend = get_backend_instance(backend_class, options)
+
+    backfill_fingerprints = lrs_backend.backfill_fingerprints
+    if isinstance(lrs_backend, BaseAsyncDataBackend):
+        backfill_fingerprints = execute_async(backfill_fingerprints)
+
+    count = backfill_fingerprints(target=target, chunk_size=chunk_size)
+    logger.info("Stored the fingerprint of %d statements", count)
+
+
+@RalphCLI.lazy_backends_options(get_lrs_archive_backends, name="archive")
+@click.option(
+    "-t",
+    "--target",
+    type=str,
+    default=None,
+    help="The target container to archive",
+)
+@click.option(
+    "-s",
+    "--chunk-size",
+    type=int,
+    default=None,
+    help="Archive statements by chunks of size #",
+)
+def archive(backend: str, target: str, chunk_size: int, **options: Any) -> None:
+    """Archive aged statements stored in a configured tiered LRS backend.
+
+    Move statements older than the hot tier retention to the cold tier.
+    """
+    logger.info("Archiving target %s for the configured %s backend", target, backend)
+    logger.debug("Backend parameters: %s", options)
+
+    backend_class = get_backend_class(get_lrs_archive_backends(), backend)
+    lrs_backend = get_backend_instance(backend_class, options)
+
+    count = lrs_backend.archive_statements(target=target, chunk_size=chunk_size)
+    logger.info("Archived %d statements", count)
+
+
+@RalphCLI.lazy_backends_options(get_lrs_index_backends, name="init")
+@click.option(
+    "-t",
+    "--target",
+    type=str,
+    default=None,
+    help="The target container to create the indexes of",
+)
+@click.option(
+    "-e",
+    "--explain",
+    is_flag=True,
+    default=False,
+    help="Only check that statements queries are served by an index",
+)
+def init(backend: str, target: str, explain: bool, **options: Any) -> None:
+    """Create the indexes serving statements queries in a configured LRS backend."""
+    logger.info("Initializing target %s for the configured %s backend", target, backend)
+    logger.debug("Backend parameters: %s", options)
+
+    backend_class = get_backend_class(get_lrs_index_backends(), backend)
+    lrs_backend = get_backend_instance(backend_class, options)
+
+    method = lrs_backend.explain_query_shapes if explain else lrs_backend.init_indexes
+    if isinstance(lrs_backend, BaseAsyncDataBackend):
+        method = execute_async(method)
+
+    if not explain:
+        logger.info("Created indexes: %s", ", ".join(method(target=target)))
+        return
+
+    unindexed_query_shapes = method(target=target)
+    for name in unindexed_query_shapes:
+        logger.warning("The %s statements query shape is not served by an index", name)
+    if unindexed_query_shapes:
+        raise click.ClickException(
+            f"{len(unindexed_query_shapes)} statements query shapes are not served by "
+            "an index"
+        )
+    logger.info("All statements query shapes are served by an index")
+
+
 @RalphCLI.lazy_backends_options(get_lrs_backends, name="runserver")
 @click.option(
     "-h",
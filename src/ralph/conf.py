@@ -208,8 +208,14 @@ class Settings(BaseSettings):
     RUNSERVER_MAX_SEARCH_HITS_COUNT: int = 100
     RUNSERVER_POINT_IN_TIME_KEEP_ALIVE: str = "1m"
     RUNSERVER_PORT: int = 8100
+    LRS_OPTIMISTIC_WRITES: bool = False
     LRS_RESTRICT_BY_AUTHORITY: bool = False
     LRS_RESTRICT_BY_SCOPES: bool = False
+    # NB: subscriptions are held in memory, by server process. A subscriber only
+    # receives the statements stored by the worker it is connected to.
+    LRS_SUBSCRIPTIONS: bool = False
+    LRS_SUBSCRIPTIONS_KEEP_ALIVE: float = 15.0
+    LRS_SUBSCRIPTIONS_QUEUE_SIZE: int = 1000
     SENTRY_CLI_TRACES_SAMPLE_RATE: float = 1.0
     SENTRY_DSN: Optional[str] = None
     SENTRY_IGNORE_HEALTH_CHECKS: bool = False
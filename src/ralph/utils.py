@@ -2,6 +2,7 @@
 
 import asyncio
 import datetime
+import hashlib
 import json
 import logging
 import operator
@@ -10,6 +11,8 @@ from importlib import import_module
 from inspect import getmembers, isclass, iscoroutine
 from itertools import islice
 from logging import Logger, getLogger
+from queue import Full, Queue
+from threading import Event, Thread
 from typing import (
     Any,
     AsyncIterable,
@@ -30,6 +33,19 @@ from ralph.exceptions import BackendException, UnsupportedBackendException
 
 logger = logging.getLogger(__name__)
 
+# Statement fields taken into account by `get_statement_fingerprint`.
+STATEMENT_FINGERPRINT_FIELDS = (
+    "actor",
+    "attachments",
+    "context",
+    "id",
+    "object",
+    "result",
+    "timestamp",
+    "verb",
+    "version",
+)
+
 
 def import_subclass(dotted_path: str, parent_class: Any) -> Any:
     """Import a dotted module path.
@@ -186,6 +202,21 @@ def statements_are_equivalent(statement_1: dict, statement_2: dict) -> bool:
     return True
 
 
+def get_statement_fingerprint(statement: dict) -> str:
+    """Return a hash of the statement fields involved in statements equivalence.
+
+    Statements sharing the same fingerprint are equivalent. Statements with different
+    fingerprints might still be equivalent (for example, if the "version" field is
+    only present in one of them) and should be compared with
+    `statements_are_equivalent`.
+    """
+    fields = {field: statement.get(field) for field in STATEMENT_FINGERPRINT_FIELDS}
+    canonical = json.dumps(
+        fields, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 T = TypeVar("T")
 
 
@@ -280,6 +311,98 @@ def iter_by_batch(iterable: Iterable, n: int) -> Iterable[list]:
         yield batch
 
 
+def iter_in_thread(iterable: Iterable[T], size: int) -> Iterator[T]:
+    """Iterate over `iterable` in a background thread, queueing up to `size` items.
+
+    Items are produced ahead while the consumer processes the previous ones.
+    Errors raised by `iterable` are raised again in the consumer thread.
+    """
+    return iter_in_threads([iterable], size)
+
+
+def iter_in_threads(
+    iterables: Sequence[Iterable[T]], size: int, ordered: bool = True
+) -> Iterator[T]:
+    """Iterate concurrently over `iterables`, each one in a background thread.
+
+    Up to `size` items of each iterable are queued ahead. If `ordered` is `True`,
+    the items of each iterable are yielded after the items of the previous ones,
+    else they are yielded as soon as they are produced.
+    Errors raised by `iterables` are raised again in the consumer thread.
+    """
+    if size < 1:
+        raise ValueError("size must be at least one")
+
+    stopped = Event()
+    if ordered:
+        queues: List[Queue] = [Queue(size) for _ in iterables]
+        threads = [
+            _start_producer_thread(iterable, queue, stopped)
+            for iterable, queue in zip(iterables, queues)
+        ]
+        producer_counts = [1] * len(queues)
+    else:
+        queues = [Queue(size * len(iterables))]
+        threads = [
+            _start_producer_thread(iterable, queues[0], stopped)
+            for iterable in iterables
+        ]
+        producer_counts = [len(iterables)]
+
+    try:
+        for queue, producer_count in zip(queues, producer_counts):
+            remaining = producer_count
+            while remaining:
+                item, error = queue.get()
+                if error:
+                    raise error
+                if item is _PRODUCER_DONE:
+                    remaining -= 1
+                    continue
+                yield item
+    finally:
+        stopped.set()
+        for thread in threads:
+            thread.join()
+
+
+# Item put into a queue by a producer thread once its iterable is exhausted.
+_PRODUCER_DONE = object()
+
+
+def _start_producer_thread(iterable: Iterable, queue: Queue, stopped: Event) -> Thread:
+    """Start a thread putting `(item, error)` tuples of `iterable` into the `queue`.
+
+    The last tuple is `(_PRODUCER_DONE, error)`, where `error` is `None` unless the
+    iteration failed. The thread stops early once the `stopped` event is set.
+    """
+
+    def put(item: Any) -> bool:
+        """Put `item` into the queue unless the consumer stopped iterating."""
+        while not stopped.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce() -> None:
+        """Put `iterable` items into the queue."""
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as error:  # noqa: BLE001
+            put((_PRODUCER_DONE, error))
+            return
+        put((_PRODUCER_DONE, None))
+
+    thread = Thread(target=produce, daemon=True)
+    thread.start()
+    return thread
+
+
 def iter_over_async(agenerator) -> Iterable:
     """Iterate synchronously over an asynchronous generator."""
     loop = asyncio.get_event_loop()
@@ -306,7 +429,7 @@ def execute_async(method):
     def wrapper(*args, **kwargs):
         """Wrap method execution."""
         loop = asyncio.get_event_loop()
-        loop.run_until_complete(method(*args, **kwargs))
+        return loop.run_until_complete(method(*args, **kwargs))
 
     return wrapper
 
@@ -8,6 +8,7 @@ from ralph.api.routers import health
 from ralph.backends.data.base import DataBackendStatus
 
 from tests.fixtures.backends import (
+    get_async_clickhouse_test_backend,
     get_async_es_test_backend,
     get_async_mongo_test_backend,
     get_clickhouse_test_backend,
@@ -23,6 +24,7 @@ from tests.fixtures.backends import (
         get_async_es_test_backend,
         get_async_mongo_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_es_test_backend,
         get_mongo_test_backend,
     ],
@@ -43,6 +45,7 @@ async def test_api_health_lbheartbeat(client, backend, monkeypatch):
         get_async_es_test_backend,
         get_async_mongo_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_es_test_backend,
         get_mongo_test_backend,
     ],
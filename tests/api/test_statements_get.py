@@ -12,8 +12,10 @@ from ralph.api.auth.basic import get_basic_auth_user
 from ralph.backends.data.base import BaseOperationType
 from ralph.backends.data.clickhouse import ClickHouseDataBackend
 from ralph.backends.data.mongo import MongoDataBackend
+from ralph.backends.lrs.base import StatementQueryResult
 from ralph.conf import AuthBackend
 from ralph.exceptions import BackendException
+from ralph.utils import get_statement_fingerprint
 
 from tests.fixtures.backends import (
     CLICKHOUSE_TEST_DATABASE,
@@ -23,6 +25,7 @@ from tests.fixtures.backends import (
     ES_TEST_INDEX,
     MONGO_TEST_COLLECTION,
     MONGO_TEST_DATABASE,
+    get_async_clickhouse_test_backend,
     get_async_es_test_backend,
     get_async_mongo_test_backend,
     get_clickhouse_test_backend,
@@ -79,7 +82,9 @@ def insert_clickhouse_statements(statements, table):
     assert success == len(statements)
 
 
-@pytest.fixture(params=["async_es", "async_mongo", "es", "mongo", "clickhouse"])
+@pytest.fixture(
+    params=["async_es", "async_mongo", "es", "mongo", "clickhouse", "async_clickhouse"]
+)
 def insert_statements_and_monkeypatch_backend(
     request, es_custom, mongo_custom, clickhouse_custom, monkeypatch
 ):
@@ -122,6 +127,14 @@ def insert_statements_and_monkeypatch_backend(
                 backend_client_class_path, get_clickhouse_test_backend()
             )
             return
+        if request.param == "async_clickhouse":
+            target = target if target else CLICKHOUSE_TEST_TABLE_NAME
+            _ = clickhouse_custom(event_table_name=target)
+            insert_clickhouse_statements(statements, target)
+            monkeypatch.setattr(
+                backend_client_class_path, get_async_clickhouse_test_backend()
+            )
+            return
 
     return _insert_statements_and_monkeypatch_backend
 
@@ -768,6 +781,152 @@ async def test_api_statements_get_with_database_query_failure(
     assert response.json() == {"detail": "xAPI statements query failed"}
 
 
+@pytest.mark.anyio
+async def test_api_statements_get_with_if_none_match(
+    client, basic_auth_credentials, monkeypatch
+):
+    """Test the get statements API route, given an `If-None-Match` header matching
+    the `ETag` of the response, should return an empty response with HTTP code 304.
+    """
+    statements = [
+        {"id": "be67b160-d958-4f51-b8b8-1892002dbac6", "verb": {"id": "foo_verb"}},
+        {"id": "72c81e98-1763-4730-8cfc-f5ab34f1bad2", "verb": {"id": "foo_verb"}},
+    ]
+    change_marker = "foo"
+
+    def mock_query_statements(*_, **__):
+        """Mocks the BACKEND_CLIENT.query_statements method."""
+        return StatementQueryResult(statements=statements, change_marker=change_marker)
+
+    monkeypatch.setattr(
+        "ralph.api.routers.statements.BACKEND_CLIENT.query_statements",
+        mock_query_statements,
+    )
+    headers = {"Authorization": f"Basic {basic_auth_credentials}"}
+
+    response = await client.get("/xAPI/statements/", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"statements": statements}
+    etag = response.headers["ETag"]
+
+    for if_none_match in (etag, f"W/{etag}", f'"foo", {etag}', "*"):
+        response = await client.get(
+            "/xAPI/statements/", headers={**headers, "If-None-Match": if_none_match}
+        )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert not response.content
+
+    # Other query parameters should change the `ETag`.
+    response = await client.get(
+        "/xAPI/statements/?limit=10", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    # Statements changes should change the `ETag`.
+    change_marker = "bar"
+    response = await client.get(
+        "/xAPI/statements/", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json() == {"statements": statements}
+
+
+@pytest.mark.anyio
+async def test_api_statements_get_with_if_none_match_and_pit_id(
+    client, basic_auth_credentials, monkeypatch
+):
+    """Test the get statements API route, given an `If-None-Match` header matching
+    the `ETag` of a page, should return a 304 response even if the backend point in
+    time id has changed.
+    """
+    statements = [{"id": "be67b160-d958-4f51-b8b8-1892002dbac6"}]
+    pit_ids = iter(["pit_1", "pit_2", "pit_3"])
+
+    def mock_query_statements(*_, **__):
+        """Mocks the BACKEND_CLIENT.query_statements method."""
+        return StatementQueryResult(
+            statements=statements,
+            pit_id=next(pit_ids),
+            search_after="cursor",
+            change_marker="foo",
+        )
+
+    monkeypatch.setattr(
+        "ralph.api.routers.statements.BACKEND_CLIENT.query_statements",
+        mock_query_statements,
+    )
+    headers = {"Authorization": f"Basic {basic_auth_credentials}"}
+    url = "/xAPI/statements/?limit=1&pit_id=pit_0&search_after=previous_cursor"
+
+    response = await client.get(url, headers=headers)
+    assert response.status_code == 200
+    assert "pit_id=pit_1" in response.json()["more"]
+    etag = response.headers["ETag"]
+
+    url = url.replace("pit_0", "pit_1")
+    response = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.anyio
+async def test_api_statements_get_without_change_marker(
+    client, basic_auth_credentials, monkeypatch
+):
+    """Test the get statements API route, given a backend not providing a change
+    marker, should not tag the response.
+    """
+    statements = [{"id": "be67b160-d958-4f51-b8b8-1892002dbac6"}]
+
+    def mock_query_statements(*_, **__):
+        """Mocks the BACKEND_CLIENT.query_statements method."""
+        return StatementQueryResult(statements=statements)
+
+    monkeypatch.setattr(
+        "ralph.api.routers.statements.BACKEND_CLIENT.query_statements",
+        mock_query_statements,
+    )
+    headers = {"Authorization": f"Basic {basic_auth_credentials}", "If-None-Match": "*"}
+
+    response = await client.get("/xAPI/statements/", headers=headers)
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert response.json() == {"statements": statements}
+
+
+@pytest.mark.anyio
+async def test_api_statements_get_by_id_with_if_none_match(
+    client, basic_auth_credentials, monkeypatch
+):
+    """Test the get statements API route, given a statement id, should return the
+    statement fingerprint as `ETag`.
+    """
+    statement = {"id": "be67b160-d958-4f51-b8b8-1892002dbac6"}
+
+    def mock_query_statements(*_, **__):
+        """Mocks the BACKEND_CLIENT.query_statements method."""
+        return StatementQueryResult(statements=[statement])
+
+    monkeypatch.setattr(
+        "ralph.api.routers.statements.BACKEND_CLIENT.query_statements",
+        mock_query_statements,
+    )
+    headers = {"Authorization": f"Basic {basic_auth_credentials}"}
+    url = f"/xAPI/statements/?statementId={statement['id']}"
+
+    response = await client.get(url, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["ETag"] == f'"{get_statement_fingerprint(statement)}"'
+
+    response = await client.get(
+        url, headers={**headers, "If-None-Match": response.headers["ETag"]}
+    )
+    assert response.status_code == 304
+
+
 @pytest.mark.anyio
 @pytest.mark.parametrize("id_param", ["statementId", "voidedStatementId"])
 async def test_api_statements_get_invalid_query_parameters(
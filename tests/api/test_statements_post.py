@@ -10,9 +10,11 @@ from httpx import ASGITransport, AsyncClient
 from ralph.api import app
 from ralph.api.auth.basic import get_basic_auth_user
 from ralph.backends.lrs.es import ESLRSBackend
+from ralph.backends.lrs.fs import FSLRSBackend
 from ralph.backends.lrs.mongo import MongoLRSBackend
 from ralph.conf import AuthBackend, XapiForwardingConfigurationSettings
 from ralph.exceptions import BackendException
+from ralph.utils import statements_are_equivalent
 
 from tests.fixtures.auth import (
     AUDIENCE,
@@ -23,11 +25,13 @@ from tests.fixtures.auth import (
 from tests.fixtures.backends import (
     ES_TEST_FORWARDING_INDEX,
     ES_TEST_HOSTS,
+    ES_TEST_INDEX,
     MONGO_TEST_CONNECTION_URI,
     MONGO_TEST_DATABASE,
     MONGO_TEST_FORWARDING_COLLECTION,
     RUNSERVER_TEST_HOST,
     RUNSERVER_TEST_PORT,
+    get_async_clickhouse_test_backend,
     get_async_es_test_backend,
     get_async_mongo_test_backend,
     get_clickhouse_test_backend,
@@ -70,6 +74,7 @@ async def test_api_statements_post_invalid_parameters(client, basic_auth_credent
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -110,6 +115,7 @@ async def test_api_statements_post_single_statement_directly(  # noqa: PLR0913
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -287,6 +293,7 @@ async def test_api_statements_post_enriching_with_existing_values(  # noqa: PLR0
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -316,6 +323,7 @@ async def test_api_statements_post_single_statement_no_trailing_slash(  # noqa:
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -355,6 +363,7 @@ async def test_api_statements_post_list_of_one(  # noqa: PLR0913
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -408,6 +417,7 @@ async def test_api_statements_post_list(  # noqa: PLR0913
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -453,6 +463,7 @@ async def test_api_statements_post_list_with_duplicates(  # noqa: PLR0913
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -513,6 +524,163 @@ async def test_api_statements_post_list_with_duplicate_of_existing_statement(  #
     )
 
 
+@pytest.mark.anyio
+async def test_api_statements_post_list_with_duplicate_fingerprints(
+    client, basic_auth_credentials, fs_lrs_backend, monkeypatch
+):
+    """Test the post statements API route, given statements that already exist in the
+    database, should only compare existing statements whose fingerprint differs.
+    """
+    backend = fs_lrs_backend()
+    compared_ids = []
+
+    def mock_statements_are_equivalent(statement_1, statement_2):
+        """Spy on the `statements_are_equivalent` function."""
+        compared_ids.append(statement_1["id"])
+        return statements_are_equivalent(statement_1, statement_2)
+
+    monkeypatch.setattr(
+        "ralph.api.routers.statements.statements_are_equivalent",
+        mock_statements_are_equivalent,
+    )
+    monkeypatch.setattr("ralph.api.routers.statements.BACKEND_CLIENT", backend)
+    statements = [mock_statement(id_=str(uuid4())) for _ in range(2)]
+    response = await client.post(
+        "/xAPI/statements/",
+        headers={"Authorization": f"Basic {basic_auth_credentials}"},
+        json=statements,
+    )
+    assert response.status_code == 200
+
+    # Given identical statements, the stored statements should not be compared.
+    response = await client.post(
+        "/xAPI/statements/",
+        headers={"Authorization": f"Basic {basic_auth_credentials}"},
+        json=statements,
+    )
+    assert response.status_code == 204
+    assert not compared_ids
+
+    # Given a differing statement, only this stored statement should be compared.
+    differing_statement = dict(statements[1], timestamp="2023-03-15T14:07:51Z")
+    response = await client.post(
+        "/xAPI/statements/",
+        headers={"Authorization": f"Basic {basic_auth_credentials}"},
+        json=[statements[0], differing_statement],
+    )
+    assert response.status_code == 409
+    assert response.json() == {
+        "detail": "Differing statements already exist with the same ID: "
+        f"{statements[1]['id']}"
+    }
+    assert compared_ids == [statements[1]["id"]]
+
+
+@pytest.mark.anyio
+async def test_api_statements_post_list_with_optimistic_writes(
+    client, basic_auth_credentials, fs_lrs_backend, monkeypatch
+):
+    """Test the post statements API route, given the `LRS_OPTIMISTIC_WRITES` setting
+    set to `True`, should only query stored statements conflicting with new ones.
+    """
+    backend = fs_lrs_backend()
+    queried_ids = []
+
+    def mock_query_statement_fingerprints(ids, target):
+        """Spy on the `FSLRSBackend.query_statement_fingerprints` method."""
+        queried_ids.append(ids)
+        return FSLRSBackend.query_statement_fingerprints(backend, ids, target)
+
+    monkeypatch.setattr(
+        "ralph.api.routers.statements.settings.LRS_OPTIMISTIC_WRITES", True
+    )
+    monkeypatch.setattr(
+        backend, "query_statement_fingerprints", mock_query_statement_fingerprints
+    )
+    monkeypatch.setattr("ralph.api.routers.statements.BACKEND_CLIENT", backend)
+    statements = [mock_statement(id_=str(uuid4())) for _ in range(3)]
+    response = await client.post(
+        "/xAPI/statements/",
+        headers={"Authorization": f"Basic {basic_auth_credentials}"},
+        json=statements[:2],
+    )
+    assert response.status_code == 200
+    assert response.json() == [statement["id"] for statement in statements[:2]]
+    assert not queried_ids
+
+    # Given a stored statement, only this statement should be queried.
+    response = await client.post(
+        "/xAPI/statements/",
+        headers={"Authorization": f"Basic {basic_auth_credentials}"},
+        json=statements[1:],
+    )
+    assert response.status_code == 200
+    assert response.json() == [statements[2]["id"]]
+    assert queried_ids == [[statements[1]["id"]]]
+
+    # Given a differing statement, a conflict should be returned.
+    differing_statement = dict(statements[0], timestamp="2023-03-15T14:07:51Z")
+    response = await client.post(
+        "/xAPI/statements/",
+        headers={"Authorization": f"Basic {basic_auth_credentials}"},
+        json=[differing_statement],
+    )
+    assert response.status_code == 409
+    assert response.json() == {
+        "detail": "Differing statements already exist with the same ID: "
+        f"{statements[0]['id']}"
+    }
+    assert len(backend.query_statements_by_ids([x["id"] for x in statements])) == 3
+
+
+@pytest.mark.anyio
+async def test_api_statements_post_with_es_index_period(
+    client, basic_auth_credentials, es, monkeypatch
+):
+    """Test the post statements API route, given the ES backend `INDEX_PERIOD`
+    setting, should reject statement ids already stored in another period index.
+    """
+    backend = ESLRSBackend(
+        ESLRSBackend.settings_class(
+            HOSTS=ES_TEST_HOSTS, DEFAULT_INDEX=ES_TEST_INDEX, INDEX_PERIOD="month"
+        )
+    )
+    monkeypatch.setattr(
+        "ralph.api.routers.statements.settings.LRS_OPTIMISTIC_WRITES", True
+    )
+    monkeypatch.setattr("ralph.api.routers.statements.BACKEND_CLIENT", backend)
+    statement = mock_statement(timestamp="2023-03-15T14:07:51Z")
+    try:
+        response = await client.post(
+            "/xAPI/statements/",
+            headers={"Authorization": f"Basic {basic_auth_credentials}"},
+            json=statement,
+        )
+        assert response.status_code == 200
+        es.indices.refresh(index=f"{ES_TEST_INDEX}-*")
+
+        # Given the same id in another period, a conflict should be returned.
+        differing_statement = dict(statement, timestamp="2023-04-15T14:07:51Z")
+        response = await client.post(
+            "/xAPI/statements/",
+            headers={"Authorization": f"Basic {basic_auth_credentials}"},
+            json=differing_statement,
+        )
+        assert response.status_code == 409
+
+        # Given an equivalent statement, no statement should be written.
+        response = await client.put(
+            f"/xAPI/statements/?statementId={statement['id']}",
+            headers={"Authorization": f"Basic {basic_auth_credentials}"},
+            json=statement,
+        )
+        assert response.status_code == 204
+        es.indices.refresh(index=f"{ES_TEST_INDEX}-*")
+        assert es.count(index=f"{ES_TEST_INDEX}-*")["count"] == 1
+    finally:
+        es.indices.delete(index=f"{ES_TEST_INDEX}-*")
+
+
 @pytest.mark.anyio
 @pytest.mark.parametrize(
     "backend",
@@ -521,6 +689,7 @@ async def test_api_statements_post_list_with_duplicate_of_existing_statement(  #
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -556,6 +725,7 @@ async def test_api_statements_post_with_failure_during_storage(  # noqa: PLR0913
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -564,13 +734,17 @@ async def test_api_statements_post_with_failure_during_id_query(  # noqa: PLR091
 ):
     """Test the post statements API route with a failure during query execution."""
 
-    def query_statements_by_ids_mock(*args, **kwargs):
-        """Raise an exception. Mock the database.query_statements_by_ids method."""
+    def query_statement_fingerprints_mock(*args, **kwargs):
+        """Raise an exception. Mock the database.query_statement_fingerprints
+        method.
+        """
         raise BackendException()
 
     backend_instance = backend()
     monkeypatch.setattr(
-        backend_instance, "query_statements_by_ids", query_statements_by_ids_mock
+        backend_instance,
+        "query_statement_fingerprints",
+        query_statement_fingerprints_mock,
     )
     monkeypatch.setattr("ralph.api.routers.statements.BACKEND_CLIENT", backend_instance)
     statement = mock_statement()
@@ -593,6 +767,7 @@ async def test_api_statements_post_with_failure_during_id_query(  # noqa: PLR091
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -27,6 +27,7 @@ from tests.fixtures.backends import (
     MONGO_TEST_FORWARDING_COLLECTION,
     RUNSERVER_TEST_HOST,
     RUNSERVER_TEST_PORT,
+    get_async_clickhouse_test_backend,
     get_async_es_test_backend,
     get_async_mongo_test_backend,
     get_clickhouse_test_backend,
@@ -66,6 +67,7 @@ async def test_api_statements_put_invalid_parameters(client, basic_auth_credenti
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -105,6 +107,7 @@ async def test_api_statements_put_single_statement_directly(  # noqa: PLR0913
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -268,6 +271,7 @@ async def test_api_statements_put_enriching_with_existing_values(  # noqa: PLR09
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -296,6 +300,7 @@ async def test_api_statements_put_single_statement_no_trailing_slash(  # noqa: P
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -327,6 +332,7 @@ async def test_api_statements_put_id_mismatch(  # noqa: PLR0913
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -354,6 +360,7 @@ async def test_api_statements_put_list_of_one(  # noqa: PLR0913
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -407,6 +414,7 @@ async def test_api_statements_put_duplicate_of_existing_statement(  # noqa: PLR0
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -442,6 +450,7 @@ async def test_api_statements_put_with_failure_during_storage(  # noqa: PLR0913
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
@@ -450,13 +459,17 @@ async def test_api_statements_put_with_a_failure_during_id_query(  # noqa: PLR09
 ):
     """Test the put statements API route with a failure during query execution."""
 
-    def query_statements_by_ids_mock(*args, **kwargs):
-        """Raise an exception. Mock the database.query_statements_by_ids method."""
+    def query_statement_fingerprints_mock(*args, **kwargs):
+        """Raise an exception. Mock the database.query_statement_fingerprints
+        method.
+        """
         raise BackendException()
 
     backend_instance = backend()
     monkeypatch.setattr(
-        backend_instance, "query_statements_by_ids", query_statements_by_ids_mock
+        backend_instance,
+        "query_statement_fingerprints",
+        query_statement_fingerprints_mock,
     )
     monkeypatch.setattr("ralph.api.routers.statements.BACKEND_CLIENT", backend_instance)
     statement = mock_statement()
@@ -479,6 +492,7 @@ async def test_api_statements_put_with_a_failure_during_id_query(  # noqa: PLR09
         get_async_mongo_test_backend,
         get_es_test_backend,
         get_clickhouse_test_backend,
+        get_async_clickhouse_test_backend,
         get_mongo_test_backend,
     ],
 )
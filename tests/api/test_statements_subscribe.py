@@ -0,0 +1,190 @@
+"""Tests for the subscribe statements endpoint of the Ralph API."""
+
+import asyncio
+import json
+
+import pytest
+
+from ralph.api import subscriptions
+
+from ..helpers import mock_statement
+
+
+def parse_events(text: str):
+    """Return the `statement` events data of a Server-Sent Events `text`."""
+    events = []
+    for event in text.split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in event.splitlines())
+        if lines.get("event") == "statement":
+            assert lines["id"] == json.loads(lines["data"])["id"]
+            events.append(json.loads(lines["data"]))
+    return events
+
+
+@pytest.mark.anyio
+async def test_api_statements_subscribe_disabled(client, basic_auth_credentials):
+    """Test the subscribe statements API route, given the `LRS_SUBSCRIPTIONS`
+    setting set to `False`, should return a 404 error.
+    """
+    response = await client.get(
+        "/xAPI/statements/subscribe",
+        headers={"Authorization": f"Basic {basic_auth_credentials}"},
+    )
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Statements subscriptions are disabled"}
+
+
+@pytest.mark.anyio
+async def test_api_statements_subscribe_invalid_parameters(
+    client, basic_auth_credentials, monkeypatch
+):
+    """Test the subscribe statements API route, given an unknown parameter, should
+    return a 400 error.
+    """
+    monkeypatch.setattr("ralph.api.routers.statements.settings.LRS_SUBSCRIPTIONS", True)
+    response = await client.get(
+        "/xAPI/statements/subscribe?since=2023-01-01",
+        headers={"Authorization": f"Basic {basic_auth_credentials}"},
+    )
+    assert response.status_code == 400
+    assert response.json() == {
+        "detail": "The following parameter is not allowed: `since`"
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("optimistic_writes", [False, True])
+async def test_api_statements_subscribe(
+    client, basic_auth_credentials, fs_lrs_backend, monkeypatch, optimistic_writes
+):
+    """Test the subscribe statements API route, should send newly stored statements
+    matching the query as Server-Sent Events.
+    """
+    monkeypatch.setattr("ralph.api.routers.statements.settings.LRS_SUBSCRIPTIONS", True)
+    monkeypatch.setattr(
+        "ralph.api.routers.statements.settings.LRS_OPTIMISTIC_WRITES",
+        optimistic_writes,
+    )
+    monkeypatch.setattr("ralph.api.routers.statements.BACKEND_CLIENT", fs_lrs_backend())
+    headers = {"Authorization": f"Basic {basic_auth_credentials}"}
+    statements = [mock_statement(verb=index % 2) for index in range(4)]
+    verb = statements[1]["verb"]["id"]
+    subscription = asyncio.create_task(
+        client.get(f"/xAPI/statements/subscribe?verb={verb}", headers=headers)
+    )
+    while not subscriptions.SUBSCRIPTIONS and not subscription.done():
+        await asyncio.sleep(0.01)
+
+    response = await client.post("/xAPI/statements/", headers=headers, json=statements)
+    assert response.status_code == 200
+
+    # Already stored statements should not be sent again.
+    response = await client.post("/xAPI/statements/", headers=headers, json=statements)
+    assert response.status_code == 204
+
+    subscriptions.close_subscriptions()
+    response = await subscription
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_events(response.text)
+    assert [event["id"] for event in events] == [
+        statements[1]["id"],
+        statements[3]["id"],
+    ]
+    assert all(event["stored"] and event["authority"] for event in events)
+    assert not subscriptions.SUBSCRIPTIONS
+
+
+@pytest.mark.anyio
+async def test_api_statements_subscribe_with_optimistic_writes_conflict(
+    client, basic_auth_credentials, fs_lrs_backend, monkeypatch
+):
+    """Test the subscribe statements API route, given the `LRS_OPTIMISTIC_WRITES`
+    setting set to `True` and statements posted along with a differing stored one,
+    should send the other statements, which are stored despite the 409 response.
+    """
+    monkeypatch.setattr("ralph.api.routers.statements.settings.LRS_SUBSCRIPTIONS", True)
+    monkeypatch.setattr(
+        "ralph.api.routers.statements.settings.LRS_OPTIMISTIC_WRITES", True
+    )
+    monkeypatch.setattr("ralph.api.routers.statements.BACKEND_CLIENT", fs_lrs_backend())
+    headers = {"Authorization": f"Basic {basic_auth_credentials}"}
+    statements = [mock_statement() for _ in range(2)]
+    response = await client.post(
+        "/xAPI/statements/", headers=headers, json=statements[:1]
+    )
+    assert response.status_code == 200
+
+    subscription = asyncio.create_task(
+        client.get("/xAPI/statements/subscribe", headers=headers)
+    )
+    while not subscriptions.SUBSCRIPTIONS and not subscription.done():
+        await asyncio.sleep(0.01)
+
+    differing_statement = dict(statements[0], timestamp="2023-03-15T14:07:51Z")
+    response = await client.post(
+        "/xAPI/statements/",
+        headers=headers,
+        json=[differing_statement, statements[1]],
+    )
+    assert response.status_code == 409
+
+    subscriptions.close_subscriptions()
+    response = await subscription
+    events = parse_events(response.text)
+    assert [event["id"] for event in events] == [statements[1]["id"]]
+
+
+@pytest.mark.anyio
+async def test_api_statements_subscribe_keep_alive(
+    client, basic_auth_credentials, monkeypatch
+):
+    """Test the subscribe statements API route, given no new statement within
+    `LRS_SUBSCRIPTIONS_KEEP_ALIVE` seconds, should send a comment.
+    """
+    monkeypatch.setattr("ralph.api.routers.statements.settings.LRS_SUBSCRIPTIONS", True)
+    monkeypatch.setattr(
+        "ralph.api.routers.statements.settings.LRS_SUBSCRIPTIONS_KEEP_ALIVE", 0.01
+    )
+    subscription = asyncio.create_task(
+        client.get(
+            "/xAPI/statements/subscribe",
+            headers={"Authorization": f"Basic {basic_auth_credentials}"},
+        )
+    )
+    while not subscriptions.SUBSCRIPTIONS and not subscription.done():
+        await asyncio.sleep(0.01)
+
+    await asyncio.sleep(0.05)
+    subscriptions.close_subscriptions()
+    response = await subscription
+    assert response.text.startswith(": keep-alive\n\n")
+
+
+@pytest.mark.anyio
+async def test_api_statements_subscribe_with_put(
+    client, basic_auth_credentials, fs_lrs_backend, monkeypatch
+):
+    """Test the subscribe statements API route, given a statement stored with the
+    put statements API route, should send it.
+    """
+    monkeypatch.setattr("ralph.api.routers.statements.settings.LRS_SUBSCRIPTIONS", True)
+    monkeypatch.setattr("ralph.api.routers.statements.BACKEND_CLIENT", fs_lrs_backend())
+    headers = {"Authorization": f"Basic {basic_auth_credentials}"}
+    subscription = asyncio.create_task(
+        client.get("/xAPI/statements/subscribe?mine=true", headers=headers)
+    )
+    while not subscriptions.SUBSCRIPTIONS and not subscription.done():
+        await asyncio.sleep(0.01)
+
+    statement = mock_statement()
+    response = await client.put(
+        f"/xAPI/statements/?statementId={statement['id']}",
+        headers=headers,
+        json=statement,
+    )
+    assert response.status_code == 204
+
+    subscriptions.close_subscriptions()
+    response = await subscription
+    assert [event["id"] for event in parse_events(response.text)] == [statement["id"]]
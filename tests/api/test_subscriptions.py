@@ -0,0 +1,84 @@
+"""Tests for the live xAPI statements subscriptions."""
+
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ralph.api import app, subscriptions
+from ralph.api.subscriptions import (
+    StatementsSubscription,
+    close_subscriptions,
+    publish_statements,
+    subscribe_statements,
+)
+from ralph.backends.lrs.base import AgentParameters, RalphStatementsQuery
+
+from ..helpers import mock_statement
+
+
+def test_api_subscriptions_statements_subscription_matches():
+    """Test the `StatementsSubscription.matches` method."""
+    statement = mock_statement(actor=1, verb=1, object=1)
+    params = RalphStatementsQuery.model_construct()
+    assert StatementsSubscription(params).matches(statement)
+
+    params = RalphStatementsQuery.model_construct(verb=statement["verb"]["id"])
+    assert StatementsSubscription(params).matches(statement)
+    assert not StatementsSubscription(params).matches(mock_statement(verb=2))
+
+    params = RalphStatementsQuery.model_construct(
+        agent=AgentParameters.model_construct(mbox=statement["actor"]["mbox"]),
+        activity=statement["object"]["id"],
+    )
+    assert StatementsSubscription(params).matches(statement)
+    assert not StatementsSubscription(params).matches(mock_statement(object=2))
+
+
+@pytest.mark.anyio
+async def test_api_subscriptions_publish_statements():
+    """Test the `publish_statements` function, should queue matching statements for
+    subscriptions with the same target.
+    """
+    statements = [mock_statement(verb=index % 2) for index in range(4)]
+    params = RalphStatementsQuery.model_construct(verb=statements[0]["verb"]["id"])
+    subscription = subscribe_statements(params)
+    other_subscription = subscribe_statements(params, target="foo")
+    publish_statements(statements, target=None)
+    close_subscriptions()
+
+    assert not subscriptions.SUBSCRIPTIONS
+    assert [x async for x in subscription.iter_statements()] == statements[::2]
+    assert not [x async for x in other_subscription.iter_statements()]
+
+
+@pytest.mark.anyio
+async def test_api_subscriptions_statements_subscription_overflow(monkeypatch, caplog):
+    """Test the `StatementsSubscription.put` method, given more than
+    `LRS_SUBSCRIPTIONS_QUEUE_SIZE` queued statements, should close the subscription.
+    """
+    monkeypatch.setattr(
+        "ralph.api.subscriptions.settings.LRS_SUBSCRIPTIONS_QUEUE_SIZE", 2
+    )
+    statements = [mock_statement() for _ in range(3)]
+    subscription = StatementsSubscription(RalphStatementsQuery.model_construct())
+    with caplog.at_level(logging.WARNING):
+        for statement in statements:
+            subscription.put(statement)
+
+    assert subscription.closed
+    assert [x async for x in subscription.iter_statements()] == statements[:2]
+    assert (
+        "ralph.api.subscriptions",
+        logging.WARNING,
+        "Closing a statements subscription not keeping up",
+    ) in caplog.record_tuples
+
+
+def test_api_subscriptions_closed_on_shutdown():
+    """Test the API application shutdown, should close statements subscriptions."""
+    with TestClient(app):
+        subscription = subscribe_statements(RalphStatementsQuery.model_construct())
+
+    assert subscription.closed
+    assert not subscriptions.SUBSCRIPTIONS
@@ -0,0 +1,313 @@
+"""Tests for Ralph's async clickhouse data backend."""
+
+import json
+import logging
+import re
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+import pytest
+from clickhouse_connect.driver.asyncclient import AsyncClient
+from clickhouse_connect.driver.common import StreamContext
+from clickhouse_connect.driver.exceptions import ClickHouseError
+
+from ralph.backends.data.async_clickhouse import AsyncClickHouseDataBackend
+from ralph.backends.data.base import BaseOperationType, DataBackendStatus
+from ralph.backends.data.clickhouse import (
+    ClickHouseClientOptions,
+    ClickHouseDataBackendSettings,
+    ClickHouseQuery,
+)
+from ralph.exceptions import BackendException, BackendParameterException
+
+from tests.fixtures.backends import CLICKHOUSE_TEST_TABLE_NAME
+
+
+def mock_async_client(**methods):
+    """Return an object mocking the `AsyncClient` with async `methods`."""
+
+    def to_coroutine_function(method):
+        async def coroutine_function(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return coroutine_function
+
+    methods = {name: to_coroutine_function(method) for name, method in methods.items()}
+    return namedtuple("MockAsyncClient", methods)(**methods)
+
+
+def test_backends_data_async_clickhouse_default_instantiation(monkeypatch, fs):
+    """Test the `AsyncClickHouseDataBackend` default instantiation."""
+    fs.create_file(".env")
+    backend_settings_names = [
+        "HOST",
+        "PORT",
+        "DATABASE",
+        "EVENT_TABLE_NAME",
+        "USERNAME",
+        "PASSWORD",
+        "CLIENT_OPTIONS",
+        "LOCALE_ENCODING",
+        "POOL_SIZE",
+        "READ_CHUNK_SIZE",
+        "WRITE_CHUNK_SIZE",
+        "WRITE_CONCURRENCY",
+    ]
+    for name in backend_settings_names:
+        monkeypatch.delenv(f"RALPH_BACKENDS__DATA__CLICKHOUSE__{name}", raising=False)
+
+    assert AsyncClickHouseDataBackend.name == "async_clickhouse"
+    assert AsyncClickHouseDataBackend.query_class == ClickHouseQuery
+    assert AsyncClickHouseDataBackend.default_operation_type == BaseOperationType.CREATE
+    assert AsyncClickHouseDataBackend.settings_class == ClickHouseDataBackendSettings
+    backend = AsyncClickHouseDataBackend()
+    assert backend.database == "xapi"
+    assert backend.settings.CLIENT_OPTIONS == ClickHouseClientOptions()
+    assert backend.settings.EVENT_TABLE_NAME == "xapi_events_all"
+    assert backend.settings.POOL_SIZE == 8
+    assert backend.settings.WRITE_CONCURRENCY == 1
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_clickhouse_status(
+    clickhouse, async_clickhouse_backend, monkeypatch
+):
+    """Test the `AsyncClickHouseDataBackend.status` method."""
+    backend = async_clickhouse_backend()
+    assert await backend.status() == DataBackendStatus.OK
+    assert isinstance(await backend.get_client(), AsyncClient)
+
+    def mock_query(*_, **__):
+        """Mock the AsyncClient.query method."""
+        raise ClickHouseError("Something is wrong")
+
+    monkeypatch.setattr(backend, "_client", mock_async_client(query=mock_query))
+    assert await backend.status() == DataBackendStatus.AWAY
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_clickhouse_list(
+    clickhouse, async_clickhouse_backend
+):
+    """Test the `AsyncClickHouseDataBackend.list` method."""
+    backend = async_clickhouse_backend()
+    assert [table async for table in backend.list()] == [CLICKHOUSE_TEST_TABLE_NAME]
+    tables = [table async for table in backend.list(details=True)]
+    assert tables[0]["name"] == CLICKHOUSE_TEST_TABLE_NAME
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_clickhouse_read(
+    clickhouse, async_clickhouse_backend
+):
+    """Test the `AsyncClickHouseDataBackend.read` method."""
+    date_1 = (datetime.now() - timedelta(seconds=3)).isoformat()
+    date_2 = (datetime.now() - timedelta(seconds=2)).isoformat()
+    date_3 = (datetime.now() - timedelta(seconds=1)).isoformat()
+    statements = [
+        {"id": str(uuid.uuid4()), "bool": 1, "timestamp": date_1},
+        {"id": str(uuid.uuid4()), "bool": 0, "timestamp": date_2},
+        {"id": str(uuid.uuid4()), "bool": 1, "timestamp": date_3},
+    ]
+
+    backend = async_clickhouse_backend()
+    assert await backend.write(statements) == 3
+
+    results = [document async for document in backend.read(chunk_size=2)]
+    assert [result["event"] for result in results] == statements
+
+    results = [document async for document in backend.read(prefetch=2)]
+    assert [result["event"] for result in results] == statements
+
+    query = ClickHouseQuery(
+        where="JSONExtractBool(event, 'bool') = {event_bool:Bool}",
+        parameters={"event_bool": 0},
+    )
+    results = [document async for document in backend.read(query=query)]
+    assert [result["event"] for result in results] == [statements[1]]
+
+    results = [document async for document in backend.read(raw_output=True)]
+    assert [json.loads(result)["event"] for result in results] == statements
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_clickhouse_read_by_blocks():
+    """Test the `AsyncClickHouseDataBackend.read` method, given a result streamed by
+    blocks, should yield documents one block at a time.
+    """
+    blocks = [
+        [("foo", '{"id": "foo"}')],
+        [("bar", '{"id": "bar"}')],
+    ]
+    streamed_blocks = []
+
+    def mock_query_row_block_stream(sql, parameters, settings):
+        """Mock the `AsyncClient.query_row_block_stream` method."""
+        assert sql == "SELECT event_id,event FROM xapi_events_all"
+        assert settings == {"max_block_size": 1}
+
+        def get_blocks():
+            for block in blocks:
+                streamed_blocks.append(block)
+                yield block
+
+        source = namedtuple("_", "column_names close")(
+            ["event_id", "event"], lambda: None
+        )
+        return StreamContext(source, get_blocks())
+
+    backend = AsyncClickHouseDataBackend()
+    backend._client = mock_async_client(
+        query_row_block_stream=mock_query_row_block_stream
+    )
+    query = ClickHouseQuery(select=["event_id", "event"])
+    documents = backend.read(query=query, chunk_size=1)
+    assert await documents.__anext__() == {"event_id": "foo", "event": {"id": "foo"}}
+    assert streamed_blocks == blocks[:1]
+    assert [document async for document in documents] == [
+        {"event_id": "bar", "event": {"id": "bar"}}
+    ]
+
+    documents = backend.read(query=query, chunk_size=1, raw_output=True)
+    assert [document async for document in documents] == [
+        b'{"event_id": "foo", "event": {"id": "foo"}}\n',
+        b'{"event_id": "bar", "event": {"id": "bar"}}\n',
+    ]
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_clickhouse_read_with_failures(caplog):
+    """Test the `AsyncClickHouseDataBackend.read` method, given a ClickHouse error,
+    should raise a `BackendException` even when ignoring errors.
+    """
+
+    def mock_query_row_block_stream(*_, **__):
+        """Mock the `AsyncClient.query_row_block_stream` method."""
+        raise ClickHouseError("Something is wrong")
+
+    backend = AsyncClickHouseDataBackend()
+    backend._client = mock_async_client(
+        query_row_block_stream=mock_query_row_block_stream
+    )
+    msg = "Failed to read documents: Something is wrong"
+    with caplog.at_level(logging.ERROR):
+        with pytest.raises(BackendException, match=re.escape(msg)):
+            _ = [document async for document in backend.read(ignore_errors=True)]
+
+    assert (
+        "ralph.backends.data.async_clickhouse",
+        logging.ERROR,
+        msg,
+    ) in caplog.record_tuples
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_clickhouse_write(
+    clickhouse, async_clickhouse_backend
+):
+    """Test the `AsyncClickHouseDataBackend.write` method with concurrency."""
+    timestamp = datetime.now().isoformat()
+    statements = [{"id": str(uuid.uuid4()), "timestamp": timestamp} for _ in range(10)]
+
+    backend = async_clickhouse_backend()
+    assert await backend.write(statements, chunk_size=3, concurrency=2) == 10
+
+    sql = f"SELECT event FROM {CLICKHOUSE_TEST_TABLE_NAME}"
+    result = clickhouse.query(sql).result_rows
+    assert sorted(json.loads(row[0])["id"] for row in result) == sorted(
+        statement["id"] for statement in statements
+    )
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_clickhouse_write_with_column_oriented_batches():
+    """Test the `AsyncClickHouseDataBackend.write` method, should insert column
+    oriented batches concurrently and describe the target table only once.
+    """
+    timestamp = datetime.now().isoformat()
+    statements = [{"id": str(uuid.uuid4()), "timestamp": timestamp} for _ in range(5)]
+    inserts = []
+    insert_contexts = []
+
+    def mock_insert(table, data, **kwargs):
+        """Mock the `AsyncClient.insert` method."""
+        assert table == "xapi_events_all"
+        assert kwargs["column_types"] == ["types"]
+        assert kwargs["column_oriented"]
+        inserts.append(data)
+
+    def mock_create_insert_context(table, column_names):
+        """Mock the `AsyncClient.create_insert_context` method."""
+        insert_contexts.append((table, column_names))
+        return namedtuple("_", "column_types")(["types"])
+
+    backend = AsyncClickHouseDataBackend()
+    backend._client = mock_async_client(
+        insert=mock_insert, create_insert_context=mock_create_insert_context
+    )
+    assert await backend.write(statements, chunk_size=2, concurrency=2) == 5
+    assert len(insert_contexts) == 1
+    assert sorted(len(data.event_id) for data in inserts) == [1, 2, 2]
+    assert sorted(event for data in inserts for event in data.event) == sorted(
+        json.dumps(statement) for statement in statements
+    )
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_clickhouse_write_with_duplicated_key(
+    clickhouse, async_clickhouse_backend
+):
+    """Test the `AsyncClickHouseDataBackend.write` method, given duplicated ids,
+    should raise a `BackendException` unless errors are ignored.
+    """
+    statement = {"id": str(uuid.uuid4()), "timestamp": datetime.now().isoformat()}
+    backend = async_clickhouse_backend()
+    with pytest.raises(BackendException, match="Duplicate IDs found in batch"):
+        await backend.write([statement, statement])
+
+    assert await backend.write([statement, statement], ignore_errors=True) == 0
+    await backend.close()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "operation_type",
+    [BaseOperationType.APPEND, BaseOperationType.DELETE, BaseOperationType.UPDATE],
+)
+async def test_backends_data_async_clickhouse_write_wrong_operation_type(
+    operation_type,
+):
+    """Test the `AsyncClickHouseDataBackend.write` method, given an unsupported
+    `operation_type`, should raise a `BackendParameterException`.
+    """
+    backend = AsyncClickHouseDataBackend()
+    msg = f"{operation_type.value.capitalize()} operation_type is not allowed"
+    with pytest.raises(BackendParameterException, match=msg):
+        await backend.write([{}], operation_type=operation_type)
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_clickhouse_close(caplog):
+    """Test the `AsyncClickHouseDataBackend.close` method."""
+    backend = AsyncClickHouseDataBackend()
+    with caplog.at_level(logging.WARNING):
+        await backend.close()
+
+    assert (
+        "ralph.backends.data.async_clickhouse",
+        logging.WARNING,
+        "No backend client to close.",
+    ) in caplog.record_tuples
+
+    def mock_close():
+        """Mock the `AsyncClient.close` method."""
+        raise ClickHouseError("Something is wrong")
+
+    backend._client = namedtuple("_", "close")(mock_close)
+    msg = "Failed to close ClickHouse client: Something is wrong"
+    with pytest.raises(BackendException, match=msg):
+        await backend.close()
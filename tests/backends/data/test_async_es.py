@@ -47,6 +47,7 @@ async def test_backends_data_async_es_default_instantiation(monkeypatch, fs):
         "POINT_IN_TIME_KEEP_ALIVE",
         "WRITE_CHUNK_SIZE",
         "REFRESH_AFTER_WRITE",
+        "WRITE_CONCURRENCY",
     ]
     for name in backend_settings_names:
         monkeypatch.delenv(f"RALPH_BACKENDS__DATA__ES__{name}", raising=False)
@@ -533,6 +534,77 @@ async def test_backends_data_async_es_write_with_concurrency(
     assert await backend.write([b"bar"], concurrency=4) == 3
 
 
+@pytest.mark.parametrize("ordered_slices", [False, True])
+@pytest.mark.anyio
+async def test_backends_data_async_es_read_with_slices(
+    ordered_slices, async_es_backend, monkeypatch
+):
+    """Test the `AsyncESDataBackend.read` method, given a query with `slices`, should
+    read each slice of the point in time concurrently and yield all documents.
+    """
+    searched_slices = set()
+
+    async def mock_open_point_in_time(**_):
+        """Mock the AsyncES.client.open_point_in_time method."""
+        return {"id": "pit"}
+
+    async def mock_search(**kwargs):
+        """Mock the AsyncES.client.search method returning the documents of one
+        slice.
+        """
+        assert kwargs["pit"] == {"id": "pit", "keep_alive": "1m"}
+        assert "slices" not in kwargs
+        slice_id = kwargs["slice"]["id"]
+        searched_slices.add(slice_id)
+        # Slice `n` holds the documents `29 - n`, `26 - n`, ... down to 0.
+        search_after = kwargs["search_after"]
+        start = int(search_after[0]) - 3 if search_after else 29 - slice_id
+        sorts = range(start, -1, -3)[: kwargs["size"]]
+        return {"hits": {"hits": [{"_id": str(i), "sort": [i]} for i in sorts]}}
+
+    backend = async_es_backend()
+    monkeypatch.setattr(backend.client, "open_point_in_time", mock_open_point_in_time)
+    monkeypatch.setattr(backend.client, "search", mock_search)
+    query = ESQuery(
+        slices=3, ordered_slices=ordered_slices, sort=[{"timestamp": "desc"}]
+    )
+    documents = [
+        document["sort"][0] async for document in backend.read(query, chunk_size=4)
+    ]
+
+    assert searched_slices == {0, 1, 2}
+    if ordered_slices:
+        assert documents == list(range(29, -1, -1))
+    else:
+        assert sorted(documents) == list(range(30))
+
+    # Given a query with a `size`, the read method should stop after `size` documents.
+    query = ESQuery(
+        slices=3, ordered_slices=ordered_slices, sort="timestamp:desc", size=7
+    )
+    documents = [
+        document["sort"][0] async for document in backend.read(query, chunk_size=4)
+    ]
+    assert len(documents) == 7
+    if ordered_slices:
+        assert documents == list(range(29, 22, -1))
+
+    # Given a search failure in one of the slices, the read method should raise a
+    # `BackendException`.
+    async def mock_search_failure(**kwargs):
+        """Mock the AsyncES.client.search method failing for the second slice."""
+        if kwargs["slice"]["id"] == 1:
+            raise ESConnectionError("")
+        return {"hits": {"hits": []}}
+
+    monkeypatch.setattr(backend.client, "search", mock_search_failure)
+    msg = "Failed to execute Elasticsearch query: Connection error"
+    with pytest.raises(BackendException, match=msg):
+        _ = [document async for document in backend.read(ESQuery(slices=2))]
+
+    await backend.close()
+
+
 @pytest.mark.anyio
 async def test_backends_data_async_es_write_with_create_operation(
     es, async_es_backend, caplog
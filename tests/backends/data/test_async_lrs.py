@@ -2,6 +2,7 @@
 
 import asyncio
 import datetime
+import gzip
 import json
 import logging
 import re
@@ -31,11 +32,21 @@ def test_backends_data_async_lrs_default_instantiation(monkeypatch, fs, lrs_back
         "USERNAME",
         "PASSWORD",
         "HEADERS",
+        "HTTP2",
         "LOCALE_ENCODING",
+        "POOL_SIZE",
+        "READ_AHEAD",
         "READ_CHUNK_SIZE",
+        "READ_PARTITIONS",
+        "READ_PARTITIONS_ORDERED",
+        "READ_PARTITIONS_SPLIT_DEPTH",
         "STATUS_ENDPOINT",
         "STATEMENTS_ENDPOINT",
         "WRITE_CHUNK_SIZE",
+        "WRITE_CONCURRENCY",
+        "WRITE_GZIP",
+        "WRITE_RETRIES",
+        "WRITE_RETRY_BACKOFF",
     ]
     for name in backend_settings_names:
         monkeypatch.delenv(f"RALPH_BACKENDS__DATA__LRS__{name}", raising=False)
@@ -56,6 +67,16 @@ def test_backends_data_async_lrs_default_instantiation(monkeypatch, fs, lrs_back
     assert backend.settings.STATUS_ENDPOINT == "/__heartbeat__"
     assert backend.settings.STATEMENTS_ENDPOINT == "/xAPI/statements"
     assert backend.settings.WRITE_CHUNK_SIZE == 500
+    assert not backend.settings.HTTP2
+    assert backend.settings.POOL_SIZE == 10
+    assert backend.settings.READ_AHEAD == 0
+    assert backend.settings.READ_PARTITIONS == 1
+    assert backend.settings.READ_PARTITIONS_ORDERED
+    assert backend.settings.READ_PARTITIONS_SPLIT_DEPTH == 0
+    assert backend.settings.WRITE_CONCURRENCY == 1
+    assert not backend.settings.WRITE_GZIP
+    assert backend.settings.WRITE_RETRIES == 0
+    assert backend.settings.WRITE_RETRY_BACKOFF == 0.5
 
     # Test overriding default values with environment variables.
     monkeypatch.setenv("RALPH_BACKENDS__DATA__LRS__USERNAME", "foo")
@@ -331,6 +352,60 @@ async def test_backends_data_async_lrs_read_with_pagination(
     await backend.close()
 
 
+@pytest.mark.anyio
+@pytest.mark.parametrize("read_ahead", [1, 2])
+async def test_backends_data_async_lrs_read_with_read_ahead(
+    httpx_mock: HTTPXMock, lrs_backend, read_ahead
+):
+    """Test the LRS backend `read` method, given `READ_AHEAD`, should yield the
+    statements of all pages in order and stop fetching pages once closed.
+    """
+    backend: AsyncLRSDataBackend = lrs_backend()
+    backend.settings.READ_AHEAD = read_ahead
+    pages = [[mock_statement() for _ in range(2)] for _ in range(3)]
+    url = "http://fake-lrs.com/xAPI/statements/?limit=2"
+    for index, statements in enumerate(pages):
+        response = {"statements": statements}
+        if index < len(pages) - 1:
+            response["more"] = f"/xAPI/statements/?pit_id=pit_{index + 1}"
+        page_url = f"{url}&pit_id=pit_{index}" if index else url
+        httpx_mock.add_response(
+            url=page_url, method="GET", json=response, is_reusable=True
+        )
+
+    result = [x async for x in backend.read(chunk_size=2)]
+    assert result == [statement for statements in pages for statement in statements]
+
+    reader = backend.read(chunk_size=2)
+    assert await reader.__anext__() == pages[0][0]
+    await reader.aclose()
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_lrs_read_with_read_ahead_error(
+    httpx_mock: HTTPXMock, lrs_backend
+):
+    """Test the LRS backend `read` method, given `READ_AHEAD` and a failing next
+    page request, should yield the current page and raise a `BackendException`.
+    """
+    backend: AsyncLRSDataBackend = lrs_backend()
+    backend.settings.READ_AHEAD = 1
+    statements = [mock_statement()]
+    url = "http://fake-lrs.com/xAPI/statements/?limit=500"
+    response = {"statements": statements, "more": "/xAPI/statements/?pit_id=pit_id"}
+    httpx_mock.add_response(url=url, method="GET", json=response)
+    httpx_mock.add_response(url=f"{url}&pit_id=pit_id", method="GET", status_code=500)
+
+    result = []
+    with pytest.raises(BackendException, match="500 Internal Server Error"):
+        async for statement in backend.read():
+            result.append(statement)
+
+    assert result == statements
+    await backend.close()
+
+
 @pytest.mark.anyio
 async def test_backends_data_async_lrs_read_with_pagination_with_query(
     httpx_mock: HTTPXMock, lrs_backend
@@ -410,6 +485,156 @@ async def test_backends_data_async_lrs_read_with_query_dates(
     await backend.close()
 
 
+def test_backends_data_async_lrs_get_time_windows():
+    """Test the `LRSDataBackend.get_time_windows` method."""
+    since = "2024-01-01T00:00:00+00:00"
+    until = "2024-01-04T00:00:00+00:00"
+    windows = [
+        ("2024-01-01T00:00:00+00:00", "2024-01-02T00:00:00+00:00"),
+        ("2024-01-02T00:00:00+00:00", "2024-01-03T00:00:00+00:00"),
+        ("2024-01-03T00:00:00+00:00", "2024-01-04T00:00:00+00:00"),
+    ]
+    assert LRSDataBackend.get_time_windows(since, until, 3, True) == windows
+    assert LRSDataBackend.get_time_windows(since, until, 3, False) == windows[::-1]
+    assert LRSDataBackend.get_time_windows(since, until, 1, True) == [(since, until)]
+
+
+def test_backends_data_async_lrs_get_time_windows_with_mixed_time_zones():
+    """Test the `LRSDataBackend.get_time_windows` method, given a naive and an aware
+    bound, should consider the naive bound to be in UTC.
+    """
+    since = "2024-01-01T00:00:00"
+    until = "2024-01-03T00:00:00+00:00"
+    assert LRSDataBackend.get_time_windows(since, until, 2, True) == [
+        (since, "2024-01-02T00:00:00+00:00"),
+        ("2024-01-02T00:00:00+00:00", until),
+    ]
+
+    msg = "Invalid `since` or `until` query parameter"
+    with pytest.raises(BackendParameterException, match=msg):
+        LRSDataBackend.get_time_windows("foo", until, 2, True)
+
+
+def add_time_window_response(httpx_mock, since, until, statements, more=None, **params):
+    """Mock the response of the LRS statements endpoint for a time window."""
+    url = httpx.URL(
+        "http://fake-lrs.com/xAPI/statements/",
+        params={"limit": 500, "since": since, "until": until, **params},
+    )
+    response = {"statements": statements}
+    if more:
+        response["more"] = more
+    httpx_mock.add_response(url=url, method="GET", json=response)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("ordered", [True, False])
+@pytest.mark.parametrize("read_ahead", [0, 2])
+async def test_backends_data_async_lrs_read_with_partitions(
+    httpx_mock: HTTPXMock, lrs_backend, ordered, read_ahead
+):
+    """Test the LRS backend `read` method, given `READ_PARTITIONS`, should read the
+    time windows of the `since`/`until` range concurrently.
+    """
+    backend: AsyncLRSDataBackend = lrs_backend()
+    backend.settings.READ_PARTITIONS = 2
+    backend.settings.READ_PARTITIONS_ORDERED = ordered
+    backend.settings.READ_AHEAD = read_ahead
+    first_day = "2024-01-01T00:00:00+00:00"
+    second_day = "2024-01-02T00:00:00+00:00"
+    third_day = "2024-01-03T00:00:00+00:00"
+    first_statements = [mock_statement() for _ in range(2)]
+    second_statements = [mock_statement() for _ in range(2)]
+    add_time_window_response(httpx_mock, first_day, second_day, first_statements)
+    add_time_window_response(httpx_mock, second_day, third_day, second_statements)
+
+    query = LRSStatementsQuery(since=first_day, until=third_day)
+    result = [x async for x in backend.read(query=query)]
+    if ordered:
+        # Statements are returned in reverse chronological order by default.
+        assert result == second_statements + first_statements
+    else:
+        assert sorted(statement["id"] for statement in result) == sorted(
+            statement["id"] for statement in first_statements + second_statements
+        )
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_lrs_read_with_partitions_split(
+    httpx_mock: HTTPXMock, lrs_backend
+):
+    """Test the LRS backend `read` method, given `READ_PARTITIONS_SPLIT_DEPTH`,
+    should split in two halves the time windows having more than one page.
+    """
+    backend: AsyncLRSDataBackend = lrs_backend()
+    backend.settings.READ_PARTITIONS = 2
+    backend.settings.READ_PARTITIONS_SPLIT_DEPTH = 1
+    first_day = "2024-01-01T00:00:00+00:00"
+    second_day = "2024-01-02T00:00:00+00:00"
+    second_day_noon = "2024-01-02T12:00:00+00:00"
+    third_day = "2024-01-03T00:00:00+00:00"
+    statements = [mock_statement() for _ in range(3)]
+    windows = [
+        (first_day, second_day, statements[:1], None),
+        (second_day, third_day, [], "/xAPI/statements/?pit_id=foo"),
+        (second_day, second_day_noon, statements[1:2], None),
+        (second_day_noon, third_day, statements[2:], None),
+    ]
+    for since, until, window_statements, more in windows:
+        add_time_window_response(
+            httpx_mock, since, until, window_statements, more, ascending="true"
+        )
+
+    query = LRSStatementsQuery(since=first_day, until=third_day, ascending=True)
+    result = [x async for x in backend.read(query=query)]
+    assert result == statements
+    assert len(httpx_mock.get_requests()) == 4
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_lrs_read_with_partitions_failures(
+    httpx_mock: HTTPXMock, lrs_backend, caplog
+):
+    """Test the LRS backend `read` method, given `READ_PARTITIONS` and a query
+    without `since` and `until`, should read statements sequentially and, given a
+    failing time window, should raise a `BackendException`.
+    """
+    backend: AsyncLRSDataBackend = lrs_backend()
+    backend.settings.READ_PARTITIONS = 2
+    statements = [mock_statement()]
+    url = "http://fake-lrs.com/xAPI/statements/?limit=500"
+    httpx_mock.add_response(url=url, method="GET", json={"statements": statements})
+    with caplog.at_level(logging.WARNING):
+        assert [x async for x in backend.read()] == statements
+
+    assert (
+        f"ralph.backends.data.{backend.name}",
+        logging.WARNING,
+        "Reading statements sequentially as the query has no `since` and `until` "
+        "parameters",
+    ) in caplog.record_tuples
+
+    first_day = "2024-01-01T00:00:00+00:00"
+    second_day = "2024-01-02T00:00:00+00:00"
+    third_day = "2024-01-03T00:00:00+00:00"
+    add_time_window_response(httpx_mock, first_day, second_day, statements)
+    httpx_mock.add_response(
+        url=httpx.URL(
+            "http://fake-lrs.com/xAPI/statements/",
+            params={"limit": 500, "since": second_day, "until": third_day},
+        ),
+        method="GET",
+        status_code=500,
+    )
+    query = LRSStatementsQuery(since=first_day, until=third_day)
+    with pytest.raises(BackendException, match="500 Internal Server Error"):
+        _ = [x async for x in backend.read(query=query)]
+
+    await backend.close()
+
+
 @pytest.mark.anyio
 @pytest.mark.parametrize(
     "chunk_size,concurrency,statement_count_logs",
@@ -678,6 +903,116 @@ async def test_backends_data_async_lrs_write_with_post_exception(
     await backend.close()
 
 
+@pytest.mark.anyio
+async def test_backends_data_async_lrs_write_with_retries(
+    httpx_mock: HTTPXMock, lrs_backend, caplog
+):
+    """Test the LRS backend `write` method, given `WRITE_RETRIES`, should retry
+    posting chunks failing with a `429` or `5xx` status and not retry other errors.
+    """
+    backend: AsyncLRSDataBackend = lrs_backend()
+    backend.settings.WRITE_RETRIES = 2
+    backend.settings.WRITE_RETRY_BACKOFF = 0
+    data = [mock_statement()]
+
+    url = "http://fake-lrs.com/xAPI/statements/"
+    httpx_mock.add_response(url=url, method="POST", status_code=503)
+    httpx_mock.add_response(
+        url=url, method="POST", status_code=429, headers={"Retry-After": "0"}
+    )
+    httpx_mock.add_response(url=url, method="POST", json=data)
+    with caplog.at_level(logging.WARNING):
+        assert await backend.write(data=data) == 1
+
+    assert len(httpx_mock.get_requests()) == 3
+    assert (
+        f"ralph.backends.data.{backend.name}",
+        logging.WARNING,
+        (
+            "Retrying to post statements in 0.0s: Client error '429 Too Many "
+            f"Requests' for url '{url}'\nFor more information check: "
+            "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/429"
+        ),
+    ) in caplog.record_tuples
+
+    # Client errors are not retried.
+    httpx_mock.add_response(url=url, method="POST", status_code=400)
+    with pytest.raises(BackendException, match="400 Bad Request"):
+        await backend.write(data=data)
+
+    assert len(httpx_mock.get_requests()) == 4
+
+    # Retries are bounded by `WRITE_RETRIES`.
+    httpx_mock.add_response(url=url, method="POST", status_code=500, is_reusable=True)
+    with pytest.raises(BackendException, match="500 Internal Server Error"):
+        await backend.write(data=data)
+
+    assert len(httpx_mock.get_requests()) == 7
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_lrs_write_with_gzip(
+    httpx_mock: HTTPXMock, lrs_backend
+):
+    """Test the LRS backend `write` method, given `WRITE_GZIP`, should post
+    gzip-compressed chunks of statements.
+    """
+    backend: AsyncLRSDataBackend = lrs_backend()
+    backend.settings.WRITE_GZIP = True
+    data = [mock_statement() for _ in range(3)]
+
+    httpx_mock.add_response(
+        url="http://fake-lrs.com/xAPI/statements/",
+        method="POST",
+        match_headers={"Content-Encoding": "gzip"},
+        is_reusable=True,
+    )
+    assert await backend.write(data=data, chunk_size=2) == 3
+
+    requests = httpx_mock.get_requests()
+    assert [json.loads(gzip.decompress(request.content)) for request in requests] == [
+        data[:2],
+        data[2:],
+    ]
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_lrs_write_with_concurrency(
+    httpx_mock: HTTPXMock, lrs_backend
+):
+    """Test the LRS backend `write` method, given a `concurrency` argument, should
+    post all chunks of statements.
+    """
+    backend: AsyncLRSDataBackend = lrs_backend()
+    data = [mock_statement() for _ in range(7)]
+
+    httpx_mock.add_response(
+        url="http://fake-lrs.com/xAPI/statements/", method="POST", is_reusable=True
+    )
+    assert await backend.write(data=data, chunk_size=2, concurrency=3) == 7
+
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 4
+    assert sorted(
+        statement["id"]
+        for request in requests
+        for statement in json.loads(request.content)
+    ) == sorted(statement["id"] for statement in data)
+
+    msg = "concurrency must be a strictly positive integer"
+    with pytest.raises(BackendParameterException, match=msg):
+        await backend.write(data=data, concurrency=-1)
+
+    # Given `concurrency` is set to zero, the write method should not fall back to
+    # the `WRITE_CONCURRENCY` setting.
+    with pytest.raises(BackendParameterException, match=msg):
+        await backend.write(data=data, concurrency=0)
+
+    await backend.close()
+
+
 # Asynchronicity tests for dev purposes (skip in CI)
 
 
@@ -807,3 +1142,52 @@ async def test_backends_data_async_lrs_write_concurrency(
     # Server side processing time should be 3 times faster with unlimited
     assert limited_concurrency_duration > 2.1 * concurrent_duration
     assert limited_concurrency_duration <= 3.1 * concurrent_duration
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_lrs_read_with_partitions_pool_size(
+    httpx_mock: HTTPXMock, lrs_backend
+):
+    """Test the LRS backend `read` method, given more `READ_PARTITIONS` than
+    `POOL_SIZE`, should fetch at most `POOL_SIZE` pages at once.
+    """
+    backend: AsyncLRSDataBackend = lrs_backend()
+    backend.settings.READ_PARTITIONS = 4
+    backend.settings.READ_PARTITIONS_ORDERED = False
+    backend.settings.POOL_SIZE = 2
+    days = [f"2024-01-0{day}T00:00:00+00:00" for day in range(1, 6)]
+    statements = [mock_statement() for _ in days[1:]]
+    for since, until, statement in zip(days[:-1], days[1:], statements):
+        add_time_window_response(httpx_mock, since, until, [statement])
+
+    fetching = []
+    peak = 0
+    fetch_page = backend._fetch_page
+    if isinstance(backend, AsyncLRSDataBackend):
+
+        async def mock_fetch_page(*args):
+            """Track the number of pages fetched at once."""
+            nonlocal peak
+            fetching.append(args)
+            peak = max(peak, len(fetching))
+            await asyncio.sleep(0.01)
+            fetching.pop()
+            return await fetch_page(*args)
+
+    else:
+
+        def mock_fetch_page(*args):
+            """Track the number of pages fetched at once."""
+            nonlocal peak
+            fetching.append(args)
+            peak = max(peak, len(fetching))
+            time.sleep(0.01)
+            fetching.pop()
+            return fetch_page(*args)
+
+    backend._fetch_page = mock_fetch_page
+    query = LRSStatementsQuery(since=days[0], until=days[-1])
+    result = [x async for x in backend.read(query=query)]
+    assert sorted(x["id"] for x in result) == sorted(x["id"] for x in statements)
+    assert peak == 2
+    await backend.close()
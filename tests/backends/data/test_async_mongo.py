@@ -38,6 +38,10 @@ async def test_backends_data_async_mongo_default_instantiation(monkeypatch, fs):
         "LOCALE_ENCODING",
         "READ_CHUNK_SIZE",
         "WRITE_CHUNK_SIZE",
+        "WRITE_CONCERN",
+        "WRITE_CONCURRENCY",
+        "WRITE_JOURNAL",
+        "WRITE_ORDERED",
     ]
     for name in backend_settings_names:
         monkeypatch.delenv(f"RALPH_BACKENDS__DATA__MONGO__{name}", raising=False)
@@ -55,6 +59,10 @@ async def test_backends_data_async_mongo_default_instantiation(monkeypatch, fs):
     assert backend.settings.LOCALE_ENCODING == "utf8"
     assert backend.settings.READ_CHUNK_SIZE == 500
     assert backend.settings.WRITE_CHUNK_SIZE == 500
+    assert backend.settings.WRITE_CONCERN is None
+    assert backend.settings.WRITE_CONCURRENCY == 1
+    assert backend.settings.WRITE_JOURNAL is None
+    assert backend.settings.WRITE_ORDERED
 
     # Test overriding default values with environment variables.
     monkeypatch.setenv("RALPH_BACKENDS__DATA__MONGO__CLIENT_OPTIONS__tz_aware", True)
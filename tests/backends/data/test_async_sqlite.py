@@ -0,0 +1,158 @@
+"""Tests for Ralph asynchronous SQLite data backend."""
+
+import json
+import logging
+
+import pytest
+
+from ralph.backends.data.async_sqlite import AsyncSQLiteDataBackend
+from ralph.backends.data.base import BaseOperationType, DataBackendStatus
+from ralph.backends.data.sqlite import (
+    SQLiteDataBackend,
+    SQLiteDataBackendSettings,
+    SQLiteQuery,
+)
+from ralph.exceptions import BackendException, BackendParameterException
+
+
+def test_backends_data_async_sqlite_default_instantiation(monkeypatch, fs):
+    """Test the `AsyncSQLiteDataBackend` default instantiation."""
+    fs.create_file(".env")
+    monkeypatch.delenv("RALPH_BACKENDS__DATA__SQLITE__DEFAULT_TABLE", raising=False)
+
+    assert AsyncSQLiteDataBackend.name == "async_sqlite"
+    assert AsyncSQLiteDataBackend.query_class == SQLiteQuery
+    assert AsyncSQLiteDataBackend.default_operation_type == BaseOperationType.INDEX
+    assert AsyncSQLiteDataBackend.settings_class == SQLiteDataBackendSettings
+    backend = AsyncSQLiteDataBackend()
+    assert isinstance(backend.backend, SQLiteDataBackend)
+    assert backend.backend.settings is backend.settings
+    assert backend.settings.DEFAULT_TABLE == "statements"
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_sqlite_status(async_sqlite_backend, tmp_path):
+    """Test the `AsyncSQLiteDataBackend.status` method."""
+    backend = async_sqlite_backend()
+    assert await backend.status() == DataBackendStatus.OK
+    await backend.close()
+
+    settings = SQLiteDataBackendSettings(DATABASE_PATH=tmp_path / "foo" / "bar.db")
+    backend = AsyncSQLiteDataBackend(settings)
+    assert await backend.status() == DataBackendStatus.AWAY
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_sqlite_list(async_sqlite_backend):
+    """Test the `AsyncSQLiteDataBackend.list` method."""
+    backend = async_sqlite_backend()
+    assert not [table async for table in backend.list()]
+
+    await backend.write([{"id": "foo", "timestamp": "2023-01-01"}])
+    await backend.write([{"id": "foo", "timestamp": "2023-01-01"}], target="bar")
+    assert [table async for table in backend.list()] == ["statements", "bar"]
+    assert [table["name"] async for table in backend.list(details=True)] == [
+        "statements",
+        "bar",
+    ]
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_sqlite_write_and_read(async_sqlite_backend):
+    """Test the `AsyncSQLiteDataBackend.write` and `AsyncSQLiteDataBackend.read`
+    methods, given statements, should write and read them by chunks.
+    """
+    backend = async_sqlite_backend()
+    statements = [
+        {"id": str(i), "timestamp": f"2023-01-0{i + 1}T00:00:00+00:00"}
+        for i in range(5)
+    ]
+    assert await backend.write(statements) == 5
+    assert await backend.write(statements[:1], ignore_errors=True) == 0
+
+    # Statements should be read by chunks of `READ_CHUNK_SIZE` rows.
+    assert [row["statement"] async for row in backend.read()] == statements
+    assert [row async for row in backend.read(raw_output=True)] == [
+        f'{{"statement": {json.dumps(statement)}}}\n'.encode()
+        for statement in statements
+    ]
+
+    query = SQLiteQuery(where="id IN (?, ?)", parameters=["1", "3"], sort="id DESC")
+    assert [row["statement"] async for row in backend.read(query=query)] == [
+        statements[3],
+        statements[1],
+    ]
+    rows = backend.read(chunk_size=1, prefetch=2, max_statements=3)
+    assert [row["statement"] async for row in rows] == statements[:3]
+
+    deleted = [{"id": "0"}, {"id": "1"}, {"id": "2"}]
+    assert await backend.write(deleted, operation_type=BaseOperationType.DELETE) == 3
+    assert [row["statement"] async for row in backend.read()] == statements[3:]
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_sqlite_write_with_concurrency(
+    async_sqlite_backend,
+):
+    """Test the `AsyncSQLiteDataBackend.write` method, given a `concurrency`
+    argument, should write all statements.
+    """
+    backend = async_sqlite_backend()
+    statements = [
+        {"id": str(i), "timestamp": f"2023-01-0{i + 1}T00:00:00+00:00"}
+        for i in range(7)
+    ]
+    assert await backend.write(statements, chunk_size=2, concurrency=3) == 7
+    query = SQLiteQuery(sort="id")
+    assert [row["statement"] async for row in backend.read(query=query)] == statements
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_sqlite_read_and_write_with_failure(
+    async_sqlite_backend, caplog
+):
+    """Test the `AsyncSQLiteDataBackend.read` and `AsyncSQLiteDataBackend.write`
+    methods, given failing operations, should raise the synchronous backend
+    exceptions.
+    """
+    backend = async_sqlite_backend()
+    msg = "The target=`foo bar` is not a valid table name"
+    with pytest.raises(BackendParameterException, match=msg):
+        _ = [row async for row in backend.read(target="foo bar")]
+
+    with pytest.raises(BackendException, match="Failed to read rows"):
+        _ = [row async for row in backend.read(query=SQLiteQuery(select="foo"))]
+
+    msg = "statement {'id': 'foo'} has a missing or invalid 'timestamp' field"
+    with pytest.raises(BackendException, match=msg):
+        await backend.write([{"id": "foo"}])
+
+    msg = "Append operation_type is not allowed"
+    with pytest.raises(BackendParameterException, match=msg):
+        with caplog.at_level(logging.ERROR):
+            await backend.write([{}], operation_type=BaseOperationType.APPEND)
+
+    assert ("ralph.backends.data.base", logging.ERROR, msg) in caplog.record_tuples
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_sqlite_close(async_sqlite_backend, caplog):
+    """Test the `AsyncSQLiteDataBackend.close` method."""
+    backend = async_sqlite_backend()
+    with caplog.at_level(logging.WARNING):
+        await backend.close()
+
+    assert (
+        "ralph.backends.data.sqlite",
+        logging.WARNING,
+        "No backend client to close.",
+    ) in caplog.record_tuples
+
+    assert await backend.status() == DataBackendStatus.OK
+    assert backend.backend._connections
+    await backend.close()
+    assert not backend.backend._connections
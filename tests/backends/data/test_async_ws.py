@@ -1,5 +1,6 @@
 """Tests for Ralph ws stream backend."""
 
+import asyncio
 import json
 import logging
 import re
@@ -7,6 +8,8 @@ import re
 import pytest
 import websockets
 from pydantic import AnyUrl, TypeAdapter
+from websockets.exceptions import ConnectionClosedOK
+from websockets.frames import Close
 
 from ralph.backends.data.async_ws import AsyncWSDataBackend, WSDataBackendSettings
 from ralph.backends.data.base import DataBackendStatus
@@ -22,7 +25,11 @@ def test_backends_data_async_ws_default_instantiation(caplog, monkeypatch, fs):
     backend_settings_names = [
         "CLIENT_OPTIONS",
         "LOCALE_ENCODING",
+        "READ_BUFFER_SIZE",
         "READ_CHUNK_SIZE",
+        "READ_MAX_LATENCY",
+        "RECONNECT_ATTEMPTS",
+        "RECONNECT_BACKOFF",
         "URI",
         "WRITE_CHUNK_SIZE",
     ]
@@ -53,6 +60,10 @@ def test_backends_data_async_ws_instantiation_with_settings(monkeypatch):
     assert backend.settings.LOCALE_ENCODING == "utf8"
     assert backend.settings.READ_CHUNK_SIZE == 500
     assert backend.settings.WRITE_CHUNK_SIZE == 500
+    assert backend.settings.READ_BUFFER_SIZE == 10
+    assert backend.settings.READ_MAX_LATENCY == 0.1
+    assert backend.settings.RECONNECT_ATTEMPTS == 0
+    assert backend.settings.RECONNECT_BACKOFF == 1.0
 
     # Test overriding default values with environment variables.
     monkeypatch.setenv("RALPH_BACKENDS__DATA__WS__READ_CHUNK_SIZE", "1")
@@ -122,7 +133,7 @@ async def test_backends_data_async_ws_read_with_target(ws, events, caplog):
     assert (
         "ralph.backends.data.async_ws",
         logging.WARNING,
-        "The `target` and `chunk_size` arguments are ignored",
+        "The `target` argument is ignored",
     ) in caplog.record_tuples
 
 
@@ -160,6 +171,153 @@ async def test_backends_data_async_ws_read_without_raw_output(ws, events, caplog
     ) in caplog.record_tuples
 
 
+class MockClient:
+    """Mock the websocket client, sending `messages` then raising `error`."""
+
+    def __init__(self, messages, error=None):
+        """Instantiate the mock client."""
+        self.messages = list(messages)
+        self.error = error if error else ConnectionClosedOK(Close(1000, ""), None)
+        self.recv_count = 0
+
+    async def recv(self):
+        """Mock the `WebSocketClientProtocol.recv` method."""
+        self.recv_count += 1
+        if not self.messages:
+            raise self.error
+        # Like `recv`, waiting for an `asyncio.Event` message is cancellation-safe.
+        if isinstance(self.messages[0], asyncio.Event):
+            await self.messages[0].wait()
+            self.messages[0] = "late"
+        return self.messages.pop(0)
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_ws_read_by_chunks(monkeypatch):
+    """Test the `AsyncWSDataBackend.read` method, should receive messages by chunks
+    of `chunk_size` messages and count them by connection.
+    """
+    backend = AsyncWSDataBackend(WSDataBackendSettings(URI="ws://foo"))
+    client = MockClient([json.dumps({"id": index}) for index in range(5)])
+
+    async def get_mock_client():
+        return client
+
+    monkeypatch.setattr(backend, "client", get_mock_client)
+    records = [_ async for _ in backend.read(chunk_size=2)]
+    assert records == [{"id": index} for index in range(5)]
+    assert len(backend.connections) == 1
+    assert backend.connections[0].messages == 5
+    assert backend.connections[0].chunks == 3
+    assert backend.connections[0].size == 5 * len('{"id": 0}')
+    assert backend.connections[0].closed_at
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_ws_read_with_connection_stats(monkeypatch, caplog):
+    """Test the `AsyncWSDataBackend.read` method, should log the connection stats
+    once every record is yielded.
+    """
+    backend = AsyncWSDataBackend(WSDataBackendSettings(URI="ws://foo"))
+    client = MockClient([json.dumps({"id": index}) for index in range(5)])
+
+    async def get_mock_client():
+        return client
+
+    monkeypatch.setattr(backend, "client", get_mock_client)
+    records = []
+    with caplog.at_level(logging.INFO):
+        async for record in backend.read(chunk_size=2):
+            assert not caplog.records
+            records.append(record)
+
+    assert records == [{"id": index} for index in range(5)]
+    stats = backend.connections[0]
+    assert caplog.record_tuples[0] == (
+        "ralph.backends.data.async_ws",
+        logging.INFO,
+        f"Received 5 messages in 3 chunks from websocket ws://foo/ ({stats.rate:.1f} "
+        "messages/s)",
+    )
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_ws_read_with_max_latency(monkeypatch):
+    """Test the `AsyncWSDataBackend.read` method, given a chunk of messages not
+    filled within `READ_MAX_LATENCY` seconds, should yield it.
+    """
+    settings = WSDataBackendSettings(URI="ws://foo", READ_MAX_LATENCY=0.01)
+    backend = AsyncWSDataBackend(settings)
+    event = asyncio.Event()
+    client = MockClient(["first", event])
+
+    async def get_mock_client():
+        return client
+
+    monkeypatch.setattr(backend, "client", get_mock_client)
+    records = backend.read(chunk_size=10, raw_output=True)
+    assert await records.__anext__() == b"first\n"
+    event.set()
+    assert [_ async for _ in records] == [b"late\n"]
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_ws_read_with_backpressure(monkeypatch):
+    """Test the `AsyncWSDataBackend.read` method, given a slow consumer, should stop
+    receiving messages once `READ_BUFFER_SIZE` chunks are buffered.
+    """
+    settings = WSDataBackendSettings(URI="ws://foo", READ_BUFFER_SIZE=1)
+    backend = AsyncWSDataBackend(settings)
+    client = MockClient(["message"] * 100)
+
+    async def get_mock_client():
+        return client
+
+    monkeypatch.setattr(backend, "client", get_mock_client)
+    records = backend.read(chunk_size=1, raw_output=True)
+    assert await records.__anext__() == b"message\n"
+    await asyncio.sleep(0.05)
+    assert client.recv_count <= 4
+    await records.aclose()
+
+
+@pytest.mark.anyio
+async def test_backends_data_async_ws_read_with_reconnection(monkeypatch, caplog):
+    """Test the `AsyncWSDataBackend.read` method, given an abnormally closed
+    connection, should reconnect up to `RECONNECT_ATTEMPTS` times.
+    """
+    settings = WSDataBackendSettings(
+        URI="ws://foo", RECONNECT_ATTEMPTS=1, RECONNECT_BACKOFF=0
+    )
+    backend = AsyncWSDataBackend(settings)
+    error = websockets.ConnectionClosedError(None, None)
+    clients = [
+        MockClient(["1", "2"], error),
+        MockClient(["3"], error),
+        MockClient([], error),
+        MockClient(["4"], error),
+    ]
+
+    async def get_mock_client():
+        return clients.pop(0)
+
+    monkeypatch.setattr(backend, "client", get_mock_client)
+    records = []
+    with caplog.at_level(logging.WARNING):
+        with pytest.raises(BackendException, match="no close frame received or sent"):
+            async for record in backend.read(chunk_size=10):
+                records.append(record)
+
+    # The third connection does not receive any message, failing after one attempt.
+    assert records == [1, 2, 3]
+    assert [connection.messages for connection in backend.connections] == [2, 1, 0]
+    assert (
+        "ralph.backends.data.async_ws",
+        logging.WARNING,
+        "Reconnecting to websocket ws://foo/ in 0.0s: no close frame received or sent",
+    ) in caplog.record_tuples
+
+
 @pytest.mark.anyio
 async def test_backends_data_async_ws_read_with_connection_failure(monkeypatch, caplog):
     """Test the `AsyncWSDataBackend.read` method with `raw_output` set to `False`."""
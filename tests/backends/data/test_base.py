@@ -2,6 +2,8 @@
 
 import asyncio
 import logging
+import threading
+import time
 from typing import Any, Dict, Generic, TypeVar, Union
 
 import pytest
@@ -240,6 +242,137 @@ def test_backends_data_base_read_with_max_statements():
     assert list(backend.read(max_statements=3, raw_output=True)) == [b"", b"", b""]
 
 
+@pytest.mark.parametrize(
+    "prefetch,expected_consumed_items",
+    [
+        # Given `prefetch` set to `None`, 0 or 1, the `read` method should consume data
+        # on demand.
+        (None, 1),  # One item read -> one item consumed.
+        (0, 1),
+        (1, 1),
+        # Given `prefetch>1`, the `read` method should consume `prefetch` number of
+        # items ahead.
+        (2, 3),  # One item read -> one item consumed + 2 items prefetched.
+        (3, 4),
+    ],
+)
+def test_backends_data_base_read_with_prefetch(prefetch, expected_consumed_items):
+    """Test the `BaseDataBackend.read` method with `prefetch` argument."""
+    consumed_items = {"count": 0}
+
+    class MockDataBackend(BaseDataBackend[BaseDataBackendSettings, BaseQuery]):
+        """A class mocking the base database class."""
+
+        def _read_dicts(self, *args):
+            """Yield 6 records."""
+            for _ in range(6):
+                consumed_items["count"] += 1
+                yield {"foo": "bar"}
+
+        def status(self):
+            pass
+
+        def close(self):
+            pass
+
+    backend = MockDataBackend()
+    reader = backend.read(prefetch=prefetch)
+    assert next(reader) == {"foo": "bar"}
+    time.sleep(0.2)
+    assert consumed_items["count"] == expected_consumed_items
+    assert list(reader) == [{"foo": "bar"}] * 5
+
+
+def test_backends_data_base_read_with_prefetch_and_early_stop():
+    """Test the `BaseDataBackend.read` method with `prefetch` argument, given the
+    consumer stops iterating, should stop the prefetching thread.
+    """
+    consumed_items = {"count": 0}
+
+    class MockDataBackend(BaseDataBackend[BaseDataBackendSettings, BaseQuery]):
+        """A class mocking the base database class."""
+
+        def _read_dicts(self, *args):
+            """Yield records endlessly."""
+            while True:
+                consumed_items["count"] += 1
+                yield {"foo": "bar"}
+
+        def status(self):
+            pass
+
+        def close(self):
+            pass
+
+    thread_count = threading.active_count()
+    reader = MockDataBackend().read(prefetch=10, max_statements=100)
+    assert next(reader) == {"foo": "bar"}
+    assert threading.active_count() == thread_count + 1
+    reader.close()
+    assert threading.active_count() == thread_count
+    assert consumed_items["count"] <= 12
+
+
+def test_backends_data_base_read_with_invalid_prefetch(caplog):
+    """Test the `BaseDataBackend.read` method given a `prefetch` argument that is
+    less than `0`, should raise a `BackendParameterException`.
+    """
+
+    class MockDataBackend(BaseDataBackend[BaseDataBackendSettings, BaseQuery]):
+        """A class mocking the base database class."""
+
+        def _read_dicts(self, *args):
+            pass
+
+        def status(self):
+            pass
+
+        def close(self):
+            pass
+
+    msg = "prefetch must be a strictly positive integer"
+    with pytest.raises(BackendParameterException, match=msg):
+        with caplog.at_level(logging.ERROR):
+            list(MockDataBackend().read(prefetch=-1))
+
+    assert ("ralph.backends.data.base", logging.ERROR, msg) in caplog.record_tuples
+
+
+def test_backends_data_base_read_with_an_error_while_prefetching():
+    """Test the `BaseDataBackend.read` method given a `prefetch` argument and an
+    exception while prefetching records, should yield the remaining records before the
+    exception and once the last record is yielded, should re-raise the exception.
+    """
+    consumed_items = {"count": 0}
+
+    class MockDataBackend(BaseDataBackend[BaseDataBackendSettings, BaseQuery]):
+        """A class mocking the base database class."""
+
+        def _read_dicts(self, *args):
+            for _ in range(3):
+                consumed_items["count"] += 1
+                yield {"foo": "bar"}
+
+            raise BackendException("connection error")
+
+        def status(self):
+            pass
+
+        def close(self):
+            pass
+
+    reader = MockDataBackend().read(prefetch=10)
+    assert next(reader) == {"foo": "bar"}
+    time.sleep(0.2)
+    # Backend prefetched all records and caught the exception.
+    assert consumed_items["count"] == 3
+    # Reading the remaining records.
+    assert next(reader) == {"foo": "bar"}
+    assert next(reader) == {"foo": "bar"}
+    with pytest.raises(BackendException, match="connection error"):
+        next(reader)
+
+
 @pytest.mark.anyio
 @pytest.mark.parametrize(
     "prefetch,expected_consumed_items",
@@ -491,6 +624,96 @@ async def test_backends_data_base_async_write_with_concurrency(
         )
 
 
+@pytest.mark.parametrize("concurrent", [True, False])
+@pytest.mark.parametrize(
+    "chunk_size,concurrency,expected_chunks",
+    [
+        # Given a chunk size equal to the data size, only one chunk should be written.
+        (4, None, [[0, 1, 2, 3]]),
+        (4, 20, [[0, 1, 2, 3]]),
+        # Given no concurrency, data should be written in a single call.
+        (1, None, [[0, 1, 2, 3]]),
+        (1, 1, [[0, 1, 2, 3]]),
+        # Given a concurrency greater than one, chunks should be written separately.
+        (3, 2, [[0, 1, 2], [3]]),
+        (1, 2, [[0], [1], [2], [3]]),
+        (1, 20, [[0], [1], [2], [3]]),
+    ],
+)
+def test_backends_data_base_write_with_concurrency(
+    chunk_size, concurrency, expected_chunks, concurrent
+):
+    """Test the `Writable.write` method with `concurrency` argument."""
+
+    chunks = []
+    threads = set()
+
+    class MockBaseDataBackend(
+        BaseDataBackend[BaseDataBackendSettings, BaseQuery], Writable
+    ):
+        """A class mocking the base database class."""
+
+        concurrent_writes = concurrent
+
+        def _read_dicts(self, *args):
+            pass
+
+        def _write_dicts(self, data, *args):
+            chunks.append(list(data))
+            threads.add(threading.get_ident())
+            return len(chunks[-1])
+
+        def status(self):
+            pass
+
+        def close(self):
+            pass
+
+    backend = MockBaseDataBackend()
+    data = (i for i in range(4))
+    assert backend.write(data, chunk_size=chunk_size, concurrency=concurrency) == 4
+    if not concurrent:
+        expected_chunks = [[0, 1, 2, 3]]
+
+    assert sorted(chunks) == expected_chunks
+    # Chunks written concurrently should be written in distinct threads.
+    if len(expected_chunks) > 1:
+        assert threading.get_ident() not in threads
+
+
+def test_backends_data_base_write_with_concurrency_failure():
+    """Test the `Writable.write` method, given a failing chunk write, should raise
+    the failure and stop submitting chunks.
+    """
+
+    class MockBaseDataBackend(
+        BaseDataBackend[BaseDataBackendSettings, BaseQuery], Writable
+    ):
+        """A class mocking the base database class."""
+
+        def _read_dicts(self, *args):
+            pass
+
+        def _write_dicts(self, data, *args):
+            if 0 in data:
+                raise BackendException("Failed to write the first chunk")
+            return len(data)
+
+        def status(self):
+            pass
+
+        def close(self):
+            pass
+
+    backend = MockBaseDataBackend()
+    data = iter(range(100))
+    with pytest.raises(BackendException, match="Failed to write the first chunk"):
+        backend.write(data, chunk_size=1, concurrency=2)
+
+    # At most `concurrency` chunks should be in flight.
+    assert next(data) <= 4
+
+
 @pytest.mark.anyio
 async def test_backends_data_base_write_with_invalid_parameters(caplog):
     """Test the Writable backend `write` method, given invalid parameters."""
@@ -515,6 +738,20 @@ async def test_backends_data_base_write_with_invalid_parameters(caplog):
             pass
 
     backend = MockBaseDataBackend()
+    # Given `concurrency` is set to zero or a negative value, the write method should
+    # raise a `BackendParameterException` and produce an error log.
+    msg = "concurrency must be a strictly positive integer"
+    for concurrency in (0, -1):
+        with pytest.raises(BackendParameterException, match=msg):
+            with caplog.at_level(logging.ERROR):
+                assert backend.write([{}], concurrency=concurrency)
+
+    assert (
+        "ralph.backends.data.base",
+        logging.ERROR,
+        msg,
+    ) in caplog.record_tuples
+
     # Given an unsupported `operation_type`, the write method should raise a
     # `BackendParameterException` and log an error.
     msg = "Delete operation_type is not allowed"
@@ -578,6 +815,11 @@ async def test_backends_data_base_async_write_with_invalid_parameters(caplog):
         msg,
     ) in caplog.record_tuples
 
+    # Given `concurrency` is set to zero, the write method should not fall back to
+    # the default concurrency.
+    with pytest.raises(BackendParameterException, match=msg):
+        assert await backend.write([{}], concurrency=0)
+
     # Given an unsupported `operation_type`, the write method should raise a
     # `BackendParameterException` and log an error.
     msg = "Delete operation_type is not allowed"
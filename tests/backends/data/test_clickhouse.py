@@ -8,6 +8,7 @@ from collections import namedtuple
 from datetime import datetime, timedelta
 
 import pytest
+from clickhouse_connect.driver.common import StreamContext
 from clickhouse_connect.driver.exceptions import ClickHouseError
 from clickhouse_connect.driver.httpclient import HttpClient
 
@@ -40,8 +41,10 @@ def test_backends_data_clickhouse_default_instantiation(monkeypatch, fs):
         "PASSWORD",
         "CLIENT_OPTIONS",
         "LOCALE_ENCODING",
+        "POOL_SIZE",
         "READ_CHUNK_SIZE",
         "WRITE_CHUNK_SIZE",
+        "WRITE_CONCURRENCY",
     ]
     for name in backend_settings_names:
         monkeypatch.delenv(f"RALPH_BACKENDS__DATA__CLICKHOUSE__{name}", raising=False)
@@ -54,8 +57,10 @@ def test_backends_data_clickhouse_default_instantiation(monkeypatch, fs):
     assert backend.settings.CLIENT_OPTIONS == ClickHouseClientOptions()
     assert backend.settings.EVENT_TABLE_NAME == "xapi_events_all"
     assert backend.settings.LOCALE_ENCODING == "utf8"
+    assert backend.settings.POOL_SIZE == 8
     assert backend.settings.READ_CHUNK_SIZE == 500
     assert backend.settings.WRITE_CHUNK_SIZE == 500
+    assert backend.settings.WRITE_CONCURRENCY == 1
 
     # Test overriding default values with environment variables.
     monkeypatch.setenv(
@@ -94,6 +99,19 @@ def test_backends_data_clickhouse_instantiation_with_settings():
     backend.close()
 
 
+def test_backends_data_clickhouse_get_credentials():
+    """Test the `ClickHouseDataBackend.get_credentials` method, should only return
+    the credentials which are set.
+    """
+    settings = ClickHouseDataBackendSettings()
+    assert not ClickHouseDataBackend.get_credentials(settings)
+    settings = ClickHouseDataBackendSettings(USERNAME="foo", PASSWORD="")
+    assert ClickHouseDataBackend.get_credentials(settings) == {
+        "username": "foo",
+        "password": "",
+    }
+
+
 def test_backends_data_clickhouse_status(clickhouse, clickhouse_backend, monkeypatch):
     """Test the `ClickHouseDataBackend.status` method."""
 
@@ -161,7 +179,7 @@ def test_backends_data_clickhouse_read_with_a_custom_query(
     ]
 
     backend = clickhouse_backend()
-    documents = list(backend._to_insert_tuples(statements))
+    documents = next(backend.to_insert_columns(statements, chunk_size=3))
 
     backend.write(statements)
 
@@ -180,11 +198,11 @@ def test_backends_data_clickhouse_read_with_a_custom_query(
 
     assert len(results) == 3
     assert len(results[0]) == 2
-    assert results[0]["event_id"] == documents[0][0]
+    assert results[0]["event_id"] == documents.event_id[0]
     assert results[0]["bool"] == statements[0]["bool"]
-    assert results[1]["event_id"] == documents[1][0]
+    assert results[1]["event_id"] == documents.event_id[1]
     assert results[1]["bool"] == statements[1]["bool"]
-    assert results[2]["event_id"] == documents[2][0]
+    assert results[2]["event_id"] == documents.event_id[2]
     assert results[2]["bool"] == statements[2]["bool"]
 
     # Test both
@@ -195,7 +213,7 @@ def test_backends_data_clickhouse_read_with_a_custom_query(
     results = list(backend.read(query=query))
     assert len(results) == 1
     assert len(results[0]) == 2
-    assert results[0]["event_id"] == documents[1][0]
+    assert results[0]["event_id"] == documents.event_id[1]
     assert results[0]["bool"] == statements[1]["bool"]
 
     # Test sort
@@ -231,11 +249,18 @@ def test_backends_data_clickhouse_read_with_failures(
     document = {"event": "Invalid JSON!"}
 
     # JSON encoding error
-    def mock_clickhouse_client_query(*args, **kwargs):
-        """Mock the `clickhouse.Client.query` returning an unparsable document."""
-        return namedtuple("_", "named_results")(lambda: [document])
-
-    monkeypatch.setattr(backend.client, "query", mock_clickhouse_client_query)
+    def mock_clickhouse_client_query_row_block_stream(*args, **kwargs):
+        """Mock the `clickhouse.Client.query_row_block_stream` returning an
+        unparsable document.
+        """
+        source = namedtuple("_", "column_names close")(["event"], lambda: None)
+        return StreamContext(source, iter([[(document["event"],)]]))
+
+    monkeypatch.setattr(
+        backend.client,
+        "query_row_block_stream",
+        mock_clickhouse_client_query_row_block_stream,
+    )
 
     msg = (
         "Failed to decode JSON: Expecting value: line 1 column 1 (char 0), "
@@ -272,11 +297,13 @@ def test_backends_data_clickhouse_read_with_failures(
     ) not in caplog.record_tuples
 
     # ClickHouse error during query should raise even when ignoring errors
-    def mock_query(*_, **__):
-        """Mock the ClickHouseClient.query method."""
+    def mock_query_row_block_stream(*_, **__):
+        """Mock the ClickHouseClient.query_row_block_stream method."""
         raise ClickHouseError("Something is wrong")
 
-    monkeypatch.setattr(backend.client, "query", mock_query)
+    monkeypatch.setattr(
+        backend.client, "query_row_block_stream", mock_query_row_block_stream
+    )
 
     msg = "Failed to read documents: Something is wrong"
     with caplog.at_level(logging.ERROR):
@@ -291,6 +318,59 @@ def test_backends_data_clickhouse_read_with_failures(
     backend.close()
 
 
+def test_backends_data_clickhouse_read_by_blocks(monkeypatch):
+    """Test the `ClickHouseDataBackend.read` method, given a result streamed by
+    blocks, should yield documents one block at a time.
+    """
+    event_id = uuid.uuid4()
+    blocks = [
+        [(str(event_id), '{"id": "foo"}')],
+        [("bar", '{"id": "bar"}'), ("baz", '{"id": "baz", "\\u00e9": 1}')],
+    ]
+    streamed_blocks = []
+
+    def mock_query_row_block_stream(sql, parameters, settings):
+        """Mock the `clickhouse.Client.query_row_block_stream` method."""
+        assert sql == "SELECT event_id,event FROM xapi_events_all"
+        assert not parameters
+        assert settings == {"max_block_size": 2}
+
+        def get_blocks():
+            for block in blocks:
+                streamed_blocks.append(block)
+                yield block
+
+        source = namedtuple("_", "column_names close")(
+            ["event_id", "event"], lambda: None
+        )
+        return StreamContext(source, get_blocks())
+
+    backend = ClickHouseDataBackend()
+    backend._client = namedtuple("_", "query_row_block_stream")(
+        mock_query_row_block_stream
+    )
+    query = ClickHouseQuery(select=["event_id", "event"])
+    documents = backend.read(query=query, chunk_size=2)
+    assert next(documents) == {"event_id": str(event_id), "event": {"id": "foo"}}
+    assert streamed_blocks == blocks[:1]
+    assert list(documents) == [
+        {"event_id": "bar", "event": {"id": "bar"}},
+        {"event_id": "baz", "event": {"id": "baz", "\u00e9": 1}},
+    ]
+
+    # Raw output should write the `event` column as is.
+    results = list(backend.read(query=query, chunk_size=2, raw_output=True))
+    assert results == [
+        f'{{"event_id": "{event_id}", "event": {{"id": "foo"}}}}\n'.encode(),
+        b'{"event_id": "bar", "event": {"id": "bar"}}\n',
+        b'{"event_id": "baz", "event": {"id": "baz", "\\u00e9": 1}}\n',
+    ]
+    assert results == [
+        f"{json.dumps(document)}\n".encode()
+        for document in backend.read(query=query, chunk_size=2)
+    ]
+
+
 def test_backends_data_clickhouse_list(clickhouse, clickhouse_backend):
     """Test the `ClickHouseDataBackend.list` method."""
 
@@ -595,6 +675,46 @@ def test_backends_data_clickhouse_write_bytes_failed(clickhouse, clickhouse_back
     backend.close()
 
 
+def test_backends_data_clickhouse_write_with_column_oriented_batches():
+    """Test the `ClickHouseDataBackend.write` method, should insert column oriented
+    batches and describe the target table only once.
+    """
+    timestamp = datetime.now().isoformat()
+    statements = [{"id": str(uuid.uuid4()), "timestamp": timestamp} for _ in range(3)]
+    inserts = []
+    insert_contexts = []
+
+    def mock_insert(table, data, **kwargs):
+        """Mock the `clickhouse.Client.insert` method."""
+        assert table == "xapi_events_all"
+        assert kwargs["column_names"] == ("event_id", "emission_time", "event")
+        assert kwargs["column_types"] == ["types"]
+        assert kwargs["column_oriented"]
+        inserts.append(data)
+
+    def mock_create_insert_context(table, column_names):
+        """Mock the `clickhouse.Client.create_insert_context` method."""
+        insert_contexts.append((table, column_names))
+        return namedtuple("_", "column_types")(["types"])
+
+    backend = ClickHouseDataBackend()
+    backend._client = namedtuple("_", "insert create_insert_context")(
+        mock_insert, mock_create_insert_context
+    )
+    assert backend.write(statements, chunk_size=2) == 3
+    assert insert_contexts == [
+        ("xapi_events_all", ("event_id", "emission_time", "event"))
+    ]
+    assert [data.event_id for data in inserts] == [
+        [uuid.UUID(statements[0]["id"]), uuid.UUID(statements[1]["id"])],
+        [uuid.UUID(statements[2]["id"])],
+    ]
+    assert [data.event for data in inserts] == [
+        [json.dumps(statements[0]), json.dumps(statements[1])],
+        [json.dumps(statements[2])],
+    ]
+
+
 def test_backends_data_clickhouse_write_empty(clickhouse, clickhouse_backend):
     """Test the `ClickHouseDataBackend.write` method."""
 
@@ -637,6 +757,30 @@ def test_backends_data_clickhouse_write_wrong_operation_type(
     backend.close()
 
 
+def test_backends_data_clickhouse_write_with_delete_operation(
+    clickhouse, clickhouse_backend
+):
+    """Test the `ClickHouseDataBackend.write` method, given a `DELETE`
+    `operation_type`, should delete the documents with matching ids.
+    """
+    statements = [
+        {"id": str(uuid.uuid4()), "timestamp": datetime.utcnow().isoformat()}
+        for _ in range(3)
+    ]
+    backend = clickhouse_backend()
+    assert backend.write(statements) == 3
+    deleted = [{"id": statements[0]["id"]}, {"id": statements[2]["id"]}]
+    assert (
+        backend.write(deleted, chunk_size=1, operation_type=BaseOperationType.DELETE)
+        == 2
+    )
+
+    sql = f"""SELECT event_id FROM {CLICKHOUSE_TEST_TABLE_NAME}"""
+    result = clickhouse.query(sql).result_set
+    assert [str(row[0]) for row in result] == [statements[1]["id"]]
+    backend.close()
+
+
 def test_backends_data_clickhouse_write_with_custom_chunk_size(
     clickhouse, clickhouse_backend
 ):
@@ -47,6 +47,7 @@ def test_backends_data_es_default_instantiation(monkeypatch, fs):
         "READ_CHUNK_SIZE",
         "REFRESH_AFTER_WRITE",
         "WRITE_CHUNK_SIZE",
+        "WRITE_CONCURRENCY",
     ]
     for name in backend_settings_names:
         monkeypatch.delenv(f"RALPH_BACKENDS__DATA__ES__{name}", raising=False)
@@ -65,6 +66,7 @@ def test_backends_data_es_default_instantiation(monkeypatch, fs):
     assert backend.settings.READ_CHUNK_SIZE == 500
     assert not backend.settings.REFRESH_AFTER_WRITE
     assert backend.settings.WRITE_CHUNK_SIZE == 500
+    assert backend.settings.WRITE_CONCURRENCY == 1
     assert isinstance(backend.client, Elasticsearch)
     elasticsearch_node = backend.client.transport.node_pool.get()
     assert elasticsearch_node.config.ca_certs is None
@@ -93,6 +95,7 @@ def test_backends_data_es_instantiation_with_settings():
         READ_CHUNK_SIZE=5000,
         REFRESH_AFTER_WRITE="true",
         WRITE_CHUNK_SIZE=4999,
+        WRITE_CONCURRENCY=4,
     )
     backend = ESDataBackend(settings)
     assert backend.settings.ALLOW_YELLOW_STATUS
@@ -106,6 +109,7 @@ def test_backends_data_es_instantiation_with_settings():
     assert backend.settings.READ_CHUNK_SIZE == 5000
     assert backend.settings.REFRESH_AFTER_WRITE
     assert backend.settings.WRITE_CHUNK_SIZE == 4999
+    assert backend.settings.WRITE_CONCURRENCY == 4
     assert isinstance(backend.client, Elasticsearch)
     elasticsearch_node = backend.client.transport.node_pool.get()
     assert elasticsearch_node.config.ca_certs == Path("/path/to/ca/bundle")
@@ -459,6 +463,102 @@ def test_backends_data_es_read_with_query(es, es_backend, caplog):
     backend.close()
 
 
+@pytest.mark.parametrize("ordered_slices", [False, True])
+def test_backends_data_es_read_with_slices(ordered_slices, es_backend, monkeypatch):
+    """Test the `ESDataBackend.read` method, given a query with `slices`, should read
+    each slice of the point in time concurrently and yield all documents.
+    """
+    pit_ids = []
+    searched_slices = set()
+
+    def mock_open_point_in_time(**_):
+        """Mock the ES.client.open_point_in_time method."""
+        pit_ids.append("pit")
+        return {"id": "pit"}
+
+    def mock_search(**kwargs):
+        """Mock the ES.client.search method returning the documents of one slice."""
+        assert kwargs["pit"] == {"id": "pit", "keep_alive": "1m"}
+        assert "slices" not in kwargs
+        assert "ordered_slices" not in kwargs
+        slice_id = kwargs["slice"]["id"]
+        assert kwargs["slice"]["max"] == 3
+        searched_slices.add(slice_id)
+        # Slice `n` holds the documents `n`, `n + 3`, `n + 6`, ... up to 30.
+        search_after = kwargs["search_after"]
+        start = int(search_after[0]) + 3 if search_after else slice_id
+        sorts = range(start, 30, 3)[: kwargs["size"]]
+        return {"hits": {"hits": [{"_id": str(i), "sort": [i]} for i in sorts]}}
+
+    backend = es_backend()
+    monkeypatch.setattr(backend.client, "open_point_in_time", mock_open_point_in_time)
+    monkeypatch.setattr(backend.client, "search", mock_search)
+    query = ESQuery(slices=3, ordered_slices=ordered_slices)
+    documents = [document["sort"][0] for document in backend.read(query, chunk_size=4)]
+
+    assert pit_ids == ["pit"]
+    assert searched_slices == {0, 1, 2}
+    if ordered_slices:
+        assert documents == list(range(30))
+    else:
+        assert sorted(documents) == list(range(30))
+
+    # Given a query with a `size`, the read method should stop after `size` documents.
+    query = ESQuery(slices=3, ordered_slices=ordered_slices, size=7)
+    documents = [document["sort"][0] for document in backend.read(query, chunk_size=4)]
+    assert len(documents) == 7
+    if ordered_slices:
+        assert documents == list(range(7))
+
+    backend.close()
+
+
+def test_backends_data_es_read_with_slices_failure(es_backend, monkeypatch, caplog):
+    """Test the `ESDataBackend.read` method, given a query with `slices` and a search
+    failure in one of the slices, should raise a `BackendException`.
+    """
+
+    def mock_search(**kwargs):
+        """Mock the ES.client.search method failing for the second slice."""
+        if kwargs["slice"]["id"] == 1:
+            raise ESConnectionError("")
+        return {"hits": {"hits": []}}
+
+    backend = es_backend()
+    monkeypatch.setattr(backend.client, "open_point_in_time", lambda **_: {"id": "0"})
+    monkeypatch.setattr(backend.client, "search", mock_search)
+    msg = "Failed to execute Elasticsearch query: Connection error"
+    with pytest.raises(BackendException, match=msg):
+        list(backend.read(ESQuery(slices=2)))
+
+    # Given a query mixing ascending and descending sort orders, the read method
+    # should raise a `BackendParameterException` in ordered mode.
+    sort = [{"timestamp": "desc"}, {"_shard_doc": {"order": "asc"}}]
+    query = ESQuery(slices=2, ordered_slices=True, sort=sort)
+    msg = "Ordered sliced reads require all sort clauses to share one order"
+    with pytest.raises(BackendParameterException, match=msg):
+        with caplog.at_level(logging.ERROR):
+            list(backend.read(query))
+
+    assert ("ralph.backends.data.es", logging.ERROR, msg) in caplog.record_tuples
+
+    backend.close()
+
+
+@pytest.mark.parametrize(
+    "sort,expected",
+    [
+        ("_shard_doc", False),
+        ("timestamp:desc,_score", True),
+        ([{"timestamp": "asc"}, {"_shard_doc": {}}], False),
+        ([{"timestamp": {"order": "desc"}}, {"_shard_doc": "desc"}], True),
+    ],
+)
+def test_backends_data_es_is_sort_descending(sort, expected):
+    """Test the `ESDataBackend.is_sort_descending` static method."""
+    assert ESDataBackend.is_sort_descending(sort) == expected
+
+
 def test_backends_data_es_write_with_create_operation(es, es_backend, caplog):
     """Test the `ESDataBackend.write` method, given an `CREATE` `operation_type`,
     should insert the target documents with the provided data.
@@ -735,6 +835,56 @@ def test_backends_data_es_write_with_ignore_errors(es, es_backend):
     backend.close()
 
 
+def test_backends_data_es_write_with_concurrency(es_backend, monkeypatch, caplog):
+    """Test the `ESDataBackend.write` method, given a `concurrency` greater than one,
+    should send bulk requests in parallel using the `parallel_bulk` helper.
+    """
+    calls = []
+
+    def mock_parallel_bulk(**kwargs):
+        calls.append(kwargs)
+        for action in kwargs["actions"]:
+            yield action["_id"] != 2, action
+
+    def mock_streaming_bulk(**_):
+        pytest.fail("streaming_bulk should not be called when concurrency > 1")
+
+    monkeypatch.setattr("ralph.backends.data.es.parallel_bulk", mock_parallel_bulk)
+    monkeypatch.setattr("ralph.backends.data.es.streaming_bulk", mock_streaming_bulk)
+    backend = es_backend()
+    data = ({"id": idx} for idx in range(5))
+    with caplog.at_level(logging.INFO):
+        assert backend.write(data, chunk_size=2, ignore_errors=True, concurrency=3) == 4
+
+    assert len(calls) == 1
+    assert calls[0]["thread_count"] == 3
+    assert calls[0]["queue_size"] == 3
+    assert calls[0]["chunk_size"] == 2
+    assert not calls[0]["raise_on_error"]
+    assert (
+        "ralph.backends.data.es",
+        logging.INFO,
+        "Finished writing 4 documents with success",
+    ) in caplog.record_tuples
+
+    # Given a `WRITE_CONCURRENCY` setting greater than one, the write method should
+    # use it by default.
+    settings = backend.settings.model_copy(update={"WRITE_CONCURRENCY": 2})
+    backend.close()
+    backend = ESDataBackend(settings)
+    assert backend.write([{"id": 1}]) == 1
+    assert calls[1]["thread_count"] == 2
+    assert calls[1]["raise_on_error"]
+
+    # Given an invalid `concurrency` value, the write method should raise a
+    # `BackendParameterException`.
+    msg = "concurrency must be a strictly positive integer"
+    with pytest.raises(BackendParameterException, match=msg):
+        backend.write([{"id": 1}], concurrency=-1)
+
+    backend.close()
+
+
 def test_backends_data_es_write_with_datastream(es_data_stream, es_backend):
     """Test the `ESDataBackend.write` method using a configured data stream."""
 
@@ -0,0 +1,171 @@
+"""Tests for Ralph fan-out data backend."""
+
+import json
+import logging
+from threading import Barrier
+
+import pytest
+
+from ralph.backends.data.base import BaseOperationType, DataBackendStatus
+from ralph.backends.data.fanout import FanoutDataBackend, FanoutDataBackendSettings
+from ralph.backends.data.fs import FSDataBackend
+from ralph.backends.data.sqlite import SQLiteDataBackend
+from ralph.exceptions import BackendException, BackendParameterException
+
+STATEMENTS = [
+    {"id": str(index), "timestamp": f"2023-06-24T00:00:0{index}+00:00"}
+    for index in range(5)
+]
+
+
+def test_backends_data_fanout_default_instantiation(monkeypatch, tmp_path):
+    """Test the `FanoutDataBackend` default instantiation."""
+    assert FanoutDataBackendSettings().BACKENDS == ("es",)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("RALPH_BACKENDS__DATA__FANOUT__BACKENDS", "fs,sqlite")
+    monkeypatch.setenv("RALPH_BACKENDS__DATA__FANOUT__PRIMARY_BACKEND", "sqlite")
+    backend = FanoutDataBackend()
+    assert backend.name == "fanout"
+    assert backend.settings.BACKENDS == ("fs", "sqlite")
+    assert isinstance(backend.backends["fs"], FSDataBackend)
+    assert isinstance(backend.primary, SQLiteDataBackend)
+    assert backend.default_operation_type == backend.primary.default_operation_type
+    assert backend.unsupported_operation_types == {
+        BaseOperationType.APPEND,
+        BaseOperationType.DELETE,
+    }
+
+
+@pytest.mark.parametrize(
+    "backends,primary,msg",
+    [
+        ("fs,foo", None, "The foo backend is not a synchronous writable backend"),
+        ("fs,async_es", None, "The async_es backend is not a synchronous writable"),
+        ("fs,ldp", None, "The ldp backend is not a synchronous writable backend"),
+        ("fs,fanout", None, "The fanout backend is not a synchronous writable"),
+        ("fs", "sqlite", "The sqlite primary backend is not one of the fanned-out"),
+    ],
+)
+def test_backends_data_fanout_instantiation_with_invalid_backends(
+    backends, primary, msg, fanout_backend
+):
+    """Test the `FanoutDataBackend` instantiation, given an invalid backend, should
+    raise a `BackendParameterException`.
+    """
+    with pytest.raises(BackendParameterException, match=msg):
+        fanout_backend(backends, primary)
+
+
+def test_backends_data_fanout_write(fanout_backend, tmp_path, caplog):
+    """Test the `FanoutDataBackend.write` method, should write records to all
+    backends and return the count of the primary backend.
+    """
+    backend = fanout_backend()
+    with caplog.at_level(logging.INFO):
+        assert backend.write(STATEMENTS) == 5
+
+    assert [
+        json.loads(line)
+        for path in tmp_path.glob("*")
+        if not path.name.startswith("db.sqlite3")
+        for line in path.read_text(encoding="utf8").splitlines()
+    ] == STATEMENTS
+    rows = list(backend.backends["sqlite"].read())
+    assert [row["statement"] for row in rows] == STATEMENTS
+    assert list(backend.read()) == rows
+    # The FS data backend counts written files.
+    assert backend.write_counts == {"sqlite": 5, "fs": 1}
+    for count, name in ((5, "sqlite"), (1, "fs")):
+        assert (
+            "ralph.backends.data.fanout",
+            logging.INFO,
+            f"Written {count} records to the {name} backend",
+        ) in caplog.record_tuples
+
+    # Given bytes, records should be written to all backends.
+    data = [f"{json.dumps(statement)}\n".encode() for statement in STATEMENTS]
+    assert backend.write(data, operation_type=BaseOperationType.UPDATE) == 5
+
+    # Given a target, each backend should write all chunks to it.
+    assert backend.write(STATEMENTS, target="foo") == 5
+    assert len((tmp_path / "foo").read_text(encoding="utf8").splitlines()) == 5
+    assert len(list(backend.read(target="foo"))) == 5
+
+
+def test_backends_data_fanout_write_with_unsupported_operation_type(fanout_backend):
+    """Test the `FanoutDataBackend.write` method, given an operation type that is not
+    supported by all backends, should raise a `BackendParameterException`.
+    """
+    backend = fanout_backend()
+    msg = "Delete operation_type is not allowed"
+    with pytest.raises(BackendParameterException, match=msg):
+        backend.write(STATEMENTS, operation_type=BaseOperationType.DELETE)
+
+
+def test_backends_data_fanout_write_concurrently(fanout_backend, monkeypatch):
+    """Test the `FanoutDataBackend.write` method, should write to all backends
+    concurrently.
+    """
+    backend = fanout_backend()
+    # Each backend waits for the other one to write its first record.
+    barrier = Barrier(2, timeout=5)
+
+    def mock_write(data, *_, **__):
+        """Wait for the other backend, then consume `data`."""
+        barrier.wait()
+        return len(list(data))
+
+    for name in ("sqlite", "fs"):
+        monkeypatch.setattr(backend.backends[name], "write", mock_write)
+
+    assert backend.write(STATEMENTS) == 5
+
+
+def test_backends_data_fanout_write_with_failure(fanout_backend, monkeypatch, caplog):
+    """Test the `FanoutDataBackend.write` method, given a failing backend, should
+    write records to other backends and raise its exception.
+    """
+    backend = fanout_backend()
+
+    def mock_write(data, *_, **__):
+        """Consume the first record, then fail."""
+        next(iter(data))
+        raise BackendException("Failed to write")
+
+    monkeypatch.setattr(backend.backends["fs"], "write", mock_write)
+    statements = [{**STATEMENTS[0], "id": str(index)} for index in range(50)]
+    with caplog.at_level(logging.INFO):
+        with pytest.raises(BackendException, match="Failed to write"):
+            backend.write(statements)
+
+    assert len(list(backend.backends["sqlite"].read())) == 50
+    assert backend.write_counts == {"sqlite": 50}
+    assert (
+        "ralph.backends.data.fanout",
+        logging.ERROR,
+        "Failed to write records to the fs backend: Failed to write",
+    ) in caplog.record_tuples
+    assert (
+        "ralph.backends.data.fanout",
+        logging.INFO,
+        "Written 50 records to the sqlite backend",
+    ) in caplog.record_tuples
+
+
+def test_backends_data_fanout_status(fanout_backend, monkeypatch):
+    """Test the `FanoutDataBackend.status` method, should return the least healthy
+    status of all backends.
+    """
+    backend = fanout_backend()
+    assert backend.status() == DataBackendStatus.OK
+
+    monkeypatch.setattr(
+        backend.backends["fs"], "status", lambda: DataBackendStatus.AWAY
+    )
+    assert backend.status() == DataBackendStatus.AWAY
+
+    monkeypatch.setattr(
+        backend.backends["sqlite"], "status", lambda: DataBackendStatus.ERROR
+    )
+    assert backend.status() == DataBackendStatus.ERROR
+    backend.close()
@@ -6,8 +6,8 @@ import re
 
 import pytest
 from bson.objectid import ObjectId
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, PyMongoError
+from pymongo import MongoClient, WriteConcern
+from pymongo.errors import BulkWriteError, ConnectionFailure, PyMongoError
 
 from ralph.backends.data.base import BaseOperationType, DataBackendStatus
 from ralph.backends.data.mongo import (
@@ -36,6 +36,10 @@ def test_backends_data_mongo_default_instantiation(monkeypatch, fs):
         "CLIENT_OPTIONS",
         "READ_CHUNK_SIZE",
         "LOCALE_ENCODING",
+        "WRITE_CONCERN",
+        "WRITE_CONCURRENCY",
+        "WRITE_JOURNAL",
+        "WRITE_ORDERED",
     ]
     for name in backend_settings_names:
         monkeypatch.delenv(f"RALPH_BACKENDS__DATA__MONGO__{name}", raising=False)
@@ -53,6 +57,10 @@ def test_backends_data_mongo_default_instantiation(monkeypatch, fs):
     assert backend.settings.LOCALE_ENCODING == "utf8"
     assert backend.settings.READ_CHUNK_SIZE == 500
     assert backend.settings.WRITE_CHUNK_SIZE == 500
+    assert backend.settings.WRITE_CONCERN is None
+    assert backend.settings.WRITE_CONCURRENCY == 1
+    assert backend.settings.WRITE_JOURNAL is None
+    assert backend.settings.WRITE_ORDERED
 
     # Test overriding default values with environment variables.
     monkeypatch.setenv("RALPH_BACKENDS__DATA__MONGO__CLIENT_OPTIONS__tz_aware", True)
@@ -907,6 +915,67 @@ def test_backends_data_mongo_write_with_custom_chunk_size(mongo, mongo_backend):
     backend.close()
 
 
+def test_backends_data_mongo_write_with_concurrency(mongo_backend, monkeypatch):
+    """Test the `MongoDataBackend.write` method, given a `concurrency` argument,
+    should write all batches of documents.
+    """
+
+    backend = mongo_backend()
+    batches = []
+
+    def mock_bulk_import(batch, ignore_errors, collection):
+        """Mock the `MongoDataBackend._bulk_import` method."""
+        batches.append([document["_source"]["id"] for document in batch])
+        return len(batch)
+
+    monkeypatch.setattr(backend, "_bulk_import", mock_bulk_import)
+    documents = [
+        {"id": str(index), "timestamp": "2022-06-27T15:36:50"} for index in range(10)
+    ]
+    assert backend.write(documents, chunk_size=3, concurrency=2) == 10
+    assert sorted(sum(batches, [])) == sorted(str(index) for index in range(10))
+    assert len(batches) == 4
+
+    msg = "concurrency must be a strictly positive integer"
+    with pytest.raises(BackendParameterException, match=msg):
+        backend.write(documents, concurrency=-1)
+
+    backend.close()
+
+
+def test_backends_data_mongo_get_write_concern():
+    """Test the `MongoDataBackend.get_write_concern` static method."""
+
+    settings = MongoDataBackend.settings_class()
+    assert MongoDataBackend.get_write_concern(settings) is None
+
+    settings = MongoDataBackend.settings_class(WRITE_CONCERN="majority")
+    assert MongoDataBackend.get_write_concern(settings) == WriteConcern(w="majority")
+
+    settings = MongoDataBackend.settings_class(WRITE_CONCERN=1, WRITE_JOURNAL=True)
+    assert MongoDataBackend.get_write_concern(settings) == WriteConcern(w=1, j=True)
+
+
+def test_backends_data_mongo_get_bulk_write_count(caplog):
+    """Test the `MongoDataBackend.get_bulk_write_count` static method."""
+
+    error = BulkWriteError(
+        {
+            "writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}],
+            "nInserted": 2,
+        }
+    )
+    with caplog.at_level(logging.WARNING):
+        assert MongoDataBackend.get_bulk_write_count(error, "nInserted") == 2
+
+    assert (
+        "ralph.backends.data.mongo",
+        logging.WARNING,
+        "Failed to write document 1 of the chunk: duplicate key",
+    ) in caplog.record_tuples
+    assert MongoDataBackend.get_bulk_write_count(ValueError(), "nInserted") == 0
+
+
 def test_backends_data_mongo_close_with_failure(mongo_backend, monkeypatch):
     """Test the `MongoDataBackend.close` method."""
 
@@ -0,0 +1,366 @@
+"""Tests for Ralph Parquet data backend."""
+
+import json
+import logging
+from datetime import datetime, timezone
+
+import boto3
+import pyarrow.parquet as pq
+import pytest
+from moto import mock_aws
+
+from ralph.backends.data.base import BaseOperationType, DataBackendStatus
+from ralph.backends.data.parquet import (
+    ParquetDataBackend,
+    ParquetDataBackendSettings,
+    ParquetQuery,
+    S3ObjectFile,
+)
+from ralph.exceptions import BackendException, BackendParameterException
+
+STATEMENTS = [
+    {
+        "id": str(i),
+        "timestamp": f"2023-01-{i + 1:02}T00:00:00+00:00",
+        "verb": {"id": f"https://w3id.org/xapi/video/verbs/{verb}"},
+        "actor": {"account": {"name": f"user{i % 2}", "homePage": "https://foo"}},
+        "object": {"id": f"https://foo/videos/{i % 3}", "objectType": "Activity"},
+    }
+    for i, verb in enumerate(["initialized"] * 3 + ["played"] * 4 + ["paused"] * 3)
+]
+
+
+def test_backends_data_parquet_default_instantiation(monkeypatch, fs):
+    """Test the `ParquetDataBackend` default instantiation."""
+    fs.create_file(".env")
+    backend_settings_names = [
+        "STORAGE",
+        "DEFAULT_DIRECTORY_PATH",
+        "COMPRESSION",
+        "LOCALE_ENCODING",
+        "READ_CHUNK_SIZE",
+        "WRITE_CHUNK_SIZE",
+    ]
+    for name in backend_settings_names:
+        monkeypatch.delenv(f"RALPH_BACKENDS__DATA__PARQUET__{name}", raising=False)
+
+    assert ParquetDataBackend.name == "parquet"
+    assert ParquetDataBackend.query_class == ParquetQuery
+    assert ParquetDataBackend.default_operation_type == BaseOperationType.CREATE
+    assert ParquetDataBackend.settings_class == ParquetDataBackendSettings
+    backend = ParquetDataBackend()
+    assert backend.settings.STORAGE == "fs"
+    assert str(backend.settings.DEFAULT_DIRECTORY_PATH) == "."
+    assert backend.settings.COMPRESSION == "zstd"
+    assert backend.settings.LOCALE_ENCODING == "utf8"
+    assert backend.settings.READ_CHUNK_SIZE == 500
+    assert backend.settings.WRITE_CHUNK_SIZE == 10000
+
+    # Test overriding default values with environment variables.
+    monkeypatch.setenv("RALPH_BACKENDS__DATA__PARQUET__COMPRESSION", "snappy")
+    backend = ParquetDataBackend()
+    assert backend.settings.COMPRESSION == "snappy"
+
+
+def test_backends_data_parquet_status(parquet_backend, tmp_path):
+    """Test the `ParquetDataBackend.status` method."""
+    backend = parquet_backend()
+    assert backend.status() == DataBackendStatus.OK
+
+    backend.default_directory = tmp_path / "foo"
+    assert backend.status() == DataBackendStatus.ERROR
+
+
+def test_backends_data_parquet_list(parquet_backend, tmp_path, caplog):
+    """Test the `ParquetDataBackend.list` method."""
+    backend = parquet_backend()
+    assert not list(backend.list())
+
+    backend.write(STATEMENTS, target="foo.parquet")
+    (tmp_path / "bar").mkdir()
+    backend.write(STATEMENTS, target="bar/baz.parquet")
+    assert list(backend.list()) == [str(tmp_path / "foo.parquet")]
+    assert list(backend.list(target="bar")) == [str(tmp_path / "bar" / "baz.parquet")]
+    details = list(backend.list(details=True))
+    assert details[0]["path"] == str(tmp_path / "foo.parquet")
+    assert details[0]["size"] == (tmp_path / "foo.parquet").stat().st_size
+
+    with caplog.at_level(logging.WARNING):
+        assert len(list(backend.list(new=True))) == 1
+
+    assert (
+        "ralph.backends.data.parquet",
+        logging.WARNING,
+        "The `new` argument is ignored",
+    ) in caplog.record_tuples
+
+    msg = "Invalid target argument"
+    with pytest.raises(BackendParameterException, match=msg):
+        list(backend.list(target="qux"))
+
+
+def test_backends_data_parquet_write_and_read(parquet_backend, tmp_path):
+    """Test the `ParquetDataBackend.write` and `ParquetDataBackend.read` methods,
+    given statements, should write row groups of `chunk_size` rows with core
+    statement fields in dedicated columns.
+    """
+    backend = parquet_backend()
+    assert backend.write(STATEMENTS, target="foo.parquet") == 10
+
+    metadata = pq.ParquetFile(tmp_path / "foo.parquet").metadata
+    assert metadata.num_rows == 10
+    assert [metadata.row_group(i).num_rows for i in range(4)] == [3, 3, 3, 1]
+    table = pq.read_table(tmp_path / "foo.parquet")
+    assert table.column("verb").to_pylist()[2:4] == [
+        "https://w3id.org/xapi/video/verbs/initialized",
+        "https://w3id.org/xapi/video/verbs/played",
+    ]
+    assert table.column("actor_account_name").to_pylist()[:2] == ["user0", "user1"]
+    assert table.column("actor_mbox").null_count == 10
+
+    # Reading whole statements.
+    assert list(backend.read()) == STATEMENTS
+    assert list(backend.read(raw_output=True)) == [
+        f"{json.dumps(statement)}\n".encode() for statement in STATEMENTS
+    ]
+    assert list(backend.read(max_statements=3)) == STATEMENTS[:3]
+
+    # Reading selected columns.
+    query = ParquetQuery(columns=["id", "timestamp", "verb"])
+    assert next(backend.read(query=query)) == {
+        "id": "0",
+        "timestamp": "2023-01-01T00:00:00+00:00",
+        "verb": "https://w3id.org/xapi/video/verbs/initialized",
+    }
+    assert next(backend.read(query=query, raw_output=True)) == (
+        b'{"id": "0", "timestamp": "2023-01-01T00:00:00+00:00", '
+        b'"verb": "https://w3id.org/xapi/video/verbs/initialized"}\n'
+    )
+
+
+def test_backends_data_parquet_write_with_bytes_and_random_target(
+    parquet_backend, tmp_path
+):
+    """Test the `ParquetDataBackend.write` method, given bytes and no target, should
+    write statements to a new file.
+    """
+    backend = parquet_backend()
+    data = [f"{json.dumps(statement)}\n".encode() for statement in STATEMENTS]
+    assert backend.write(data) == 10
+    paths = list(tmp_path.iterdir())
+    assert len(paths) == 1
+    assert paths[0].suffix == ".parquet"
+    assert list(backend.read()) == STATEMENTS
+
+
+@pytest.mark.parametrize(
+    "query,expected_ids,expected_row_groups",
+    [
+        # Filtering by timestamp.
+        ({"since": "2023-01-03T00:00:00+00:00"}, [str(i) for i in range(3, 10)], 3),
+        ({"until": "2023-01-03T00:00:00"}, ["0", "1", "2"], 1),
+        (
+            {"since": "2023-01-04T00:00:00Z", "until": "2023-01-05T00:00:00Z"},
+            ["4"],
+            1,
+        ),
+        # Filtering by verb.
+        (
+            {"verb": "https://w3id.org/xapi/video/verbs/played"},
+            ["3", "4", "5", "6"],
+            2,
+        ),
+        ({"verb": "https://w3id.org/xapi/video/verbs/terminated"}, [], 0),
+        # Filtering by id.
+        ({"ids": ["8", "1", "foo"]}, ["1", "8"], 4),
+        ({"ids": []}, [], 4),
+        # Filtering by timestamp and verb.
+        (
+            {
+                "since": "2023-01-05T00:00:00+01:00",
+                "verb": "https://w3id.org/xapi/video/verbs/paused",
+            },
+            ["7", "8", "9"],
+            2,
+        ),
+    ],
+)
+def test_backends_data_parquet_read_with_query(
+    query, expected_ids, expected_row_groups, parquet_backend, tmp_path
+):
+    """Test the `ParquetDataBackend.read` method, given a query, should only read
+    row groups which may contain matching statements.
+    """
+    backend = parquet_backend()
+    backend.write(STATEMENTS, target="foo.parquet")
+    query = ParquetQuery(columns=["id"], **query)
+    assert [row["id"] for row in backend.read(query=query)] == expected_ids
+    metadata = pq.ParquetFile(tmp_path / "foo.parquet").metadata
+    row_groups = ParquetDataBackend.get_row_groups(metadata, query)
+    assert len(row_groups) == expected_row_groups
+
+
+def test_backends_data_parquet_read_with_pattern(parquet_backend, caplog):
+    """Test the `ParquetDataBackend.read` method, given a pattern, should read the
+    matching files in order.
+    """
+    backend = parquet_backend()
+    backend.write(STATEMENTS[5:], target="2023-02.parquet")
+    backend.write(STATEMENTS[:5], target="2023-01.parquet")
+    backend.write(STATEMENTS[:1], target="2022-12.parquet")
+
+    query = ParquetQuery(pattern="2023-*.parquet")
+    assert list(backend.read(query=query)) == STATEMENTS
+
+    with caplog.at_level(logging.INFO):
+        assert not list(backend.read(query=ParquetQuery(pattern="foo")))
+
+    assert caplog.record_tuples[-1][2].startswith("No file found for query")
+
+
+def test_backends_data_parquet_read_with_invalid_columns(parquet_backend):
+    """Test the `ParquetDataBackend.read` method, given unknown columns, should
+    raise a `BackendParameterException`.
+    """
+    backend = parquet_backend()
+    query = ParquetQuery(columns=["id", "foo"])
+    with pytest.raises(BackendParameterException, match=r"Unknown columns: \['foo'\]"):
+        list(backend.read(query=query))
+
+
+def test_backends_data_parquet_read_with_invalid_file(parquet_backend, tmp_path):
+    """Test the `ParquetDataBackend.read` method, given an invalid file, should
+    raise a `BackendException`.
+    """
+    backend = parquet_backend()
+    (tmp_path / "foo.parquet").write_text("foo")
+    msg = f"Failed to read {tmp_path / 'foo.parquet'}"
+    with pytest.raises(BackendException, match=msg):
+        list(backend.read())
+
+
+def test_backends_data_parquet_read_with_ignore_errors(parquet_backend, caplog):
+    """Test the `ParquetDataBackend.read` method, given `ignore_errors`, should skip
+    statements that can't be decoded.
+    """
+    backend = parquet_backend()
+    backend.write(STATEMENTS, target="foo.parquet")
+    # Decoding errors are only possible in files not written by Ralph.
+    table = pq.read_table(backend.default_directory / "foo.parquet")
+    statements = table.column("statement").to_pylist()
+    statements[1] = "foo"
+    table = table.set_column(
+        table.schema.get_field_index("statement"),
+        "statement",
+        [statements],
+    )
+    pq.write_table(table, backend.default_directory / "bar.parquet")
+
+    query = ParquetQuery(pattern="bar.parquet")
+    with caplog.at_level(logging.WARNING):
+        statements = list(backend.read(query=query, ignore_errors=True))
+
+    assert statements == STATEMENTS[:1] + STATEMENTS[2:]
+    with pytest.raises(BackendException, match="Failed to decode JSON"):
+        list(backend.read(query=query))
+
+
+def test_backends_data_parquet_write_with_existing_target(parquet_backend, tmp_path):
+    """Test the `ParquetDataBackend.write` method, given an existing target, should
+    raise a `BackendException`.
+    """
+    backend = parquet_backend()
+    backend.write(STATEMENTS, target="foo.parquet")
+    msg = f"{tmp_path / 'foo.parquet'} already exists and overwrite is not allowed"
+    with pytest.raises(BackendException, match=msg):
+        backend.write(STATEMENTS, target="foo.parquet")
+
+    assert list(backend.read()) == STATEMENTS
+
+
+def test_backends_data_parquet_write_with_invalid_statements(
+    parquet_backend, tmp_path, caplog
+):
+    """Test the `ParquetDataBackend.write` method, given statements without a valid
+    timestamp, should raise a `BackendException` and remove the partially written
+    file, unless `ignore_errors` is `True`.
+    """
+    backend = parquet_backend()
+    data = STATEMENTS[:4] + [{"id": "foo"}] + STATEMENTS[4:]
+    msg = "statement {'id': 'foo'} has a missing or invalid 'timestamp' field"
+    with pytest.raises(BackendException, match=msg):
+        backend.write(data, target="foo.parquet")
+
+    assert not list(tmp_path.iterdir())
+
+    with caplog.at_level(logging.WARNING):
+        assert backend.write(data, target="foo.parquet", ignore_errors=True) == 10
+
+    assert ("ralph.backends.data.parquet", logging.WARNING, msg) in (
+        caplog.record_tuples
+    )
+    assert list(backend.read()) == STATEMENTS
+
+
+@pytest.mark.parametrize(
+    "operation_type",
+    [BaseOperationType.APPEND, BaseOperationType.UPDATE, BaseOperationType.DELETE],
+)
+def test_backends_data_parquet_write_with_unsupported_operation(
+    operation_type, parquet_backend
+):
+    """Test the `ParquetDataBackend.write` method, given an unsupported
+    `operation_type`, should raise a `BackendParameterException`.
+    """
+    backend = parquet_backend()
+    msg = f"{operation_type.value.capitalize()} operation_type is not allowed"
+    with pytest.raises(BackendParameterException, match=msg):
+        backend.write(STATEMENTS, operation_type=operation_type)
+
+
+@mock_aws
+def test_backends_data_parquet_s3_storage(parquet_backend, monkeypatch):
+    """Test the `ParquetDataBackend` with the `s3` storage, should write objects
+    with the S3 data backend and read them with ranged requests.
+    """
+    monkeypatch.setenv("RALPH_BACKENDS__DATA__S3__DEFAULT_BUCKET_NAME", "bucket")
+    monkeypatch.setenv("RALPH_BACKENDS__DATA__S3__DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("RALPH_BACKENDS__DATA__S3__ACCESS_KEY_ID", "foo")
+    monkeypatch.setenv("RALPH_BACKENDS__DATA__S3__SECRET_ACCESS_KEY", "bar")
+    boto3.client("s3", region_name="us-east-1").create_bucket(Bucket="bucket")
+
+    backend = parquet_backend(storage="s3")
+    assert backend.status() == DataBackendStatus.OK
+    assert backend.write(STATEMENTS, target="bucket/2023/01.parquet") == 10
+    assert backend.write(STATEMENTS[:2], target="02.parquet") == 2
+    assert sorted(backend.list()) == ["02.parquet", "2023/01.parquet"]
+
+    assert list(backend.read(target="bucket/2023")) == STATEMENTS
+    query = ParquetQuery(
+        columns=["id"], since=datetime(2023, 1, 9, tzinfo=timezone.utc)
+    )
+    assert list(backend.read(query=query)) == [{"id": "9"}]
+
+    msg = "already exists and overwrite is not allowed"
+    with pytest.raises(BackendException, match=msg):
+        backend.write(STATEMENTS, target="02.parquet")
+
+    backend.close()
+
+
+@mock_aws
+def test_backends_data_parquet_s3_object_file():
+    """Test the `S3ObjectFile` class, should read ranges of an S3 object."""
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket="bucket")
+    client.put_object(Bucket="bucket", Key="foo", Body=b"0123456789")
+
+    file = S3ObjectFile(client, "bucket", "foo", 10)
+    assert file.read(3) == b"012"
+    assert file.tell() == 3
+    assert file.seek(-2, 2) == 8
+    assert file.read() == b"89"
+    assert file.read(1) == b""
+    file.seek(4)
+    assert file.seek(1, 1) == 5
+    assert file.read(2) == b"56"
@@ -0,0 +1,371 @@
+"""Tests for Ralph SQLite data backend."""
+
+import json
+import logging
+import sqlite3
+
+import pytest
+
+from ralph.backends.data.base import BaseOperationType, DataBackendStatus
+from ralph.backends.data.sqlite import (
+    SQLiteDataBackend,
+    SQLiteDataBackendSettings,
+    SQLiteQuery,
+)
+from ralph.exceptions import BackendException, BackendParameterException
+
+
+def test_backends_data_sqlite_default_instantiation(monkeypatch, fs):
+    """Test the `SQLiteDataBackend` default instantiation."""
+    fs.create_file(".env")
+    backend_settings_names = [
+        "DATABASE_PATH",
+        "DEFAULT_TABLE",
+        "BUSY_TIMEOUT",
+        "SYNCHRONOUS",
+        "LOCALE_ENCODING",
+        "READ_CHUNK_SIZE",
+        "WRITE_CHUNK_SIZE",
+    ]
+    for name in backend_settings_names:
+        monkeypatch.delenv(f"RALPH_BACKENDS__DATA__SQLITE__{name}", raising=False)
+
+    assert SQLiteDataBackend.name == "sqlite"
+    assert SQLiteDataBackend.query_class == SQLiteQuery
+    assert SQLiteDataBackend.default_operation_type == BaseOperationType.INDEX
+    assert SQLiteDataBackend.settings_class == SQLiteDataBackendSettings
+    backend = SQLiteDataBackend()
+    assert str(backend.settings.DATABASE_PATH) == "ralph.sqlite3"
+    assert backend.settings.DEFAULT_TABLE == "statements"
+    assert backend.settings.BUSY_TIMEOUT == 5.0
+    assert backend.settings.SYNCHRONOUS == "NORMAL"
+    assert backend.settings.LOCALE_ENCODING == "utf8"
+    assert backend.settings.READ_CHUNK_SIZE == 500
+    assert backend.settings.WRITE_CHUNK_SIZE == 500
+
+    # Test overriding default values with environment variables.
+    monkeypatch.setenv("RALPH_BACKENDS__DATA__SQLITE__DEFAULT_TABLE", "foo")
+    backend = SQLiteDataBackend()
+    assert backend.settings.DEFAULT_TABLE == "foo"
+
+
+def test_backends_data_sqlite_instantiation_with_invalid_table():
+    """Test the `SQLiteDataBackendSettings` instantiation, given an invalid default
+    table name, should raise a `ValidationError`.
+    """
+    with pytest.raises(ValueError, match="DEFAULT_TABLE"):
+        SQLiteDataBackendSettings(DEFAULT_TABLE="foo; DROP TABLE bar")
+
+
+def test_backends_data_sqlite_status(sqlite_backend):
+    """Test the `SQLiteDataBackend.status` method."""
+    backend = sqlite_backend()
+    assert backend.status() == DataBackendStatus.OK
+    # The database should be opened in WAL mode.
+    assert backend.connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    backend.close()
+
+
+def test_backends_data_sqlite_status_with_connection_failure(tmp_path, caplog):
+    """Test the `SQLiteDataBackend.status` method, given a database that can't be
+    opened, should return `DataBackendStatus.AWAY`.
+    """
+    settings = SQLiteDataBackendSettings(DATABASE_PATH=tmp_path / "foo" / "bar.db")
+    backend = SQLiteDataBackend(settings)
+    with caplog.at_level(logging.ERROR):
+        assert backend.status() == DataBackendStatus.AWAY
+
+    assert (
+        "ralph.backends.data.sqlite",
+        logging.ERROR,
+        f"Failed to connect to the {tmp_path / 'foo' / 'bar.db'} SQLite database: "
+        "unable to open database file",
+    ) in caplog.record_tuples
+
+
+def test_backends_data_sqlite_list(sqlite_backend, caplog):
+    """Test the `SQLiteDataBackend.list` method."""
+    backend = sqlite_backend()
+    assert not list(backend.list())
+
+    backend.write([{"id": "foo", "timestamp": "2023-01-01"}])
+    backend.write([{"id": "foo", "timestamp": "2023-01-01"}], target="bar")
+    assert list(backend.list()) == ["statements", "bar"]
+    assert [table["name"] for table in backend.list(details=True)] == [
+        "statements",
+        "bar",
+    ]
+    assert "CREATE TABLE statements" in next(backend.list(details=True))["sql"]
+
+    with caplog.at_level(logging.WARNING):
+        assert list(backend.list(target="foo", new=True)) == ["statements", "bar"]
+
+    assert (
+        "ralph.backends.data.sqlite",
+        logging.WARNING,
+        "The `target` argument is ignored",
+    ) in caplog.record_tuples
+    assert (
+        "ralph.backends.data.sqlite",
+        logging.WARNING,
+        "The `new` argument is ignored",
+    ) in caplog.record_tuples
+    backend.close()
+
+
+def test_backends_data_sqlite_write_and_read(sqlite_backend):
+    """Test the `SQLiteDataBackend.write` and `SQLiteDataBackend.read` methods,
+    given statements, should store them along with their indexed fields.
+    """
+    backend = sqlite_backend()
+    statements = [
+        {
+            "id": str(i),
+            "timestamp": f"2023-01-0{i + 1}T00:00:00+00:00",
+            "verb": {"id": "https://w3id.org/xapi/video/verbs/played"},
+            "actor": {"account": {"name": "foo", "homePage": "https://bar.baz"}},
+            "context": {"registration": "3630c0ea-94c1-4b3a-8fe9-e1b4e5b94fa6"},
+        }
+        for i in range(5)
+    ]
+    assert backend.write(statements) == 5
+
+    rows = list(backend.read(query=SQLiteQuery(select="*", sort="id")))
+    assert len(rows) == 5
+    assert rows[0]["id"] == "0"
+    assert rows[0]["timestamp"] == 1672531200000000
+    assert rows[0]["verb"] == "https://w3id.org/xapi/video/verbs/played"
+    assert rows[0]["actor_account_name"] == "foo"
+    assert rows[0]["actor_account_home_page"] == "https://bar.baz"
+    assert rows[0]["actor_mbox"] is None
+    assert rows[0]["registration"] == "3630c0ea-94c1-4b3a-8fe9-e1b4e5b94fa6"
+    assert rows[0]["statement"] == statements[0]
+
+    # Read statements with a query.
+    query = SQLiteQuery(
+        where=["timestamp > :since", "id != :id"],
+        parameters={"since": 1672531200000000, "id": "3"},
+        sort="timestamp DESC",
+        limit=2,
+    )
+    assert [row["statement"] for row in backend.read(query=query)] == [
+        statements[4],
+        statements[2],
+    ]
+
+    # Read raw statements.
+    query = SQLiteQuery(select=["id", "statement"], where="id = ?", parameters=["1"])
+    assert list(backend.read(query=query, raw_output=True)) == [
+        f'{{"id": "1", "statement": {json.dumps(statements[1])}}}\n'.encode()
+    ]
+
+    # Read a limited number of statements.
+    assert len(list(backend.read(max_statements=3))) == 3
+
+    # Read statements prefetched in a background thread.
+    rows = backend.read(chunk_size=1, prefetch=2, max_statements=3)
+    assert list(rows) == list(backend.read(max_statements=3))
+    backend.close()
+
+
+def test_backends_data_sqlite_write_with_target(sqlite_backend):
+    """Test the `SQLiteDataBackend.write` method, given a target, should write
+    statements to the target table.
+    """
+    backend = sqlite_backend()
+    assert backend.write([{"id": "foo", "timestamp": "2023-01-01"}], target="bar") == 1
+    assert not list(backend.read())
+    assert [row["statement"]["id"] for row in backend.read(target="bar")] == ["foo"]
+    backend.close()
+
+
+@pytest.mark.parametrize("target", ["foo bar", "foo;", "1foo", "foo-bar"])
+def test_backends_data_sqlite_read_and_write_with_invalid_target(
+    target, sqlite_backend
+):
+    """Test the `SQLiteDataBackend.read` and `SQLiteDataBackend.write` methods,
+    given an invalid target, should raise a `BackendParameterException`.
+    """
+    backend = sqlite_backend()
+    msg = f"The target=`{target}` is not a valid table name"
+    with pytest.raises(BackendParameterException, match=msg):
+        list(backend.read(target=target))
+
+    with pytest.raises(BackendParameterException, match=msg):
+        backend.write([{"id": "foo", "timestamp": "2023-01-01"}], target=target)
+
+    backend.close()
+
+
+def test_backends_data_sqlite_read_with_invalid_query(sqlite_backend, caplog):
+    """Test the `SQLiteDataBackend.read` method, given an invalid query, should
+    raise a `BackendException`.
+    """
+    backend = sqlite_backend()
+    msg = "Failed to read rows: no such column: foo"
+    with pytest.raises(BackendException, match=msg):
+        with caplog.at_level(logging.ERROR):
+            list(backend.read(query=SQLiteQuery(select="foo")))
+
+    assert ("ralph.backends.data.sqlite", logging.ERROR, msg) in caplog.record_tuples
+    backend.close()
+
+
+@pytest.mark.parametrize(
+    "operation_type", [BaseOperationType.CREATE, BaseOperationType.INDEX]
+)
+def test_backends_data_sqlite_write_with_create_or_index_operation(
+    operation_type, sqlite_backend, caplog
+):
+    """Test the `SQLiteDataBackend.write` method, given a `CREATE` or `INDEX`
+    `operation_type`, should insert statements, failing on stored ids unless
+    `ignore_errors` is `True`.
+    """
+    backend = sqlite_backend()
+    statements = [
+        {"id": "foo", "timestamp": "2023-01-01"},
+        {"id": "bar", "timestamp": "2023-01-02"},
+    ]
+    assert backend.write(statements, operation_type=operation_type) == 2
+
+    # Statements with an already stored id should not be inserted.
+    msg = "Failed to write statements batch: UNIQUE constraint failed: statements.id"
+    with pytest.raises(BackendException, match=msg):
+        backend.write(statements[:1], operation_type=operation_type)
+
+    data = [statements[0], {"id": "baz", "timestamp": "2023-01-03"}]
+    assert backend.write(data, operation_type=operation_type, ignore_errors=True) == 1
+
+    # Invalid statements should raise an exception unless errors are ignored.
+    msg = "statement {'id': 'qux'} has a missing or invalid 'timestamp' field"
+    with pytest.raises(BackendException, match=msg):
+        backend.write([{"id": "qux"}], operation_type=operation_type)
+
+    with caplog.at_level(logging.WARNING):
+        data = [{"id": "qux"}, {"id": "quux", "timestamp": "2023-01-04"}]
+        assert backend.write(data, ignore_errors=True) == 1
+
+    assert ("ralph.backends.data.sqlite", logging.WARNING, msg) in caplog.record_tuples
+    assert [row["statement"]["id"] for row in backend.read()] == [
+        "foo",
+        "bar",
+        "baz",
+        "quux",
+    ]
+    backend.close()
+
+
+def test_backends_data_sqlite_write_without_id(sqlite_backend):
+    """Test the `SQLiteDataBackend.write` method, given statements without an id,
+    should give them a random id when creating them.
+    """
+    backend = sqlite_backend()
+    statement = {"timestamp": "2023-01-01"}
+    msg = "statement {'timestamp': '2023-01-01'} has no 'id' field"
+    with pytest.raises(BackendException, match=msg):
+        backend.write([statement], operation_type=BaseOperationType.INDEX)
+
+    assert backend.write([statement], operation_type=BaseOperationType.CREATE) == 1
+    rows = list(backend.read(query=SQLiteQuery(select=["id", "statement"])))
+    assert len(rows) == 1
+    assert rows[0]["id"]
+    assert rows[0]["statement"] == statement
+    backend.close()
+
+
+def test_backends_data_sqlite_write_with_update_and_delete_operations(
+    sqlite_backend,
+):
+    """Test the `SQLiteDataBackend.write` method, given `UPDATE` or `DELETE`
+    `operation_type`, should update or delete the statements with matching ids.
+    """
+    backend = sqlite_backend()
+    statements = [
+        {"id": "foo", "timestamp": "2023-01-01", "verb": {"id": "https://a.b"}},
+        {"id": "bar", "timestamp": "2023-01-02"},
+    ]
+    assert backend.write(statements) == 2
+
+    updated = [
+        {"id": "foo", "timestamp": "2023-01-03", "verb": {"id": "https://c.d"}},
+        {"id": "baz", "timestamp": "2023-01-03"},
+    ]
+    assert backend.write(updated, operation_type=BaseOperationType.UPDATE) == 1
+    query = SQLiteQuery(select=["id", "verb", "statement"], sort="id")
+    assert list(backend.read(query=query)) == [
+        {"id": "bar", "verb": None, "statement": statements[1]},
+        {"id": "foo", "verb": "https://c.d", "statement": updated[0]},
+    ]
+
+    deleted = [{"id": "foo"}, {"id": "baz"}]
+    assert backend.write(deleted, operation_type=BaseOperationType.DELETE) == 1
+    assert [row["statement"] for row in backend.read()] == statements[1:]
+    backend.close()
+
+
+def test_backends_data_sqlite_write_with_append_operation(sqlite_backend, caplog):
+    """Test the `SQLiteDataBackend.write` method, given an `APPEND`
+    `operation_type`, should raise a `BackendParameterException`.
+    """
+    backend = sqlite_backend()
+    msg = "Append operation_type is not allowed"
+    with pytest.raises(BackendParameterException, match=msg):
+        with caplog.at_level(logging.ERROR):
+            backend.write(data=[{}], operation_type=BaseOperationType.APPEND)
+
+    assert ("ralph.backends.data.base", logging.ERROR, msg) in caplog.record_tuples
+    backend.close()
+
+
+def test_backends_data_sqlite_write_with_batch_failure(sqlite_backend):
+    """Test the `SQLiteDataBackend.write` method, given a batch failing to be
+    written, should roll back the whole batch.
+    """
+    backend = sqlite_backend()
+    statements = [
+        {"id": "foo", "timestamp": "2023-01-01"},
+        {"id": "bar", "timestamp": "2023-01-02"},
+        {"id": "baz", "timestamp": "2023-01-03"},
+        {"id": "baz", "timestamp": "2023-01-04"},
+    ]
+    with pytest.raises(BackendException, match="UNIQUE constraint failed"):
+        backend.write(statements, chunk_size=2)
+
+    # Only the first batch should be written.
+    assert [row["statement"] for row in backend.read()] == statements[:2]
+    backend.close()
+
+
+def test_backends_data_sqlite_write_with_bytes(sqlite_backend):
+    """Test the `SQLiteDataBackend.write` method, given bytes, should decode and
+    write statements.
+    """
+    backend = sqlite_backend()
+    statements = [
+        {"id": "foo", "timestamp": "2023-01-01"},
+        {"id": "bar", "timestamp": "2023-01-02"},
+    ]
+    data = [f"{json.dumps(statement)}\n".encode() for statement in statements]
+    assert backend.write(data) == 2
+    assert [row["statement"] for row in backend.read()] == statements
+    backend.close()
+
+
+def test_backends_data_sqlite_close(sqlite_backend, caplog):
+    """Test the `SQLiteDataBackend.close` method."""
+    backend = sqlite_backend()
+
+    # Not using the connection, then closing it should log a warning.
+    with caplog.at_level(logging.WARNING):
+        backend.close()
+
+    assert (
+        "ralph.backends.data.sqlite",
+        logging.WARNING,
+        "No backend client to close.",
+    ) in caplog.record_tuples
+
+    connection = backend.connection
+    backend.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
@@ -0,0 +1,106 @@
+"""Tests for Ralph asynchronous cached LRS backend."""
+
+import pytest
+
+from ralph.backends.data.base import BaseOperationType
+from ralph.backends.lrs.async_cached import AsyncCachedLRSBackend
+from ralph.backends.lrs.async_sqlite import AsyncSQLiteLRSBackend
+from ralph.backends.lrs.base import RalphStatementsQuery
+from ralph.exceptions import BackendParameterException
+
+STATEMENTS = [
+    {
+        "id": str(index),
+        "actor": {"mbox": "mailto:foo@bar.baz"},
+        "verb": {"id": "foo_verb"},
+        "object": {"id": "foo_object"},
+        "timestamp": f"2023-06-24T00:00:0{index}+00:00",
+    }
+    for index in range(4)
+]
+
+
+def get_ids(statements):
+    """Return the ids of the `statements`."""
+    return [statement["id"] for statement in statements]
+
+
+def mock_query(*_):
+    """Fail as statements should be served by the cache."""
+    raise AssertionError("The cached backend should not be queried")
+
+
+def test_backends_lrs_async_cached_default_instantiation(monkeypatch, tmp_path):
+    """Test the `AsyncCachedLRSBackend` default instantiation."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("RALPH_BACKENDS__LRS__ASYNC_CACHED__BACKEND", "async_sqlite")
+    backend = AsyncCachedLRSBackend()
+    assert backend.name == "async_cached"
+    assert backend.settings.CACHE_MAX_SIZE == 10000
+    assert isinstance(backend.backend, AsyncSQLiteLRSBackend)
+
+
+@pytest.mark.parametrize("name", ["foo", "sqlite", "async_cached"])
+def test_backends_lrs_async_cached_instantiation_with_invalid_backend(
+    name, monkeypatch, tmp_path
+):
+    """Test the `AsyncCachedLRSBackend` instantiation, given a cached backend which
+    is not an asynchronous LRS backend, should raise a `BackendParameterException`.
+    """
+    monkeypatch.chdir(tmp_path)
+    settings = AsyncCachedLRSBackend.settings_class(BACKEND=name)
+    msg = f"The {name} backend is not an asynchronous LRS backend"
+    with pytest.raises(BackendParameterException, match=msg):
+        AsyncCachedLRSBackend(settings)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("shared", [False, True])
+async def test_backends_lrs_async_cached_queries(
+    shared, async_cached_lrs_backend, monkeypatch
+):
+    """Test the `AsyncCachedLRSBackend` query methods, should be served by the cache
+    once statements are cached.
+    """
+    backend = async_cached_lrs_backend(shared)
+    await backend.write(STATEMENTS)
+    params = RalphStatementsQuery.model_construct(statementId="0", limit=1)
+    assert get_ids((await backend.query_statements(params)).statements) == ["0"]
+    statements = backend.query_statements_by_ids(["1", "2", "foo"])
+    assert sorted([item["id"] async for item in statements]) == ["1", "2"]
+
+    for method in (
+        "query_statements",
+        "query_statements_by_ids",
+        "query_statement_fingerprints",
+    ):
+        monkeypatch.setattr(backend.backend, method, mock_query)
+
+    assert get_ids((await backend.query_statements(params)).statements) == ["0"]
+    statements = backend.query_statements_by_ids(["0", "1", "2"])
+    assert sorted([item["id"] async for item in statements]) == ["0", "1", "2"]
+    fingerprints = backend.query_statement_fingerprints(["2", "1"])
+    assert sorted([item.id async for item in fingerprints]) == ["1", "2"]
+    assert backend.cache.get_statistics()["hits"] == 6
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_lrs_async_cached_write_and_create_statements(
+    async_cached_lrs_backend,
+):
+    """Test the `AsyncCachedLRSBackend` `write` and `create_statements` methods,
+    should respectively remove written statements from the cache and cache created
+    statements.
+    """
+    backend = async_cached_lrs_backend()
+    assert not await backend.create_statements(STATEMENTS[:2])
+    assert await backend.create_statements(STATEMENTS[1:]) == ["1"]
+    statements = backend.query_statements_by_ids(get_ids(STATEMENTS))
+    assert sorted([item["id"] async for item in statements]) == ["0", "1", "2", "3"]
+    assert backend.cache.hits == 4
+
+    await backend.write([{"id": "0"}], operation_type=BaseOperationType.DELETE)
+    statements = backend.query_statements_by_ids(["0"])
+    assert not [item async for item in statements]
+    await backend.close()
@@ -0,0 +1,150 @@
+"""Tests for Ralph's async clickhouse LRS backend."""
+
+import logging
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from clickhouse_connect.driver.exceptions import ClickHouseError
+
+from ralph.backends.lrs.async_clickhouse import AsyncClickHouseLRSBackend
+from ralph.backends.lrs.base import RalphStatementsQuery
+from ralph.backends.lrs.clickhouse import ClickHouseLRSBackendSettings
+from ralph.exceptions import BackendException
+from ralph.utils import get_statement_fingerprint
+
+
+def test_backends_lrs_async_clickhouse_default_instantiation(monkeypatch, fs):
+    """Test the `AsyncClickHouseLRSBackend` default instantiation."""
+    fs.create_file(".env")
+    monkeypatch.delenv("RALPH_BACKENDS__LRS__CLICKHOUSE__IDS_CHUNK_SIZE", raising=False)
+    backend = AsyncClickHouseLRSBackend()
+    assert backend.name == "async_clickhouse"
+    assert backend.settings_class == ClickHouseLRSBackendSettings
+    assert backend.settings.IDS_CHUNK_SIZE == 10000
+
+    monkeypatch.setenv("RALPH_BACKENDS__LRS__CLICKHOUSE__IDS_CHUNK_SIZE", "1")
+    backend = AsyncClickHouseLRSBackend()
+    assert backend.settings.IDS_CHUNK_SIZE == 1
+
+
+@pytest.mark.anyio
+async def test_backends_lrs_async_clickhouse_query_statements(
+    clickhouse, async_clickhouse_lrs_backend
+):
+    """Test the `AsyncClickHouseLRSBackend.query_statements` method, should page
+    through statements and strip their stored fingerprint.
+    """
+    backend = async_clickhouse_lrs_backend()
+    timestamp = datetime.now(timezone.utc).isoformat()
+    statements = [
+        {
+            "id": str(uuid.uuid4()),
+            "timestamp": timestamp,
+            "actor": {"mbox": "mailto:foo@example.com"},
+            "verb": {"id": f"verb_{i}"},
+        }
+        for i in range(3)
+    ]
+    assert await backend.write(statements) == 3
+
+    params = RalphStatementsQuery.model_construct(limit=2, ascending=True)
+    result = await backend.query_statements(params)
+    assert len(result.statements) == 2
+    assert result.search_after
+    assert result.pit_id == result.statements[-1]["id"]
+
+    params = RalphStatementsQuery.model_construct(
+        limit=2,
+        ascending=True,
+        search_after=result.search_after,
+        pit_id=result.pit_id,
+    )
+    next_result = await backend.query_statements(params)
+    assert len(next_result.statements) == 1
+    assert sorted(
+        statement["id"] for statement in result.statements + next_result.statements
+    ) == sorted(statement["id"] for statement in statements)
+
+    params = RalphStatementsQuery.model_construct(verb="verb_1", limit=10)
+    result = await backend.query_statements(params)
+    assert result.statements == [statements[1]]
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_lrs_async_clickhouse_query_statements_by_ids(
+    clickhouse, async_clickhouse_lrs_backend
+):
+    """Test the `AsyncClickHouseLRSBackend.query_statements_by_ids` and
+    `query_statement_fingerprints` methods.
+    """
+    backend = async_clickhouse_lrs_backend()
+    timestamp = datetime.now(timezone.utc).isoformat()
+    statements = [{"id": str(uuid.uuid4()), "timestamp": timestamp} for _ in range(3)]
+    assert await backend.write(statements) == 3
+
+    ids = [statements[0]["id"], statements[2]["id"], str(uuid.uuid4())]
+    results = [statement async for statement in backend.query_statements_by_ids(ids)]
+    assert sorted(results, key=lambda statement: statement["id"]) == sorted(
+        [statements[0], statements[2]], key=lambda statement: statement["id"]
+    )
+
+    fingerprints = {
+        item.id: item.fingerprint
+        async for item in backend.query_statement_fingerprints(ids)
+    }
+    assert fingerprints == {
+        statements[0]["id"]: get_statement_fingerprint(statements[0]),
+        statements[2]["id"]: get_statement_fingerprint(statements[2]),
+    }
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_lrs_async_clickhouse_init_indexes(
+    clickhouse, async_clickhouse_lrs_backend
+):
+    """Test the `AsyncClickHouseLRSBackend.init_indexes` method, should add
+    materialized columns used to filter statements.
+    """
+    backend = async_clickhouse_lrs_backend()
+    assert "verb" in await backend.explain_query_shapes()
+
+    names = await backend.init_indexes()
+    assert "verb_id" in names
+    assert "verb_id_index" in names
+    assert not await backend.explain_query_shapes()
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_lrs_async_clickhouse_query_statements_client_failure(
+    monkeypatch, caplog
+):
+    """Test the `AsyncClickHouseLRSBackend.query_statements` method, given a client
+    query failure, should raise a `BackendException` and log the error.
+    """
+
+    async def mock_get_client():
+        """Mock the `AsyncClickHouseLRSBackend.get_client` method."""
+        raise ClickHouseError("Query error")
+
+    backend = AsyncClickHouseLRSBackend()
+    backend._columns[backend.settings.EVENT_TABLE_NAME] = {}
+    monkeypatch.setattr(backend, "get_client", mock_get_client)
+    msg = "Failed to read documents: Query error"
+    with caplog.at_level(logging.ERROR):
+        with pytest.raises(BackendException, match=msg):
+            await backend.query_statements(RalphStatementsQuery.model_construct())
+
+    assert (
+        "ralph.backends.lrs.async_clickhouse",
+        logging.ERROR,
+        "Failed to read from ClickHouse",
+    ) in caplog.record_tuples
+
+    backend._columns.clear()
+    msg = "Failed to get the xapi_events_all table columns: Query error"
+    with pytest.raises(BackendException, match=msg):
+        await backend.explain_query_shapes()
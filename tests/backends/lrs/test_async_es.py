@@ -41,6 +41,10 @@ def test_backends_lrs_async_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 1. Query by statementId.
@@ -54,6 +58,10 @@ def test_backends_lrs_async_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 2. Query by statementId and agent with mbox IFI.
@@ -74,6 +82,10 @@ def test_backends_lrs_async_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 3. Query by statementId and agent with mbox_sha1sum IFI.
@@ -103,6 +115,10 @@ def test_backends_lrs_async_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 4. Query by statementId and agent with openid IFI.
@@ -132,6 +148,10 @@ def test_backends_lrs_async_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 5. Query by statementId and agent with account IFI.
@@ -165,6 +185,10 @@ def test_backends_lrs_async_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 6. Query by verb and activity.
@@ -200,6 +224,10 @@ def test_backends_lrs_async_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 7. Query by timerange (with since/until).
@@ -235,6 +263,10 @@ def test_backends_lrs_async_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 8. Query with pagination and pit_id.
@@ -248,6 +280,10 @@ def test_backends_lrs_async_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 9. Query ignoring statement sort order.
@@ -261,6 +297,10 @@ def test_backends_lrs_async_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": "_shard_doc",
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
     ],
@@ -453,3 +493,65 @@ async def test_backends_lrs_async_es_query_statements_by_ids_many_indexes(
 
     await backend_1.close()
     await backend_2.close()
+
+
+@pytest.mark.anyio
+async def test_backends_lrs_async_es_write_with_index_period(monkeypatch):
+    """Test the `AsyncESLRSBackend.write` method, given an `INDEX_PERIOD`, should
+    write statements to the index of their timestamp period.
+    """
+    indices = []
+
+    async def mock_async_streaming_bulk(client, actions, **kwargs):
+        """Mock the `async_streaming_bulk` Elasticsearch helper."""
+        for action in actions:
+            indices.append(action["_index"])
+            yield True, action
+
+    monkeypatch.setattr(
+        "ralph.backends.data.async_es.async_streaming_bulk", mock_async_streaming_bulk
+    )
+    settings = AsyncESLRSBackend.settings_class(DEFAULT_INDEX="foo", INDEX_PERIOD="day")
+    backend = AsyncESLRSBackend(settings)
+    statements = [
+        {"id": "0", "timestamp": "2022-06-27T15:36:50"},
+        {"id": "1", "timestamp": "2022-06-28T00:30:00+01:00"},
+    ]
+    assert await backend.write(statements) == 2
+    assert indices == ["foo-2022.06.27", "foo-2022.06.27"]
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_lrs_async_es_create_statements_with_index_period(
+    monkeypatch,
+):
+    """Test the `AsyncESLRSBackend.create_statements` method, given an
+    `INDEX_PERIOD` and a statement id stored in the index of another period, should
+    not create it and return its id.
+    """
+    statements = [
+        {"id": "foo", "timestamp": "2023-01-01T00:00:00"},
+        {"id": "bar", "timestamp": "2023-01-01T00:00:00"},
+    ]
+
+    async def mock_read(query, target, chunk_size=None):
+        """Mock the `AsyncESLRSBackend.read` method."""
+        assert target == "foo-*"
+        yield {"_index": "foo-2022.06", "_source": {"id": "foo"}}
+
+    async def mock_async_streaming_bulk(client, actions, **kwargs):
+        """Mock the `async_streaming_bulk` Elasticsearch helper."""
+        assert [action["_id"] for action in actions] == ["bar"]
+        yield True, {"create": {"_id": "bar", "status": 201}}
+
+    monkeypatch.setattr(
+        "ralph.backends.lrs.async_es.async_streaming_bulk", mock_async_streaming_bulk
+    )
+    settings = AsyncESLRSBackend.settings_class(
+        DEFAULT_INDEX="foo", INDEX_PERIOD="month"
+    )
+    backend = AsyncESLRSBackend(settings)
+    monkeypatch.setattr(backend, "read", mock_read)
+    assert await backend.create_statements(statements) == ["foo"]
+    await backend.close()
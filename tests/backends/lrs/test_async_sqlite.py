@@ -0,0 +1,103 @@
+"""Tests for Ralph asynchronous SQLite LRS backend."""
+
+import pytest
+
+from ralph.backends.lrs.async_sqlite import AsyncSQLiteLRSBackend
+from ralph.backends.lrs.base import RalphStatementsQuery, StatementFingerprint
+from ralph.backends.lrs.sqlite import SQLiteLRSBackend, SQLiteLRSBackendSettings
+from ralph.utils import get_statement_fingerprint
+
+STATEMENTS = [
+    {
+        "id": str(i),
+        "verb": {"id": "foo_verb" if i % 2 else "bar_verb"},
+        "timestamp": f"2023-06-2{i}T00:00:20.194929+00:00",
+    }
+    for i in range(5)
+]
+
+
+def test_backends_lrs_async_sqlite_default_instantiation(monkeypatch, fs):
+    """Test the `AsyncSQLiteLRSBackend` default instantiation."""
+    fs.create_file(".env")
+    monkeypatch.delenv("RALPH_BACKENDS__LRS__SQLITE__DEFAULT_TABLE", raising=False)
+
+    assert AsyncSQLiteLRSBackend.settings_class == SQLiteLRSBackendSettings
+    backend = AsyncSQLiteLRSBackend()
+    assert isinstance(backend.backend, SQLiteLRSBackend)
+    assert backend.settings.DEFAULT_TABLE == "statements"
+
+
+@pytest.mark.anyio
+async def test_backends_lrs_async_sqlite_query_statements(async_sqlite_lrs_backend):
+    """Test the `AsyncSQLiteLRSBackend.query_statements` method, given statement
+    parameters, should return the matching statements page by page.
+    """
+    backend = async_sqlite_lrs_backend()
+    assert await backend.write(STATEMENTS) == 5
+
+    params = RalphStatementsQuery.model_construct(verb="foo_verb", limit=1)
+    result = await backend.query_statements(params)
+    assert result.statements == [STATEMENTS[3]]
+
+    params = RalphStatementsQuery.model_construct(
+        verb="foo_verb", limit=1, search_after=result.search_after
+    )
+    result = await backend.query_statements(params)
+    assert result.statements == [STATEMENTS[1]]
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_lrs_async_sqlite_query_statements_by_ids(
+    async_sqlite_lrs_backend,
+):
+    """Test the `AsyncSQLiteLRSBackend.query_statements_by_ids` and
+    `AsyncSQLiteLRSBackend.query_statement_fingerprints` methods, given a list of
+    ids, should yield the matching statements and fingerprints.
+    """
+    backend = async_sqlite_lrs_backend()
+    await backend.write(STATEMENTS)
+
+    statements = backend.query_statements_by_ids(["0", "2", "4", "foo"])
+    assert sorted(
+        [statement async for statement in statements],
+        key=lambda statement: statement["id"],
+    ) == [STATEMENTS[0], STATEMENTS[2], STATEMENTS[4]]
+
+    fingerprints = backend.query_statement_fingerprints(["1", "3"])
+    assert sorted(
+        [fingerprint async for fingerprint in fingerprints],
+        key=lambda fingerprint: fingerprint.id,
+    ) == [
+        StatementFingerprint(statement["id"], get_statement_fingerprint(statement))
+        for statement in (STATEMENTS[1], STATEMENTS[3])
+    ]
+    assert not await backend.backfill_fingerprints()
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_lrs_async_sqlite_create_statements(async_sqlite_lrs_backend):
+    """Test the `AsyncSQLiteLRSBackend.create_statements` method, given new and
+    stored statements, should only write new statements and return the stored ids.
+    """
+    backend = async_sqlite_lrs_backend()
+    assert not await backend.create_statements(STATEMENTS[:3])
+    assert await backend.create_statements(STATEMENTS[2:]) == ["2"]
+    result = await backend.query_statements(
+        RalphStatementsQuery.model_construct(limit=10, ascending=True)
+    )
+    assert result.statements == STATEMENTS
+    await backend.close()
+
+
+@pytest.mark.anyio
+async def test_backends_lrs_async_sqlite_init_indexes(async_sqlite_lrs_backend):
+    """Test the `AsyncSQLiteLRSBackend.init_indexes` and
+    `AsyncSQLiteLRSBackend.explain_query_shapes` methods.
+    """
+    backend = async_sqlite_lrs_backend()
+    assert "statements_verb_idx" in await backend.init_indexes()
+    assert not await backend.explain_query_shapes()
+    await backend.close()
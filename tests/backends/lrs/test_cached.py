@@ -0,0 +1,208 @@
+"""Tests for Ralph cached LRS backend."""
+
+import pytest
+
+from ralph.backends.data.base import BaseOperationType
+from ralph.backends.lrs.base import (
+    AgentParameters,
+    RalphStatementsQuery,
+    StatementFingerprint,
+)
+from ralph.backends.lrs.cached import CachedLRSBackend, StatementCache
+from ralph.backends.lrs.sqlite import SQLiteLRSBackend
+from ralph.exceptions import BackendParameterException
+from ralph.utils import get_statement_fingerprint
+
+STATEMENTS = [
+    {
+        "id": str(index),
+        "actor": {"mbox": "mailto:foo@bar.baz"},
+        "verb": {"id": "foo_verb"},
+        "object": {"id": "foo_object"},
+        "timestamp": f"2023-06-24T00:00:0{index}+00:00",
+    }
+    for index in range(4)
+]
+
+
+def get_ids(statements):
+    """Return the ids of the `statements`."""
+    return [statement["id"] for statement in statements]
+
+
+def mock_query(*_):
+    """Fail as statements should be served by the cache."""
+    raise AssertionError("The cached backend should not be queried")
+
+
+def test_backends_lrs_cached_default_instantiation(monkeypatch, tmp_path):
+    """Test the `CachedLRSBackend` default instantiation."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("RALPH_BACKENDS__LRS__CACHED__BACKEND", "sqlite")
+    backend = CachedLRSBackend()
+    assert backend.name == "cached"
+    assert backend.settings.CACHE_MAX_SIZE == 10000
+    assert backend.settings.CACHE_TTL == 3600
+    assert backend.settings.CACHE_DATABASE_PATH is None
+    assert isinstance(backend.backend, SQLiteLRSBackend)
+    assert backend.default_operation_type == backend.backend.default_operation_type
+
+
+@pytest.mark.parametrize("name", ["foo", "async_sqlite", "cached"])
+def test_backends_lrs_cached_instantiation_with_invalid_backend(
+    name, monkeypatch, tmp_path
+):
+    """Test the `CachedLRSBackend` instantiation, given a cached backend which is not
+    a synchronous LRS backend, should raise a `BackendParameterException`.
+    """
+    monkeypatch.chdir(tmp_path)
+    settings = CachedLRSBackend.settings_class(BACKEND=name)
+    msg = f"The {name} backend is not a synchronous LRS backend"
+    with pytest.raises(BackendParameterException, match=msg):
+        CachedLRSBackend(settings)
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_backends_lrs_cached_query_statements_by_ids(
+    shared, cached_lrs_backend, monkeypatch
+):
+    """Test the `CachedLRSBackend.query_statements_by_ids` method, should only query
+    the cached backend for statements missing from the cache.
+    """
+    backend = cached_lrs_backend(shared)
+    backend.write(STATEMENTS)
+    ids = ["0", "1", "foo"]
+    assert sorted(get_ids(backend.query_statements_by_ids(ids))) == ["0", "1"]
+    assert backend.cache.get_statistics() == {
+        "hits": 0,
+        "misses": 3,
+        "hit_rate": 0.0,
+        "size": 2,
+    }
+
+    queried_ids = []
+
+    def mock_query_statements_by_ids(ids, target=None):
+        queried_ids.extend(ids)
+        return SQLiteLRSBackend.query_statements_by_ids(backend.backend, ids, target)
+
+    monkeypatch.setattr(
+        backend.backend, "query_statements_by_ids", mock_query_statements_by_ids
+    )
+    statements = list(backend.query_statements_by_ids(["1", "2", "foo"]))
+    assert sorted(get_ids(statements)) == ["1", "2"]
+    assert queried_ids == ["2", "foo"]
+    assert backend.cache.hits == 1
+    assert backend.cache.hit_rate == 1 / 6
+
+    # Mutating statements should not alter the cache.
+    statements[0]["verb"]["id"] = "bar_verb"
+    statements = list(backend.query_statements_by_ids(["1", "2"]))
+    assert [statement["verb"]["id"] for statement in statements] == ["foo_verb"] * 2
+    assert queried_ids == ["2", "foo"]
+
+
+def test_backends_lrs_cached_query_statements(cached_lrs_backend, monkeypatch):
+    """Test the `CachedLRSBackend.query_statements` method, given a query by id,
+    should be served by the cache once the statement is cached.
+    """
+    backend = cached_lrs_backend()
+    backend.write(STATEMENTS)
+    params = RalphStatementsQuery.model_construct(statementId="1", limit=1)
+    assert get_ids(backend.query_statements(params).statements) == ["1"]
+    # Missing statements are not cached.
+    params_foo = RalphStatementsQuery.model_construct(statementId="foo", limit=1)
+    assert not backend.query_statements(params_foo).statements
+
+    monkeypatch.setattr(backend.backend, "query_statements", mock_query)
+    assert get_ids(backend.query_statements(params).statements) == ["1"]
+    assert backend.cache.get_statistics()["hits"] == 1
+
+    # Other queries should be forwarded to the cached backend.
+    for params in (
+        RalphStatementsQuery.model_construct(limit=1),
+        RalphStatementsQuery.model_construct(statementId="1", verb="foo_verb"),
+        RalphStatementsQuery.model_construct(
+            statementId="1",
+            authority=AgentParameters.model_construct(mbox="mailto:foo@bar.baz"),
+        ),
+        RalphStatementsQuery.model_construct(
+            statementId="1", authority={"mbox": "mailto:foo@bar.baz"}
+        ),
+    ):
+        with pytest.raises(AssertionError, match="should not be queried"):
+            backend.query_statements(params)
+
+
+def test_backends_lrs_cached_write(cached_lrs_backend):
+    """Test the `CachedLRSBackend.write` method, should remove written statements
+    from the cache.
+    """
+    backend = cached_lrs_backend()
+    backend.write(STATEMENTS)
+    assert len(list(backend.query_statements_by_ids(["0", "1"]))) == 2
+
+    updated = {**STATEMENTS[0], "verb": {"id": "bar_verb"}}
+    assert backend.write([updated], operation_type=BaseOperationType.UPDATE) == 1
+    statements = {item["id"]: item for item in backend.query_statements_by_ids(["0"])}
+    assert statements["0"]["verb"] == {"id": "bar_verb"}
+    assert backend.cache.hits == 0
+
+    backend.write([{"id": "1"}], operation_type=BaseOperationType.DELETE)
+    assert not list(backend.query_statements_by_ids(["1"]))
+
+
+def test_backends_lrs_cached_create_statements(cached_lrs_backend, monkeypatch):
+    """Test the `CachedLRSBackend.create_statements` method, should cache created
+    statements, serving their fingerprints from the cache.
+    """
+    backend = cached_lrs_backend()
+    assert not backend.create_statements(STATEMENTS[:2])
+    assert backend.create_statements(STATEMENTS[1:]) == ["1"]
+    ids = get_ids(STATEMENTS)
+    assert sorted(get_ids(backend.backend.query_statements_by_ids(ids))) == ids
+
+    monkeypatch.setattr(backend.backend, "query_statement_fingerprints", mock_query)
+    fingerprints = backend.query_statement_fingerprints(ids)
+    assert sorted(fingerprints, key=lambda item: item.id) == [
+        StatementFingerprint(statement["id"], get_statement_fingerprint(statement))
+        for statement in STATEMENTS
+    ]
+
+
+def test_backends_lrs_cached_shared_cache(cached_lrs_backend, monkeypatch):
+    """Test the `CachedLRSBackend` shared cache, should serve statements cached by
+    other instances and evict the oldest statements above `CACHE_MAX_SIZE`.
+    """
+    backend = cached_lrs_backend(shared=True, max_size=3)
+    backend.write(STATEMENTS)
+    list(backend.query_statements_by_ids(["0"]))
+    list(backend.query_statements_by_ids(["1", "2", "3"]))
+
+    other_backend = cached_lrs_backend(shared=True, max_size=3)
+    monkeypatch.setattr(other_backend.backend, "query_statements_by_ids", mock_query)
+    statements = other_backend.query_statements_by_ids(["1", "2", "3"])
+    assert sorted(get_ids(statements)) == ["1", "2", "3"]
+    assert other_backend.cache.hits == 3
+    with pytest.raises(AssertionError, match="should not be queried"):
+        list(other_backend.query_statements_by_ids(["0"]))
+
+    # Invalidations should apply to all instances.
+    backend.write([{"id": "1"}], operation_type=BaseOperationType.DELETE)
+    other_backend = cached_lrs_backend(shared=True, max_size=3)
+    assert not list(other_backend.query_statements_by_ids(["1"]))
+    assert not other_backend.cache.hits
+
+
+def test_backends_lrs_cached_statement_cache_with_shared_cache_failure(
+    tmp_path, caplog
+):
+    """Test the `StatementCache`, given a failing shared cache, should handle it as
+    a cache miss.
+    """
+    cache = StatementCache(10, 60, tmp_path / "missing" / "cache.sqlite3")
+    cache.set({"foo": {"id": "foo"}})
+    assert cache.get(["foo", "bar"]) == {"foo": {"id": "foo"}}
+    assert cache.get_statistics()["misses"] == 1
+    assert "Failed to write the shared statement cache" in caplog.text
+    assert "Failed to read the shared statement cache" in caplog.text
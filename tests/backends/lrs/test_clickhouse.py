@@ -1,5 +1,6 @@
 """Tests for Ralph clickhouse database backend."""
 
+import json
 import logging
 import uuid
 from datetime import datetime, timezone
@@ -7,10 +8,17 @@ from datetime import datetime, timezone
 import pytest
 from clickhouse_connect.driver.exceptions import ClickHouseError
 
+from ralph.backends.data.clickhouse import InsertColumns
 from ralph.backends.lrs.base import RalphStatementsQuery
-from ralph.backends.lrs.clickhouse import ClickHouseLRSBackend
+from ralph.backends.lrs.clickhouse import (
+    BACKFILL_SETTINGS,
+    MATERIALIZED_COLUMNS,
+    ClickHouseLRSBackend,
+    FingerprintedInsertColumns,
+)
 from ralph.exceptions import BackendException
 from ralph.models.xapi.base.common import IRI
+from ralph.utils import get_statement_fingerprint
 
 
 def test_backends_lrs_clickhouse_default_instantiation(monkeypatch, fs):
@@ -462,12 +470,14 @@ def test_backends_lrs_clickhouse_query_statements_client_failure(
     failure, should raise a `BackendException` and log the error.
     """
 
-    def mock_query(*args, **kwargs):
-        """Mock the clickhouse_connect.client.search method."""
+    def mock_query_row_block_stream(*args, **kwargs):
+        """Mock the clickhouse_connect.client.query_row_block_stream method."""
         raise ClickHouseError("Query error")
 
     backend = clickhouse_lrs_backend()
-    monkeypatch.setattr(backend.client, "query", mock_query)
+    monkeypatch.setattr(
+        backend.client, "query_row_block_stream", mock_query_row_block_stream
+    )
 
     caplog.set_level(logging.ERROR)
 
@@ -490,12 +500,14 @@ def test_backends_lrs_clickhouse_query_statements_by_ids_client_failure(
     query failure, should raise a `BackendException` and log the error.
     """
 
-    def mock_query(*args, **kwargs):
-        """Mock the clickhouse_connect.client.search method."""
+    def mock_query_row_block_stream(*args, **kwargs):
+        """Mock the clickhouse_connect.client.query_row_block_stream method."""
         raise ClickHouseError("Query error")
 
     backend = clickhouse_lrs_backend()
-    monkeypatch.setattr(backend.client, "query", mock_query)
+    monkeypatch.setattr(
+        backend.client, "query_row_block_stream", mock_query_row_block_stream
+    )
 
     caplog.set_level(logging.ERROR)
 
@@ -509,3 +521,199 @@ def test_backends_lrs_clickhouse_query_statements_by_ids_client_failure(
         "Failed to read from ClickHouse",
     ) in caplog.record_tuples
     backend.close()
+
+
+def test_backends_lrs_clickhouse_init_indexes(clickhouse, clickhouse_lrs_backend):
+    """Test the `ClickHouseLRSBackend.init_indexes` method, should add materialized
+    columns used to filter statements.
+    """
+    backend = clickhouse_lrs_backend()
+    statements = [
+        {
+            "id": str(uuid.uuid4()),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "actor": {"mbox": "mailto:foo@example.com"},
+            "verb": {"id": verb_id},
+        }
+        for verb_id in ("verb_1", "verb_2")
+    ]
+    assert backend.write(statements) == 2
+    assert "verb" in backend.explain_query_shapes()
+
+    names = backend.init_indexes()
+    assert "verb_id" in names
+    assert "verb_id_index" in names
+    assert not backend.explain_query_shapes()
+    params = RalphStatementsQuery.model_construct(verb="verb_1", limit=10)
+    assert backend.query_statements(params).statements == [statements[0]]
+
+    # Given a table with materialized columns, the method should be idempotent.
+    assert backend.init_indexes() == names
+    backend.close()
+
+
+def test_backends_lrs_clickhouse_get_query_with_materialized_columns():
+    """Test the `ClickHouseLRSBackend.get_query` method, given materialized columns,
+    should filter statements using them.
+    """
+    params = RalphStatementsQuery.model_construct(verb="verb_1", limit=10)
+    assert ClickHouseLRSBackend.get_query(params).where == [
+        "JSONExtractString(event, 'verb', 'id') = {verb:String}"
+    ]
+    assert ClickHouseLRSBackend.get_query(params, {"verb_id"}).where == [
+        "verb_id = {verb:String}"
+    ]
+    assert "verb" in ClickHouseLRSBackend.get_unindexed_query_shapes(set())
+    assert not ClickHouseLRSBackend.get_unindexed_query_shapes(
+        set(MATERIALIZED_COLUMNS)
+    )
+
+
+def test_backends_lrs_clickhouse_get_json_extraction():
+    """Test the `ClickHouseLRSBackend.get_json_extraction` method."""
+    assert (
+        ClickHouseLRSBackend.get_json_extraction(("actor", "account", "name"))
+        == "JSONExtractString(event, 'actor', 'account', 'name')"
+    )
+
+
+def test_backends_lrs_clickhouse_write_with_fingerprint_column(monkeypatch):
+    """Test the `ClickHouseLRSBackend.write` method, should store statement
+    fingerprints in the `fingerprint` column if the table has one.
+    """
+    batches = []
+
+    def mock_bulk_import(batch, ignore_errors, target):
+        """Mock the `ClickHouseLRSBackend._bulk_import` method."""
+        batches.append(batch)
+        return len(batch.event_id)
+
+    backend = ClickHouseLRSBackend()
+    monkeypatch.setattr(backend, "_bulk_import", mock_bulk_import)
+    statement = {"id": str(uuid.uuid4()), "timestamp": "2022-06-27T15:36:50"}
+    target = backend.settings.EVENT_TABLE_NAME
+    backend._columns[target] = {"event": "", "fingerprint": ""}
+    assert backend.write([statement]) == 1
+    assert isinstance(batches[0], FingerprintedInsertColumns)
+    assert batches[0].fingerprint == [get_statement_fingerprint(statement)]
+    assert json.loads(batches[0].event[0]) == statement
+
+    # Given a table without `fingerprint` column, statements should be written
+    # without fingerprint.
+    backend._columns[target] = {"event": ""}
+    assert backend.write([statement]) == 1
+    assert isinstance(batches[1], InsertColumns)
+    assert json.loads(batches[1].event[0]) == statement
+
+
+def test_backends_lrs_clickhouse_get_fingerprints_query():
+    """Test the `ClickHouseLRSBackend.get_fingerprints_query` method, should select
+    the `fingerprint` column if the table has one.
+    """
+    query = ClickHouseLRSBackend.get_fingerprints_query({"fingerprint": ""})
+    assert query.select == ["event_id AS id", "fingerprint AS fingerprint"]
+    query = ClickHouseLRSBackend.get_fingerprints_query({})
+    assert query.select == ["event_id AS id", "'' AS fingerprint"]
+    document = {"id": uuid.UUID(int=1), "fingerprint": ""}
+    assert ClickHouseLRSBackend.to_statement_fingerprint(document).fingerprint is None
+
+
+def test_backends_lrs_clickhouse_backfill_fingerprints(monkeypatch):
+    """Test the `ClickHouseLRSBackend.backfill_fingerprints` method, should insert
+    fingerprints by chunks and store them using a single mutation.
+    """
+    commands = []
+    inserts = []
+    queries = []
+
+    class MockClient:
+        """Mock the ClickHouse client."""
+
+        def command(self, sql, settings=None):
+            """Record the executed command."""
+            commands.append((sql, settings))
+
+        def insert(self, table, rows, column_names):
+            """Record the inserted rows."""
+            inserts.append((table, rows, column_names))
+
+    timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    documents = [
+        {
+            "event_id": uuid.UUID(int=index),
+            "emission_time": timestamp,
+            "event": {"id": str(uuid.UUID(int=index)), "timestamp": "2024-01-01"},
+        }
+        for index in range(3)
+    ]
+
+    def mock_read(query, target, ignore_errors):
+        """Mock the `ClickHouseLRSBackend.read` method."""
+        assert not ignore_errors
+        queries.append(query)
+        offset = 2 * (len(queries) - 1)
+        return iter(documents[offset : offset + 2])
+
+    backend = ClickHouseLRSBackend()
+    backend._client = MockClient()
+    monkeypatch.setattr(backend, "read", mock_read)
+    assert backend.backfill_fingerprints(target="foo", chunk_size=2) == 3
+
+    # Chunks should be read following the last document of the previous chunk.
+    assert len(queries) == 3
+    assert queries[0].limit == 2
+    assert not queries[0].parameters
+    assert queries[1].parameters == {
+        "emission_time": timestamp.isoformat(),
+        "event_id": str(uuid.UUID(int=1)),
+    }
+    assert [rows for _, rows, _ in inserts] == [
+        [(x["event_id"], get_statement_fingerprint(x["event"])) for x in documents[:2]],
+        [(documents[2]["event_id"], get_statement_fingerprint(documents[2]["event"]))],
+    ]
+    assert {table for table, _, _ in inserts} == {"foo_fingerprints"}
+    mutations = [sql for sql, settings in commands if settings == BACKFILL_SETTINGS]
+    assert mutations == [
+        "ALTER TABLE foo UPDATE fingerprint = "
+        "joinGet('foo_fingerprints', 'fingerprint', event_id) WHERE fingerprint = ''"
+    ]
+    assert (
+        commands[0][0] == "ALTER TABLE foo ADD COLUMN IF NOT EXISTS fingerprint String"
+    )
+    assert commands[-1][0] == "DROP TABLE IF EXISTS foo_fingerprints"
+
+
+def test_backends_lrs_clickhouse_query_statement_fingerprints(
+    clickhouse, clickhouse_backend, clickhouse_lrs_backend
+):
+    """Test the `ClickHouseLRSBackend.query_statement_fingerprints` method, should
+    return stored fingerprints without storing them in the `event` column.
+    """
+    backend = clickhouse_lrs_backend()
+    data_backend = clickhouse_backend()
+    timestamp = datetime.now(timezone.utc).isoformat()
+    statements = [{"id": str(uuid.uuid4()), "timestamp": timestamp} for _ in range(2)]
+    ids = [statement["id"] for statement in statements]
+    assert backend.write(statements[:1]) == 1
+    assert data_backend.write(statements[1:]) == 1
+    events = [document["event"] for document in data_backend.read()]
+    assert sorted(event["id"] for event in events) == sorted(ids)
+    assert all("fingerprint" not in event for event in events)
+
+    fingerprints = {
+        x.id: x.fingerprint for x in backend.query_statement_fingerprints(ids)
+    }
+    assert fingerprints == {
+        statements[0]["id"]: get_statement_fingerprint(statements[0]),
+        statements[1]["id"]: None,
+    }
+
+    # Given statements written without fingerprint, they should be backfilled.
+    assert backend.backfill_fingerprints() == 1
+    fingerprints = {
+        x.id: x.fingerprint for x in backend.query_statement_fingerprints(ids)
+    }
+    assert fingerprints[statements[1]["id"]] == get_statement_fingerprint(statements[1])
+    assert not backend.backfill_fingerprints()
+    backend.close()
+    data_backend.close()
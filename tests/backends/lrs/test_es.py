@@ -8,9 +8,14 @@ from elastic_transport import ApiResponseMeta
 from elasticsearch import ApiError
 from elasticsearch.helpers import bulk
 
-from ralph.backends.lrs.base import RalphStatementsQuery
-from ralph.backends.lrs.es import ESLRSBackend
+from ralph.backends.lrs.base import (
+    STATEMENTS_QUERY_SHAPES,
+    RalphStatementsQuery,
+    StatementFingerprint,
+)
+from ralph.backends.lrs.es import STATEMENTS_MAPPINGS, ESLRSBackend
 from ralph.exceptions import BackendException
+from ralph.utils import get_statement_fingerprint
 
 from tests.fixtures.backends import ES_TEST_FORWARDING_INDEX, ES_TEST_INDEX
 
@@ -25,6 +30,7 @@ def test_backends_lrs_es_default_instantiation(monkeypatch, fs):
     monkeypatch.setenv("RALPH_BACKENDS__LRS__ES__DEFAULT_INDEX", "foo")
     backend = ESLRSBackend()
     assert backend.settings.DEFAULT_INDEX == "foo"
+    assert backend.settings.INDEX_PERIOD is None
 
 
 @pytest.mark.parametrize(
@@ -41,6 +47,10 @@ def test_backends_lrs_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 1. Query by statementId.
@@ -54,6 +64,10 @@ def test_backends_lrs_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 2. Query by statementId and agent with mbox IFI.
@@ -74,6 +88,10 @@ def test_backends_lrs_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 3. Query by statementId and agent with mbox_sha1sum IFI.
@@ -103,6 +121,10 @@ def test_backends_lrs_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 4. Query by statementId and agent with openid IFI.
@@ -132,6 +154,10 @@ def test_backends_lrs_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 5. Query by statementId and agent with account IFI.
@@ -165,6 +191,10 @@ def test_backends_lrs_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 6. Query by verb and activity.
@@ -200,6 +230,10 @@ def test_backends_lrs_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 7. Query by timerange (with since/until).
@@ -235,6 +269,10 @@ def test_backends_lrs_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 8. Query with pagination and pit_id.
@@ -248,6 +286,10 @@ def test_backends_lrs_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": [{"timestamp": {"order": "desc"}}],
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
         # 9. Query ignoring statement sort order.
@@ -261,6 +303,10 @@ def test_backends_lrs_es_default_instantiation(monkeypatch, fs):
                 "size": 0,
                 "sort": "_shard_doc",
                 "track_total_hits": False,
+                "seq_no_primary_term": True,
+                "source": None,
+                "slices": None,
+                "ordered_slices": False,
             },
         ),
     ],
@@ -426,3 +472,271 @@ def test_backends_lrs_es_query_statements_by_ids_with_multiple_indexes(
 
     backend_1.close()
     backend_2.close()
+
+
+def test_backends_lrs_es_query_statement_fingerprints(es_lrs_backend, monkeypatch):
+    """Test the `ESLRSBackend.query_statement_fingerprints` method, given a list of
+    ids, should return the fingerprints of matching statements.
+    """
+    statement = {"id": "foo", "verb": {"id": "bar"}}
+
+    def mock_read(query, target, chunk_size):
+        """Mock the `ESLRSBackend.read` method."""
+        assert query.query == {"terms": {"_id": ["foo", "baz"]}}
+        assert target == "target"
+        assert chunk_size is None
+        yield {"_id": "foo", "_source": statement}
+
+    backend = es_lrs_backend()
+    monkeypatch.setattr(backend, "read", mock_read)
+    assert list(
+        backend.query_statement_fingerprints(["foo", "baz"], target="target")
+    ) == [StatementFingerprint("foo", get_statement_fingerprint(statement))]
+    assert not backend.backfill_fingerprints(target="target")
+    backend.close()
+
+
+def test_backends_lrs_es_create_statements(es_lrs_backend, monkeypatch):
+    """Test the `ESLRSBackend.create_statements` method, given new and stored
+    statements, should write statements using the `create` operation type and
+    return stored ids.
+    """
+    statements = [{"id": "foo"}, {"id": "bar"}]
+
+    def mock_streaming_bulk(client, actions, **kwargs):
+        """Mock the `streaming_bulk` Elasticsearch helper."""
+        assert not kwargs["raise_on_error"]
+        actions = list(actions)
+        assert [action["_op_type"] for action in actions] == ["create", "create"]
+        # Statements should be stored unchanged.
+        assert actions[0]["_source"] == {"id": "foo"}
+        yield True, {"create": {"_id": "foo", "status": 201}}
+        yield False, {"create": {"_id": "bar", "status": 409}}
+
+    monkeypatch.setattr("ralph.backends.lrs.es.streaming_bulk", mock_streaming_bulk)
+    backend = es_lrs_backend()
+    assert backend.create_statements(statements) == ["bar"]
+    backend.close()
+
+
+def test_backends_lrs_es_create_statements_with_index_period(
+    es_lrs_backend, monkeypatch
+):
+    """Test the `ESLRSBackend.create_statements` method, given an `INDEX_PERIOD` and
+    a statement id stored in the index of another period, should not create it and
+    return its id.
+    """
+    statements = [
+        {"id": "foo", "timestamp": "2023-01-01T00:00:00"},
+        {"id": "bar", "timestamp": "2023-01-01T00:00:00"},
+    ]
+
+    def mock_read(query, target, chunk_size=None):
+        """Mock the `ESLRSBackend.read` method."""
+        assert query.query == {"terms": {"_id": ["foo", "bar"]}}
+        assert target == "foo-*"
+        # `foo` is stored in the index of another period.
+        yield {"_index": "foo-2022.06", "_source": {"id": "foo"}}
+
+    def mock_streaming_bulk(client, actions, **kwargs):
+        """Mock the `streaming_bulk` Elasticsearch helper."""
+        actions = list(actions)
+        assert [action["_id"] for action in actions] == ["bar"]
+        assert actions[0]["_index"] == "foo-2023.01"
+        yield True, {"create": {"_id": "bar", "status": 201}}
+
+    monkeypatch.setattr("ralph.backends.lrs.es.streaming_bulk", mock_streaming_bulk)
+    backend = es_lrs_backend(index="foo")
+    backend.settings.INDEX_PERIOD = "month"
+    monkeypatch.setattr(backend, "read", mock_read)
+    assert backend.create_statements(statements) == ["foo"]
+    backend.close()
+
+
+def test_backends_lrs_es_get_version():
+    """Test the `ESLRSBackend.get_version` method, given a document, should return
+    its sequence number and primary term if it has one.
+    """
+    document = {"_index": "foo", "_id": "bar", "_primary_term": 1, "_seq_no": 2}
+    assert ESLRSBackend.get_version(document) == "foo/bar:1:2"
+    assert ESLRSBackend.get_version({"_index": "foo", "_id": "bar"}) is None
+
+
+def test_backends_lrs_es_get_conflicting_id():
+    """Test the `ESLRSBackend.get_conflicting_id` method, given a failed bulk create
+    item, should return its id if it already exists, else raise an exception.
+    """
+    item = {"create": {"_id": "foo", "status": 409}}
+    assert ESLRSBackend.get_conflicting_id(item) == "foo"
+
+    item = {"create": {"_id": "foo", "status": 400, "error": {"type": "mapper"}}}
+    msg = "Failed to create statement: {'_id': 'foo', 'status': 400, 'error'"
+    with pytest.raises(BackendException, match=msg):
+        ESLRSBackend.get_conflicting_id(item)
+
+
+def test_backends_lrs_es_init_indexes(es_lrs_backend, monkeypatch):
+    """Test the `ESLRSBackend.init_indexes` method, should create the statements
+    index template and update the mapping of the existing index.
+    """
+    calls = []
+
+    def mock_put_index_template(name, index_patterns, template):
+        """Mock the `put_index_template` Elasticsearch indices method."""
+        assert name == "foo"
+        assert index_patterns == ["foo"]
+        assert template == {"mappings": STATEMENTS_MAPPINGS}
+        calls.append("put_index_template")
+
+    def mock_put_mapping(index, properties):
+        """Mock the `put_mapping` Elasticsearch indices method."""
+        assert index == "foo"
+        assert properties == STATEMENTS_MAPPINGS["properties"]
+        calls.append("put_mapping")
+
+    backend = es_lrs_backend()
+    indices = backend.client.indices
+    monkeypatch.setattr(indices, "put_index_template", mock_put_index_template)
+    monkeypatch.setattr(indices, "put_mapping", mock_put_mapping)
+    monkeypatch.setattr(indices, "exists", lambda index: True)
+    assert backend.init_indexes(target="foo") == ["foo"]
+    assert calls == ["put_index_template", "put_mapping"]
+
+    # Given a missing index, the mapping should only be set by the index template.
+    calls.clear()
+    monkeypatch.setattr(indices, "exists", lambda index: False)
+    assert backend.init_indexes(target="foo") == ["foo"]
+    assert calls == ["put_index_template"]
+
+    def mock_put_index_template_failure(**_):
+        """Mock the `put_index_template` Elasticsearch indices method failure."""
+        raise ApiError("Mocked error", ApiResponseMeta(400, "1.1", {}, 1, None), {})
+
+    monkeypatch.setattr(indices, "put_index_template", mock_put_index_template_failure)
+    msg = "Failed to create the statements index template: ApiError"
+    with pytest.raises(BackendException, match=msg):
+        backend.init_indexes()
+    backend.close()
+
+
+def test_backends_lrs_es_explain_query_shapes(es_lrs_backend, monkeypatch):
+    """Test the `ESLRSBackend.explain_query_shapes` method, should return query
+    shapes having a field not mapped with its expected type.
+    """
+    keyword = {"type": "keyword", "ignore_above": 8191}
+    dynamic_keyword = {"type": "keyword", "ignore_above": 256}
+
+    def mock_get_field_mapping(index, fields):
+        """Mock the `get_field_mapping` Elasticsearch indices method."""
+        assert index == ES_TEST_INDEX
+        mappings = {
+            field: {"full_name": field, "mapping": {"keyword": keyword}}
+            for field in fields
+            if field.endswith(".keyword")
+        }
+        mappings["verb.id.keyword"]["mapping"]["keyword"] = dynamic_keyword
+        mappings["timestamp"] = {
+            "full_name": "timestamp",
+            "mapping": {"timestamp": {"type": "date"}},
+        }
+        del mappings["authority.openid.keyword"]
+        return {index: {"mappings": mappings}}
+
+    backend = es_lrs_backend()
+    monkeypatch.setattr(
+        backend.client.indices, "get_field_mapping", mock_get_field_mapping
+    )
+    assert backend.explain_query_shapes() == ["verb", "authority.openid"]
+    backend.close()
+
+
+def test_backends_lrs_es_get_query_fields():
+    """Test the `ESLRSBackend.get_query_fields` method, should return the fields
+    a query filters or sorts on along with their expected type.
+    """
+    query = ESLRSBackend.get_query(STATEMENTS_QUERY_SHAPES["agent.account"])
+    assert ESLRSBackend.get_query_fields(query) == {
+        "actor.account.name.keyword": "keyword",
+        "actor.account.homePage.keyword": "keyword",
+        "timestamp": "date",
+    }
+    query = ESLRSBackend.get_query(STATEMENTS_QUERY_SHAPES["statementId"])
+    assert ESLRSBackend.get_query_fields(query) == {"timestamp": "date"}
+
+
+@pytest.mark.parametrize(
+    "period,since,until,expected",
+    [
+        (None, "2021-11-29", None, "foo"),
+        ("month", None, "2021-11-29", "foo-*"),
+        ("year", "2021-11-29", "2023-01-01", "foo-2021*,foo-2022*,foo-2023*"),
+        ("month", "2021-11-29", "2021-11-30", "foo-2021.11*"),
+        (
+            "day",
+            "2021-11-29T10:00:00+02:00",
+            "2023-02-02T00:00:00Z",
+            "foo-2021.11.29*,foo-2021.11.30*,foo-2021.12*,foo-2022*,foo-2023.01*,"
+            "foo-2023.02.01*,foo-2023.02.02*",
+        ),
+    ],
+)
+def test_backends_lrs_es_get_query_indices(period, since, until, expected):
+    """Test the `ESLRSBackend.get_query_indices` method, should return the patterns
+    of the period indices overlapping the queried window.
+    """
+    assert ESLRSBackend.get_query_indices("foo", period, since, until) == expected
+
+
+def test_backends_lrs_es_write_with_index_period(es_lrs_backend, monkeypatch):
+    """Test the `ESLRSBackend.write` method, given an `INDEX_PERIOD`, should write
+    statements to the index of their timestamp period.
+    """
+    indices = []
+
+    def mock_streaming_bulk(client, actions, **kwargs):
+        """Mock the `streaming_bulk` Elasticsearch helper."""
+        for action in actions:
+            indices.append(action["_index"])
+            yield True, action
+
+    monkeypatch.setattr("ralph.backends.data.es.streaming_bulk", mock_streaming_bulk)
+    backend = es_lrs_backend(index="foo")
+    backend.settings.INDEX_PERIOD = "month"
+    statements = [
+        {"id": "0", "timestamp": "2022-06-27T15:36:50"},
+        {"id": "1", "timestamp": "2023-01-01T00:30:00+01:00"},
+        {"id": "2", "timestamp": "2022-06-01T00:00:00Z"},
+    ]
+    assert backend.write(statements) == 3
+    assert indices == ["foo-2022.06", "foo-2022.06", "foo-2022.12"]
+
+    msg = "Failed to get the period index of statement 3: 'timestamp'"
+    with pytest.raises(BackendException, match=msg):
+        backend.write([{"id": "3"}])
+
+    indices.clear()
+    assert backend.write([{"id": "3"}, statements[0]], ignore_errors=True) == 1
+    assert indices == ["foo-2022.06"]
+    backend.close()
+
+
+def test_backends_lrs_es_query_statements_with_index_period(
+    es_lrs_backend, monkeypatch
+):
+    """Test the `ESLRSBackend.query_statements` method, given an `INDEX_PERIOD`,
+    should only search the period indices of the queried window.
+    """
+
+    def mock_read(query, target, chunk_size):
+        """Mock the `ESLRSBackend.read` method."""
+        assert target == "foo-2022.06*,foo-2022.07*"
+        yield {"_id": "0", "_source": {"id": "0"}}
+
+    backend = es_lrs_backend(index="foo")
+    backend.settings.INDEX_PERIOD = "month"
+    monkeypatch.setattr(backend, "read", mock_read)
+    params = RalphStatementsQuery.model_construct(
+        since="2022-06-27T15:36:50", until="2022-07-01T00:00:00", limit=10
+    )
+    assert backend.query_statements(params).statements == [{"id": "0"}]
+    backend.close()
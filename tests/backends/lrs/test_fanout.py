@@ -0,0 +1,99 @@
+"""Tests for Ralph fan-out LRS backend."""
+
+import pytest
+
+from ralph.backends.lrs.base import RalphStatementsQuery, StatementFingerprint
+from ralph.backends.lrs.fanout import FanoutLRSBackend
+from ralph.backends.lrs.fs import FSLRSBackend
+from ralph.backends.lrs.sqlite import SQLiteLRSBackend
+from ralph.exceptions import BackendParameterException
+from ralph.utils import get_statement_fingerprint
+
+STATEMENTS = [
+    {
+        "id": str(index),
+        "actor": {"mbox": "mailto:foo@bar.baz"},
+        "verb": {"id": "foo_verb"},
+        "object": {"id": "foo_object"},
+        "timestamp": f"2023-06-24T00:00:0{index}+00:00",
+    }
+    for index in range(4)
+]
+
+
+def get_ids(statements):
+    """Return the ids of the `statements`."""
+    return [statement["id"] for statement in statements]
+
+
+def test_backends_lrs_fanout_default_instantiation(monkeypatch, tmp_path):
+    """Test the `FanoutLRSBackend` default instantiation."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("RALPH_BACKENDS__LRS__FANOUT__BACKENDS", "sqlite,fs")
+    backend = FanoutLRSBackend()
+    assert backend.name == "fanout"
+    assert isinstance(backend.primary, SQLiteLRSBackend)
+    assert isinstance(backend.backends["fs"], FSLRSBackend)
+
+
+@pytest.mark.parametrize("name", ["parquet_foo", "async_sqlite", "fanout"])
+def test_backends_lrs_fanout_instantiation_with_invalid_backends(
+    name, fanout_lrs_backend
+):
+    """Test the `FanoutLRSBackend` instantiation, given a backend which is not a
+    synchronous LRS backend, should raise a `BackendParameterException`.
+    """
+    msg = f"The {name} backend is not a synchronous writable backend"
+    with pytest.raises(BackendParameterException, match=msg):
+        fanout_lrs_backend(f"sqlite,{name}")
+
+
+def test_backends_lrs_fanout_write(fanout_lrs_backend):
+    """Test the `FanoutLRSBackend.write` method, should write statements along with
+    their fingerprint to all backends.
+    """
+    backend = fanout_lrs_backend()
+    assert backend.write(STATEMENTS) == 4
+    expected = [
+        StatementFingerprint(statement["id"], get_statement_fingerprint(statement))
+        for statement in STATEMENTS
+    ]
+    ids = get_ids(STATEMENTS)
+    for name in ("sqlite", "fs"):
+        fingerprints = backend.backends[name].query_statement_fingerprints(ids)
+        assert sorted(fingerprints, key=lambda x: x.id) == expected
+
+
+def test_backends_lrs_fanout_queries(fanout_lrs_backend, monkeypatch):
+    """Test the `FanoutLRSBackend` query methods, should be served by the primary
+    backend.
+    """
+    backend = fanout_lrs_backend()
+    backend.write(STATEMENTS)
+
+    def mock_query(*_):
+        raise AssertionError("The secondary backend should not be queried")
+
+    for method in (
+        "query_statements",
+        "query_statements_by_ids",
+        "query_statement_fingerprints",
+    ):
+        monkeypatch.setattr(backend.backends["fs"], method, mock_query)
+
+    params = RalphStatementsQuery.model_construct(limit=2)
+    assert get_ids(backend.query_statements(params).statements) == ["3", "2"]
+    assert get_ids(backend.query_statements_by_ids(["1", "foo"])) == ["1"]
+    assert [item.id for item in backend.query_statement_fingerprints(["2"])] == ["2"]
+
+
+def test_backends_lrs_fanout_create_statements(fanout_lrs_backend):
+    """Test the `FanoutLRSBackend.create_statements` method, should create statements
+    in the primary backend and write the new ones to the other backends.
+    """
+    backend = fanout_lrs_backend()
+    assert not backend.create_statements(STATEMENTS[:2])
+    assert backend.create_statements(STATEMENTS[1:]) == ["1"]
+    for name in ("sqlite", "fs"):
+        statements = backend.backends[name].query_statements_by_ids(get_ids(STATEMENTS))
+        assert sorted(get_ids(statements)) == ["0", "1", "2", "3"]
@@ -2,8 +2,10 @@
 
 import pytest
 
-from ralph.backends.lrs.base import RalphStatementsQuery
+from ralph.backends.data.base import BaseOperationType
+from ralph.backends.lrs.base import RalphStatementsQuery, StatementFingerprint
 from ralph.backends.lrs.fs import FSLRSBackend
+from ralph.utils import get_statement_fingerprint
 
 
 def test_backends_lrs_fs_default_instantiation(monkeypatch, fs):
@@ -340,3 +342,58 @@ def test_backends_lrs_fs_query_statements_by_ids(fs, fs_lrs_backend):
     assert backend.query_statements_by_ids(["foo2"], target=custom_target) == [
         {"id": "foo2"}
     ]
+
+
+def test_backends_lrs_fs_query_statement_fingerprints(fs, fs_lrs_backend):
+    """Test the `FSLRSBackend.query_statement_fingerprints` method, given a list of
+    ids, should return the fingerprints of the matching statements.
+    """
+    backend = fs_lrs_backend()
+    statements = [{"id": "foo"}, {"id": "bar", "timestamp": "2023-03-15"}]
+    backend.write(statements)
+    backend.write([{"id": "baz"}], operation_type=BaseOperationType.APPEND)
+
+    assert not list(backend.query_statement_fingerprints(["qux"]))
+    assert list(backend.query_statement_fingerprints(["foo", "bar"])) == [
+        StatementFingerprint(
+            id="foo", fingerprint=get_statement_fingerprint(statements[0])
+        ),
+        StatementFingerprint(
+            id="bar", fingerprint=get_statement_fingerprint(statements[1])
+        ),
+    ]
+
+    # Stored statements should be left unchanged.
+    assert list(backend.read()) == statements + [{"id": "baz"}]
+
+    backend.close()
+
+
+def test_backends_lrs_fs_backfill_fingerprints(fs, fs_lrs_backend):
+    """Test the `FSLRSBackend.backfill_fingerprints` method, should return `0` as
+    fingerprints are not stored.
+    """
+    backend = fs_lrs_backend()
+    statements = [{"id": "foo"}, {"id": "bar", "timestamp": "2023-03-15"}]
+    backend.write(statements)
+
+    assert not backend.backfill_fingerprints()
+    assert list(backend.read()) == statements
+
+    backend.close()
+
+
+def test_backends_lrs_fs_create_statements(fs, fs_lrs_backend):
+    """Test the `FSLRSBackend.create_statements` method, given new and stored
+    statements, should only write new statements and return the stored ids.
+    """
+    backend = fs_lrs_backend()
+    assert not backend.create_statements([{"id": "foo"}, {"id": "bar"}])
+    assert backend.create_statements([{"id": "bar"}, {"id": "baz"}]) == ["bar"]
+    assert backend.query_statements_by_ids(["foo", "bar", "baz"]) == [
+        {"id": "foo"},
+        {"id": "bar"},
+        {"id": "baz"},
+    ]
+    assert [x.id for x in backend.query_statement_fingerprints(["baz"])] == ["baz"]
+    backend.close()
@@ -5,10 +5,17 @@ import logging
 import pytest
 from bson.objectid import ObjectId
 from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError
 
-from ralph.backends.lrs.base import AgentParameters, RalphStatementsQuery
+from ralph.backends.data.base import BaseOperationType
+from ralph.backends.lrs.base import (
+    STATEMENTS_QUERY_SHAPES,
+    AgentParameters,
+    RalphStatementsQuery,
+)
 from ralph.backends.lrs.mongo import MongoLRSBackend
 from ralph.exceptions import BackendException
+from ralph.utils import get_statement_fingerprint
 
 from tests.fixtures.backends import (
     MONGO_TEST_COLLECTION,
@@ -410,3 +417,133 @@ def test_backends_lrs_mongo_query_statements_by_ids_with_two_collections(
 
     backend_1.close()
     backend_2.close()
+
+
+def test_backends_lrs_mongo_get_fingerprint_query():
+    """Test the `MongoLRSBackend.get_fingerprint_query` method, given a list of ids,
+    should return a query projecting the stored fingerprint.
+    """
+    query = MongoLRSBackend.get_fingerprint_query(["foo", "bar"])
+    assert query.filter == {"_source.id": {"$in": ["foo", "bar"]}}
+    assert query.projection == {"_source.id": 1, "_fingerprint": 1}
+
+
+def test_backends_lrs_mongo_backfill_fingerprints(mongo_lrs_backend, monkeypatch):
+    """Test the `MongoLRSBackend.backfill_fingerprints` method, should replace
+    statements missing a stored fingerprint.
+    """
+    statement = {"id": "foo", "verb": {"id": "bar"}}
+
+    def mock_read(query, target, chunk_size):
+        """Mock the `MongoLRSBackend.read` method."""
+        assert query.filter == {"_fingerprint": {"$exists": False}}
+        assert target == "target"
+        assert chunk_size is None
+        yield {"_id": "123", "_source": statement}
+
+    def mock_write(data, target, chunk_size, operation_type):
+        """Mock the `MongoLRSBackend.write` method."""
+        assert list(data) == [statement]
+        assert target == "target"
+        assert chunk_size is None
+        assert operation_type == BaseOperationType.UPDATE
+        return 1
+
+    backend = mongo_lrs_backend()
+    monkeypatch.setattr(backend, "read", mock_read)
+    monkeypatch.setattr(backend, "write", mock_write)
+    assert backend.backfill_fingerprints(target="target") == 1
+    backend.close()
+
+
+def test_backends_lrs_mongo_to_documents():
+    """Test the `MongoLRSBackend.to_documents` and `to_replace_one` methods, given
+    statements, should store their fingerprint outside of the unchanged statement.
+    """
+    statement = {"id": "foo", "timestamp": "2022-06-27T15:36:50"}
+    fingerprint = get_statement_fingerprint(statement)
+    documents = list(
+        MongoLRSBackend.to_documents([statement], False, BaseOperationType.CREATE)
+    )
+    assert [document["_source"] for document in documents] == [statement]
+    assert [document["_fingerprint"] for document in documents] == [fingerprint]
+    replacements = list(MongoLRSBackend.to_replace_one([statement]))
+    assert [item._doc for item in replacements] == [
+        {"_source": statement, "_fingerprint": fingerprint}
+    ]
+
+
+def test_backends_lrs_mongo_get_conflicting_ids():
+    """Test the `MongoLRSBackend.get_conflicting_ids` method, given an unordered
+    insert error, should return already stored ids or raise an exception.
+    """
+    duplicate = {"code": 11000, "op": {"_source": {"id": "foo"}}}
+    error = BulkWriteError({"writeErrors": [duplicate, duplicate]})
+    assert MongoLRSBackend.get_conflicting_ids(error) == ["foo", "foo"]
+
+    failure = {"code": 2, "op": {"_source": {"id": "bar"}}}
+    error = BulkWriteError({"writeErrors": [duplicate, failure]})
+    with pytest.raises(BackendException, match="Failed to create statement"):
+        MongoLRSBackend.get_conflicting_ids(error)
+
+
+def test_backends_lrs_mongo_has_unique_id_index():
+    """Test the `MongoLRSBackend.has_unique_id_index` method."""
+    indexes = {"_id_": {"key": [("_id", 1)]}}
+    assert not MongoLRSBackend.has_unique_id_index(indexes)
+    indexes["_source.id_1"] = {"key": [("_source.id", 1)]}
+    assert not MongoLRSBackend.has_unique_id_index(indexes)
+    indexes["_source.id_1"]["unique"] = True
+    assert MongoLRSBackend.has_unique_id_index(indexes)
+
+
+def test_backends_lrs_mongo_create_statements(mongo, mongo_lrs_backend, caplog):
+    """Test the `MongoLRSBackend.create_statements` method, given a collection
+    without a unique statements id index, should query stored statements first.
+    """
+    backend = mongo_lrs_backend()
+    statements = [{"id": "foo"}, {"id": "bar"}]
+    with caplog.at_level(logging.WARNING):
+        assert not backend.create_statements(statements[:1])
+        assert backend.create_statements(statements) == ["foo"]
+
+    assert (
+        "ralph.backends.lrs.mongo",
+        logging.WARNING,
+        f"The {MONGO_TEST_COLLECTION} collection has no unique statements id index, "
+        "querying stored statements before writing. Create it with the `ralph init` "
+        "command",
+    ) in caplog.record_tuples
+
+    backend.init_indexes()
+    assert backend.create_statements([{"id": "bar"}, {"id": "baz"}]) == ["bar"]
+    assert len(list(backend.query_statements_by_ids(["foo", "bar", "baz"]))) == 3
+    backend.close()
+
+
+def test_backends_lrs_mongo_init_indexes_and_explain_query_shapes(
+    mongo, mongo_lrs_backend
+):
+    """Test the `MongoLRSBackend.init_indexes` and `explain_query_shapes` methods,
+    should create indexes serving all statements query shapes.
+    """
+    backend = mongo_lrs_backend()
+    backend.write([{"id": "foo", "timestamp": "2022-06-27T15:36:50"}])
+    assert backend.explain_query_shapes() == list(STATEMENTS_QUERY_SHAPES)
+    names = backend.init_indexes()
+    assert "_source.id_1" in names
+    assert "_source.verb.id_1__source.timestamp_-1__id_-1" in names
+    assert not backend.explain_query_shapes()
+    # Already existing indexes are left unchanged.
+    assert backend.init_indexes() == names
+    backend.close()
+
+
+def test_backends_lrs_mongo_is_collection_scan():
+    """Test the `MongoLRSBackend.is_collection_scan` method."""
+    plan = {"stage": "LIMIT", "inputStage": {"stage": "COLLSCAN"}}
+    assert MongoLRSBackend.is_collection_scan(plan)
+    plan = {"stage": "OR", "inputStages": [{"stage": "IXSCAN"}, {"stage": "COLLSCAN"}]}
+    assert MongoLRSBackend.is_collection_scan(plan)
+    plan = {"queryPlan": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}}
+    assert not MongoLRSBackend.is_collection_scan(plan)
@@ -0,0 +1,246 @@
+"""Tests for Ralph Parquet LRS backend."""
+
+import pytest
+
+from ralph.backends.data.parquet import ParquetQuery
+from ralph.backends.lrs.base import RalphStatementsQuery, StatementFingerprint
+from ralph.backends.lrs.parquet import PARTITION_PATTERN, ParquetLRSBackend
+from ralph.exceptions import BackendParameterException
+from ralph.utils import get_statement_fingerprint
+
+STATEMENTS = [
+    {
+        "id": "0",
+        "actor": {"mbox_sha1sum": "foo_sha1sum"},
+        "verb": {"id": "foo_verb"},
+        "object": {"id": "bar_object"},
+        "timestamp": "2021-06-24T00:00:20.194929+00:00",
+    },
+    {
+        "id": "1",
+        "actor": {"mbox": "mailto:foo@bar.baz"},
+        "verb": {"id": "foo_verb"},
+        "object": {"id": "foo_object"},
+        "timestamp": "2021-06-24T00:00:20.194930+00:00",
+    },
+    {
+        "id": "2",
+        "actor": {"openid": "foo_openid"},
+        "verb": {"id": "foo_verb"},
+        "object": {"id": "foo_object"},
+        "timestamp": "2021-06-24T02:00:20.194931+02:00",
+    },
+    {
+        "id": "3",
+        "actor": {"account": {"name": "foo_name", "homePage": "foo_home"}},
+        "verb": {"id": "bar_verb"},
+        "object": {"id": "foo_object"},
+        "timestamp": "2022-06-24T00:00:20.194929+00:00",
+    },
+    {
+        "id": "4",
+        "actor": {"mbox_sha1sum": "foo_sha1sum"},
+        "verb": {"id": "bar_verb"},
+        "object": {"id": "foo_object"},
+        "timestamp": "2023-06-24T00:00:20.194929+00:00",
+    },
+]
+
+
+def test_backends_lrs_parquet_default_instantiation(monkeypatch, fs):
+    """Test the `ParquetLRSBackend` default instantiation."""
+    fs.create_file(".env")
+    monkeypatch.delenv("RALPH_BACKENDS__LRS__PARQUET__STORAGE", raising=False)
+    backend = ParquetLRSBackend()
+    assert backend.name == "parquet"
+    assert backend.settings.STORAGE == "fs"
+
+    monkeypatch.setenv("RALPH_BACKENDS__LRS__PARQUET__STORAGE", "s3")
+    backend = ParquetLRSBackend()
+    assert backend.settings.STORAGE == "s3"
+
+
+def test_backends_lrs_parquet_write(parquet_lrs_backend, tmp_path):
+    """Test the `ParquetLRSBackend.write` method, given statements of several days,
+    should write them once in daily partitions.
+    """
+    backend = parquet_lrs_backend()
+    assert backend.write(STATEMENTS) == 5
+    assert sorted(
+        path.parent.relative_to(tmp_path / "archive").as_posix()
+        for path in (tmp_path / "archive").glob("*/*/*/*.parquet")
+    ) == ["2021/06/24", "2022/06/24", "2023/06/24"]
+
+    # Given already archived statements, nothing should be written.
+    assert not backend.write(STATEMENTS)
+    assert len(list((tmp_path / "archive").glob("*/*/*/*.parquet"))) == 3
+
+    # Given a target, statements should be written to its sub-directory.
+    assert backend.write(STATEMENTS[:1], target="custom") == 1
+    assert list((tmp_path / "archive" / "custom").glob("2021/06/24/*.parquet"))
+
+
+@pytest.mark.parametrize(
+    "params,expected_statement_ids",
+    [
+        # 0. Default query.
+        ({}, ["4", "3", "2", "1", "0"]),
+        # 1. Query by statementId.
+        ({"statementId": "1"}, ["1"]),
+        # 2. Query by agent with mbox_sha1sum IFI.
+        ({"agent": {"mbox_sha1sum": "foo_sha1sum"}}, ["4", "0"]),
+        # 3. Query by verb and activity.
+        ({"verb": "foo_verb", "activity": "foo_object"}, ["2", "1"]),
+        # 4. Query by timerange (with since/until).
+        (
+            {
+                "since": "2021-06-24T00:00:20.194929+00:00",
+                "until": "2022-06-24T00:00:20.194929+00:00",
+            },
+            ["3", "2", "1"],
+        ),
+        # 5. Query with limit.
+        ({"limit": 2}, ["4", "3"]),
+        # 6. Query in ascending order.
+        ({"ascending": True}, ["0", "1", "2", "3", "4"]),
+    ],
+)
+def test_backends_lrs_parquet_query_statements_query(
+    params, expected_statement_ids, parquet_lrs_backend
+):
+    """Test the `ParquetLRSBackend.query_statements` method, given a query,
+    should return matching statements.
+    """
+    backend = parquet_lrs_backend()
+    backend.write(STATEMENTS)
+    result = backend.query_statements(RalphStatementsQuery.model_construct(**params))
+    ids = [statement["id"] for statement in result.statements]
+    assert ids == expected_statement_ids
+
+
+@pytest.mark.parametrize(
+    "ascending,expected_pages",
+    [
+        (False, [["4", "3"], ["2", "1"], ["0"]]),
+        (True, [["0", "1"], ["2", "3"], ["4"]]),
+    ],
+)
+def test_backends_lrs_parquet_query_statements_with_search_after(
+    ascending, expected_pages, parquet_lrs_backend
+):
+    """Test the `ParquetLRSBackend.query_statements` method, given a `search_after`
+    cursor, should return the following page of statements.
+    """
+    backend = parquet_lrs_backend()
+    backend.write(STATEMENTS)
+    params = RalphStatementsQuery.model_construct(limit=2, ascending=ascending)
+    pages = []
+    while True:
+        result = backend.query_statements(params)
+        pages.append([statement["id"] for statement in result.statements])
+        if not result.search_after:
+            break
+        params = params.model_copy(update={"search_after": result.search_after})
+
+    assert pages == expected_pages
+
+
+@pytest.mark.parametrize("ascending", [False, True])
+def test_backends_lrs_parquet_query_statements_with_search_after_and_same_timestamp(
+    ascending, parquet_lrs_backend
+):
+    """Test the `ParquetLRSBackend.query_statements` method, given statements
+    sharing the timestamp of the `search_after` cursor, should return each of them
+    once.
+    """
+    backend = parquet_lrs_backend()
+    statements = [{**STATEMENTS[0], "id": str(index)} for index in range(3)]
+    backend.write(statements)
+    params = RalphStatementsQuery.model_construct(limit=1, ascending=ascending)
+    ids = []
+    for _ in range(3):
+        result = backend.query_statements(params)
+        ids.extend(statement["id"] for statement in result.statements)
+        params = params.model_copy(update={"search_after": result.search_after})
+
+    assert sorted(ids) == ["0", "1", "2"]
+    assert not backend.query_statements(params).statements
+
+
+@pytest.mark.parametrize("ascending", [False, True])
+def test_backends_lrs_parquet_query_statements_with_search_after_and_many_files(
+    ascending, parquet_lrs_backend
+):
+    """Test the `ParquetLRSBackend.query_statements` method, given statements of the
+    same day written to many files, should return each of them once, in order.
+    """
+    backend = parquet_lrs_backend()
+    statements = [
+        {"id": f"{index:02}", "timestamp": f"2021-06-24T00:00:{index:02}+00:00"}
+        for index in range(1, 8)
+    ]
+    for batch in (statements[4:], statements[:1], statements[2:4], statements[1:2]):
+        backend.write(batch)
+
+    params = RalphStatementsQuery.model_construct(limit=1, ascending=ascending)
+    ids = []
+    while True:
+        result = backend.query_statements(params)
+        ids.extend(statement["id"] for statement in result.statements)
+        if not result.search_after:
+            break
+        params = params.model_copy(update={"search_after": result.search_after})
+
+    expected_ids = [statement["id"] for statement in statements]
+    assert ids == (expected_ids if ascending else expected_ids[::-1])
+
+
+def test_backends_lrs_parquet_query_statements_with_invalid_search_after(
+    parquet_lrs_backend,
+):
+    """Test the `ParquetLRSBackend.query_statements` method, given an invalid
+    `search_after` cursor, should raise a `BackendParameterException`.
+    """
+    backend = parquet_lrs_backend()
+    params = RalphStatementsQuery.model_construct(search_after="foo")
+    msg = "Invalid search_after cursor: foo"
+    with pytest.raises(BackendParameterException, match=msg):
+        backend.query_statements(params)
+
+
+def test_backends_lrs_parquet_query_statements_by_ids_and_fingerprints(
+    parquet_lrs_backend,
+):
+    """Test the `ParquetLRSBackend.query_statements_by_ids` and
+    `query_statement_fingerprints` methods.
+    """
+    backend = parquet_lrs_backend()
+    backend.write(STATEMENTS)
+    backend.write(STATEMENTS[:1], target="custom")
+    assert sorted(
+        backend.query_statements_by_ids(["4", "0", "foo"]), key=lambda x: x["id"]
+    ) == [STATEMENTS[0], STATEMENTS[4]]
+    assert list(backend.query_statements_by_ids(["0"], target="custom")) == [
+        STATEMENTS[0]
+    ]
+    fingerprints = backend.query_statement_fingerprints(["1", "3"])
+    assert sorted(fingerprints, key=lambda x: x.id) == [
+        StatementFingerprint(statement["id"], get_statement_fingerprint(statement))
+        for statement in STATEMENTS[1:4:2]
+    ]
+    assert not backend.backfill_fingerprints()
+
+    # Raw reads should return archived statements unchanged.
+    query = ParquetQuery(pattern=PARTITION_PATTERN)
+    assert sorted(backend.read(query), key=lambda x: x["id"]) == STATEMENTS
+
+
+def test_backends_lrs_parquet_create_statements(parquet_lrs_backend):
+    """Test the `ParquetLRSBackend.create_statements` method, given archived
+    statements, should return their ids instead of writing them again.
+    """
+    backend = parquet_lrs_backend()
+    assert not backend.create_statements(STATEMENTS[:2])
+    assert backend.create_statements(STATEMENTS[1:3]) == ["1"]
+    result = backend.query_statements(RalphStatementsQuery.model_construct())
+    assert [statement["id"] for statement in result.statements] == ["2", "1", "0"]
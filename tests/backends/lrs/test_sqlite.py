@@ -0,0 +1,395 @@
+"""Tests for Ralph SQLite LRS backend."""
+
+import logging
+
+import pytest
+
+from ralph.backends.data.base import BaseOperationType
+from ralph.backends.data.sqlite import SQLiteQuery
+from ralph.backends.lrs.base import (
+    STATEMENTS_QUERY_SHAPES,
+    RalphStatementsQuery,
+    StatementFingerprint,
+)
+from ralph.backends.lrs.sqlite import SQLiteLRSBackend
+from ralph.exceptions import BackendException, BackendParameterException
+from ralph.utils import get_statement_fingerprint
+
+STATEMENTS = [
+    {
+        "id": "0",
+        "actor": {"mbox_sha1sum": "foo_sha1sum"},
+        "verb": {"id": "foo_verb"},
+        "object": {"id": "bar_object"},
+        "context": {"registration": "de867099-77ee-453b-949e-2c1933734436"},
+        "timestamp": "2021-06-24T00:00:20.194929+00:00",
+    },
+    {
+        "id": "1",
+        "actor": {"mbox": "mailto:foo@bar.baz"},
+        "verb": {"id": "foo_verb"},
+        "object": {"id": "foo_object"},
+        "timestamp": "2021-06-24T00:00:20.194930+00:00",
+    },
+    {
+        "id": "2",
+        "actor": {"openid": "foo_openid"},
+        "verb": {"id": "foo_verb"},
+        "object": {"id": "foo_object"},
+        "context": {"registration": "b0d0e57d-9fbf-42e3-ba60-85e0be6f709d"},
+        "timestamp": "2022-06-24T02:00:20.194929+02:00",
+        "authority": {"account": {"name": "foo_name", "homePage": "foo_home"}},
+    },
+    {
+        "id": "3",
+        "actor": {"account": {"name": "foo_name", "homePage": "foo_home"}},
+        "verb": {"id": "bar_verb"},
+        "object": {"objectType": "Agent", "mbox": "mailto:foo@bar.baz"},
+        "timestamp": "2023-06-24T00:00:20.194929+00:00",
+    },
+    {
+        "id": "4",
+        "verb": {"id": "bar_verb"},
+        "object": {"id": "foo_object"},
+        "context": {"registration": "b0d0e57d-9fbf-42e3-ba60-85e0be6f709d"},
+        "timestamp": "2024-06-24T00:00:20.194929",
+        "authority": {"mbox": "mailto:foo@bar.baz"},
+    },
+    {
+        "id": "5",
+        "actor": {"mbox_sha1sum": "foo_sha1sum"},
+        "verb": {"id": "qux_verb"},
+        "timestamp": "2024-06-24T00:00:20.194929+00:00",
+        "authority": {"openid": "foo_openid"},
+    },
+]
+
+
+def test_backends_lrs_sqlite_default_instantiation(monkeypatch, fs):
+    """Test the `SQLiteLRSBackend` default instantiation."""
+    fs.create_file(".env")
+    monkeypatch.delenv("RALPH_BACKENDS__LRS__SQLITE__DEFAULT_TABLE", raising=False)
+    backend = SQLiteLRSBackend()
+    assert backend.settings.DEFAULT_TABLE == "statements"
+
+    monkeypatch.setenv("RALPH_BACKENDS__LRS__SQLITE__DEFAULT_TABLE", "foo")
+    backend = SQLiteLRSBackend()
+    assert backend.settings.DEFAULT_TABLE == "foo"
+
+
+@pytest.mark.parametrize(
+    "params,expected_statement_ids",
+    [
+        # 0. Default query.
+        ({}, ["5", "4", "3", "2", "1", "0"]),
+        # 1. Query by statementId.
+        ({"statementId": "1"}, ["1"]),
+        # 2. Query by statementId and agent with mbox IFI.
+        ({"statementId": "1", "agent": {"mbox": "mailto:foo@bar.baz"}}, ["1"]),
+        # 3. Query by statementId and agent with mbox IFI (no match).
+        ({"statementId": "1", "agent": {"mbox": "mailto:bar@bar.baz"}}, []),
+        # 4. Query by agent with mbox_sha1sum IFI.
+        ({"agent": {"mbox_sha1sum": "foo_sha1sum"}}, ["5", "0"]),
+        # 5. Query by agent with openid IFI.
+        ({"agent": {"openid": "foo_openid"}}, ["2"]),
+        # 6. Query by agent with account IFI.
+        (
+            {
+                "agent": {
+                    "account__home_page": "foo_home",
+                    "account__name": "foo_name",
+                },
+            },
+            ["3"],
+        ),
+        # 7. Query by agent with account IFI (no match).
+        (
+            {
+                "agent": {
+                    "account__home_page": "foo_home",
+                    "account__name": "bar_name",
+                },
+            },
+            [],
+        ),
+        # 8. Query by verb and activity.
+        ({"verb": "foo_verb", "activity": "foo_object"}, ["2", "1"]),
+        # 9. Query by timerange (with since/until).
+        (
+            {
+                "since": "2021-06-24T00:00:20.194929+00:00",
+                "until": "2023-06-24T00:00:20.194929+00:00",
+            },
+            ["3", "2", "1"],
+        ),
+        # 10. Query by timerange (with until).
+        ({"until": "2022-06-24T00:00:20.194929+00:00"}, ["2", "1", "0"]),
+        # 11. Query with limit.
+        ({"limit": 2}, ["5", "4"]),
+        # 12. Query in ascending order.
+        ({"ascending": True}, ["0", "1", "2", "3", "4", "5"]),
+        # 13. Query by registration.
+        ({"registration": "b0d0e57d-9fbf-42e3-ba60-85e0be6f709d"}, ["4", "2"]),
+        # 14. Query by authority with mbox IFI.
+        ({"authority": {"mbox": "mailto:foo@bar.baz"}}, ["4"]),
+        # 15. Query by authority with openid IFI.
+        ({"authority": {"openid": "foo_openid"}}, ["5"]),
+        # 16. Query by authority with account IFI.
+        (
+            {
+                "authority": {
+                    "account__home_page": "foo_home",
+                    "account__name": "foo_name",
+                },
+            },
+            ["2"],
+        ),
+    ],
+)
+def test_backends_lrs_sqlite_query_statements_query(
+    params, expected_statement_ids, sqlite_lrs_backend
+):
+    """Test the `SQLiteLRSBackend.query_statements` method, given valid statement
+    parameters, should return the expected statements.
+    """
+    backend = sqlite_lrs_backend()
+    backend.write(STATEMENTS)
+    params = {"limit": 10, **params}
+    result = backend.query_statements(RalphStatementsQuery.model_construct(**params))
+    assert [statement["id"] for statement in result.statements] == (
+        expected_statement_ids
+    )
+    backend.close()
+
+
+@pytest.mark.parametrize("ascending", [False, True])
+def test_backends_lrs_sqlite_query_statements_with_search_after(
+    ascending, sqlite_lrs_backend
+):
+    """Test the `SQLiteLRSBackend.query_statements` method, given a `search_after`
+    parameter, should return the next page of statements.
+    """
+    backend = sqlite_lrs_backend()
+    # Statements "4" and "5" have the same timestamp.
+    backend.write(STATEMENTS)
+
+    ids = []
+    search_after = None
+    while True:
+        params = RalphStatementsQuery.model_construct(
+            limit=2, ascending=ascending, search_after=search_after
+        )
+        result = backend.query_statements(params)
+        if not result.statements:
+            break
+        ids.extend(statement["id"] for statement in result.statements)
+        search_after = result.search_after
+
+    expected_ids = ["0", "1", "2", "3", "4", "5"]
+    assert ids == (expected_ids if ascending else expected_ids[::-1])
+    assert result.search_after is None
+    backend.close()
+
+
+def test_backends_lrs_sqlite_query_statements_change_marker(sqlite_lrs_backend):
+    """Test the `SQLiteLRSBackend.query_statements` method, should return a change
+    marker changing when the stored content of the statements changes.
+    """
+    backend = sqlite_lrs_backend()
+    backend.write(STATEMENTS)
+    params = RalphStatementsQuery.model_construct(limit=10)
+    change_marker = backend.query_statements(params).change_marker
+    assert change_marker
+    assert backend.query_statements(params).change_marker == change_marker
+
+    updated = {**STATEMENTS[0], "verb": {"id": "bar_verb"}}
+    backend.write([updated], operation_type=BaseOperationType.DELETE)
+    backend.write([updated])
+    assert backend.query_statements(params).change_marker not in (None, change_marker)
+    backend.close()
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"since": "foo"},
+        {"until": "99999-01-01"},
+        {"search_after": "foo:bar"},
+    ],
+)
+def test_backends_lrs_sqlite_query_statements_with_invalid_params(
+    params, sqlite_lrs_backend, caplog
+):
+    """Test the `SQLiteLRSBackend.query_statements` method, given invalid
+    parameters, should raise a `BackendParameterException`.
+    """
+    backend = sqlite_lrs_backend()
+    msg = "Invalid statements query parameters"
+    with pytest.raises(BackendParameterException, match=msg):
+        with caplog.at_level(logging.ERROR):
+            backend.query_statements(RalphStatementsQuery.model_construct(**params))
+
+    assert caplog.records[-1].levelname == "ERROR"
+    backend.close()
+
+
+def test_backends_lrs_sqlite_query_statements_with_failure(sqlite_lrs_backend, caplog):
+    """Test the `SQLiteLRSBackend.query_statements` method, given a read failure,
+    should raise a `BackendException`.
+    """
+    backend = sqlite_lrs_backend()
+    backend.init_indexes()
+    backend.connection.executescript(
+        "DROP TABLE statements; CREATE TABLE statements (foo TEXT)"
+    )
+    with pytest.raises(BackendException, match="Failed to read rows"):
+        with caplog.at_level(logging.ERROR):
+            backend.query_statements(RalphStatementsQuery.model_construct(limit=10))
+
+    assert (
+        "ralph.backends.lrs.sqlite",
+        logging.ERROR,
+        "Failed to read from SQLite",
+    ) in caplog.record_tuples
+    backend.close()
+
+
+def test_backends_lrs_sqlite_query_statements_by_ids(sqlite_lrs_backend):
+    """Test the `SQLiteLRSBackend.query_statements_by_ids` method, given a list of
+    ids, should yield the matching statements, by batches of `READ_CHUNK_SIZE` ids.
+    """
+    backend = sqlite_lrs_backend()
+    assert not list(backend.query_statements_by_ids(["0"]))
+    backend.write(STATEMENTS)
+    backend.write(STATEMENTS[:1], target="custom")
+
+    assert not list(backend.query_statements_by_ids([]))
+    assert not list(backend.query_statements_by_ids(["foo", "bar"]))
+    ids = ["0", "2", "4", "5", "foo"]
+    statements = backend.query_statements_by_ids(ids)
+    assert sorted(statements, key=lambda statement: statement["id"]) == [
+        STATEMENTS[0],
+        STATEMENTS[2],
+        STATEMENTS[4],
+        STATEMENTS[5],
+    ]
+    assert not list(backend.query_statements_by_ids(["1"], target="custom"))
+    assert list(backend.query_statements_by_ids(["0"], target="custom")) == [
+        STATEMENTS[0]
+    ]
+    backend.close()
+
+
+def test_backends_lrs_sqlite_query_statement_fingerprints(sqlite_lrs_backend):
+    """Test the `SQLiteLRSBackend.query_statement_fingerprints` method, given a
+    list of ids, should yield the stored fingerprints of matching statements.
+    """
+    backend = sqlite_lrs_backend()
+    backend.write(STATEMENTS[:3])
+
+    assert not list(backend.query_statement_fingerprints(["foo"]))
+    fingerprints = backend.query_statement_fingerprints(["0", "1", "2"])
+    assert sorted(fingerprints, key=lambda fingerprint: fingerprint.id) == [
+        StatementFingerprint(statement["id"], get_statement_fingerprint(statement))
+        for statement in STATEMENTS[:3]
+    ]
+    backend.close()
+
+
+def test_backends_lrs_sqlite_backfill_fingerprints(sqlite_lrs_backend):
+    """Test the `SQLiteLRSBackend.backfill_fingerprints` method, should return `0`
+    as fingerprints are stored on every write, outside of stored statements.
+    """
+    backend = sqlite_lrs_backend()
+    backend.write(STATEMENTS[:3])
+    updated_statement = {**STATEMENTS[0], "verb": {"id": "foo"}}
+    backend.write([updated_statement], operation_type=BaseOperationType.UPDATE)
+
+    assert not backend.backfill_fingerprints()
+    fingerprints = backend.query_statement_fingerprints(["0", "1", "2"])
+    assert sorted(fingerprints, key=lambda fingerprint: fingerprint.id) == [
+        StatementFingerprint(statement["id"], get_statement_fingerprint(statement))
+        for statement in [updated_statement, *STATEMENTS[1:3]]
+    ]
+
+    # Reads should return stored statements unchanged.
+    query = SQLiteQuery(sort="id")
+    assert [row["statement"] for row in backend.read(query=query)] == [
+        updated_statement,
+        *STATEMENTS[1:3],
+    ]
+    backend.close()
+
+
+def test_backends_lrs_sqlite_create_statements(sqlite_lrs_backend):
+    """Test the `SQLiteLRSBackend.create_statements` method, given new and stored
+    statements, should only write new statements and return the stored ids.
+    """
+    backend = sqlite_lrs_backend()
+    assert not backend.create_statements(STATEMENTS[:3])
+    assert backend.create_statements(STATEMENTS[2:5]) == ["2"]
+    assert backend.create_statements([{**STATEMENTS[0], "verb": {"id": "foo"}}]) == [
+        "0"
+    ]
+    assert (
+        sorted(
+            backend.query_statements_by_ids(
+                [statement["id"] for statement in STATEMENTS]
+            ),
+            key=lambda statement: statement["id"],
+        )
+        == STATEMENTS[:5]
+    )
+    assert [x.id for x in backend.query_statement_fingerprints(["4"])] == ["4"]
+
+    msg = "has a missing or invalid 'timestamp' field"
+    with pytest.raises(BackendException, match=msg):
+        backend.create_statements([{"id": "foo"}])
+
+    backend.close()
+
+
+def test_backends_lrs_sqlite_create_statements_with_failure(sqlite_lrs_backend):
+    """Test the `SQLiteLRSBackend.create_statements` method, given a write failure,
+    should roll back the batch and raise a `BackendException`.
+    """
+    backend = sqlite_lrs_backend()
+    backend.init_indexes()
+    backend.connection.executescript(
+        "DROP TABLE statements; CREATE TABLE statements (id TEXT, timestamp INTEGER)"
+    )
+    with pytest.raises(BackendException, match="Failed to create statements"):
+        backend.create_statements(STATEMENTS[:1])
+
+    assert not backend.connection.in_transaction
+    backend.close()
+
+
+def test_backends_lrs_sqlite_init_indexes_and_explain_query_shapes(
+    sqlite_lrs_backend,
+):
+    """Test the `SQLiteLRSBackend.init_indexes` and
+    `SQLiteLRSBackend.explain_query_shapes` methods, should create indexes serving
+    all statements query shapes.
+    """
+    backend = sqlite_lrs_backend()
+    index_names = backend.init_indexes(target="custom")
+    assert "custom_verb_idx" in index_names
+    query = SQLiteQuery(
+        select="name",
+        where="type = 'index' AND tbl_name = 'custom' AND sql IS NOT NULL",
+    )
+    sql = backend.get_sql(query, "sqlite_master")
+    assert sorted(name for name, in backend.connection.execute(sql)) == sorted(
+        index_names
+    )
+    assert not backend.explain_query_shapes(target="custom")
+    assert STATEMENTS_QUERY_SHAPES
+
+    # Without its indexes, statements queries scan the whole table.
+    for name in index_names:
+        backend.connection.execute(f"DROP INDEX {name}")
+    # Query plans are only computed again by new connections.
+    backend.close()
+    assert "verb" in backend.explain_query_shapes(target="custom")
+    backend.close()
@@ -0,0 +1,251 @@
+"""Tests for Ralph tiered LRS backend."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ralph.backends.data.base import BaseOperationType, DataBackendStatus
+from ralph.backends.lrs.base import RalphStatementsQuery
+from ralph.backends.lrs.tiered import TieredLRSBackend
+from ralph.exceptions import BackendParameterException
+
+NOW = datetime.now(tz=timezone.utc)
+
+# Statements 0 to 2 are older than the hot tier retention, 3 to 5 are recent.
+STATEMENTS = [
+    {
+        "id": str(index),
+        "actor": {"mbox": "mailto:foo@bar.baz"},
+        "verb": {"id": "foo_verb" if index % 2 else "bar_verb"},
+        "object": {"id": "foo_object"},
+        "timestamp": (NOW - timedelta(days=days)).isoformat(),
+    }
+    for index, days in enumerate([90, 80, 70, 3, 2, 1])
+]
+
+
+def get_ids(statements):
+    """Return the ids of the `statements`."""
+    return [statement["id"] for statement in statements]
+
+
+def test_backends_lrs_tiered_default_instantiation(monkeypatch, tmp_path):
+    """Test the `TieredLRSBackend` default instantiation."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("RALPH_BACKENDS__LRS__TIERED__HOT_BACKEND", "sqlite")
+    monkeypatch.setenv("RALPH_BACKENDS__LRS__TIERED__HOT_RETENTION_DAYS", "7")
+    backend = TieredLRSBackend()
+    assert backend.name == "tiered"
+    assert backend.settings.HOT_BACKEND == "sqlite"
+    assert backend.settings.COLD_BACKEND == "parquet"
+    assert backend.settings.HOT_RETENTION_DAYS == 7
+    assert backend.hot.name == "sqlite"
+    assert backend.cold.name == "parquet"
+    assert backend.default_operation_type == backend.hot.default_operation_type
+
+
+@pytest.mark.parametrize("name", ["foo", "async_sqlite", "tiered"])
+def test_backends_lrs_tiered_instantiation_with_invalid_tier(
+    name, monkeypatch, tmp_path
+):
+    """Test the `TieredLRSBackend` instantiation, given a tier backend which is not
+    a synchronous LRS backend, should raise a `BackendParameterException`.
+    """
+    monkeypatch.chdir(tmp_path)
+    settings = TieredLRSBackend.settings_class(HOT_BACKEND=name)
+    msg = f"The {name} backend is not a synchronous LRS backend"
+    with pytest.raises(BackendParameterException, match=msg):
+        TieredLRSBackend(settings)
+
+
+def test_backends_lrs_tiered_archive_statements(tiered_lrs_backend):
+    """Test the `TieredLRSBackend.archive_statements` method, given statements older
+    than the hot tier retention, should move them to the cold tier.
+    """
+    backend = tiered_lrs_backend()
+    assert backend.write(STATEMENTS) == 6
+    assert backend.archive_statements(chunk_size=2) == 3
+
+    params = RalphStatementsQuery.model_construct(ascending=True)
+    hot_result = backend.hot.query_statements(params)
+    assert get_ids(hot_result.statements) == ["3", "4", "5"]
+    cold_result = backend.cold.query_statements(params)
+    assert get_ids(cold_result.statements) == ["0", "1", "2"]
+
+    # Given no more aged statements, nothing should be moved.
+    assert not backend.archive_statements()
+
+
+def test_backends_lrs_tiered_archive_statements_without_delete_support(
+    tiered_lrs_backend,
+):
+    """Test the `TieredLRSBackend.archive_statements` method, given a hot backend
+    not supporting the `DELETE` operation, should raise a
+    `BackendParameterException`.
+    """
+    backend = tiered_lrs_backend()
+    backend.hot.unsupported_operation_types = {BaseOperationType.DELETE}
+    msg = "The sqlite hot backend does not support deleting statements"
+    with pytest.raises(BackendParameterException, match=msg):
+        backend.archive_statements()
+
+
+@pytest.mark.parametrize(
+    "params,expected_statement_ids",
+    [
+        # 0. Default query.
+        ({}, ["5", "4", "3", "2", "1", "0"]),
+        # 1. Query in ascending order.
+        ({"ascending": True}, ["0", "1", "2", "3", "4", "5"]),
+        # 2. Query by verb.
+        ({"verb": "foo_verb"}, ["5", "3", "1"]),
+        # 3. Query by statementId of an archived statement.
+        ({"statementId": "1"}, ["1"]),
+        # 4. Query with a limit spanning both tiers.
+        ({"limit": 4}, ["5", "4", "3", "2"]),
+        # 5. Query since a date of the hot tier retention.
+        ({"since": (NOW - timedelta(days=5)).isoformat()}, ["5", "4", "3"]),
+    ],
+)
+def test_backends_lrs_tiered_query_statements_query(
+    params, expected_statement_ids, tiered_lrs_backend
+):
+    """Test the `TieredLRSBackend.query_statements` method, given a query, should
+    return matching statements of both tiers.
+    """
+    backend = tiered_lrs_backend()
+    backend.write(STATEMENTS)
+    backend.archive_statements()
+    result = backend.query_statements(RalphStatementsQuery.model_construct(**params))
+    assert get_ids(result.statements) == expected_statement_ids
+
+
+def test_backends_lrs_tiered_query_statements_without_cold_tier(
+    tiered_lrs_backend, monkeypatch
+):
+    """Test the `TieredLRSBackend.query_statements` method, given a `since` date of
+    the hot tier retention, should not query the cold tier.
+    """
+    backend = tiered_lrs_backend()
+    backend.write(STATEMENTS[3:])
+
+    def mock_query_statements(*_):
+        raise AssertionError("The cold tier should not be queried")
+
+    monkeypatch.setattr(backend.cold, "query_statements", mock_query_statements)
+    since = (NOW - timedelta(days=5)).isoformat()
+    params = RalphStatementsQuery.model_construct(since=since)
+    assert get_ids(backend.query_statements(params).statements) == ["5", "4", "3"]
+
+
+def test_backends_lrs_tiered_query_statements_change_marker(tiered_lrs_backend):
+    """Test the `TieredLRSBackend.query_statements` method, should join the change
+    markers of the queried tiers, or return `None` if a tier does not provide one.
+    """
+    backend = tiered_lrs_backend()
+    backend.write(STATEMENTS[3:])
+    since = (NOW - timedelta(days=5)).isoformat()
+    params = RalphStatementsQuery.model_construct(since=since)
+    hot_result = backend.hot.query_statements(params)
+    assert hot_result.change_marker
+    assert backend.query_statements(params).change_marker == hot_result.change_marker
+
+    params = RalphStatementsQuery.model_construct(limit=10)
+    assert backend.query_statements(params).change_marker is None
+
+
+@pytest.mark.parametrize(
+    "ascending,limit,expected_pages",
+    [
+        (False, 2, [["5", "4"], ["3", "2"], ["1", "0"], []]),
+        (True, 2, [["0", "1"], ["2", "3"], ["4", "5"], []]),
+        (False, 3, [["5", "4", "3"], ["2", "1", "0"], []]),
+        (True, 4, [["0", "1", "2", "3"], ["4", "5"]]),
+    ],
+)
+def test_backends_lrs_tiered_query_statements_with_search_after(
+    ascending, limit, expected_pages, tiered_lrs_backend
+):
+    """Test the `TieredLRSBackend.query_statements` method, given a `search_after`
+    cursor, should return the following page of statements across tiers.
+    """
+    backend = tiered_lrs_backend()
+    backend.write(STATEMENTS)
+    backend.archive_statements()
+    params = RalphStatementsQuery.model_construct(limit=limit, ascending=ascending)
+    pages = []
+    while True:
+        result = backend.query_statements(params)
+        pages.append(get_ids(result.statements))
+        if not result.search_after:
+            break
+        params = params.model_copy(
+            update={"search_after": result.search_after, "pit_id": result.pit_id}
+        )
+
+    assert pages == expected_pages
+
+
+def test_backends_lrs_tiered_query_statements_with_invalid_search_after(
+    tiered_lrs_backend,
+):
+    """Test the `TieredLRSBackend.query_statements` method, given an invalid
+    `search_after` cursor, should raise a `BackendParameterException`.
+    """
+    backend = tiered_lrs_backend()
+    params = RalphStatementsQuery.model_construct(search_after="foo|bar")
+    msg = "Invalid search_after cursor: foo|bar"
+    with pytest.raises(BackendParameterException, match=msg):
+        backend.query_statements(params)
+
+
+def test_backends_lrs_tiered_query_statements_by_ids_and_fingerprints(
+    tiered_lrs_backend,
+):
+    """Test the `TieredLRSBackend.query_statements_by_ids` and
+    `query_statement_fingerprints` methods, given statements of both tiers,
+    should return all of them.
+    """
+    backend = tiered_lrs_backend()
+    backend.write(STATEMENTS)
+    backend.archive_statements()
+    ids = ["5", "1", "foo", "3"]
+    assert sorted(get_ids(backend.query_statements_by_ids(ids))) == ["1", "3", "5"]
+    fingerprints = backend.query_statement_fingerprints(ids)
+    assert sorted(fingerprint.id for fingerprint in fingerprints) == ["1", "3", "5"]
+
+
+def test_backends_lrs_tiered_create_statements(tiered_lrs_backend):
+    """Test the `TieredLRSBackend.create_statements` method, given statements stored
+    in either tier, should return their ids instead of writing them again.
+    """
+    backend = tiered_lrs_backend()
+    assert not backend.create_statements(STATEMENTS[:4])
+    backend.archive_statements()
+    assert backend.create_statements(STATEMENTS) == ["0", "1", "2", "3"]
+    params = RalphStatementsQuery.model_construct(ascending=True)
+    assert get_ids(backend.hot.query_statements(params).statements) == [
+        "3",
+        "4",
+        "5",
+    ]
+    assert get_ids(backend.cold.query_statements(params).statements) == [
+        "0",
+        "1",
+        "2",
+    ]
+
+
+def test_backends_lrs_tiered_status(tiered_lrs_backend, monkeypatch):
+    """Test the `TieredLRSBackend.status` method, should return the least healthy
+    status of both tiers.
+    """
+    backend = tiered_lrs_backend()
+    assert backend.status() == DataBackendStatus.OK
+
+    monkeypatch.setattr(backend.cold, "status", lambda: DataBackendStatus.AWAY)
+    assert backend.status() == DataBackendStatus.AWAY
+
+    monkeypatch.setattr(backend.hot, "status", lambda: DataBackendStatus.ERROR)
+    assert backend.status() == DataBackendStatus.ERROR
+    backend.close()
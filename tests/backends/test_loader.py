@@ -8,32 +8,47 @@ if sys.version_info < (3, 10):
 else:
     from importlib.metadata import EntryPoint, EntryPoints, entry_points
 
+from ralph.backends.data.async_clickhouse import AsyncClickHouseDataBackend
 from ralph.backends.data.async_es import AsyncESDataBackend
 from ralph.backends.data.async_lrs import AsyncLRSDataBackend
 from ralph.backends.data.async_mongo import AsyncMongoDataBackend
+from ralph.backends.data.async_sqlite import AsyncSQLiteDataBackend
 from ralph.backends.data.async_ws import AsyncWSDataBackend
 from ralph.backends.data.base import BaseDataBackend
 from ralph.backends.data.clickhouse import ClickHouseDataBackend
 from ralph.backends.data.es import ESDataBackend
+from ralph.backends.data.fanout import FanoutDataBackend
 from ralph.backends.data.fs import FSDataBackend
 from ralph.backends.data.ldp import LDPDataBackend
 from ralph.backends.data.lrs import LRSDataBackend
 from ralph.backends.data.mongo import MongoDataBackend
+from ralph.backends.data.parquet import ParquetDataBackend
 from ralph.backends.data.s3 import S3DataBackend
+from ralph.backends.data.sqlite import SQLiteDataBackend
 from ralph.backends.data.swift import SwiftDataBackend
 from ralph.backends.loader import (
     get_backends,
     get_cli_backends,
     get_cli_list_backends,
     get_cli_write_backends,
+    get_lrs_archive_backends,
     get_lrs_backends,
+    get_lrs_index_backends,
 )
+from ralph.backends.lrs.async_cached import AsyncCachedLRSBackend
+from ralph.backends.lrs.async_clickhouse import AsyncClickHouseLRSBackend
 from ralph.backends.lrs.async_es import AsyncESLRSBackend
 from ralph.backends.lrs.async_mongo import AsyncMongoLRSBackend
+from ralph.backends.lrs.async_sqlite import AsyncSQLiteLRSBackend
+from ralph.backends.lrs.cached import CachedLRSBackend
 from ralph.backends.lrs.clickhouse import ClickHouseLRSBackend
 from ralph.backends.lrs.es import ESLRSBackend
+from ralph.backends.lrs.fanout import FanoutLRSBackend
 from ralph.backends.lrs.fs import FSLRSBackend
 from ralph.backends.lrs.mongo import MongoLRSBackend
+from ralph.backends.lrs.parquet import ParquetLRSBackend
+from ralph.backends.lrs.sqlite import SQLiteLRSBackend
+from ralph.backends.lrs.tiered import TieredLRSBackend
 
 from tests.backends.test_utils_backends.valid_backends import TestBackend
 
@@ -121,17 +136,22 @@ def test_backends_loader_get_cli_backends(monkeypatch):
     get_cli_backends.cache_clear()
     assert get_cli_backends() == {
         "test_backend": TestBackend,
+        "async_clickhouse": AsyncClickHouseDataBackend,
         "async_es": AsyncESDataBackend,
         "async_lrs": AsyncLRSDataBackend,
         "async_mongo": AsyncMongoDataBackend,
+        "async_sqlite": AsyncSQLiteDataBackend,
         "async_ws": AsyncWSDataBackend,
         "clickhouse": ClickHouseDataBackend,
         "es": ESDataBackend,
+        "fanout": FanoutDataBackend,
         "fs": FSDataBackend,
         "ldp": LDPDataBackend,
         "lrs": LRSDataBackend,
         "mongo": MongoDataBackend,
+        "parquet": ParquetDataBackend,
         "s3": S3DataBackend,
+        "sqlite": SQLiteDataBackend,
         "swift": SwiftDataBackend,
     }
 
@@ -140,15 +160,20 @@ def test_backends_loader_get_cli_write_backends():
     """Test the `get_cli_write_backends` function."""
     get_cli_backends.cache_clear()
     assert get_cli_write_backends() == {
+        "async_clickhouse": AsyncClickHouseDataBackend,
         "async_es": AsyncESDataBackend,
         "async_lrs": AsyncLRSDataBackend,
         "async_mongo": AsyncMongoDataBackend,
+        "async_sqlite": AsyncSQLiteDataBackend,
         "clickhouse": ClickHouseDataBackend,
         "es": ESDataBackend,
+        "fanout": FanoutDataBackend,
         "fs": FSDataBackend,
         "lrs": LRSDataBackend,
         "mongo": MongoDataBackend,
+        "parquet": ParquetDataBackend,
         "s3": S3DataBackend,
+        "sqlite": SQLiteDataBackend,
         "swift": SwiftDataBackend,
     }
 
@@ -157,14 +182,18 @@ def test_backends_loader_get_cli_list_backends():
     """Test the `get_cli_list_backends` function."""
     get_cli_backends.cache_clear()
     assert get_cli_list_backends() == {
+        "async_clickhouse": AsyncClickHouseDataBackend,
         "async_es": AsyncESDataBackend,
         "async_mongo": AsyncMongoDataBackend,
+        "async_sqlite": AsyncSQLiteDataBackend,
         "clickhouse": ClickHouseDataBackend,
         "es": ESDataBackend,
         "fs": FSDataBackend,
         "ldp": LDPDataBackend,
         "mongo": MongoDataBackend,
+        "parquet": ParquetDataBackend,
         "s3": S3DataBackend,
+        "sqlite": SQLiteDataBackend,
         "swift": SwiftDataBackend,
     }
 
@@ -193,11 +222,40 @@ def test_backends_loader_get_lrs_backends(monkeypatch):
     get_lrs_backends.cache_clear()
     assert get_lrs_backends() == {
         "test_backend": TestBackend,
+        "async_cached": AsyncCachedLRSBackend,
+        "async_clickhouse": AsyncClickHouseLRSBackend,
         "async_es": AsyncESLRSBackend,
         "async_mongo": AsyncMongoLRSBackend,
+        "async_sqlite": AsyncSQLiteLRSBackend,
+        "cached": CachedLRSBackend,
         "clickhouse": ClickHouseLRSBackend,
         "es": ESLRSBackend,
+        "fanout": FanoutLRSBackend,
         "fs": FSLRSBackend,
         "mongo": MongoLRSBackend,
+        "parquet": ParquetLRSBackend,
+        "sqlite": SQLiteLRSBackend,
+        "tiered": TieredLRSBackend,
     }
     get_lrs_backends.cache_clear()
+
+
+def test_backends_loader_get_lrs_index_backends():
+    """Test the `get_lrs_index_backends` function."""
+    get_lrs_backends.cache_clear()
+    assert get_lrs_index_backends() == {
+        "async_clickhouse": AsyncClickHouseLRSBackend,
+        "async_es": AsyncESLRSBackend,
+        "async_mongo": AsyncMongoLRSBackend,
+        "async_sqlite": AsyncSQLiteLRSBackend,
+        "clickhouse": ClickHouseLRSBackend,
+        "es": ESLRSBackend,
+        "mongo": MongoLRSBackend,
+        "sqlite": SQLiteLRSBackend,
+    }
+
+
+def test_backends_loader_get_lrs_archive_backends():
+    """Test the `get_lrs_archive_backends` function."""
+    get_lrs_backends.cache_clear()
+    assert get_lrs_archive_backends() == {"tiered": TieredLRSBackend}
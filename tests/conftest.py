@@ -9,10 +9,16 @@ from .fixtures.auth import (  # noqa: F401
 )
 from .fixtures.backends import (  # noqa: F401
     anyio_backend,
+    async_cached_lrs_backend,
+    async_clickhouse_backend,
+    async_clickhouse_lrs_backend,
     async_es_backend,
     async_es_lrs_backend,
     async_mongo_backend,
     async_mongo_lrs_backend,
+    async_sqlite_backend,
+    async_sqlite_lrs_backend,
+    cached_lrs_backend,
     clickhouse,
     clickhouse_backend,
     clickhouse_custom,
@@ -24,6 +30,8 @@ from .fixtures.backends import (  # noqa: F401
     es_forwarding,
     es_lrs_backend,
     events,
+    fanout_backend,
+    fanout_lrs_backend,
     flavor,
     fs_backend,
     fs_lrs_backend,
@@ -36,9 +44,14 @@ from .fixtures.backends import (  # noqa: F401
     mongo_forwarding,
     mongo_lrs_backend,
     moto_fs,
+    parquet_backend,
+    parquet_lrs_backend,
     s3_backend,
     settings_fs,
+    sqlite_backend,
+    sqlite_lrs_backend,
     swift_backend,
+    tiered_lrs_backend,
     ws,
 )
 from .fixtures.logs import gelf_logger  # noqa: F401
@@ -22,26 +22,39 @@ from pydantic import AnyHttpUrl, TypeAdapter
 from pymongo import MongoClient
 from pymongo.errors import CollectionInvalid
 
+from ralph.backends.data.async_clickhouse import AsyncClickHouseDataBackend
 from ralph.backends.data.async_es import AsyncESDataBackend
 from ralph.backends.data.async_lrs import AsyncLRSDataBackend
 from ralph.backends.data.async_mongo import AsyncMongoDataBackend
+from ralph.backends.data.async_sqlite import AsyncSQLiteDataBackend
 from ralph.backends.data.clickhouse import (
     ClickHouseClientOptions,
     ClickHouseDataBackend,
 )
 from ralph.backends.data.es import ESDataBackend
+from ralph.backends.data.fanout import FanoutDataBackend
 from ralph.backends.data.fs import FSDataBackend
 from ralph.backends.data.ldp import LDPDataBackend
 from ralph.backends.data.lrs import LRSDataBackend, LRSHeaders
 from ralph.backends.data.mongo import MongoDataBackend
+from ralph.backends.data.parquet import ParquetDataBackend
 from ralph.backends.data.s3 import S3DataBackend
+from ralph.backends.data.sqlite import SQLiteDataBackend
 from ralph.backends.data.swift import SwiftDataBackend
+from ralph.backends.lrs.async_cached import AsyncCachedLRSBackend
+from ralph.backends.lrs.async_clickhouse import AsyncClickHouseLRSBackend
 from ralph.backends.lrs.async_es import AsyncESLRSBackend
 from ralph.backends.lrs.async_mongo import AsyncMongoLRSBackend
+from ralph.backends.lrs.async_sqlite import AsyncSQLiteLRSBackend
+from ralph.backends.lrs.cached import CachedLRSBackend
 from ralph.backends.lrs.clickhouse import ClickHouseLRSBackend
 from ralph.backends.lrs.es import ESLRSBackend
+from ralph.backends.lrs.fanout import FanoutLRSBackend
 from ralph.backends.lrs.fs import FSLRSBackend
 from ralph.backends.lrs.mongo import MongoLRSBackend
+from ralph.backends.lrs.parquet import ParquetLRSBackend
+from ralph.backends.lrs.sqlite import SQLiteLRSBackend
+from ralph.backends.lrs.tiered import TieredLRSBackend
 from ralph.conf import Settings, core_settings
 
 # ClickHouse backend defaults
@@ -108,6 +121,17 @@ def get_clickhouse_test_backend():
     return ClickHouseLRSBackend(settings)
 
 
+def get_async_clickhouse_test_backend():
+    """Return an AsyncClickHouseLRSBackend backend instance using test defaults."""
+    settings = AsyncClickHouseLRSBackend.settings_class(
+        HOST=CLICKHOUSE_TEST_HOST,
+        PORT=CLICKHOUSE_TEST_PORT,
+        DATABASE=CLICKHOUSE_TEST_DATABASE,
+        EVENT_TABLE_NAME=CLICKHOUSE_TEST_TABLE_NAME,
+    )
+    return AsyncClickHouseLRSBackend(settings)
+
+
 @lru_cache
 def get_es_test_backend():
     """Return a ESLRSBackend backend instance using test defaults."""
@@ -263,6 +287,195 @@ def fs_lrs_backend(fs, settings_fs):
     return get_fs_lrs_backend
 
 
+@pytest.fixture
+def fanout_backend(monkeypatch, tmp_path):
+    """Return the `get_fanout_data_backend` function.
+
+    Records are written to an SQLite and an FS data backend.
+    """
+    monkeypatch.setenv(
+        "RALPH_BACKENDS__DATA__SQLITE__DATABASE_PATH", str(tmp_path / "db.sqlite3")
+    )
+    monkeypatch.setenv(
+        "RALPH_BACKENDS__DATA__FS__DEFAULT_DIRECTORY_PATH", str(tmp_path)
+    )
+
+    def get_fanout_data_backend(backends: str = "sqlite,fs", primary=None):
+        """Return an instance of `FanoutDataBackend`."""
+        settings = FanoutDataBackend.settings_class(
+            BACKENDS=backends,
+            PRIMARY_BACKEND=primary,
+            WRITE_CHUNK_SIZE=2,
+        )
+        return FanoutDataBackend(settings)
+
+    return get_fanout_data_backend
+
+
+@pytest.fixture
+def fanout_lrs_backend(monkeypatch, tmp_path):
+    """Return the `get_fanout_lrs_backend` function.
+
+    Statements are written to an SQLite and an FS LRS backend.
+    """
+    monkeypatch.setenv(
+        "RALPH_BACKENDS__LRS__SQLITE__DATABASE_PATH", str(tmp_path / "lrs.sqlite3")
+    )
+    monkeypatch.setenv("RALPH_BACKENDS__LRS__FS__DEFAULT_DIRECTORY_PATH", str(tmp_path))
+
+    def get_fanout_lrs_backend(backends: str = "sqlite,fs"):
+        """Return an instance of `FanoutLRSBackend`."""
+        settings = FanoutLRSBackend.settings_class(BACKENDS=backends)
+        return FanoutLRSBackend(settings)
+
+    return get_fanout_lrs_backend
+
+
+@pytest.fixture
+def parquet_backend(tmp_path):
+    """Return the `get_parquet_data_backend` function."""
+
+    def get_parquet_data_backend(storage: str = "fs"):
+        """Return an instance of `ParquetDataBackend`."""
+        settings = ParquetDataBackend.settings_class(
+            STORAGE=storage,
+            DEFAULT_DIRECTORY_PATH=tmp_path,
+            LOCALE_ENCODING="utf8",
+            READ_CHUNK_SIZE=2,
+            WRITE_CHUNK_SIZE=3,
+        )
+        return ParquetDataBackend(settings)
+
+    return get_parquet_data_backend
+
+
+@pytest.fixture
+def parquet_lrs_backend(tmp_path):
+    """Return the `get_parquet_lrs_backend` function."""
+
+    def get_parquet_lrs_backend():
+        """Return an instance of `ParquetLRSBackend`."""
+        settings = ParquetLRSBackend.settings_class(
+            DEFAULT_DIRECTORY_PATH=tmp_path / "archive",
+            LOCALE_ENCODING="utf8",
+            READ_CHUNK_SIZE=2,
+            WRITE_CHUNK_SIZE=3,
+        )
+        return ParquetLRSBackend(settings)
+
+    return get_parquet_lrs_backend
+
+
+@pytest.fixture
+def tiered_lrs_backend(monkeypatch, tmp_path):
+    """Return the `get_tiered_lrs_backend` function.
+
+    The hot tier is an SQLite LRS backend and the cold tier a Parquet LRS backend.
+    """
+    (tmp_path / "cold").mkdir()
+    monkeypatch.setenv(
+        "RALPH_BACKENDS__LRS__SQLITE__DATABASE_PATH", str(tmp_path / "hot.sqlite3")
+    )
+    monkeypatch.setenv(
+        "RALPH_BACKENDS__LRS__PARQUET__DEFAULT_DIRECTORY_PATH", str(tmp_path / "cold")
+    )
+
+    def get_tiered_lrs_backend(hot_retention_days: int = 30):
+        """Return an instance of `TieredLRSBackend`."""
+        settings = TieredLRSBackend.settings_class(
+            HOT_BACKEND="sqlite",
+            COLD_BACKEND="parquet",
+            HOT_RETENTION_DAYS=hot_retention_days,
+        )
+        return TieredLRSBackend(settings)
+
+    return get_tiered_lrs_backend
+
+
+@pytest.fixture
+def cached_lrs_backend(monkeypatch, tmp_path):
+    """Return the `get_cached_lrs_backend` function.
+
+    The cached backend is an SQLite LRS backend.
+    """
+    monkeypatch.setenv(
+        "RALPH_BACKENDS__LRS__SQLITE__DATABASE_PATH", str(tmp_path / "lrs.sqlite3")
+    )
+
+    def get_cached_lrs_backend(shared: bool = False, max_size: int = 10):
+        """Return an instance of `CachedLRSBackend`."""
+        settings = CachedLRSBackend.settings_class(
+            BACKEND="sqlite",
+            CACHE_MAX_SIZE=max_size,
+            CACHE_DATABASE_PATH=tmp_path / "cache.sqlite3" if shared else None,
+        )
+        return CachedLRSBackend(settings)
+
+    return get_cached_lrs_backend
+
+
+@pytest.fixture
+def async_cached_lrs_backend(monkeypatch, tmp_path):
+    """Return the `get_async_cached_lrs_backend` function.
+
+    The cached backend is an asynchronous SQLite LRS backend.
+    """
+    monkeypatch.setenv(
+        "RALPH_BACKENDS__LRS__SQLITE__DATABASE_PATH", str(tmp_path / "lrs.sqlite3")
+    )
+
+    def get_async_cached_lrs_backend(shared: bool = False):
+        """Return an instance of `AsyncCachedLRSBackend`."""
+        settings = AsyncCachedLRSBackend.settings_class(
+            BACKEND="async_sqlite",
+            CACHE_DATABASE_PATH=tmp_path / "cache.sqlite3" if shared else None,
+        )
+        return AsyncCachedLRSBackend(settings)
+
+    return get_async_cached_lrs_backend
+
+
+def get_sqlite_backend_factory(backend_class, database_path: Path):
+    """Return a function instantiating `backend_class` with a test database."""
+
+    def get_sqlite_backend(default_table: str = "statements"):
+        """Return an instance of the SQLite `backend_class`."""
+        settings = backend_class.settings_class(
+            DATABASE_PATH=database_path,
+            DEFAULT_TABLE=default_table,
+            LOCALE_ENCODING="utf8",
+            READ_CHUNK_SIZE=2,
+            WRITE_CHUNK_SIZE=2,
+        )
+        return backend_class(settings)
+
+    return get_sqlite_backend
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path):
+    """Return the `get_sqlite_backend` function."""
+    return get_sqlite_backend_factory(SQLiteDataBackend, tmp_path / "test.sqlite3")
+
+
+@pytest.fixture
+def sqlite_lrs_backend(tmp_path):
+    """Return the `get_sqlite_backend` function for the SQLite LRS backend."""
+    return get_sqlite_backend_factory(SQLiteLRSBackend, tmp_path / "test.sqlite3")
+
+
+@pytest.fixture
+def async_sqlite_backend(tmp_path):
+    """Return the `get_sqlite_backend` function for the async SQLite backend."""
+    return get_sqlite_backend_factory(AsyncSQLiteDataBackend, tmp_path / "test.sqlite3")
+
+
+@pytest.fixture
+def async_sqlite_lrs_backend(tmp_path):
+    """Return the `get_sqlite_backend` function for the async SQLite LRS backend."""
+    return get_sqlite_backend_factory(AsyncSQLiteLRSBackend, tmp_path / "test.sqlite3")
+
+
 @pytest.fixture(scope="session")
 def anyio_backend():
     """Select asyncio backend for pytest anyio."""
@@ -288,7 +501,6 @@ def lrs_backend(
 
         @wraps(sync_func)
         async def async_func(*args, **kwargs):
-            kwargs.pop("concurrency", None)
             return sync_func(*args, **kwargs)
 
         return async_func
@@ -523,7 +735,8 @@ def get_clickhouse_fixture(
         CREATE TABLE {event_table_name} (
         event_id UUID NOT NULL,
         emission_time DateTime64(6) NOT NULL,
-        event String NOT NULL
+        event String NOT NULL,
+        fingerprint String
         )
         ENGINE MergeTree ORDER BY (emission_time, event_id)
         PRIMARY KEY (emission_time, event_id)
@@ -592,7 +805,8 @@ def clickhouse_custom():
             CREATE TABLE {event_table_name} (
             event_id UUID NOT NULL,
             emission_time DateTime64(6) NOT NULL,
-            event String NOT NULL
+            event String NOT NULL,
+            fingerprint String
             )
             ENGINE MergeTree ORDER BY (emission_time, event_id)
             PRIMARY KEY (emission_time, event_id)
@@ -724,6 +938,57 @@ def async_es_lrs_backend():
     return get_async_es_test_backend
 
 
+@pytest.fixture
+def async_clickhouse_backend():
+    """Return the `get_async_clickhouse_data_backend` function."""
+
+    def get_async_clickhouse_data_backend():
+        """Return an instance of AsyncClickHouseDataBackend."""
+        settings = AsyncClickHouseDataBackend.settings_class(
+            HOST=CLICKHOUSE_TEST_HOST,
+            PORT=CLICKHOUSE_TEST_PORT,
+            DATABASE=CLICKHOUSE_TEST_DATABASE,
+            EVENT_TABLE_NAME=CLICKHOUSE_TEST_TABLE_NAME,
+            USERNAME="default",
+            PASSWORD="",
+            CLIENT_OPTIONS={
+                "date_time_input_format": "best_effort",
+            },
+            LOCALE_ENCODING="utf8",
+            READ_CHUNK_SIZE=500,
+            WRITE_CHUNK_SIZE=499,
+        )
+        return AsyncClickHouseDataBackend(settings)
+
+    return get_async_clickhouse_data_backend
+
+
+@pytest.fixture
+def async_clickhouse_lrs_backend():
+    """Return the `get_async_clickhouse_lrs_backend` function."""
+
+    def get_async_clickhouse_lrs_backend():
+        """Return an instance of AsyncClickHouseLRSBackend."""
+        settings = AsyncClickHouseLRSBackend.settings_class(
+            HOST=CLICKHOUSE_TEST_HOST,
+            PORT=CLICKHOUSE_TEST_PORT,
+            DATABASE=CLICKHOUSE_TEST_DATABASE,
+            EVENT_TABLE_NAME=CLICKHOUSE_TEST_TABLE_NAME,
+            USERNAME="default",
+            PASSWORD="",
+            CLIENT_OPTIONS={
+                "date_time_input_format": "best_effort",
+            },
+            LOCALE_ENCODING="utf8",
+            IDS_CHUNK_SIZE=10000,
+            READ_CHUNK_SIZE=500,
+            WRITE_CHUNK_SIZE=499,
+        )
+        return AsyncClickHouseLRSBackend(settings)
+
+    return get_async_clickhouse_lrs_backend
+
+
 @pytest.fixture
 def clickhouse_backend():
     """Return the `get_clickhouse_data_backend` function."""
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import pstats
 from contextlib import contextmanager
 from importlib import reload
 from pathlib import Path
@@ -16,6 +17,9 @@ from pydantic import ValidationError
 from ralph import cli as cli_module
 from ralph.backends.data.fs import FSDataBackend
 from ralph.backends.data.ldp import LDPDataBackend
+from ralph.backends.data.lrs import LRSDataBackend
+from ralph.backends.lrs.mongo import MongoLRSBackend
+from ralph.backends.lrs.tiered import TieredLRSBackend
 from ralph.cli import (
     CommaSeparatedKeyValueParamType,
     CommaSeparatedTupleParamType,
@@ -553,6 +557,43 @@ def test_cli_verbosity_option_should_impact_logging_behaviour(verbosity):
     assert verbosity in result.output
 
 
+def test_cli_stats_option_should_print_a_throughput_summary(monkeypatch):
+    """Test the `--stats` option prints input and output counters to stderr."""
+
+    def mock_read(*_, **__):
+        """Always return the same two records."""
+        yield from (b'{"foo": "bar"}\n', b'{"bar": "baz"}\n')
+
+    monkeypatch.setattr(FSDataBackend, "read", mock_read)
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--stats", "read", "-b", "fs"])
+    assert result.exit_code == 0
+    assert '{"foo": "bar"}\n{"bar": "baz"}\n' in result.output
+    assert "output             2              30" in result.output
+    assert "input              0               0" in result.output
+    assert "warnings: 0 | errors: 0" in result.output
+
+    # Given invalid input lines, errors should be counted.
+    result = runner.invoke(
+        cli, ["--stats", "validate", "-f", "xapi", "-I"], input='{"a": 1}\n{}\n'
+    )
+    assert result.exit_code == 0
+    assert "input              2              12" in result.output
+    assert "errors: 2" in result.output
+
+
+def test_cli_profile_option_should_dump_profiling_statistics(tmp_path, monkeypatch):
+    """Test the `--profile` option writes a pstats file and a memory report."""
+    monkeypatch.setattr(FSDataBackend, "read", lambda *_, **__: iter(()))
+    profile_file = tmp_path / "ralph.prof"
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--profile", str(profile_file), "read", "-b", "fs"])
+    assert result.exit_code == 0
+    assert pstats.Stats(str(profile_file)).total_calls
+    assert "peak memory:" in result.output
+    assert f"Profiling statistics written to: {profile_file}" in result.output
+
+
 def test_cli_read_command_with_ldp_backend(monkeypatch):
     """Test ralph read command using the LDP backend."""
     archive_content = {"foo": "bar"}
@@ -984,6 +1025,29 @@ def test_cli_write_command_with_chunk_size(fs, monkeypatch):
     assert result.exit_code == 0
 
 
+def test_cli_write_command_with_concurrency(monkeypatch):
+    """Test ralph `write` command with a `concurrency` option."""
+    concurrencies = []
+
+    def mock_write_dicts(self, data, target, chunk_size, ignore_errors, *args):
+        """Record the `concurrency` argument and return the data count."""
+        concurrencies.append(args[-1])
+        return len(list(data))
+
+    monkeypatch.setattr(LRSDataBackend, "_write_dicts", mock_write_dicts)
+    runner = CliRunner()
+
+    # Given no concurrency option, the backend default should be used.
+    result = runner.invoke(cli, "write -b lrs".split(), input='{"id": "foo"}\n')
+    assert result.exit_code == 0
+    assert concurrencies == [None]
+
+    # Given a concurrency option, it should be forwarded to sync backends.
+    result = runner.invoke(cli, "write -b lrs -c 4".split(), input='{"id": "foo"}\n')
+    assert result.exit_code == 0
+    assert concurrencies == [None, 4]
+
+
 def test_cli_write_command_with_es_backend(es):
     """Test ralph write command using the es backend."""
 
@@ -1010,6 +1074,75 @@ def test_cli_write_command_with_es_backend(es):
     assert [document.get("_source") for document in documents] == records
 
 
+def test_cli_migrate_command_with_fs_backend(fs):
+    """Test ralph migrate command using the FS LRS backend."""
+    fs.create_dir(str(settings.APP_DIR))
+    statements = [{"id": "foo"}, {"id": "bar", "timestamp": "2023-03-15"}]
+    fs.create_file(
+        "foo/fs_lrs.jsonl",
+        contents="\n".join(json.dumps(statement) for statement in statements),
+    )
+
+    runner = CliRunner()
+    command = "migrate -b fs --fs-default-directory-path foo".split()
+    result = runner.invoke(cli, command)
+    assert result.exit_code == 0
+
+    # FS statements have no stored fingerprint, thus they should be left unchanged.
+    with Path("foo/fs_lrs.jsonl").open(encoding="utf-8") as lrs_file:
+        assert [json.loads(line) for line in lrs_file] == statements
+
+
+def test_cli_archive_command_with_tiered_backend(monkeypatch):
+    """Test ralph archive command using the tiered LRS backend."""
+
+    def mock_archive_statements(self, target=None, chunk_size=None):
+        """Mock the `TieredLRSBackend.archive_statements` method."""
+        assert self.settings.HOT_BACKEND == "sqlite"
+        assert target == "foo"
+        assert chunk_size == 10
+        return 3
+
+    monkeypatch.setattr(TieredLRSBackend, "archive_statements", mock_archive_statements)
+
+    runner = CliRunner()
+    command = "-v INFO archive -b tiered --tiered-hot-backend sqlite -t foo -s 10"
+    result = runner.invoke(cli, command.split())
+    assert result.exit_code == 0
+    assert "Archived 3 statements" in result.output
+
+
+def test_cli_init_command_with_mongo_backend(monkeypatch):
+    """Test ralph init command using the MongoDB LRS backend."""
+
+    def mock_init_indexes(self, target=None):
+        """Mock the `MongoLRSBackend.init_indexes` method."""
+        assert target == "foo"
+        return ["_source.id_1", "_source.timestamp_-1__id_-1"]
+
+    def mock_explain_query_shapes(self, target=None):
+        """Mock the `MongoLRSBackend.explain_query_shapes` method."""
+        assert target == "foo"
+        return ["verb"]
+
+    monkeypatch.setattr(MongoLRSBackend, "init_indexes", mock_init_indexes)
+    monkeypatch.setattr(
+        MongoLRSBackend, "explain_query_shapes", mock_explain_query_shapes
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, "-v INFO init -b mongo -t foo".split())
+    assert result.exit_code == 0
+    assert "Created indexes: _source.id_1, _source.timestamp_-1__id_-1" in result.output
+
+    result = runner.invoke(cli, "init -b mongo -t foo --explain".split())
+    assert result.exit_code == 1
+    assert "The verb statements query shape is not served by an index" in (
+        result.output
+    )
+    assert "1 statements query shapes are not served by an index" in result.output
+
+
 @pytest.mark.parametrize("host_,port_", [("0.0.0.0", "8000"), ("127.0.0.1", "80")])
 def test_cli_runserver_command_with_host_and_port_arguments(host_, port_, monkeypatch):
     """Test the ralph runserver command should consider the host and port arguments."""
@@ -1073,4 +1206,5 @@ def test_cli_ralph_cli_lazy_backend_options(monkeypatch):
     # Given a command that requires backend options of multiple commands, the
     # `backend_options` function should be called once for each command.
     runner.invoke(cli_module.cli, ["--help"])
-    assert call_counter["count"] == 4  # list + (read, write, runserver)
+    # list + (read, write, migrate, archive, init, runserver)
+    assert call_counter["count"] == 7
@@ -111,14 +111,28 @@ def test_cli_read_command_usage():
     assert result.exit_code == 0
 
     assert (
-        "Usage: ralph read [OPTIONS] [QUERY]\n\n"
+        "Usage: ralph read [OPTIONS] [QUERY]\n"
+        "\n"
         "  Read records matching the QUERY (json or string) from a configured backend."
-        "\n\n"
+        "\n"
+        "\n"
         "Options:\n"
-        "  -b, --backend "
-        "[async_es|async_lrs|async_mongo|async_ws|clickhouse|es|fs|ldp|lrs|mongo|s3|"
-        "swift]\n"
+        "  -b, --backend [async_clickhouse|async_es|async_lrs|async_mongo|async_sqlite|"
+        "async_ws|clickhouse|es|fanout|fs|ldp|lrs|mongo|parquet|s3|sqlite|swift]\n"
         "                                  Backend  [required]\n"
+        "  async_clickhouse backend: \n"
+        "    --async-clickhouse-client-options KEY=VALUE,KEY=VALUE\n"
+        "    --async-clickhouse-database TEXT\n"
+        "    --async-clickhouse-event-table-name TEXT\n"
+        "    --async-clickhouse-host TEXT\n"
+        "    --async-clickhouse-locale-encoding TEXT\n"
+        "    --async-clickhouse-password TEXT\n"
+        "    --async-clickhouse-pool-size INTEGER\n"
+        "    --async-clickhouse-port INTEGER\n"
+        "    --async-clickhouse-read-chunk-size INTEGER\n"
+        "    --async-clickhouse-username TEXT\n"
+        "    --async-clickhouse-write-chunk-size INTEGER\n"
+        "    --async-clickhouse-write-concurrency INTEGER\n"
         "  async_es backend: \n"
         "    --async-es-allow-yellow-status / --no-async-es-allow-yellow-status\n"
         "    --async-es-client-options KEY=VALUE,KEY=VALUE\n"
@@ -129,16 +143,28 @@ def test_cli_read_command_usage():
         "    --async-es-read-chunk-size INTEGER\n"
         "    --async-es-refresh-after-write TEXT\n"
         "    --async-es-write-chunk-size INTEGER\n"
+        "    --async-es-write-concurrency INTEGER\n"
         "  async_lrs backend: \n"
         "    --async-lrs-base-url TEXT\n"
         "    --async-lrs-headers KEY=VALUE,KEY=VALUE\n"
+        "    --async-lrs-http2 / --no-async-lrs-http2\n"
         "    --async-lrs-locale-encoding TEXT\n"
         "    --async-lrs-password TEXT\n"
+        "    --async-lrs-pool-size INTEGER\n"
+        "    --async-lrs-read-ahead INTEGER\n"
         "    --async-lrs-read-chunk-size INTEGER\n"
+        "    --async-lrs-read-partitions INTEGER\n"
+        "    --async-lrs-read-partitions-ordered / --no-async-lrs-read-partitions-order"
+        "ed\n"
+        "    --async-lrs-read-partitions-split-depth INTEGER\n"
         "    --async-lrs-statements-endpoint TEXT\n"
         "    --async-lrs-status-endpoint TEXT\n"
         "    --async-lrs-username TEXT\n"
         "    --async-lrs-write-chunk-size INTEGER\n"
+        "    --async-lrs-write-concurrency INTEGER\n"
+        "    --async-lrs-write-gzip / --no-async-lrs-write-gzip\n"
+        "    --async-lrs-write-retries INTEGER\n"
+        "    --async-lrs-write-retry-backoff FLOAT\n"
         "  async_mongo backend: \n"
         "    --async-mongo-client-options KEY=VALUE,KEY=VALUE\n"
         "    --async-mongo-connection-uri MONGODSN\n"
@@ -147,10 +173,26 @@ def test_cli_read_command_usage():
         "    --async-mongo-locale-encoding TEXT\n"
         "    --async-mongo-read-chunk-size INTEGER\n"
         "    --async-mongo-write-chunk-size INTEGER\n"
+        "    --async-mongo-write-concern TEXT\n"
+        "    --async-mongo-write-concurrency INTEGER\n"
+        "    --async-mongo-write-journal TEXT\n"
+        "    --async-mongo-write-ordered / --no-async-mongo-write-ordered\n"
+        "  async_sqlite backend: \n"
+        "    --async-sqlite-busy-timeout FLOAT\n"
+        "    --async-sqlite-database-path PATH\n"
+        "    --async-sqlite-default-table TEXT\n"
+        "    --async-sqlite-locale-encoding TEXT\n"
+        "    --async-sqlite-read-chunk-size INTEGER\n"
+        "    --async-sqlite-synchronous TEXT\n"
+        "    --async-sqlite-write-chunk-size INTEGER\n"
         "  async_ws backend: \n"
         "    --async-ws-client-options KEY=VALUE,KEY=VALUE\n"
         "    --async-ws-locale-encoding TEXT\n"
+        "    --async-ws-read-buffer-size INTEGER\n"
         "    --async-ws-read-chunk-size INTEGER\n"
+        "    --async-ws-read-max-latency FLOAT\n"
+        "    --async-ws-reconnect-attempts INTEGER\n"
+        "    --async-ws-reconnect-backoff FLOAT\n"
         "    --async-ws-uri URL\n"
         "    --async-ws-write-chunk-size INTEGER\n"
         "  clickhouse backend: \n"
@@ -160,10 +202,12 @@ def test_cli_read_command_usage():
         "    --clickhouse-host TEXT\n"
         "    --clickhouse-locale-encoding TEXT\n"
         "    --clickhouse-password TEXT\n"
+        "    --clickhouse-pool-size INTEGER\n"
         "    --clickhouse-port INTEGER\n"
         "    --clickhouse-read-chunk-size INTEGER\n"
         "    --clickhouse-username TEXT\n"
         "    --clickhouse-write-chunk-size INTEGER\n"
+        "    --clickhouse-write-concurrency INTEGER\n"
         "  es backend: \n"
         "    --es-allow-yellow-status / --no-es-allow-yellow-status\n"
         "    --es-client-options KEY=VALUE,KEY=VALUE\n"
@@ -174,6 +218,13 @@ def test_cli_read_command_usage():
         "    --es-read-chunk-size INTEGER\n"
         "    --es-refresh-after-write TEXT\n"
         "    --es-write-chunk-size INTEGER\n"
+        "    --es-write-concurrency INTEGER\n"
+        "  fanout backend: \n"
+        "    --fanout-backends TEXT\n"
+        "    --fanout-locale-encoding TEXT\n"
+        "    --fanout-primary-backend TEXT\n"
+        "    --fanout-read-chunk-size INTEGER\n"
+        "    --fanout-write-chunk-size INTEGER\n"
         "  fs backend: \n"
         "    --fs-default-directory-path PATH\n"
         "    --fs-default-query-string TEXT\n"
@@ -194,13 +245,23 @@ def test_cli_read_command_usage():
         "  lrs backend: \n"
         "    --lrs-base-url TEXT\n"
         "    --lrs-headers KEY=VALUE,KEY=VALUE\n"
+        "    --lrs-http2 / --no-lrs-http2\n"
         "    --lrs-locale-encoding TEXT\n"
         "    --lrs-password TEXT\n"
+        "    --lrs-pool-size INTEGER\n"
+        "    --lrs-read-ahead INTEGER\n"
         "    --lrs-read-chunk-size INTEGER\n"
+        "    --lrs-read-partitions INTEGER\n"
+        "    --lrs-read-partitions-ordered / --no-lrs-read-partitions-ordered\n"
+        "    --lrs-read-partitions-split-depth INTEGER\n"
         "    --lrs-statements-endpoint TEXT\n"
         "    --lrs-status-endpoint TEXT\n"
         "    --lrs-username TEXT\n"
         "    --lrs-write-chunk-size INTEGER\n"
+        "    --lrs-write-concurrency INTEGER\n"
+        "    --lrs-write-gzip / --no-lrs-write-gzip\n"
+        "    --lrs-write-retries INTEGER\n"
+        "    --lrs-write-retry-backoff FLOAT\n"
         "  mongo backend: \n"
         "    --mongo-client-options KEY=VALUE,KEY=VALUE\n"
         "    --mongo-connection-uri MONGODSN\n"
@@ -209,6 +270,17 @@ def test_cli_read_command_usage():
         "    --mongo-locale-encoding TEXT\n"
         "    --mongo-read-chunk-size INTEGER\n"
         "    --mongo-write-chunk-size INTEGER\n"
+        "    --mongo-write-concern TEXT\n"
+        "    --mongo-write-concurrency INTEGER\n"
+        "    --mongo-write-journal TEXT\n"
+        "    --mongo-write-ordered / --no-mongo-write-ordered\n"
+        "  parquet backend: \n"
+        "    --parquet-compression TEXT\n"
+        "    --parquet-default-directory-path PATH\n"
+        "    --parquet-locale-encoding TEXT\n"
+        "    --parquet-read-chunk-size INTEGER\n"
+        "    --parquet-storage TEXT\n"
+        "    --parquet-write-chunk-size INTEGER\n"
         "  s3 backend: \n"
         "    --s3-access-key-id TEXT\n"
         "    --s3-default-bucket-name TEXT\n"
@@ -219,6 +291,14 @@ def test_cli_read_command_usage():
         "    --s3-secret-access-key TEXT\n"
         "    --s3-session-token TEXT\n"
         "    --s3-write-chunk-size INTEGER\n"
+        "  sqlite backend: \n"
+        "    --sqlite-busy-timeout FLOAT\n"
+        "    --sqlite-database-path PATH\n"
+        "    --sqlite-default-table TEXT\n"
+        "    --sqlite-locale-encoding TEXT\n"
+        "    --sqlite-read-chunk-size INTEGER\n"
+        "    --sqlite-synchronous TEXT\n"
+        "    --sqlite-write-chunk-size INTEGER\n"
         "  swift backend: \n"
         "    --swift-auth-url TEXT\n"
         "    --swift-default-container TEXT\n"
@@ -240,15 +320,34 @@ def test_cli_read_command_usage():
         "  -i, --ignore_errors BOOLEAN     Ignore errors during the encoding operation."
         "\n"
         "                                  [default: False]\n"
+        "  -p, --prefetch INTEGER          Number of records read ahead in a background"
+        "\n"
+        "                                  thread while outputting previous ones.\n"
+        "                                  Defaults to 1, i.e. no read ahead\n"
         "  --help                          Show this message and exit.\n"
     ) == result.output
     logging.warning(result.output)
     result = runner.invoke(cli, ["read"])
     assert result.exit_code > 0
     assert (
-        "Error: Missing option '-b' / '--backend'. "
-        "Choose from:\n\tasync_es,\n\tasync_lrs,\n\tasync_mongo,\n\tasync_ws,"
-        "\n\tclickhouse,\n\tes,\n\tfs,\n\tldp,\n\tlrs,\n\tmongo,\n\ts3,\n\tswift\n"
+        "Error: Missing option '-b' / '--backend'. Choose from:\n"
+        "\tasync_clickhouse,\n"
+        "\tasync_es,\n"
+        "\tasync_lrs,\n"
+        "\tasync_mongo,\n"
+        "\tasync_sqlite,\n"
+        "\tasync_ws,\n"
+        "\tclickhouse,\n"
+        "\tes,\n"
+        "\tfanout,\n"
+        "\tfs,\n"
+        "\tldp,\n"
+        "\tlrs,\n"
+        "\tmongo,\n"
+        "\tparquet,\n"
+        "\ts3,\n"
+        "\tsqlite,\n"
+        "\tswift\n"
     ) in result.output
 
 
@@ -259,11 +358,27 @@ def test_cli_list_command_usage():
 
     assert result.exit_code == 0
     assert (
-        "Usage: ralph list [OPTIONS]\n\n"
-        "  List available documents from a configured data backend.\n\n"
+        "Usage: ralph list [OPTIONS]\n"
+        "\n"
+        "  List available documents from a configured data backend.\n"
+        "\n"
         "Options:\n"
-        "  -b, --backend [async_es|async_mongo|clickhouse|es|fs|ldp|mongo|s3|swift]\n"
+        "  -b, --backend [async_clickhouse|async_es|async_mongo|async_sqlite|clickhouse"
+        "|es|fs|ldp|mongo|parquet|s3|sqlite|swift]\n"
         "                                  Backend  [required]\n"
+        "  async_clickhouse backend: \n"
+        "    --async-clickhouse-client-options KEY=VALUE,KEY=VALUE\n"
+        "    --async-clickhouse-database TEXT\n"
+        "    --async-clickhouse-event-table-name TEXT\n"
+        "    --async-clickhouse-host TEXT\n"
+        "    --async-clickhouse-locale-encoding TEXT\n"
+        "    --async-clickhouse-password TEXT\n"
+        "    --async-clickhouse-pool-size INTEGER\n"
+        "    --async-clickhouse-port INTEGER\n"
+        "    --async-clickhouse-read-chunk-size INTEGER\n"
+        "    --async-clickhouse-username TEXT\n"
+        "    --async-clickhouse-write-chunk-size INTEGER\n"
+        "    --async-clickhouse-write-concurrency INTEGER\n"
         "  async_es backend: \n"
         "    --async-es-allow-yellow-status / --no-async-es-allow-yellow-status\n"
         "    --async-es-client-options KEY=VALUE,KEY=VALUE\n"
@@ -274,6 +389,7 @@ def test_cli_list_command_usage():
         "    --async-es-read-chunk-size INTEGER\n"
         "    --async-es-refresh-after-write TEXT\n"
         "    --async-es-write-chunk-size INTEGER\n"
+        "    --async-es-write-concurrency INTEGER\n"
         "  async_mongo backend: \n"
         "    --async-mongo-client-options KEY=VALUE,KEY=VALUE\n"
         "    --async-mongo-connection-uri MONGODSN\n"
@@ -282,6 +398,18 @@ def test_cli_list_command_usage():
         "    --async-mongo-locale-encoding TEXT\n"
         "    --async-mongo-read-chunk-size INTEGER\n"
         "    --async-mongo-write-chunk-size INTEGER\n"
+        "    --async-mongo-write-concern TEXT\n"
+        "    --async-mongo-write-concurrency INTEGER\n"
+        "    --async-mongo-write-journal TEXT\n"
+        "    --async-mongo-write-ordered / --no-async-mongo-write-ordered\n"
+        "  async_sqlite backend: \n"
+        "    --async-sqlite-busy-timeout FLOAT\n"
+        "    --async-sqlite-database-path PATH\n"
+        "    --async-sqlite-default-table TEXT\n"
+        "    --async-sqlite-locale-encoding TEXT\n"
+        "    --async-sqlite-read-chunk-size INTEGER\n"
+        "    --async-sqlite-synchronous TEXT\n"
+        "    --async-sqlite-write-chunk-size INTEGER\n"
         "  clickhouse backend: \n"
         "    --clickhouse-client-options KEY=VALUE,KEY=VALUE\n"
         "    --clickhouse-database TEXT\n"
@@ -289,10 +417,12 @@ def test_cli_list_command_usage():
         "    --clickhouse-host TEXT\n"
         "    --clickhouse-locale-encoding TEXT\n"
         "    --clickhouse-password TEXT\n"
+        "    --clickhouse-pool-size INTEGER\n"
         "    --clickhouse-port INTEGER\n"
         "    --clickhouse-read-chunk-size INTEGER\n"
         "    --clickhouse-username TEXT\n"
         "    --clickhouse-write-chunk-size INTEGER\n"
+        "    --clickhouse-write-concurrency INTEGER\n"
         "  es backend: \n"
         "    --es-allow-yellow-status / --no-es-allow-yellow-status\n"
         "    --es-client-options KEY=VALUE,KEY=VALUE\n"
@@ -303,6 +433,7 @@ def test_cli_list_command_usage():
         "    --es-read-chunk-size INTEGER\n"
         "    --es-refresh-after-write TEXT\n"
         "    --es-write-chunk-size INTEGER\n"
+        "    --es-write-concurrency INTEGER\n"
         "  fs backend: \n"
         "    --fs-default-directory-path PATH\n"
         "    --fs-default-query-string TEXT\n"
@@ -328,6 +459,17 @@ def test_cli_list_command_usage():
         "    --mongo-locale-encoding TEXT\n"
         "    --mongo-read-chunk-size INTEGER\n"
         "    --mongo-write-chunk-size INTEGER\n"
+        "    --mongo-write-concern TEXT\n"
+        "    --mongo-write-concurrency INTEGER\n"
+        "    --mongo-write-journal TEXT\n"
+        "    --mongo-write-ordered / --no-mongo-write-ordered\n"
+        "  parquet backend: \n"
+        "    --parquet-compression TEXT\n"
+        "    --parquet-default-directory-path PATH\n"
+        "    --parquet-locale-encoding TEXT\n"
+        "    --parquet-read-chunk-size INTEGER\n"
+        "    --parquet-storage TEXT\n"
+        "    --parquet-write-chunk-size INTEGER\n"
         "  s3 backend: \n"
         "    --s3-access-key-id TEXT\n"
         "    --s3-default-bucket-name TEXT\n"
@@ -338,6 +480,14 @@ def test_cli_list_command_usage():
         "    --s3-secret-access-key TEXT\n"
         "    --s3-session-token TEXT\n"
         "    --s3-write-chunk-size INTEGER\n"
+        "  sqlite backend: \n"
+        "    --sqlite-busy-timeout FLOAT\n"
+        "    --sqlite-database-path PATH\n"
+        "    --sqlite-default-table TEXT\n"
+        "    --sqlite-locale-encoding TEXT\n"
+        "    --sqlite-read-chunk-size INTEGER\n"
+        "    --sqlite-synchronous TEXT\n"
+        "    --sqlite-write-chunk-size INTEGER\n"
         "  swift backend: \n"
         "    --swift-auth-url TEXT\n"
         "    --swift-default-container TEXT\n"
@@ -362,9 +512,20 @@ def test_cli_list_command_usage():
     result = runner.invoke(cli, ["list"])
     assert result.exit_code > 0
     assert (
-        "Error: Missing option '-b' / '--backend'. Choose from:\n\tasync_es,\n\t"
-        "async_mongo,\n\tclickhouse,\n\tes,\n\tfs,\n\tldp,\n\tmongo,\n\ts3,"
-        "\n\tswift\n"
+        "Error: Missing option '-b' / '--backend'. Choose from:\n"
+        "\tasync_clickhouse,\n"
+        "\tasync_es,\n"
+        "\tasync_mongo,\n"
+        "\tasync_sqlite,\n"
+        "\tclickhouse,\n"
+        "\tes,\n"
+        "\tfs,\n"
+        "\tldp,\n"
+        "\tmongo,\n"
+        "\tparquet,\n"
+        "\ts3,\n"
+        "\tsqlite,\n"
+        "\tswift\n"
     ) in result.output
 
 
@@ -376,13 +537,27 @@ def test_cli_write_command_usage():
     assert result.exit_code == 0
 
     expected_output = (
-        "Usage: ralph write [OPTIONS]\n\n"
-        "  Write an archive to a configured backend.\n\n"
-        "Options:\n"
-        "  -b, --backend "
-        "[async_es|async_lrs|async_mongo|clickhouse|es|fs|lrs|mongo|s3|swift]"
+        "Usage: ralph write [OPTIONS]\n"
         "\n"
+        "  Write an archive to a configured backend.\n"
+        "\n"
+        "Options:\n"
+        "  -b, --backend [async_clickhouse|async_es|async_lrs|async_mongo|async_sqlite|"
+        "clickhouse|es|fanout|fs|lrs|mongo|parquet|s3|sqlite|swift]\n"
         "                                  Backend  [required]\n"
+        "  async_clickhouse backend: \n"
+        "    --async-clickhouse-client-options KEY=VALUE,KEY=VALUE\n"
+        "    --async-clickhouse-database TEXT\n"
+        "    --async-clickhouse-event-table-name TEXT\n"
+        "    --async-clickhouse-host TEXT\n"
+        "    --async-clickhouse-locale-encoding TEXT\n"
+        "    --async-clickhouse-password TEXT\n"
+        "    --async-clickhouse-pool-size INTEGER\n"
+        "    --async-clickhouse-port INTEGER\n"
+        "    --async-clickhouse-read-chunk-size INTEGER\n"
+        "    --async-clickhouse-username TEXT\n"
+        "    --async-clickhouse-write-chunk-size INTEGER\n"
+        "    --async-clickhouse-write-concurrency INTEGER\n"
         "  async_es backend: \n"
         "    --async-es-allow-yellow-status / --no-async-es-allow-yellow-status\n"
         "    --async-es-client-options KEY=VALUE,KEY=VALUE\n"
@@ -393,16 +568,28 @@ def test_cli_write_command_usage():
         "    --async-es-read-chunk-size INTEGER\n"
         "    --async-es-refresh-after-write TEXT\n"
         "    --async-es-write-chunk-size INTEGER\n"
+        "    --async-es-write-concurrency INTEGER\n"
         "  async_lrs backend: \n"
         "    --async-lrs-base-url TEXT\n"
         "    --async-lrs-headers KEY=VALUE,KEY=VALUE\n"
+        "    --async-lrs-http2 / --no-async-lrs-http2\n"
         "    --async-lrs-locale-encoding TEXT\n"
         "    --async-lrs-password TEXT\n"
+        "    --async-lrs-pool-size INTEGER\n"
+        "    --async-lrs-read-ahead INTEGER\n"
         "    --async-lrs-read-chunk-size INTEGER\n"
+        "    --async-lrs-read-partitions INTEGER\n"
+        "    --async-lrs-read-partitions-ordered / --no-async-lrs-read-partitions-order"
+        "ed\n"
+        "    --async-lrs-read-partitions-split-depth INTEGER\n"
         "    --async-lrs-statements-endpoint TEXT\n"
         "    --async-lrs-status-endpoint TEXT\n"
         "    --async-lrs-username TEXT\n"
         "    --async-lrs-write-chunk-size INTEGER\n"
+        "    --async-lrs-write-concurrency INTEGER\n"
+        "    --async-lrs-write-gzip / --no-async-lrs-write-gzip\n"
+        "    --async-lrs-write-retries INTEGER\n"
+        "    --async-lrs-write-retry-backoff FLOAT\n"
         "  async_mongo backend: \n"
         "    --async-mongo-client-options KEY=VALUE,KEY=VALUE\n"
         "    --async-mongo-connection-uri MONGODSN\n"
@@ -411,6 +598,18 @@ def test_cli_write_command_usage():
         "    --async-mongo-locale-encoding TEXT\n"
         "    --async-mongo-read-chunk-size INTEGER\n"
         "    --async-mongo-write-chunk-size INTEGER\n"
+        "    --async-mongo-write-concern TEXT\n"
+        "    --async-mongo-write-concurrency INTEGER\n"
+        "    --async-mongo-write-journal TEXT\n"
+        "    --async-mongo-write-ordered / --no-async-mongo-write-ordered\n"
+        "  async_sqlite backend: \n"
+        "    --async-sqlite-busy-timeout FLOAT\n"
+        "    --async-sqlite-database-path PATH\n"
+        "    --async-sqlite-default-table TEXT\n"
+        "    --async-sqlite-locale-encoding TEXT\n"
+        "    --async-sqlite-read-chunk-size INTEGER\n"
+        "    --async-sqlite-synchronous TEXT\n"
+        "    --async-sqlite-write-chunk-size INTEGER\n"
         "  clickhouse backend: \n"
         "    --clickhouse-client-options KEY=VALUE,KEY=VALUE\n"
         "    --clickhouse-database TEXT\n"
@@ -418,10 +617,12 @@ def test_cli_write_command_usage():
         "    --clickhouse-host TEXT\n"
         "    --clickhouse-locale-encoding TEXT\n"
         "    --clickhouse-password TEXT\n"
+        "    --clickhouse-pool-size INTEGER\n"
         "    --clickhouse-port INTEGER\n"
         "    --clickhouse-read-chunk-size INTEGER\n"
         "    --clickhouse-username TEXT\n"
         "    --clickhouse-write-chunk-size INTEGER\n"
+        "    --clickhouse-write-concurrency INTEGER\n"
         "  es backend: \n"
         "    --es-allow-yellow-status / --no-es-allow-yellow-status\n"
         "    --es-client-options KEY=VALUE,KEY=VALUE\n"
@@ -432,6 +633,13 @@ def test_cli_write_command_usage():
         "    --es-read-chunk-size INTEGER\n"
         "    --es-refresh-after-write TEXT\n"
         "    --es-write-chunk-size INTEGER\n"
+        "    --es-write-concurrency INTEGER\n"
+        "  fanout backend: \n"
+        "    --fanout-backends TEXT\n"
+        "    --fanout-locale-encoding TEXT\n"
+        "    --fanout-primary-backend TEXT\n"
+        "    --fanout-read-chunk-size INTEGER\n"
+        "    --fanout-write-chunk-size INTEGER\n"
         "  fs backend: \n"
         "    --fs-default-directory-path PATH\n"
         "    --fs-default-query-string TEXT\n"
@@ -441,13 +649,23 @@ def test_cli_write_command_usage():
         "  lrs backend: \n"
         "    --lrs-base-url TEXT\n"
         "    --lrs-headers KEY=VALUE,KEY=VALUE\n"
+        "    --lrs-http2 / --no-lrs-http2\n"
         "    --lrs-locale-encoding TEXT\n"
         "    --lrs-password TEXT\n"
+        "    --lrs-pool-size INTEGER\n"
+        "    --lrs-read-ahead INTEGER\n"
         "    --lrs-read-chunk-size INTEGER\n"
+        "    --lrs-read-partitions INTEGER\n"
+        "    --lrs-read-partitions-ordered / --no-lrs-read-partitions-ordered\n"
+        "    --lrs-read-partitions-split-depth INTEGER\n"
         "    --lrs-statements-endpoint TEXT\n"
         "    --lrs-status-endpoint TEXT\n"
         "    --lrs-username TEXT\n"
         "    --lrs-write-chunk-size INTEGER\n"
+        "    --lrs-write-concurrency INTEGER\n"
+        "    --lrs-write-gzip / --no-lrs-write-gzip\n"
+        "    --lrs-write-retries INTEGER\n"
+        "    --lrs-write-retry-backoff FLOAT\n"
         "  mongo backend: \n"
         "    --mongo-client-options KEY=VALUE,KEY=VALUE\n"
         "    --mongo-connection-uri MONGODSN\n"
@@ -456,6 +674,17 @@ def test_cli_write_command_usage():
         "    --mongo-locale-encoding TEXT\n"
         "    --mongo-read-chunk-size INTEGER\n"
         "    --mongo-write-chunk-size INTEGER\n"
+        "    --mongo-write-concern TEXT\n"
+        "    --mongo-write-concurrency INTEGER\n"
+        "    --mongo-write-journal TEXT\n"
+        "    --mongo-write-ordered / --no-mongo-write-ordered\n"
+        "  parquet backend: \n"
+        "    --parquet-compression TEXT\n"
+        "    --parquet-default-directory-path PATH\n"
+        "    --parquet-locale-encoding TEXT\n"
+        "    --parquet-read-chunk-size INTEGER\n"
+        "    --parquet-storage TEXT\n"
+        "    --parquet-write-chunk-size INTEGER\n"
         "  s3 backend: \n"
         "    --s3-access-key-id TEXT\n"
         "    --s3-default-bucket-name TEXT\n"
@@ -466,6 +695,14 @@ def test_cli_write_command_usage():
         "    --s3-secret-access-key TEXT\n"
         "    --s3-session-token TEXT\n"
         "    --s3-write-chunk-size INTEGER\n"
+        "  sqlite backend: \n"
+        "    --sqlite-busy-timeout FLOAT\n"
+        "    --sqlite-database-path PATH\n"
+        "    --sqlite-default-table TEXT\n"
+        "    --sqlite-locale-encoding TEXT\n"
+        "    --sqlite-read-chunk-size INTEGER\n"
+        "    --sqlite-synchronous TEXT\n"
+        "    --sqlite-write-chunk-size INTEGER\n"
         "  swift backend: \n"
         "    --swift-auth-url TEXT\n"
         "    --swift-default-container TEXT\n"
@@ -485,11 +722,12 @@ def test_cli_write_command_usage():
         "  -s, --chunk-size INTEGER        Get events by chunks of size #\n"
         "  -I, --ignore-errors             Continue writing regardless of raised errors"
         "\n"
-        "  -o, --operation-type OP_TYPE    Either index, create, delete, update or "
-        "append\n"
-        "  -c, --concurrency INTEGER       Number of chunks to write concurrently. ("
-        "async\n"
-        "                                  backends only)\n"
+        "  -o, --operation-type OP_TYPE    Either index, create, delete, update or appe"
+        "nd\n"
+        "  -c, --concurrency INTEGER       Number of chunks to write concurrently, for"
+        "\n"
+        "                                  backends supporting it. Defaults to the\n"
+        "                                  backend WRITE_CONCURRENCY setting\n"
         "  --help                          Show this message and exit.\n"
     )
     assert expected_output == result.output
@@ -497,8 +735,22 @@ def test_cli_write_command_usage():
     result = runner.invoke(cli, ["write"])
     assert result.exit_code > 0
     assert (
-        "Missing option '-b' / '--backend'. Choose from:\n\tasync_es,\n\tasync_lrs,\n\t"
-        "async_mongo,\n\tclickhouse,\n\tes,\n\tfs,\n\tlrs,\n\tmongo,\n\ts3,\n\tswift\n"
+        "Missing option '-b' / '--backend'. Choose from:\n"
+        "\tasync_clickhouse,\n"
+        "\tasync_es,\n"
+        "\tasync_lrs,\n"
+        "\tasync_mongo,\n"
+        "\tasync_sqlite,\n"
+        "\tclickhouse,\n"
+        "\tes,\n"
+        "\tfanout,\n"
+        "\tfs,\n"
+        "\tlrs,\n"
+        "\tmongo,\n"
+        "\tparquet,\n"
+        "\ts3,\n"
+        "\tsqlite,\n"
+        "\tswift\n"
     ) in result.output
 
 
@@ -508,22 +760,50 @@ def test_cli_runserver_command_usage():
     result = runner.invoke(cli, ["runserver", "--help"])
 
     expected_output = (
-        "Usage: ralph runserver [OPTIONS]\n\n"
-        "  Run the API server for the development environment.\n\n"
-        "  Starts uvicorn programmatically for convenience and documentation.\n\n"
+        "Usage: ralph runserver [OPTIONS]\n"
+        "\n"
+        "  Run the API server for the development environment.\n"
+        "\n"
+        "  Starts uvicorn programmatically for convenience and documentation.\n"
+        "\n"
         "Options:\n"
-        "  -b, --backend [async_es|async_mongo|clickhouse|es|fs|mongo]\n"
+        "  -b, --backend [async_cached|async_clickhouse|async_es|async_mongo|async_sqli"
+        "te|cached|clickhouse|es|fanout|fs|mongo|parquet|sqlite|tiered]\n"
         "                                  Backend  [required]\n"
+        "  async_cached backend: \n"
+        "    --async-cached-backend TEXT\n"
+        "    --async-cached-cache-database-path TEXT\n"
+        "    --async-cached-cache-max-size INTEGER\n"
+        "    --async-cached-cache-ttl INTEGER\n"
+        "    --async-cached-locale-encoding TEXT\n"
+        "    --async-cached-read-chunk-size INTEGER\n"
+        "    --async-cached-write-chunk-size INTEGER\n"
+        "  async_clickhouse backend: \n"
+        "    --async-clickhouse-client-options KEY=VALUE,KEY=VALUE\n"
+        "    --async-clickhouse-database TEXT\n"
+        "    --async-clickhouse-event-table-name TEXT\n"
+        "    --async-clickhouse-host TEXT\n"
+        "    --async-clickhouse-ids-chunk-size INTEGER\n"
+        "    --async-clickhouse-locale-encoding TEXT\n"
+        "    --async-clickhouse-password TEXT\n"
+        "    --async-clickhouse-pool-size INTEGER\n"
+        "    --async-clickhouse-port INTEGER\n"
+        "    --async-clickhouse-read-chunk-size INTEGER\n"
+        "    --async-clickhouse-username TEXT\n"
+        "    --async-clickhouse-write-chunk-size INTEGER\n"
+        "    --async-clickhouse-write-concurrency INTEGER\n"
         "  async_es backend: \n"
         "    --async-es-allow-yellow-status / --no-async-es-allow-yellow-status\n"
         "    --async-es-client-options KEY=VALUE,KEY=VALUE\n"
         "    --async-es-default-index TEXT\n"
         "    --async-es-hosts TEXT\n"
+        "    --async-es-index-period TEXT\n"
         "    --async-es-locale-encoding TEXT\n"
         "    --async-es-point-in-time-keep-alive TEXT\n"
         "    --async-es-read-chunk-size INTEGER\n"
         "    --async-es-refresh-after-write TEXT\n"
         "    --async-es-write-chunk-size INTEGER\n"
+        "    --async-es-write-concurrency INTEGER\n"
         "  async_mongo backend: \n"
         "    --async-mongo-client-options KEY=VALUE,KEY=VALUE\n"
         "    --async-mongo-connection-uri MONGODSN\n"
@@ -532,6 +812,26 @@ def test_cli_runserver_command_usage():
         "    --async-mongo-locale-encoding TEXT\n"
         "    --async-mongo-read-chunk-size INTEGER\n"
         "    --async-mongo-write-chunk-size INTEGER\n"
+        "    --async-mongo-write-concern TEXT\n"
+        "    --async-mongo-write-concurrency INTEGER\n"
+        "    --async-mongo-write-journal TEXT\n"
+        "    --async-mongo-write-ordered / --no-async-mongo-write-ordered\n"
+        "  async_sqlite backend: \n"
+        "    --async-sqlite-busy-timeout FLOAT\n"
+        "    --async-sqlite-database-path PATH\n"
+        "    --async-sqlite-default-table TEXT\n"
+        "    --async-sqlite-locale-encoding TEXT\n"
+        "    --async-sqlite-read-chunk-size INTEGER\n"
+        "    --async-sqlite-synchronous TEXT\n"
+        "    --async-sqlite-write-chunk-size INTEGER\n"
+        "  cached backend: \n"
+        "    --cached-backend TEXT\n"
+        "    --cached-cache-database-path TEXT\n"
+        "    --cached-cache-max-size INTEGER\n"
+        "    --cached-cache-ttl INTEGER\n"
+        "    --cached-locale-encoding TEXT\n"
+        "    --cached-read-chunk-size INTEGER\n"
+        "    --cached-write-chunk-size INTEGER\n"
         "  clickhouse backend: \n"
         "    --clickhouse-client-options KEY=VALUE,KEY=VALUE\n"
         "    --clickhouse-database TEXT\n"
@@ -540,20 +840,30 @@ def test_cli_runserver_command_usage():
         "    --clickhouse-ids-chunk-size INTEGER\n"
         "    --clickhouse-locale-encoding TEXT\n"
         "    --clickhouse-password TEXT\n"
+        "    --clickhouse-pool-size INTEGER\n"
         "    --clickhouse-port INTEGER\n"
         "    --clickhouse-read-chunk-size INTEGER\n"
         "    --clickhouse-username TEXT\n"
         "    --clickhouse-write-chunk-size INTEGER\n"
+        "    --clickhouse-write-concurrency INTEGER\n"
         "  es backend: \n"
         "    --es-allow-yellow-status / --no-es-allow-yellow-status\n"
         "    --es-client-options KEY=VALUE,KEY=VALUE\n"
         "    --es-default-index TEXT\n"
         "    --es-hosts TEXT\n"
+        "    --es-index-period TEXT\n"
         "    --es-locale-encoding TEXT\n"
         "    --es-point-in-time-keep-alive TEXT\n"
         "    --es-read-chunk-size INTEGER\n"
         "    --es-refresh-after-write TEXT\n"
         "    --es-write-chunk-size INTEGER\n"
+        "    --es-write-concurrency INTEGER\n"
+        "  fanout backend: \n"
+        "    --fanout-backends TEXT\n"
+        "    --fanout-locale-encoding TEXT\n"
+        "    --fanout-primary-backend TEXT\n"
+        "    --fanout-read-chunk-size INTEGER\n"
+        "    --fanout-write-chunk-size INTEGER\n"
         "  fs backend: \n"
         "    --fs-default-directory-path PATH\n"
         "    --fs-default-lrs-file TEXT\n"
@@ -569,6 +879,32 @@ def test_cli_runserver_command_usage():
         "    --mongo-locale-encoding TEXT\n"
         "    --mongo-read-chunk-size INTEGER\n"
         "    --mongo-write-chunk-size INTEGER\n"
+        "    --mongo-write-concern TEXT\n"
+        "    --mongo-write-concurrency INTEGER\n"
+        "    --mongo-write-journal TEXT\n"
+        "    --mongo-write-ordered / --no-mongo-write-ordered\n"
+        "  parquet backend: \n"
+        "    --parquet-compression TEXT\n"
+        "    --parquet-default-directory-path PATH\n"
+        "    --parquet-locale-encoding TEXT\n"
+        "    --parquet-read-chunk-size INTEGER\n"
+        "    --parquet-storage TEXT\n"
+        "    --parquet-write-chunk-size INTEGER\n"
+        "  sqlite backend: \n"
+        "    --sqlite-busy-timeout FLOAT\n"
+        "    --sqlite-database-path PATH\n"
+        "    --sqlite-default-table TEXT\n"
+        "    --sqlite-locale-encoding TEXT\n"
+        "    --sqlite-read-chunk-size INTEGER\n"
+        "    --sqlite-synchronous TEXT\n"
+        "    --sqlite-write-chunk-size INTEGER\n"
+        "  tiered backend: \n"
+        "    --tiered-cold-backend TEXT\n"
+        "    --tiered-hot-backend TEXT\n"
+        "    --tiered-hot-retention-days INTEGER\n"
+        "    --tiered-locale-encoding TEXT\n"
+        "    --tiered-read-chunk-size INTEGER\n"
+        "    --tiered-write-chunk-size INTEGER\n"
         "  -h, --host TEXT                 LRS server host name\n"
         "  -p, --port INTEGER              LRS server port\n"
         "  --help                          Show this message and exit.\n"
@@ -579,6 +915,19 @@ def test_cli_runserver_command_usage():
     result = runner.invoke(cli, ["runserver"])
     assert result.exit_code > 0
     assert (
-        "Missing option '-b' / '--backend'. Choose from:\n\tasync_es,\n\tasync_mongo,\n"
-        "\tclickhouse,\n\tes,\n\tfs,\n\tmongo\n"
+        "Missing option '-b' / '--backend'. Choose from:\n"
+        "\tasync_cached,\n"
+        "\tasync_clickhouse,\n"
+        "\tasync_es,\n"
+        "\tasync_mongo,\n"
+        "\tasync_sqlite,\n"
+        "\tcached,\n"
+        "\tclickhouse,\n"
+        "\tes,\n"
+        "\tfanout,\n"
+        "\tfs,\n"
+        "\tmongo,\n"
+        "\tparquet,\n"
+        "\tsqlite,\n"
+        "\ttiered\n"
     ) in result.output
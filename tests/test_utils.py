@@ -1,6 +1,8 @@
 """Tests for Ralph utils."""
 
+import itertools
 import logging
+import threading
 
 import pytest
 from pydantic import BaseModel
@@ -113,3 +115,73 @@ def test_utils_set_dict_value_from_path_updating_fields():
     dictionary = {"foo": {"bar": "bar_value"}}
     ralph_utils.set_dict_value_from_path(dictionary, ["foo", "bar"], "baz")
     assert dictionary == {"foo": {"bar": "baz"}}
+
+
+def test_utils_get_statement_fingerprint():
+    """Test the `get_statement_fingerprint` function, given equivalent statements,
+    should return the same fingerprint.
+    """
+    statement = {
+        "id": "2140967b-563b-464b-90c0-2e114bd8e133",
+        "actor": {"mbox": "mailto:foo@bar.com", "objectType": "Agent"},
+        "verb": {"id": "http://adlnet.gov/expapi/verbs/attended"},
+        "object": {"id": "http://example.com/activity"},
+        "timestamp": "2023-03-15T14:07:51Z",
+    }
+    fingerprint = ralph_utils.get_statement_fingerprint(statement)
+    assert len(fingerprint) == 64
+
+    # Fields order and fields ignored by the equivalence check should not matter.
+    reordered_statement = dict(reversed(list(statement.items())))
+    reordered_statement["actor"] = {"objectType": "Agent", "mbox": "mailto:foo@bar.com"}
+    reordered_statement["stored"] = "2023-03-15T14:07:52Z"
+    reordered_statement["authority"] = {"mbox": "mailto:ralph@example.com"}
+    assert ralph_utils.get_statement_fingerprint(reordered_statement) == fingerprint
+    assert ralph_utils.statements_are_equivalent(reordered_statement, statement)
+
+    # Differing fields should change the fingerprint.
+    for field, value in [("timestamp", "2023-03-15"), ("result", {"success": True})]:
+        assert (
+            ralph_utils.get_statement_fingerprint({**statement, field: value})
+            != fingerprint
+        )
+
+
+def test_utils_iter_in_thread():
+    """Test the `iter_in_thread` function, should yield the items of the iterable
+    in order and raise its errors in the consumer thread.
+    """
+    assert list(ralph_utils.iter_in_thread(range(10), 3)) == list(range(10))
+
+    def failing_generator():
+        yield 1
+        raise ValueError("Something is wrong")
+
+    items = ralph_utils.iter_in_thread(failing_generator(), 1)
+    assert next(items) == 1
+    with pytest.raises(ValueError, match="Something is wrong"):
+        next(items)
+
+    # Closing the iterator early should stop the background thread.
+    thread_count = threading.active_count()
+    items = ralph_utils.iter_in_thread(itertools.count(), 1)
+    assert next(items) == 0
+    assert threading.active_count() == thread_count + 1
+    items.close()
+    assert threading.active_count() == thread_count
+
+    with pytest.raises(ValueError, match="size must be at least one"):
+        next(ralph_utils.iter_in_thread([], 0))
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_utils_iter_in_threads(ordered):
+    """Test the `iter_in_threads` function, should yield the items of all
+    iterables, in order if `ordered` is `True`.
+    """
+    iterables = [range(0, 5), range(5, 10), range(10, 15)]
+    items = list(ralph_utils.iter_in_threads(iterables, 2, ordered))
+    if ordered:
+        assert items == list(range(15))
+    else:
+        assert sorted(items) == list(range(15))